@@ -23,6 +23,7 @@ class Config:
         "demo": "https://opensource-demo.orangehrmlive.com",
         "staging": "https://staging-demo.orangehrmlive.com",  # example
         "dev": "http://localhost:8080",  # example
+        "local": os.getenv("LOCAL_BASE_URL", "http://127.0.0.1:8765"),  # stand-in server
     }
 
     # Credentials (per environment)
@@ -39,6 +40,10 @@ class Config:
             "username": os.getenv("DEV_USER", "admin"),
             "password": os.getenv("DEV_PASSWORD", "admin"),
         },
+        "local": {
+            "username": os.getenv("LOCAL_USER", "Admin"),
+            "password": os.getenv("LOCAL_PASSWORD", "admin123"),
+        },
     }
 
     # Browser settings
@@ -50,12 +55,84 @@ class Config:
     DEFAULT_TIMEOUT: int = int(os.getenv("DEFAULT_TIMEOUT", "30000"))
     NAVIGATION_TIMEOUT: int = int(os.getenv("NAVIGATION_TIMEOUT", "30000"))
     ACTION_TIMEOUT: int = int(os.getenv("ACTION_TIMEOUT", "10000"))
+    # Longest debounce an autocomplete may apply before its lookup request goes out
+    AUTOCOMPLETE_DEBOUNCE_MS: int = int(os.getenv("AUTOCOMPLETE_DEBOUNCE_MS", "2000"))
 
     # Test settings
     SCREENSHOT_ON_FAILURE: bool = os.getenv("SCREENSHOT_ON_FAILURE", "true").lower() == "true"
     VIDEO_ON_FAILURE: bool = os.getenv("VIDEO_ON_FAILURE", "false").lower() == "true"
     TRACE_ON_FAILURE: bool = os.getenv("TRACE_ON_FAILURE", "true").lower() == "true"
 
+    # Authenticated session reuse (login once per worker, then share storage state)
+    REUSE_AUTH_STATE: bool = os.getenv("REUSE_AUTH_STATE", "true").lower() == "true"
+    AUTH_STATE_DIR: str = os.getenv("AUTH_STATE_DIR", ".auth")
+    AUTH_STATE_MAX_AGE: int = int(os.getenv("AUTH_STATE_MAX_AGE", "1800"))  # seconds
+
+    # Browser context reuse (warm contexts are wiped and handed to the next test)
+    REUSE_CONTEXTS: bool = os.getenv("REUSE_CONTEXTS", "true").lower() == "true"
+    CONTEXT_POOL_SIZE: int = int(os.getenv("CONTEXT_POOL_SIZE", "2"))
+
+    # Local stand-in server (ENV=local); autostart binds a free port per worker
+    STANDIN_AUTOSTART: bool = os.getenv("STANDIN_AUTOSTART", "true").lower() == "true"
+
+    # Static asset cache shared by contexts and xdist workers (JS/CSS, fonts, images)
+    ASSET_CACHE: bool = os.getenv("ASSET_CACHE", "true").lower() == "true"
+    ASSET_CACHE_DIR: str = os.getenv("ASSET_CACHE_DIR", ".cache/assets")
+    ASSET_CACHE_MAX_MB: int = int(os.getenv("ASSET_CACHE_MAX_MB", "200"))
+
+    # Network blocking: default profile for test packages without one (see utils/network_blocker.py)
+    NETWORK_PROFILE: str = os.getenv("NETWORK_PROFILE", "no_tracking")
+    NETWORK_SIZE_LEDGER: str = os.getenv("NETWORK_SIZE_LEDGER", ".cache/network_sizes.json")
+
+    # Response-aware waits: also time `networkidle` after each wait to measure the savings
+    API_WAIT_BASELINE: bool = os.getenv("API_WAIT_BASELINE", "false").lower() == "true"
+
+    # Page-object locators: time each chain's resolution in the browser and list the slowest
+    LOCATOR_DEBUG: bool = os.getenv("LOCATOR_DEBUG", "false").lower() == "true"
+    LOCATOR_SLOW_MS: float = float(os.getenv("LOCATOR_SLOW_MS", "25"))
+
+    # API data seeding: requests in flight while creating test preconditions
+    SEED_CONCURRENCY: int = int(os.getenv("SEED_CONCURRENCY", "8"))
+
+    # Delete the employees and users a session created when it ends; ids per bulk DELETE
+    CLEANUP_CREATED_DATA: bool = os.getenv("CLEANUP_CREATED_DATA", "true").lower() == "true"
+    CLEANUP_BATCH_SIZE: int = int(os.getenv("CLEANUP_BATCH_SIZE", "50"))
+
+    # Unique employee IDs/usernames: high-water marks shared by workers and runs, values per reservation
+    ID_ALLOCATOR_FILE: str = os.getenv("ID_ALLOCATOR_FILE", ".cache/id_allocator.json")
+    ID_BLOCK_SIZE: int = int(os.getenv("ID_BLOCK_SIZE", "1000"))
+
+    # xdist: plan -n runs longest-test-first from durations earlier runs recorded here
+    LPT_SCHEDULING: bool = os.getenv("LPT_SCHEDULING", "true").lower() == "true"
+    TEST_DURATIONS_FILE: str = os.getenv("TEST_DURATIONS_FILE", ".cache/test_durations.json")
+
+    # Test impact analysis: test -> code index written by --impact-collect, read by --changed-since
+    TEST_IMPACT_INDEX: str = os.getenv("TEST_IMPACT_INDEX", ".cache/test_impact.json")
+
+    # Employees in the synthesized organization the scale performance test loads
+    HR_DATASET_EMPLOYEES: int = int(os.getenv("HR_DATASET_EMPLOYEES", "2000"))
+    # The load writes ~60k records: only on local/staging unless opted in; kept in the environment for reuse
+    HR_DATASET_LOAD: bool = os.getenv("HR_DATASET_LOAD", "false").lower() == "true"
+    HR_DATASET_DIR: str = os.getenv("HR_DATASET_DIR", ".cache/hr_dataset")
+
+    # Performance scenarios: measured and discarded iterations per @perf_scenario run
+    PERF_ITERATIONS: int = int(os.getenv("PERF_ITERATIONS", "10"))
+    PERF_WARMUP: int = int(os.getenv("PERF_WARMUP", "2"))
+    PERF_RESULTS_DIR: str = os.getenv("PERF_RESULTS_DIR", "reports/perf")
+
+    # Performance baseline: SQLite history compared against the last N runs
+    PERF_BASELINE_DB: str = os.getenv("PERF_BASELINE_DB", ".cache/perf_baseline.sqlite")
+    PERF_BASELINE_RUNS: int = int(os.getenv("PERF_BASELINE_RUNS", "5"))
+    PERF_REGRESSION_ALPHA: float = float(os.getenv("PERF_REGRESSION_ALPHA", "0.01"))
+    PERF_REGRESSION_MIN_EFFECT: float = float(os.getenv("PERF_REGRESSION_MIN_EFFECT", "0.10"))  # 10% slower
+
+    # Virtual-user load runs (python -m loadgen) write their JSON reports here
+    LOAD_RESULTS_DIR: str = os.getenv("LOAD_RESULTS_DIR", "reports/load")
+
+    # HAR record/replay (off, record, replay); one HAR per test module
+    HAR_MODE: str = os.getenv("HAR_MODE", "off")
+    HAR_DIR: str = os.getenv("HAR_DIR", "hars")
+
     # Retry settings
     MAX_RETRIES: int = int(os.getenv("MAX_RETRIES", "1"))
     RETRY_DELAY: int = int(os.getenv("RETRY_DELAY", "2"))
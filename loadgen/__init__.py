@@ -0,0 +1,20 @@
+"""Load generation: page-object flows as browser virtual users, and protocol-level API load"""
+from .histogram import LatencyHistogram
+from .profile import LoadProfile, ThinkTime
+from .flows import FLOWS, VirtualUser
+from .runner import LoadReport, run_load
+from .api_load import ApiEndpoint, ApiLoadProfile, ApiLoadReport, run_api_load
+
+__all__ = [
+    "LatencyHistogram",
+    "LoadProfile",
+    "ThinkTime",
+    "FLOWS",
+    "VirtualUser",
+    "LoadReport",
+    "run_load",
+    "ApiEndpoint",
+    "ApiLoadProfile",
+    "ApiLoadReport",
+    "run_api_load",
+]
@@ -0,0 +1,49 @@
+"""
+Run a virtual-user load test from the command line.
+
+Usage:
+    python -m loadgen --users 50 --processes 4 --ramp-up 60 --hold 300 --ramp-down 30
+    python -m loadgen --users 5 --flows browse_employees=3,leave_list=1 --think lognormal:3,0.5
+"""
+import argparse
+
+from config import config
+from loadgen import FLOWS, LoadProfile, ThinkTime, run_load
+
+
+def _flow_weights(spec: str) -> dict:
+    weights = {}
+    for item in spec.split(","):
+        name, _, weight = item.partition("=")
+        weights[name.strip()] = float(weight or 1)
+    return weights
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Browser-level load test driven by the page objects")
+    parser.add_argument("--users", type=int, default=10, help="concurrent virtual users at full load")
+    parser.add_argument("--processes", type=int, default=1, help="browser processes the users are spread over")
+    parser.add_argument("--ramp-up", type=float, default=30, help="seconds until all users have started")
+    parser.add_argument("--hold", type=float, default=60, help="seconds at full load")
+    parser.add_argument("--ramp-down", type=float, default=10, help="seconds over which users stop")
+    parser.add_argument("--think", type=ThinkTime.parse, default=ThinkTime(), help="e.g. lognormal:3,0.5 or uniform:1,5")
+    parser.add_argument("--flows", type=_flow_weights, default=LoadProfile().flows,
+                        help=f"weighted flows, e.g. browse_employees=3,leave_list=1 (available: {', '.join(FLOWS)})")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--base-url", default=None, help=f"defaults to the {config.ENV} environment's URL")
+    parser.add_argument("--username", default=None)
+    parser.add_argument("--password", default=None)
+    parser.add_argument("--headed", action="store_true")
+    args = parser.parse_args()
+
+    profile = LoadProfile(
+        users=args.users, processes=args.processes, ramp_up=args.ramp_up, hold=args.hold,
+        ramp_down=args.ramp_down, think_time=args.think, flows=args.flows, seed=args.seed,
+    )
+    report = run_load(profile, args.base_url, args.username, args.password, headless=not args.headed)
+    print("\n".join(report.format_lines()))
+    print(f"Report written to {report.write()}")
+
+
+if __name__ == "__main__":
+    main()
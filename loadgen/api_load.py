@@ -0,0 +1,307 @@
+"""
+Protocol-level load engine for OrangeHRM's /api/v2/ endpoints.
+A browser virtual user costs a renderer; an API request costs a few
+hundred microseconds of one event loop. This engine replays the endpoints
+the page objects and API tests use, over keep-alive connections, under
+either workload model:
+
+- closed: `concurrency` users, each sending its next request when the
+  previous one answered (throughput follows server speed)
+- open: requests arrive at `rate` per second regardless of how the server
+  keeps up; latency counts from the scheduled arrival, so queueing is not
+  hidden (no coordinated omission)
+
+Usage:
+    python -m loadgen.api_load --model open --rate 2000 --duration 60
+    python -m loadgen.api_load --standin --model closed --concurrency 50   # self-test
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import random
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from playwright.sync_api import sync_playwright
+
+from config import config
+from loadgen.histogram import LatencyHistogram
+from utils.auth import ApiAuthenticator
+from utils.http_pool import API_PREFIX, HttpConnectionPool, HttpError, cookie_header
+
+WORKLOAD_MODELS = ("closed", "open")
+ARRIVAL_PROCESSES = ("poisson", "constant")
+
+
+@dataclass(frozen=True)
+class ApiEndpoint:
+    """One request in the mix; `path` is relative to /api/v2/"""
+    name: str
+    path: str
+    method: str = "GET"
+    weight: float = 1.0
+    body: Optional[dict] = None
+
+
+# Read traffic of the employee list, user admin and leave screens
+DEFAULT_ENDPOINTS: Tuple[ApiEndpoint, ...] = (
+    ApiEndpoint("list employees", "pim/employees?limit=50&offset=0&includeEmployees=onlyCurrent", weight=3),
+    ApiEndpoint("search employees", "pim/employees?nameOrId=a&limit=50&offset=0", weight=2),
+    ApiEndpoint("list users", "admin/users?limit=50&offset=0"),
+    ApiEndpoint("leave types", "leave/leave-types"),
+)
+
+
+@dataclass(frozen=True)
+class ApiLoadProfile:
+    model: str = "closed"
+    concurrency: int = 50           # closed model: simultaneous users
+    rate: float = 500.0             # open model: requests per second (all processes)
+    arrival: str = "poisson"        # open model: inter-arrival distribution
+    duration: float = 30.0
+    connections: int = 100          # keep-alive connections per process
+    max_in_flight: int = 5000       # open model: arrivals beyond this are dropped
+    processes: int = 1
+    endpoints: Tuple[ApiEndpoint, ...] = DEFAULT_ENDPOINTS
+    seed: int = 0
+
+    def __post_init__(self):
+        if self.model not in WORKLOAD_MODELS:
+            raise ValueError(f"Unknown workload model '{self.model}'; expected one of {WORKLOAD_MODELS}")
+        if self.arrival not in ARRIVAL_PROCESSES:
+            raise ValueError(f"Unknown arrival process '{self.arrival}'; expected one of {ARRIVAL_PROCESSES}")
+
+
+@dataclass
+class ApiLoadReport:
+    profile: dict
+    base_url: str
+    duration_s: float
+    endpoints: Dict[str, LatencyHistogram] = field(default_factory=dict)
+    statuses: Dict[str, int] = field(default_factory=dict)
+    errors: Dict[str, int] = field(default_factory=dict)
+    dropped: int = 0
+    connections_opened: int = 0
+
+    @property
+    def requests(self) -> int:
+        return sum(h.count for h in self.endpoints.values())
+
+    @property
+    def throughput(self) -> float:
+        return self.requests / max(self.duration_s, 1e-9)
+
+    def format_lines(self) -> List[str]:
+        lines = [
+            f"{self.profile['model']} model against {self.base_url}: {self.requests} requests in "
+            f"{self.duration_s:.1f}s ({self.throughput:.0f}/s) over {self.connections_opened} connections, "
+            f"{sum(self.errors.values())} errors, {self.dropped} dropped",
+            f"statuses: {' '.join(f'{s}={n}' for s, n in sorted(self.statuses.items()))}",
+            f"{'endpoint':<22}{'count':>8}{'p50':>10}{'p90':>10}{'p99':>10}{'p99.9':>10}{'max':>10}",
+        ]
+        for name, histogram in sorted(self.endpoints.items()):
+            lines.append(
+                f"{name:<22}{histogram.count:>8}"
+                + "".join(f"{histogram.percentile(p):>8.1f}ms" for p in (50, 90, 99, 99.9))
+                + f"{histogram.max_ms or 0:>8.1f}ms"
+            )
+        return lines
+
+    def as_dict(self) -> dict:
+        return {
+            "profile": self.profile,
+            "base_url": self.base_url,
+            "duration_s": self.duration_s,
+            "requests": self.requests,
+            "throughput_rps": self.throughput,
+            "statuses": self.statuses,
+            "errors": self.errors,
+            "dropped": self.dropped,
+            "connections_opened": self.connections_opened,
+            "endpoints": {name: {**h.summary(), "histogram": h.as_dict()} for name, h in self.endpoints.items()},
+        }
+
+    def write(self, results_dir: str = config.LOAD_RESULTS_DIR) -> Path:
+        directory = Path(results_dir)
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f"api-load-{time.strftime('%Y%m%d-%H%M%S')}.json"
+        path.write_text(json.dumps(self.as_dict(), indent=2), encoding="utf-8")
+        return path
+
+
+class ApiLoadEngine:
+    """Runs one process's share of a profile on the current event loop"""
+
+    def __init__(self, pool: HttpConnectionPool, endpoints: Tuple[ApiEndpoint, ...], seed: int = 0):
+        self.pool = pool
+        self.endpoints = endpoints
+        self.weights = [e.weight for e in endpoints]
+        self.rng = random.Random(seed)
+        self.histograms: Dict[str, LatencyHistogram] = {e.name: LatencyHistogram() for e in endpoints}
+        self.statuses: Counter = Counter()
+        self.errors: Counter = Counter()
+        self.dropped = 0
+        self._bodies = {e.name: json.dumps(e.body).encode() if e.body is not None else b"" for e in endpoints}
+
+    async def send(self, endpoint: ApiEndpoint, started: float):
+        """One request; latency counts from `started` (the arrival time)"""
+        try:
+            status, _body = await self.pool.request(endpoint.method, API_PREFIX + endpoint.path, self._bodies[endpoint.name])
+        except (HttpError, OSError, asyncio.TimeoutError, asyncio.IncompleteReadError) as error:
+            self.errors[type(error).__name__] += 1
+            return
+        self.histograms[endpoint.name].record((time.perf_counter() - started) * 1000)
+        self.statuses[str(status)] += 1
+
+    def pick(self) -> ApiEndpoint:
+        return self.rng.choices(self.endpoints, self.weights)[0]
+
+    async def run_closed(self, concurrency: int, duration: float):
+        deadline = time.perf_counter() + duration
+
+        async def user():
+            while time.perf_counter() < deadline:
+                await self.send(self.pick(), time.perf_counter())
+
+        await asyncio.gather(*(user() for _ in range(concurrency)))
+
+    async def run_open(self, rate: float, duration: float, arrival: str, max_in_flight: int):
+        loop = asyncio.get_running_loop()
+        start = time.perf_counter()
+        in_flight: set = set()
+        next_arrival = start
+        while next_arrival < start + duration:
+            delay = next_arrival - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)  # allow-sleep: open-model arrival schedule
+            if len(in_flight) >= max_in_flight:
+                self.dropped += 1
+            else:
+                task = loop.create_task(self.send(self.pick(), next_arrival))
+                in_flight.add(task)
+                task.add_done_callback(in_flight.discard)
+            next_arrival += self.rng.expovariate(rate) if arrival == "poisson" else 1 / rate
+        if in_flight:
+            await asyncio.gather(*in_flight)
+
+
+def bootstrap_cookie_header(base_url: str, username: Optional[str] = None, password: Optional[str] = None) -> str:
+    """Log in once through the framework's API authenticator; returns a Cookie header"""
+    with sync_playwright() as playwright:
+        return cookie_header(ApiAuthenticator(playwright, base_url, username, password).login())
+
+
+def run_api_load(
+    profile: ApiLoadProfile, base_url: Optional[str] = None, username: Optional[str] = None,
+    password: Optional[str] = None, cookie: Optional[str] = None,
+) -> ApiLoadReport:
+    """
+    Run the profile over `processes` event loops and merge the results.
+    Without a `cookie` header, logs in first (needs no running Playwright).
+    """
+    base_url = (base_url or config.get_base_url()).rstrip("/")
+    cookie = cookie or bootstrap_cookie_header(base_url, username, password)
+    processes = max(1, profile.processes)
+    if processes == 1:
+        # A thread of its own: the caller may already run an event loop (e.g. sync Playwright)
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            results = [pool.submit(_process_main, profile, 0, base_url, cookie).result()]
+    else:
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=processes, mp_context=context) as pool:
+            futures = [pool.submit(_process_main, profile, index, base_url, cookie) for index in range(processes)]
+            results = [future.result() for future in futures]
+
+    report = ApiLoadReport(
+        profile={**asdict(profile), "endpoints": [asdict(e) for e in profile.endpoints]},
+        base_url=base_url,
+        # Slowest process, excluding process start-up
+        duration_s=max(result["elapsed_s"] for result in results),
+    )
+    statuses: Counter = Counter()
+    errors: Counter = Counter()
+    for result in results:
+        statuses.update(result["statuses"])
+        errors.update(result["errors"])
+        report.dropped += result["dropped"]
+        report.connections_opened += result["connections_opened"]
+        for name, data in result["histograms"].items():
+            histogram = LatencyHistogram.from_dict(data)
+            if name in report.endpoints:
+                report.endpoints[name].merge(histogram)
+            else:
+                report.endpoints[name] = histogram
+    report.statuses, report.errors = dict(statuses), dict(errors)
+    return report
+
+
+def _process_main(profile: ApiLoadProfile, index: int, base_url: str, cookie: str) -> dict:
+    return asyncio.run(_run_engine(profile, index, base_url, cookie))
+
+
+async def _run_engine(profile: ApiLoadProfile, index: int, base_url: str, cookie: str) -> dict:
+    """One process's share: concurrency and rate are split across processes"""
+    processes = max(1, profile.processes)
+    pool = HttpConnectionPool(base_url, size=profile.connections, headers={"Cookie": cookie})
+    engine = ApiLoadEngine(pool, profile.endpoints, seed=profile.seed * 1009 + index)
+    start = time.perf_counter()
+    try:
+        if profile.model == "closed":
+            share = profile.concurrency // processes + (1 if index < profile.concurrency % processes else 0)
+            await engine.run_closed(share, profile.duration)
+        else:
+            await engine.run_open(profile.rate / processes, profile.duration, profile.arrival, profile.max_in_flight)
+    finally:
+        await pool.close()
+    return {
+        "histograms": {name: h.as_dict() for name, h in engine.histograms.items() if h.count},
+        "statuses": dict(engine.statuses),
+        "errors": dict(engine.errors),
+        "dropped": engine.dropped,
+        "connections_opened": pool.opened,
+        "elapsed_s": time.perf_counter() - start,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Protocol-level load test of OrangeHRM's /api/v2/ endpoints")
+    parser.add_argument("--model", choices=WORKLOAD_MODELS, default="closed")
+    parser.add_argument("--concurrency", type=int, default=50, help="closed model: simultaneous users")
+    parser.add_argument("--rate", type=float, default=500, help="open model: requests per second")
+    parser.add_argument("--arrival", choices=ARRIVAL_PROCESSES, default="poisson")
+    parser.add_argument("--duration", type=float, default=30, help="seconds")
+    parser.add_argument("--connections", type=int, default=100, help="keep-alive connections per process")
+    parser.add_argument("--processes", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--base-url", default=None, help=f"defaults to the {config.ENV} environment's URL")
+    parser.add_argument("--username", default=None)
+    parser.add_argument("--password", default=None)
+    parser.add_argument("--standin", action="store_true", help="target a fresh in-process stand-in server")
+    args = parser.parse_args()
+
+    profile = ApiLoadProfile(
+        model=args.model, concurrency=args.concurrency, rate=args.rate, arrival=args.arrival,
+        duration=args.duration, connections=args.connections, processes=args.processes, seed=args.seed,
+    )
+    server = None
+    base_url = args.base_url
+    if args.standin:
+        from standin import StandinApp, StandinServer
+        server = StandinServer(StandinApp())
+        base_url = server.start()
+    try:
+        report = run_api_load(profile, base_url, args.username, args.password)
+    finally:
+        if server:
+            server.stop()
+    print("\n".join(report.format_lines()))
+    print(f"Report written to {report.write()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+Virtual-user flows built on the async page objects (pages.aio), so every
+user in a process shares one event loop and the actions wait on the same
+/api/v2/ responses as in the functional tests.
+"""
+import asyncio
+import random
+import time
+from collections import Counter
+from contextlib import asynccontextmanager
+from datetime import date, timedelta
+from typing import AsyncIterator, Awaitable, Callable, Dict
+
+from playwright.async_api import Page
+
+from config import config
+from loadgen.histogram import LatencyHistogram
+from loadgen.profile import ThinkTime
+from pages.aio import DashboardPage, LeavePage, LoginPage, PimPage
+from utils.api_waits import endpoint_matcher
+
+# Name fragments that match several demo/stand-in employees
+SEARCH_TERMS = ("a", "e", "Peter", "Linda", "John", "Rebecca")
+
+
+class VirtualUser:
+    """One simulated user: a page, its random stream and the step recorders"""
+
+    def __init__(
+        self,
+        index: int,
+        page: Page,
+        think_time: ThinkTime,
+        histograms: Dict[str, LatencyHistogram],
+        errors: Counter,
+        seed: int = 0,
+    ):
+        self.index = index
+        self.page = page
+        self.think_time = think_time
+        self.histograms = histograms
+        self.errors = errors
+        self.rng = random.Random(seed * 100003 + index)
+
+    @asynccontextmanager
+    async def step(self, name: str) -> AsyncIterator[None]:
+        """Record the block's latency under `name`; failures count as errors"""
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            self.errors[name] += 1
+            raise
+        latency_ms = (time.perf_counter() - start) * 1000
+        self.histograms.setdefault(name, LatencyHistogram()).record(latency_ms)
+
+    async def think(self):
+        await asyncio.sleep(self.think_time.sample(self.rng))  # allow-sleep: user think time
+
+    def url(self, path: str) -> str:
+        return f"{config.get_base_url()}/{path}"
+
+
+# ---------- Session ----------
+
+async def login(vu: VirtualUser, username: str, password: str):
+    login_page = LoginPage(vu.page)
+    async with vu.step("open login"):
+        await login_page.navigate()
+    await vu.think()
+    async with vu.step("login"):
+        await login_page.login(username, password)
+        await vu.page.wait_for_url("**/dashboard/**")
+
+
+async def logout(vu: VirtualUser):
+    dashboard = DashboardPage(vu.page)
+    async with vu.step("logout"):
+        await dashboard.logout()
+        await vu.page.wait_for_url("**/auth/login")
+
+
+# ---------- Flows ----------
+
+async def browse_employees(vu: VirtualUser):
+    """Open the employee list and search it by name"""
+    pim = PimPage(vu.page)
+    async with vu.step("open employee list"):
+        async with vu.page.expect_response(endpoint_matcher("pim/employees")):
+            await pim.navigate()
+    await vu.think()
+    async with vu.step("search employee"):
+        await pim.search_employee_by_name(vu.rng.choice(SEARCH_TERMS))
+
+
+async def leave_list(vu: VirtualUser):
+    """Open the leave list and filter it by a date range"""
+    leave = LeavePage(vu.page)
+    async with vu.step("open leave list"):
+        async with vu.page.expect_response(endpoint_matcher("leave/employees/leave-requests")):
+            await leave.navigate()
+    await vu.think()
+    start = date.today() - timedelta(days=vu.rng.randint(0, 180))
+    async with vu.step("search leave"):
+        await leave.search_leave_by_date(start.isoformat(), (start + timedelta(days=30)).isoformat())
+
+
+async def dashboard(vu: VirtualUser):
+    """Open the dashboard and wait until its widgets rendered"""
+    page = DashboardPage(vu.page)
+    async with vu.step("open dashboard"):
+        await page.navigate()
+        await page.quick_launch_widget.wait_for()
+        await page.my_actions_widget.wait_for()
+
+
+FLOWS: Dict[str, Callable[[VirtualUser], Awaitable[None]]] = {
+    "browse_employees": browse_employees,
+    "leave_list": leave_list,
+    "dashboard": dashboard,
+}
@@ -0,0 +1,100 @@
+"""
+Mergeable latency histogram with constant relative precision.
+Buckets grow geometrically, so 1ms and 60s latencies are both resolved to
+within ~1% while the histogram stays a small dict of counts that processes
+can ship to each other and add together (the HDR histogram idea).
+"""
+import math
+from typing import Dict, Optional
+
+
+class LatencyHistogram:
+    """
+    Latencies in milliseconds, bucketed to `precision` relative error.
+
+    Usage:
+        histogram = LatencyHistogram()
+        histogram.record(12.7)
+        histogram.percentile(99)
+        histogram.merge(LatencyHistogram.from_dict(other.as_dict()))
+    """
+
+    # Values below this (ms) share the first bucket
+    FLOOR_MS = 0.01
+
+    def __init__(self, precision: float = 0.01):
+        self.precision = precision
+        self._log_base = math.log1p(precision)
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.total_ms = 0.0
+        self.min_ms: Optional[float] = None
+        self.max_ms: Optional[float] = None
+
+    def record(self, value_ms: float, count: int = 1):
+        bucket = math.ceil(math.log(max(value_ms, self.FLOOR_MS) / self.FLOOR_MS) / self._log_base)
+        self.counts[bucket] = self.counts.get(bucket, 0) + count
+        self.count += count
+        self.total_ms += value_ms * count
+        self.min_ms = value_ms if self.min_ms is None else min(self.min_ms, value_ms)
+        self.max_ms = value_ms if self.max_ms is None else max(self.max_ms, value_ms)
+
+    def percentile(self, percentile: float) -> float:
+        """Upper edge of the bucket holding the percentile (0 when empty)"""
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(self.count * percentile / 100))
+        seen = 0
+        for bucket in sorted(self.counts):
+            seen += self.counts[bucket]
+            if seen >= rank:
+                return min(self.FLOOR_MS * (1 + self.precision) ** bucket, self.max_ms)
+        return self.max_ms
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.count if self.count else 0.0
+
+    def merge(self, other: "LatencyHistogram"):
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge histograms of different precision")
+        for bucket, count in other.counts.items():
+            self.counts[bucket] = self.counts.get(bucket, 0) + count
+        self.count += other.count
+        self.total_ms += other.total_ms
+        for value in (other.min_ms, other.max_ms):
+            if value is not None:
+                self.min_ms = value if self.min_ms is None else min(self.min_ms, value)
+                self.max_ms = value if self.max_ms is None else max(self.max_ms, value)
+
+    def summary(self) -> dict:
+        return {
+            "count": self.count,
+            "mean_ms": round(self.mean_ms, 2),
+            "min_ms": round(self.min_ms or 0.0, 2),
+            "p50_ms": round(self.percentile(50), 2),
+            "p90_ms": round(self.percentile(90), 2),
+            "p99_ms": round(self.percentile(99), 2),
+            "max_ms": round(self.max_ms or 0.0, 2),
+        }
+
+    # ---------- Serialization (between processes, into reports) ----------
+    def as_dict(self) -> dict:
+        return {
+            "precision": self.precision,
+            "counts": {str(bucket): count for bucket, count in self.counts.items()},
+            "count": self.count,
+            "total_ms": self.total_ms,
+            "min_ms": self.min_ms,
+            "max_ms": self.max_ms,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "LatencyHistogram":
+        histogram = cls(data["precision"])
+        histogram.counts = {int(bucket): count for bucket, count in data["counts"].items()}
+        histogram.count = data["count"]
+        histogram.total_ms = data["total_ms"]
+        histogram.min_ms = data["min_ms"]
+        histogram.max_ms = data["max_ms"]
+        return histogram
@@ -0,0 +1,78 @@
+"""
+Load shape and think-time settings for a virtual-user run.
+"""
+import math
+import random
+from dataclasses import dataclass, field
+from typing import Dict, Tuple
+
+THINK_TIME_DISTRIBUTIONS = ("none", "constant", "uniform", "exponential", "lognormal")
+
+
+@dataclass(frozen=True)
+class ThinkTime:
+    """
+    Pause between a virtual user's steps, in seconds.
+
+    Parsed from "<distribution>:<params>":
+        none                  no pause
+        constant:2            always 2s
+        uniform:1,5           between 1s and 5s
+        exponential:3         mean 3s (Poisson arrivals of actions)
+        lognormal:3,0.5       median 3s, sigma 0.5 (long-tailed, like real users)
+    """
+    distribution: str = "lognormal"
+    params: Tuple[float, ...] = (3.0, 0.5)
+
+    @classmethod
+    def parse(cls, spec: str) -> "ThinkTime":
+        name, _, raw = spec.partition(":")
+        if name not in THINK_TIME_DISTRIBUTIONS:
+            raise ValueError(f"Unknown think-time distribution '{name}'; expected one of {THINK_TIME_DISTRIBUTIONS}")
+        params = tuple(float(p) for p in raw.split(",") if p)
+        expected = {"none": 0, "constant": 1, "uniform": 2, "exponential": 1, "lognormal": 2}[name]
+        if len(params) != expected:
+            raise ValueError(f"Think time '{name}' takes {expected} parameter(s), got '{spec}'")
+        return cls(name, params)
+
+    def sample(self, rng: random.Random) -> float:
+        if self.distribution == "constant":
+            return self.params[0]
+        if self.distribution == "uniform":
+            return rng.uniform(*self.params)
+        if self.distribution == "exponential":
+            return rng.expovariate(1 / self.params[0])
+        if self.distribution == "lognormal":
+            median, sigma = self.params
+            return rng.lognormvariate(math.log(median), sigma)
+        return 0.0
+
+    def __str__(self) -> str:
+        return ":".join((self.distribution, ",".join(f"{p:g}" for p in self.params))).rstrip(":")
+
+
+@dataclass(frozen=True)
+class LoadProfile:
+    """
+    Users start evenly over `ramp_up` seconds, all run for `hold` seconds,
+    then stop evenly over `ramp_down` seconds (last started, first stopped).
+    Each user repeatedly picks a flow by weight until its stop time.
+    """
+    users: int = 10
+    processes: int = 1
+    ramp_up: float = 30.0
+    hold: float = 60.0
+    ramp_down: float = 10.0
+    think_time: ThinkTime = ThinkTime()
+    flows: Dict[str, float] = field(default_factory=lambda: {"browse_employees": 3, "leave_list": 1})
+    seed: int = 0
+
+    def start_offset(self, user: int) -> float:
+        return self.ramp_up * user / self.users
+
+    def stop_offset(self, user: int) -> float:
+        return self.ramp_up + self.hold + self.ramp_down * (self.users - 1 - user) / max(self.users, 1)
+
+    @property
+    def duration(self) -> float:
+        return self.ramp_up + self.hold + self.ramp_down
@@ -0,0 +1,170 @@
+"""
+Runs a LoadProfile as concurrent virtual users.
+Users are spread over worker processes (one browser each, so rendering
+scales across cores); inside a process every user is an asyncio task with
+its own browser context. Per-step histograms from all processes are merged
+into one report.
+"""
+import asyncio
+import json
+import multiprocessing
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from playwright.async_api import Browser, async_playwright
+
+from config import config
+from loadgen.flows import FLOWS, VirtualUser, login, logout
+from loadgen.histogram import LatencyHistogram
+from loadgen.profile import LoadProfile
+from pages.aio import DashboardPage
+
+# Seconds between starting the worker processes and the first user starting,
+# so every process shares the same schedule after launching its browser
+_START_DELAY = 5.0
+
+
+@dataclass
+class LoadReport:
+    """Merged outcome of a run"""
+    profile: dict
+    base_url: str
+    duration_s: float
+    iterations: int
+    steps: Dict[str, LatencyHistogram] = field(default_factory=dict)
+    errors: Dict[str, int] = field(default_factory=dict)
+    failed_users: int = 0
+
+    def format_lines(self) -> List[str]:
+        lines = [
+            f"{self.profile['users']} users x {self.profile['processes']} processes against {self.base_url}: "
+            f"{self.iterations} flow iterations in {self.duration_s:.0f}s "
+            f"({self.iterations / max(self.duration_s, 1e-9):.2f}/s), {self.failed_users} users aborted",
+            f"{'step':<22}{'count':>8}{'errors':>8}{'p50':>10}{'p90':>10}{'p99':>10}{'max':>10}",
+        ]
+        for name, histogram in sorted(self.steps.items()):
+            s = histogram.summary()
+            lines.append(
+                f"{name:<22}{s['count']:>8}{self.errors.get(name, 0):>8}"
+                f"{s['p50_ms']:>8.0f}ms{s['p90_ms']:>8.0f}ms{s['p99_ms']:>8.0f}ms{s['max_ms']:>8.0f}ms"
+            )
+        return lines
+
+    def as_dict(self) -> dict:
+        return {
+            "profile": self.profile,
+            "base_url": self.base_url,
+            "duration_s": self.duration_s,
+            "iterations": self.iterations,
+            "failed_users": self.failed_users,
+            "errors": self.errors,
+            "steps": {name: {**h.summary(), "histogram": h.as_dict()} for name, h in self.steps.items()},
+        }
+
+    def write(self, results_dir: str = config.LOAD_RESULTS_DIR) -> Path:
+        directory = Path(results_dir)
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f"load-{time.strftime('%Y%m%d-%H%M%S')}.json"
+        path.write_text(json.dumps(self.as_dict(), indent=2), encoding="utf-8")
+        return path
+
+
+def run_load(
+    profile: LoadProfile, base_url: Optional[str] = None, username: Optional[str] = None,
+    password: Optional[str] = None, headless: bool = config.HEADLESS,
+) -> LoadReport:
+    """Run the profile to completion and return the merged report"""
+    unknown = set(profile.flows) - set(FLOWS)
+    if unknown:
+        raise ValueError(f"Unknown flows {sorted(unknown)}; expected some of {sorted(FLOWS)}")
+    base_url = base_url or config.get_base_url()
+    credentials = (username or config.get_username(), password or config.get_password())
+    start_at = time.time() + _START_DELAY
+    processes = max(1, min(profile.processes, profile.users))
+    assignments = [list(range(p, profile.users, processes)) for p in range(processes)]
+
+    # spawn: each worker starts its own Playwright driver from a clean interpreter
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=processes, mp_context=context) as pool:
+        futures = [
+            pool.submit(_process_main, profile, users, start_at, base_url, credentials, headless)
+            for users in assignments
+        ]
+        results = [future.result() for future in futures]
+
+    report = LoadReport(
+        profile={**asdict(profile), "think_time": str(profile.think_time)},
+        base_url=base_url,
+        duration_s=time.time() - start_at,
+        iterations=0,
+    )
+    errors: Counter = Counter()
+    for result in results:
+        report.iterations += result["iterations"]
+        report.failed_users += result["failed_users"]
+        errors.update(result["errors"])
+        for name, data in result["steps"].items():
+            histogram = LatencyHistogram.from_dict(data)
+            if name in report.steps:
+                report.steps[name].merge(histogram)
+            else:
+                report.steps[name] = histogram
+    report.errors = dict(errors)
+    return report
+
+
+def _process_main(profile, users, start_at, base_url, credentials, headless) -> dict:
+    """Worker process entry point: a browser hosting this process's users"""
+    config.BASE_URLS[config.ENV] = base_url
+    return asyncio.run(_run_users(profile, users, start_at, credentials, headless))
+
+
+async def _run_users(profile: LoadProfile, users: List[int], start_at: float, credentials, headless: bool) -> dict:
+    histograms: Dict[str, LatencyHistogram] = {}
+    errors: Counter = Counter()
+    async with async_playwright() as playwright:
+        browser = await getattr(playwright, config.BROWSER).launch(headless=headless)
+        outcomes = await asyncio.gather(
+            *(_virtual_user(browser, profile, user, start_at, credentials, histograms, errors) for user in users),
+            return_exceptions=True,
+        )
+        await browser.close()
+    return {
+        "iterations": sum(o for o in outcomes if isinstance(o, int)),
+        "failed_users": sum(1 for o in outcomes if isinstance(o, BaseException)),
+        "errors": dict(errors),
+        "steps": {name: h.as_dict() for name, h in histograms.items()},
+    }
+
+
+async def _virtual_user(
+    browser: Browser, profile: LoadProfile, index: int, start_at: float, credentials,
+    histograms: Dict[str, LatencyHistogram], errors: Counter,
+) -> int:
+    """One user's session; returns the number of completed flow iterations"""
+    await asyncio.sleep(max(0.0, start_at + profile.start_offset(index) - time.time()))  # allow-sleep: ramp-up offset
+    stop_at = start_at + profile.stop_offset(index)
+    context = await browser.new_context(viewport={"width": 1920, "height": 1080})
+    page = await context.new_page()
+    page.set_default_timeout(config.DEFAULT_TIMEOUT)
+    vu = VirtualUser(index, page, profile.think_time, histograms, errors, profile.seed)
+    names, weights = zip(*profile.flows.items())
+    iterations = 0
+    try:
+        await login(vu, *credentials)
+        while time.time() < stop_at:
+            await vu.think()
+            try:
+                await FLOWS[vu.rng.choices(names, weights)[0]](vu)
+                iterations += 1
+            except Exception:
+                # Counted by the failing step; start over from a known page
+                await page.goto(vu.url(DashboardPage.path))
+        await logout(vu)
+    finally:
+        await context.close()
+    return iterations
@@ -2,126 +2,50 @@
 Admin Page Object - handles user management.
 Admin module manages system users, job titles, locations, etc.
 """
-from playwright.sync_api import Page
-from pages.base_page import BasePage
+from pages.base_page import BaseLocators, BasePage
+from utils.api_waits import expects_api
+from utils.locators import by_role, css, param
 
 
-class AdminPage(BasePage):
-    """Admin page object for OrangeHRM"""
+class AdminPageLocators(BaseLocators):
+    """Admin page locators, shared with pages.aio.AdminPage"""
 
-    def __init__(self, page: Page):
-        super().__init__(page)
-        self.path = "web/index.php/admin/viewSystemUsers"
-        self.add_user_path = "web/index.php/admin/saveSystemUser"
+    path = "web/index.php/admin/viewSystemUsers"
+    add_user_path = "web/index.php/admin/saveSystemUser"
 
     # ---------- Locators ----------
-    @property
-    def admin_menu_link(self):
-        """Admin menu link"""
-        return self.page.get_by_role("link", name="Admin")
-
-    @property
-    def add_button(self):
-        """Add user button"""
-        return self.page.get_by_role("button", name="Add")
+    admin_menu_link = by_role("link", name="Admin")
+    add_button = by_role("button", name="Add")
 
     # User Form Fields
-    @property
-    def user_role_dropdown(self):
-        """User role dropdown"""
-        return self.page.locator('label:text("User Role")').locator('..').locator('.oxd-select-text-input')
-
-    @property
-    def employee_name_input(self):
-        """Employee name autocomplete input"""
-        return self.page.locator('label:text("Employee Name")').locator('..').locator('input')
-
-    @property
-    def status_dropdown(self):
-        """Status dropdown"""
-        return self.page.locator('label:text("Status")').locator('..').locator('.oxd-select-text-input')
-
-    @property
-    def username_input(self):
-        """Username input field"""
-        return self.page.locator('label:text("Username")').locator('..').locator('input').nth(0)
-
-    @property
-    def password_input(self):
-        """Password input field"""
-        return self.page.locator('label:text("Password")').locator('..').locator('input').nth(0)
-
-    @property
-    def confirm_password_input(self):
-        """Confirm password input field"""
-        return self.page.locator('label:text("Confirm Password")').locator('..').locator('input').nth(0)
-
-    @property
-    def save_button(self):
-        """Save button"""
-        return self.page.get_by_role("button", name="Save")
-
-    @property
-    def cancel_button(self):
-        """Cancel button"""
-        return self.page.get_by_role("button", name="Cancel")
+    user_role_dropdown = css('label:text("User Role")').parent.locator('.oxd-select-text-input')
+    employee_name_input = css('label:text("Employee Name")').parent.locator('input')  # autocomplete
+    status_dropdown = css('label:text("Status")').parent.locator('.oxd-select-text-input')
+    username_input = css('label:text("Username")').parent.locator('input').nth(0)
+    password_input = css('label:text("Password")').parent.locator('input').nth(0)
+    confirm_password_input = css('label:text("Confirm Password")').parent.locator('input').nth(0)
+    save_button = by_role("button", name="Save")
+    cancel_button = by_role("button", name="Cancel")
 
     # Search and Table
-    @property
-    def username_search_input(self):
-        """Username search input"""
-        return self.page.locator('label:text("Username")').locator('..').locator('input')
-
-    @property
-    def user_role_search_dropdown(self):
-        """User role search dropdown"""
-        return self.page.locator('.oxd-form').locator('.oxd-select-text-input').first
-
-    @property
-    def employee_name_search_input(self):
-        """Employee name search input"""
-        return self.page.locator('input[placeholder*="Type for hints"]').first
-
-    @property
-    def status_search_dropdown(self):
-        """Status search dropdown"""
-        return self.page.locator('.oxd-form').locator('.oxd-select-text-input').nth(1)
-
-    @property
-    def search_button(self):
-        """Search button"""
-        return self.page.get_by_role("button", name="Search")
-
-    @property
-    def reset_button(self):
-        """Reset button"""
-        return self.page.get_by_role("button", name="Reset")
-
-    @property
-    def users_table(self):
-        """Users table"""
-        return self.page.locator('.oxd-table-body')
-
-    @property
-    def users_table_rows(self):
-        """User table rows"""
-        return self.page.locator('.oxd-table-card')
-
-    @property
-    def delete_button(self):
-        """Delete selected button"""
-        return self.page.get_by_role("button", name="Delete Selected")
-
-    @property
-    def confirm_delete_button(self):
-        """Confirm delete button"""
-        return self.page.get_by_role("button", name="Yes, Delete")
+    username_search_input = css('label:text("Username")').parent.locator('input')
+    user_role_search_dropdown = css('.oxd-form').locator('.oxd-select-text-input').first
+    employee_name_search_input = css('input[placeholder*="Type for hints"]').first
+    status_search_dropdown = css('.oxd-form').locator('.oxd-select-text-input').nth(1)
+    search_button = by_role("button", name="Search")
+    reset_button = by_role("button", name="Reset")
+    users_table = css('.oxd-table-body')
+    users_table_rows = css('.oxd-table-card')
+    user_checkbox = users_table_rows.nth(param("row_index")).locator('.oxd-checkbox-input')
+    delete_button = by_role("button", name="Delete Selected")
+    confirm_delete_button = by_role("button", name="Yes, Delete")
 
     # Error messages
-    @property
-    def required_error(self):
-        """Required field error"""
-        return self.page.locator('.oxd-input-field-error-message').first
+    required_error = css('.oxd-input-field-error-message').first
+
+
+class AdminPage(AdminPageLocators, BasePage):
+    """Admin page object for OrangeHRM"""
 
     # ---------- Actions ----------
     def navigate(self):
@@ -135,18 +59,16 @@ class AdminPage(BasePage):
     def select_user_role(self, role: str):
         """Select user role from dropdown (Admin or ESS)"""
         self.user_role_dropdown.click()
-        self.page.get_by_role("option", name=role).click()
+        self.dropdown_option(role).click()
 
     def enter_employee_name(self, name: str):
         """Enter employee name and select from autocomplete"""
-        self.employee_name_input.fill(name)
-        self.page.wait_for_timeout(1000)  # Wait for autocomplete
-        self.page.get_by_role("option").first.click()
+        self.select_autocomplete(self.employee_name_input, name, "pim/employees")
 
     def select_status(self, status: str):
         """Select status from dropdown (Enabled or Disabled)"""
         self.status_dropdown.click()
-        self.page.get_by_role("option", name=status).click()
+        self.dropdown_option(status).click()
 
     def enter_username(self, username: str):
         """Enter username"""
@@ -164,6 +86,7 @@ class AdminPage(BasePage):
         """Click save button"""
         self.save_button.click()
 
+    @expects_api("admin/users", method="POST", creates="user")
     def add_user(self, role: str, employee_name: str, status: str, username: str, password: str):
         """Add a new user with all required fields"""
         self.select_user_role(role)
@@ -174,19 +97,22 @@ class AdminPage(BasePage):
         self.enter_confirm_password(password)
         self.click_save()
 
+    @expects_api("admin/users")
     def search_user_by_username(self, username: str):
         """Search for a user by username"""
         self.username_search_input.fill(username)
         self.search_button.click()
 
+    @expects_api("admin/users")
     def reset_search(self):
         """Reset search filters"""
         self.reset_button.click()
 
     def select_user_checkbox(self, row_index: int = 0):
         """Select user checkbox by row index"""
-        self.users_table_rows.nth(row_index).locator('.oxd-checkbox-input').click()
+        self.user_checkbox(row_index).click()
 
+    @expects_api("admin/users", method="DELETE", removes="user")
     def delete_selected_user(self):
         """Delete selected user"""
         self.delete_button.click()
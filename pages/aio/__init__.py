@@ -0,0 +1,23 @@
+"""
+Async Page Object Models for OrangeHRM (playwright.async_api).
+Each class reuses its sync counterpart's locators; only actions differ.
+"""
+from .base_page import BasePage
+from .login_page import LoginPage
+from .dashboard_page import DashboardPage
+from .pim_page import PimPage
+from .admin_page import AdminPage
+from .leave_page import LeavePage
+from .time_page import TimePage
+from .myinfo_page import MyInfoPage
+
+__all__ = [
+    "BasePage",
+    "LoginPage",
+    "DashboardPage",
+    "PimPage",
+    "AdminPage",
+    "LeavePage",
+    "TimePage",
+    "MyInfoPage",
+]
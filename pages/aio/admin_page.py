@@ -0,0 +1,90 @@
+"""
+Async Admin Page Object.
+Locators are shared with pages.admin_page.
+"""
+from pages.admin_page import AdminPageLocators
+from pages.aio.base_page import BasePage
+from utils.api_waits import expects_api
+
+
+class AdminPage(AdminPageLocators, BasePage):
+    """Async admin page object for OrangeHRM"""
+
+    # ---------- Actions ----------
+    async def navigate(self):
+        """Navigate to admin page"""
+        await self.navigate_to(self.path)
+
+    async def click_add_user(self):
+        """Click add user button"""
+        await self.add_button.click()
+
+    async def select_user_role(self, role: str):
+        """Select user role from dropdown (Admin or ESS)"""
+        await self.user_role_dropdown.click()
+        await self.dropdown_option(role).click()
+
+    async def enter_employee_name(self, name: str):
+        """Enter employee name and select from autocomplete"""
+        await self.select_autocomplete(self.employee_name_input, name, "pim/employees")
+
+    async def select_status(self, status: str):
+        """Select status from dropdown (Enabled or Disabled)"""
+        await self.status_dropdown.click()
+        await self.dropdown_option(status).click()
+
+    async def enter_username(self, username: str):
+        """Enter username"""
+        await self.username_input.fill(username)
+
+    async def enter_password(self, password: str):
+        """Enter password"""
+        await self.password_input.fill(password)
+
+    async def enter_confirm_password(self, password: str):
+        """Enter confirm password"""
+        await self.confirm_password_input.fill(password)
+
+    async def click_save(self):
+        """Click save button"""
+        await self.save_button.click()
+
+    @expects_api("admin/users", method="POST", creates="user")
+    async def add_user(self, role: str, employee_name: str, status: str, username: str, password: str):
+        """Add a new user with all required fields"""
+        await self.select_user_role(role)
+        await self.enter_employee_name(employee_name)
+        await self.select_status(status)
+        await self.enter_username(username)
+        await self.enter_password(password)
+        await self.enter_confirm_password(password)
+        await self.click_save()
+
+    @expects_api("admin/users")
+    async def search_user_by_username(self, username: str):
+        """Search for a user by username"""
+        await self.username_search_input.fill(username)
+        await self.search_button.click()
+
+    @expects_api("admin/users")
+    async def reset_search(self):
+        """Reset search filters"""
+        await self.reset_button.click()
+
+    async def select_user_checkbox(self, row_index: int = 0):
+        """Select user checkbox by row index"""
+        await self.user_checkbox(row_index).click()
+
+    @expects_api("admin/users", method="DELETE", removes="user")
+    async def delete_selected_user(self):
+        """Delete selected user"""
+        await self.delete_button.click()
+        await self.confirm_delete_button.click()
+
+    async def get_user_count(self) -> int:
+        """Get number of users in table"""
+        return await self.users_table_rows.count()
+
+    async def user_exists_in_table(self, username: str) -> bool:
+        """Check if username exists in table"""
+        return username in await self.users_table.text_content()
@@ -0,0 +1,53 @@
+"""
+Async Base Page class that all async page objects inherit from.
+Locators come from pages.base_page; the actions here are awaited, so many
+independent flows can share one event loop and one browser.
+"""
+from typing import Optional
+
+from playwright.async_api import Locator
+from config import config
+from pages.base_page import BaseLocators
+from utils.api_waits import api_waits
+
+
+class BasePage(BaseLocators):
+    """Base class for all async page objects"""
+
+    # Common actions
+    async def navigate_to(self, path: str = ""):
+        """Navigate to a specific path"""
+        url = f"{self.base_url}/{path}" if path else self.base_url
+        await self.page.goto(url)
+
+    async def logout(self):
+        """Logout from application"""
+        await self.user_dropdown.click()
+        await self.logout_link.click()
+
+    async def wait_for_page_load(self, state: str = "domcontentloaded"):
+        """Wait for page to load"""
+        await self.page.wait_for_load_state(state)
+
+    async def wait_for_network_idle(self):
+        """Wait until no API call is in flight and the UI has re-rendered"""
+        await api_waits.wait_for_api_idle_async(self.page)
+
+    async def select_autocomplete(self, input_locator: Locator, text: str, endpoint: str, option: Optional[str] = None):
+        """Type into an autocomplete and pick a suggestion (see pages.BasePage.select_autocomplete)"""
+        timeout = config.AUTOCOMPLETE_DEBOUNCE_MS + config.ACTION_TIMEOUT
+        async with api_waits.expect_api_async(self.page, endpoint, timeout=timeout):
+            await input_locator.fill(text)
+        await self.autocomplete_options(option).first.click()
+
+    async def get_success_toast_text(self) -> str:
+        """Get success toast message text"""
+        return await self.success_toast.text_content()
+
+    async def get_error_toast_text(self) -> str:
+        """Get error toast message text"""
+        return await self.error_toast.text_content()
+
+    async def click_menu_item(self, menu_name: str):
+        """Click a main menu item by name"""
+        await self.menu_item(menu_name).click()
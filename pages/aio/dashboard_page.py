@@ -0,0 +1,47 @@
+"""
+Async Dashboard Page Object.
+Locators are shared with pages.dashboard_page.
+"""
+from pages.aio.base_page import BasePage
+from pages.dashboard_page import DashboardPageLocators
+
+
+class DashboardPage(DashboardPageLocators, BasePage):
+    """Async dashboard page object for OrangeHRM"""
+
+    # ---------- Actions ----------
+    async def navigate(self):
+        """Navigate to dashboard"""
+        await self.navigate_to(self.path)
+
+    async def click_assign_leave(self):
+        """Click Assign Leave quick action"""
+        await self.leave_quick_launch_button.click()
+
+    async def click_leave_list(self):
+        """Click Leave List quick action"""
+        await self.leave_list_quick_launch_button.click()
+
+    async def click_timesheets(self):
+        """Click Timesheets quick action"""
+        await self.timesheets_quick_launch_button.click()
+
+    async def click_apply_leave(self):
+        """Click Apply Leave quick action"""
+        await self.apply_leave_quick_launch_button.click()
+
+    async def click_my_leave(self):
+        """Click My Leave quick action"""
+        await self.my_leave_quick_launch_button.click()
+
+    async def click_my_timesheet(self):
+        """Click My Timesheet quick action"""
+        await self.my_timesheet_quick_launch_button.click()
+
+    async def is_page_loaded(self) -> bool:
+        """Check if dashboard is loaded"""
+        return await self.dashboard_title.is_visible()
+
+    async def get_widget_count(self) -> int:
+        """Count number of widgets on dashboard"""
+        return await self.widgets.count()
@@ -0,0 +1,92 @@
+"""
+Async Leave Page Object.
+Locators are shared with pages.leave_page.
+"""
+from pages.aio.base_page import BasePage
+from pages.leave_page import LeavePageLocators
+from utils.api_waits import expects_api
+
+
+class LeavePage(LeavePageLocators, BasePage):
+    """Async leave page object for OrangeHRM"""
+
+    # ---------- Actions ----------
+    async def navigate(self):
+        """Navigate to leave list"""
+        await self.navigate_to(self.path)
+
+    async def navigate_to_apply_leave(self):
+        """Navigate to apply leave page"""
+        await self.click_menu_item("Leave")
+        await self.apply_link.click()
+
+    async def navigate_to_my_leave(self):
+        """Navigate to my leave page"""
+        await self.click_menu_item("Leave")
+        await self.my_leave_link.click()
+
+    async def navigate_to_leave_list(self):
+        """Navigate to leave list page"""
+        await self.click_menu_item("Leave")
+        await self.leave_list_link.click()
+
+    async def select_leave_type(self, leave_type: str):
+        """Select leave type from dropdown"""
+        await self.leave_type_dropdown.click()
+        await self.dropdown_option(leave_type).click()
+
+    async def enter_from_date(self, date: str):
+        """Enter from date (YYYY-MM-DD format)"""
+        await self.from_date_input.fill(date)
+
+    async def enter_to_date(self, date: str):
+        """Enter to date (YYYY-MM-DD format)"""
+        await self.to_date_input.fill(date)
+
+    async def enter_comments(self, comments: str):
+        """Enter leave comments"""
+        await self.comments_textarea.fill(comments)
+
+    async def click_apply(self):
+        """Click apply button"""
+        await self.apply_button.click()
+
+    @expects_api("leave/leave-requests", method="POST")
+    async def apply_leave(self, leave_type: str, from_date: str, to_date: str, comments: str = ""):
+        """Apply for leave with required fields"""
+        await self.select_leave_type(leave_type)
+        await self.enter_from_date(from_date)
+        await self.enter_to_date(to_date)
+        if comments:
+            await self.enter_comments(comments)
+        await self.click_apply()
+
+    @expects_api("leave/employees/leave-requests/{id}", method="PUT")
+    async def approve_first_leave(self):
+        """Approve the first leave in the list"""
+        await self.approve_button.first.click()
+
+    @expects_api("leave/employees/leave-requests/{id}", method="PUT")
+    async def reject_first_leave(self):
+        """Reject the first leave in the list"""
+        await self.reject_button.first.click()
+
+    @expects_api("leave/employees/leave-requests")
+    async def search_leave_by_date(self, from_date: str, to_date: str):
+        """Search leave by date range"""
+        await self.from_date_search_input.fill(from_date)
+        await self.to_date_search_input.fill(to_date)
+        await self.search_button.click()
+
+    @expects_api("leave/employees/leave-requests")
+    async def reset_search(self):
+        """Reset search filters"""
+        await self.reset_button.click()
+
+    async def get_leave_count(self) -> int:
+        """Get number of leave records in table"""
+        return await self.leave_list_rows.count()
+
+    async def get_leave_status(self, row_index: int = 0) -> str:
+        """Get leave status from specific row"""
+        return await self.leave_status_cell(row_index).text_content()
@@ -0,0 +1,47 @@
+"""
+Async Login Page Object.
+Locators are shared with pages.login_page.
+"""
+from pages.aio.base_page import BasePage
+from pages.login_page import LoginPageLocators
+
+
+class LoginPage(LoginPageLocators, BasePage):
+    """Async login page object for OrangeHRM"""
+
+    # ---------- Actions ----------
+    async def navigate(self):
+        """Navigate to login page"""
+        await self.navigate_to(self.path)
+
+    async def enter_username(self, username: str):
+        """Enter username"""
+        await self.username_input.fill(username)
+
+    async def enter_password(self, password: str):
+        """Enter password"""
+        await self.password_input.fill(password)
+
+    async def click_login(self):
+        """Click login button"""
+        await self.login_button.wait_for(state="visible", timeout=5000)
+        await self.login_button.click()
+        await self.wait_for_page_load()
+
+    async def login(self, username: str, password: str):
+        """Perform complete login action"""
+        await self.enter_username(username)
+        await self.enter_password(password)
+        await self.click_login()
+
+    async def get_error_text(self) -> str:
+        """Get error message text"""
+        return await self.error_message.text_content()
+
+    async def click_forgot_password(self):
+        """Click forgot password link"""
+        await self.forgot_password_link.click()
+
+    async def is_page_loaded(self) -> bool:
+        """Check if login page is fully loaded"""
+        return await self.page_title.is_visible() and await self.login_button.is_visible()
@@ -0,0 +1,85 @@
+"""
+Async My Info Page Object.
+Locators are shared with pages.myinfo_page.
+"""
+from pages.aio.base_page import BasePage
+from pages.myinfo_page import MyInfoPageLocators
+
+
+class MyInfoPage(MyInfoPageLocators, BasePage):
+    """Async My Info page object for OrangeHRM"""
+
+    # ---------- Actions ----------
+    async def navigate(self):
+        """Navigate to My Info page"""
+        await self.click_menu_item("My Info")
+
+    async def click_personal_details_tab(self):
+        """Click Personal Details tab"""
+        await self.personal_details_tab.click()
+
+    async def click_contact_details_tab(self):
+        """Click Contact Details tab"""
+        await self.contact_details_tab.click()
+
+    async def upload_profile_picture(self, file_path: str):
+        """Upload profile picture"""
+        await self.profile_picture_input.set_input_files(file_path)
+
+    async def enter_first_name(self, first_name: str):
+        """Enter first name"""
+        await self.first_name_input.fill(first_name)
+
+    async def enter_middle_name(self, middle_name: str):
+        """Enter middle name"""
+        await self.middle_name_input.fill(middle_name)
+
+    async def enter_last_name(self, last_name: str):
+        """Enter last name"""
+        await self.last_name_input.fill(last_name)
+
+    async def enter_license_number(self, license_number: str):
+        """Enter driver's license number"""
+        await self.license_number_input.fill(license_number)
+
+    async def select_nationality(self, nationality: str):
+        """Select nationality from dropdown"""
+        await self.nationality_dropdown.click()
+        await self.dropdown_option(nationality).click()
+
+    async def select_marital_status(self, status: str):
+        """Select marital status from dropdown"""
+        await self.marital_status_dropdown.click()
+        await self.dropdown_option(status).click()
+
+    async def enter_date_of_birth(self, date: str):
+        """Enter date of birth (YYYY-MM-DD)"""
+        await self.date_of_birth_input.fill(date)
+
+    async def select_gender_male(self):
+        """Select male gender"""
+        await self.gender_male_radio.click()
+
+    async def select_gender_female(self):
+        """Select female gender"""
+        await self.gender_female_radio.click()
+
+    async def click_save(self):
+        """Click save button"""
+        await self.save_button.click()
+
+    async def add_attachment(self, file_path: str, comment: str = ""):
+        """Add a document attachment"""
+        await self.add_attachment_button.click()
+        await self.attachment_file_input.set_input_files(file_path)
+        if comment:
+            await self.attachment_comment_textarea.fill(comment)
+        await self.save_button.click()
+
+    async def get_attachment_count(self) -> int:
+        """Get number of attachments"""
+        return await self.attachments_rows.count()
+
+    async def is_profile_picture_visible(self) -> bool:
+        """Check if profile picture is visible"""
+        return await self.profile_picture.is_visible()
@@ -0,0 +1,97 @@
+"""
+Async PIM (Personnel Information Management) Page Object.
+Locators are shared with pages.pim_page.
+"""
+from pages.aio.base_page import BasePage
+from pages.pim_page import PimPageLocators
+from utils.api_waits import expects_api
+
+
+class PimPage(PimPageLocators, BasePage):
+    """Async PIM page object for OrangeHRM"""
+
+    # ---------- Navigation ----------
+    async def navigate(self):
+        """Navigate to employee list"""
+        await self.navigate_to(self.path)
+
+    async def navigate_to_add_employee(self):
+        """Navigate to Add Employee page via menu"""
+        await self.click_menu_item("PIM")
+        await self.add_employee_link.click()
+
+    async def navigate_to_add_employee_direct(self):
+        """Navigate directly to Add Employee page"""
+        await self.navigate_to(self.add_employee_path)
+
+    # ---------- Actions ----------
+    async def enter_first_name(self, first_name: str):
+        """Enter first name"""
+        await self.first_name_input.fill(first_name)
+
+    async def enter_middle_name(self, middle_name: str):
+        """Enter middle name"""
+        await self.middle_name_input.fill(middle_name)
+
+    async def enter_last_name(self, last_name: str):
+        """Enter last name"""
+        await self.last_name_input.fill(last_name)
+
+    async def enter_employee_id(self, employee_id: str):
+        """Enter employee ID"""
+        await self.employee_id_input.clear()
+        await self.employee_id_input.fill(employee_id)
+
+    async def click_save(self):
+        """Click save button"""
+        await self.save_button.click()
+
+    @expects_api("pim/employees", method="POST", creates="employee")
+    async def add_employee(self, first_name: str, last_name: str, middle_name: str = "", employee_id: str = ""):
+        """Add a new employee with required fields"""
+        await self.enter_first_name(first_name)
+        if middle_name:
+            await self.enter_middle_name(middle_name)
+        await self.enter_last_name(last_name)
+        if employee_id:
+            await self.enter_employee_id(employee_id)
+        await self.click_save()
+
+    @expects_api("pim/employees")
+    async def search_employee_by_name(self, full_name: str):
+        """Search for an employee by name in the employee list"""
+        await self.employee_name_search_input.fill(full_name)
+        await self.search_button.click()
+
+    @expects_api("pim/employees")
+    async def search_employee_by_id(self, employee_id: str):
+        """Search for an employee by ID in the employee list"""
+        await self.employee_id_search_input.fill(employee_id)
+        await self.search_button.click()
+
+    @expects_api("pim/employees")
+    async def reset_search(self):
+        """Reset the search filters"""
+        await self.reset_button.click()
+
+    async def select_employee_checkbox(self, row_index: int = 0):
+        """Select an employee checkbox by row index (default first row)"""
+        await self.employee_checkbox(row_index).click()
+
+    @expects_api("pim/employees", method="DELETE", removes="employee")
+    async def delete_selected_employee(self):
+        """Click delete button and confirm deletion"""
+        await self.delete_button.click()
+        await self.confirm_delete_button.click()
+
+    async def get_employee_count(self) -> int:
+        """Get the number of employees in the table"""
+        return await self.employee_table_rows.count()
+
+    async def get_employee_id_value(self) -> str:
+        """Get the auto-generated employee ID value"""
+        return await self.employee_id_input.input_value()
+
+    def is_on_add_employee_page(self) -> bool:
+        """Check if on Add Employee page"""
+        return "/pim/addEmployee" in self.page.url
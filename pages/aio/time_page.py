@@ -0,0 +1,68 @@
+"""
+Async Time Page Object.
+Locators are shared with pages.time_page.
+"""
+from pages.aio.base_page import BasePage
+from pages.time_page import TimePageLocators
+from utils.api_waits import expects_api
+
+
+class TimePage(TimePageLocators, BasePage):
+    """Async time page object for OrangeHRM"""
+
+    # ---------- Actions ----------
+    async def navigate(self):
+        """Navigate to timesheets"""
+        await self.navigate_to(self.path)
+
+    async def navigate_to_my_timesheet(self):
+        """Navigate to my timesheet"""
+        await self.click_menu_item("Time")
+        await self.my_timesheets_link.click()
+
+    async def click_edit(self):
+        """Click edit timesheet button"""
+        await self.edit_button.click()
+
+    async def click_submit(self):
+        """Click submit timesheet button"""
+        await self.submit_button.click()
+
+    async def click_save(self):
+        """Click save timesheet button"""
+        await self.save_button.click()
+
+    async def add_timesheet_row(self):
+        """Add a new timesheet row"""
+        await self.add_row_button.click()
+
+    async def enter_project(self, project_name: str):
+        """Enter project name and select from autocomplete"""
+        await self.select_autocomplete(self.project_input, project_name, "time/projects")
+
+    async def select_activity(self, activity: str):
+        """Select activity from dropdown"""
+        await self.activity_dropdown.click()
+        await self.dropdown_option(activity).click()
+
+    async def enter_hours(self, day_index: int, hours: str):
+        """Enter hours for a specific day (0-6 for Mon-Sun)"""
+        await self.hours_input(day_index).fill(hours)
+
+    @expects_api("time/timesheets/{id}", method="PUT")
+    async def submit_timesheet(self):
+        """Submit the timesheet"""
+        await self.click_submit()
+
+    @expects_api("time/timesheets/{id}/entries", method="PUT")
+    async def save_timesheet(self):
+        """Save the timesheet"""
+        await self.click_save()
+
+    async def get_timesheet_status(self) -> str:
+        """Get current timesheet status"""
+        return await self.timesheet_status.text_content()
+
+    async def is_timesheet_editable(self) -> bool:
+        """Check if timesheet is in editable state"""
+        return await self.save_button.is_visible()
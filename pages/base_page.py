@@ -2,53 +2,71 @@
 Base Page class that all page objects inherit from.
 Contains common locators and actions shared across all pages.
 """
-from playwright.sync_api import Page
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from playwright.sync_api import Locator, Page
 from config import config
+from utils.api_waits import api_waits
+from utils.locators import by_role, css, param
+from utils.perf_probe import ActionTiming, PageTiming, perf_probe
 
 
-class BasePage:
-    """Base class for all page objects"""
+class BaseLocators:
+    """
+    Locators shared by every page.
+    Locators are declared as LocatorSpec chains (utils/locators.py): built
+    once per page object, and usable by both the sync page objects and
+    their async twins in pages.aio.
+    """
+
+    # Module path relative to the base URL, overridden by each page
+    path = ""
 
     def __init__(self, page: Page):
         self.page = page
         self.base_url = config.get_base_url()
 
     # Common locators across all pages
-    @property
-    def user_dropdown(self):
-        """User dropdown in header"""
-        return self.page.locator(".oxd-userdropdown-tab")
-
-    @property
-    def logout_link(self):
-        """Logout link in user dropdown"""
-        return self.page.get_by_role("menuitem", name="Logout")
-
-    @property
-    def success_toast(self):
-        """Success toast notification"""
-        return self.page.locator('.oxd-toast--success')
-
-    @property
-    def error_toast(self):
-        """Error toast notification"""
-        return self.page.locator('.oxd-toast--error')
-
-    @property
-    def info_toast(self):
-        """Info toast notification"""
-        return self.page.locator('.oxd-toast--info')
-
-    @property
-    def loading_spinner(self):
-        """Loading spinner"""
-        return self.page.locator('.oxd-loading-spinner')
+    user_dropdown = css(".oxd-userdropdown-tab")  # in header
+    logout_link = by_role("menuitem", name="Logout")
+    success_toast = css('.oxd-toast--success')
+    error_toast = css('.oxd-toast--error')
+    info_toast = css('.oxd-toast--info')
+    loading_spinner = css('.oxd-loading-spinner')
+    menu_item = by_role("link", name=param("menu_name"), exact=True)
+    dropdown_option = by_role("option", name=param("name"))  # of the open select dropdown
+    # The "Searching...." placeholder row is not a suggestion
+    autocomplete_option_list = by_role("listbox").get_by_role("option").filter(has_not_text="Searching")
+
+    def autocomplete_options(self, option: Optional[str] = None) -> Locator:
+        """Suggestions of the open autocomplete, optionally those containing `option`"""
+        options = self.autocomplete_option_list
+        return options.filter(has_text=option) if option else options
+
+
+class BasePage(BaseLocators):
+    """Base class for all page objects"""
 
     # Common actions
-    def navigate_to(self, path: str = ""):
-        """Navigate to a specific path"""
+    def navigate_to(self, path: str = "", measure: bool = False) -> Optional[PageTiming]:
+        """Navigate to a specific path; with measure=True, return the load's timing"""
         url = f"{self.base_url}/{path}" if path else self.base_url
         self.page.goto(url)
+        return perf_probe.page_timing(self.page) if measure else None
+
+    @contextmanager
+    def measure(self, name: str) -> Iterator[ActionTiming]:
+        """
+        Time the actions inside the block on the browser clock.
+
+        Example:
+            with pim.measure("search") as timing:
+                pim.search_employee_by_name("Peter")
+            assert timing.duration_ms < 3000
+        """
+        with perf_probe.measure(self.page, name) as timing:
+            yield timing
 
     def logout(self):
         """Logout from application"""
@@ -60,8 +78,20 @@ class BasePage:
         self.page.wait_for_load_state(state)
 
     def wait_for_network_idle(self):
-        """Wait for network to be idle"""
-        self.page.wait_for_load_state("networkidle")
+        """Wait until no API call is in flight and the UI has re-rendered"""
+        api_waits.wait_for_api_idle(self.page)
+
+    def select_autocomplete(self, input_locator: Locator, text: str, endpoint: str, option: Optional[str] = None):
+        """
+        Type into an autocomplete and pick a suggestion.
+        Waits for the lookup response from /api/v2/<endpoint> (sent after the
+        input's debounce, at most AUTOCOMPLETE_DEBOUNCE_MS) and for the options
+        it rendered, then clicks the option containing `option`, or the first.
+        """
+        timeout = config.AUTOCOMPLETE_DEBOUNCE_MS + config.ACTION_TIMEOUT
+        with api_waits.expect_api(self.page, endpoint, timeout=timeout):
+            input_locator.fill(text)
+        self.autocomplete_options(option).first.click()
 
     def get_success_toast_text(self) -> str:
         """Get success toast message text"""
@@ -73,4 +103,4 @@ class BasePage:
 
     def click_menu_item(self, menu_name: str):
         """Click a main menu item by name"""
-        self.page.get_by_role("link", name=menu_name).click()
+        self.menu_item(menu_name).click()
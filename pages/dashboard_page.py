@@ -2,82 +2,34 @@
 Dashboard Page Object - handles dashboard interactions.
 Dashboard is the landing page after successful login.
 """
-from playwright.sync_api import Page
-from pages.base_page import BasePage
+from pages.base_page import BaseLocators, BasePage
+from utils.locators import by_role, css
 
 
-class DashboardPage(BasePage):
-    """Dashboard page object for OrangeHRM"""
+class DashboardPageLocators(BaseLocators):
+    """Dashboard locators, shared with pages.aio.DashboardPage"""
 
-    def __init__(self, page: Page):
-        super().__init__(page)
-        self.path = "web/index.php/dashboard/index"
+    path = "web/index.php/dashboard/index"
 
     # ---------- Locators ----------
-    @property
-    def dashboard_title(self):
-        """Dashboard page title"""
-        return self.page.locator("h6").filter(has_text="Dashboard")
-
-    @property
-    def time_at_work_widget(self):
-        """Time at Work widget"""
-        return self.page.locator('.orangehrm-dashboard-widget').filter(has_text="Time at Work")
-
-    @property
-    def my_actions_widget(self):
-        """My Actions widget"""
-        return self.page.locator('.orangehrm-dashboard-widget').filter(has_text="My Actions")
-
-    @property
-    def quick_launch_widget(self):
-        """Quick Launch widget"""
-        return self.page.locator('.orangehrm-dashboard-widget').filter(has_text="Quick Launch")
-
-    @property
-    def buzz_latest_posts_widget(self):
-        """Buzz Latest Posts widget"""
-        return self.page.locator('.orangehrm-dashboard-widget').filter(has_text="Buzz Latest Posts")
-
-    @property
-    def employees_on_leave_widget(self):
-        """Employees on Leave Today widget"""
-        return self.page.locator('.orangehrm-dashboard-widget').filter(has_text="Employees on Leave Today")
-
-    @property
-    def employee_distribution_widget(self):
-        """Employee Distribution by Sub Unit widget"""
-        return self.page.locator('.orangehrm-dashboard-widget').filter(has_text="Employee Distribution")
-
-    @property
-    def leave_quick_launch_button(self):
-        """Assign Leave quick launch button"""
-        return self.page.get_by_role("button", name="Assign Leave")
-
-    @property
-    def leave_list_quick_launch_button(self):
-        """Leave List quick launch button"""
-        return self.page.get_by_role("button", name="Leave List")
-
-    @property
-    def timesheets_quick_launch_button(self):
-        """Timesheets quick launch button"""
-        return self.page.get_by_role("button", name="Timesheets")
-
-    @property
-    def apply_leave_quick_launch_button(self):
-        """Apply Leave quick launch button"""
-        return self.page.get_by_role("button", name="Apply Leave")
-
-    @property
-    def my_leave_quick_launch_button(self):
-        """My Leave quick launch button"""
-        return self.page.get_by_role("button", name="My Leave")
-
-    @property
-    def my_timesheet_quick_launch_button(self):
-        """My Timesheet quick launch button"""
-        return self.page.get_by_role("button", name="My Timesheet")
+    dashboard_title = css("h6").filter(has_text="Dashboard")
+    widgets = css('.orangehrm-dashboard-widget')
+    time_at_work_widget = widgets.filter(has_text="Time at Work")
+    my_actions_widget = widgets.filter(has_text="My Actions")
+    quick_launch_widget = widgets.filter(has_text="Quick Launch")
+    buzz_latest_posts_widget = widgets.filter(has_text="Buzz Latest Posts")
+    employees_on_leave_widget = widgets.filter(has_text="Employees on Leave Today")
+    employee_distribution_widget = widgets.filter(has_text="Employee Distribution")  # by Sub Unit
+    leave_quick_launch_button = by_role("button", name="Assign Leave")
+    leave_list_quick_launch_button = by_role("button", name="Leave List")
+    timesheets_quick_launch_button = by_role("button", name="Timesheets")
+    apply_leave_quick_launch_button = by_role("button", name="Apply Leave")
+    my_leave_quick_launch_button = by_role("button", name="My Leave")
+    my_timesheet_quick_launch_button = by_role("button", name="My Timesheet")
+
+
+class DashboardPage(DashboardPageLocators, BasePage):
+    """Dashboard page object for OrangeHRM"""
 
     # ---------- Actions ----------
     def navigate(self):
@@ -114,4 +66,4 @@ class DashboardPage(BasePage):
 
     def get_widget_count(self) -> int:
         """Count number of widgets on dashboard"""
-        return self.page.locator('.orangehrm-dashboard-widget').count()
+        return self.widgets.count()
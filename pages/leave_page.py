@@ -2,117 +2,49 @@
 Leave Page Object - handles leave management.
 Includes applying leave, approving/rejecting leave requests.
 """
-from playwright.sync_api import Page
-from pages.base_page import BasePage
+from pages.base_page import BaseLocators, BasePage
+from utils.api_waits import expects_api
+from utils.locators import by_role, css, param
 
 
-class LeavePage(BasePage):
-    """Leave page object for OrangeHRM"""
+class LeavePageLocators(BaseLocators):
+    """Leave page locators, shared with pages.aio.LeavePage"""
 
-    def __init__(self, page: Page):
-        super().__init__(page)
-        self.path = "web/index.php/leave/viewLeaveList"
-        self.apply_path = "web/index.php/leave/applyLeave"
-        self.assign_path = "web/index.php/leave/assignLeave"
+    path = "web/index.php/leave/viewLeaveList"
+    apply_path = "web/index.php/leave/applyLeave"
+    assign_path = "web/index.php/leave/assignLeave"
 
     # ---------- Locators ----------
-    @property
-    def leave_menu_link(self):
-        """Leave menu link"""
-        return self.page.get_by_role("link", name="Leave")
-
-    @property
-    def apply_link(self):
-        """Apply leave link"""
-        return self.page.get_by_role("link", name="Apply")
-
-    @property
-    def my_leave_link(self):
-        """My leave link"""
-        return self.page.get_by_role("link", name="My Leave")
-
-    @property
-    def leave_list_link(self):
-        """Leave list link"""
-        return self.page.get_by_role("link", name="Leave List")
-
-    @property
-    def assign_leave_link(self):
-        """Assign leave link"""
-        return self.page.get_by_role("link", name="Assign Leave")
+    leave_menu_link = by_role("link", name="Leave")
+    apply_link = by_role("link", name="Apply")
+    my_leave_link = by_role("link", name="My Leave")
+    leave_list_link = by_role("link", name="Leave List")
+    assign_leave_link = by_role("link", name="Assign Leave")
 
     # Apply Leave Form
-    @property
-    def leave_type_dropdown(self):
-        """Leave type dropdown"""
-        return self.page.locator('label:text("Leave Type")').locator('..').locator('.oxd-select-text-input')
-
-    @property
-    def from_date_input(self):
-        """From date input"""
-        return self.page.locator('label:text("From Date")').locator('..').locator('input')
-
-    @property
-    def to_date_input(self):
-        """To date input"""
-        return self.page.locator('label:text("To Date")').locator('..').locator('input')
-
-    @property
-    def comments_textarea(self):
-        """Comments textarea"""
-        return self.page.locator('textarea').first
-
-    @property
-    def apply_button(self):
-        """Apply button"""
-        return self.page.get_by_role("button", name="Apply")
-
-    @property
-    def cancel_button(self):
-        """Cancel button"""
-        return self.page.get_by_role("button", name="Cancel")
+    leave_type_dropdown = css('label:text("Leave Type")').parent.locator('.oxd-select-text-input')
+    from_date_input = css('label:text("From Date")').parent.locator('input')
+    to_date_input = css('label:text("To Date")').parent.locator('input')
+    comments_textarea = css('textarea').first
+    apply_button = by_role("button", name="Apply")
+    cancel_button = by_role("button", name="Cancel")
 
     # Leave List and Actions
-    @property
-    def leave_list_table(self):
-        """Leave list table"""
-        return self.page.locator('.oxd-table-body')
-
-    @property
-    def leave_list_rows(self):
-        """Leave list table rows"""
-        return self.page.locator('.oxd-table-card')
-
-    @property
-    def approve_button(self):
-        """Approve leave button (action button in table)"""
-        return self.page.get_by_role("button", name="Approve")
-
-    @property
-    def reject_button(self):
-        """Reject leave button (action button in table)"""
-        return self.page.get_by_role("button", name="Reject")
+    leave_list_table = css('.oxd-table-body')
+    leave_list_rows = css('.oxd-table-card')
+    leave_status_cell = leave_list_rows.nth(param("row_index")).locator('.oxd-table-cell').nth(5)
+    approve_button = by_role("button", name="Approve")  # action button in table
+    reject_button = by_role("button", name="Reject")  # action button in table
 
     # Search filters
-    @property
-    def from_date_search_input(self):
-        """From date search input"""
-        return self.page.locator('.oxd-form').locator('input').first
-
-    @property
-    def to_date_search_input(self):
-        """To date search input"""
-        return self.page.locator('.oxd-form').locator('input').nth(1)
-
-    @property
-    def search_button(self):
-        """Search button"""
-        return self.page.get_by_role("button", name="Search")
-
-    @property
-    def reset_button(self):
-        """Reset button"""
-        return self.page.get_by_role("button", name="Reset")
+    from_date_search_input = css('.oxd-form').locator('input').first
+    to_date_search_input = css('.oxd-form').locator('input').nth(1)
+    search_button = by_role("button", name="Search")
+    reset_button = by_role("button", name="Reset")
+
+
+class LeavePage(LeavePageLocators, BasePage):
+    """Leave page object for OrangeHRM"""
 
     # ---------- Actions ----------
     def navigate(self):
@@ -137,7 +69,7 @@ class LeavePage(BasePage):
     def select_leave_type(self, leave_type: str):
         """Select leave type from dropdown"""
         self.leave_type_dropdown.click()
-        self.page.get_by_role("option", name=leave_type).click()
+        self.dropdown_option(leave_type).click()
 
     def enter_from_date(self, date: str):
         """Enter from date (YYYY-MM-DD format)"""
@@ -155,6 +87,7 @@ class LeavePage(BasePage):
         """Click apply button"""
         self.apply_button.click()
 
+    @expects_api("leave/leave-requests", method="POST")
     def apply_leave(self, leave_type: str, from_date: str, to_date: str, comments: str = ""):
         """Apply for leave with required fields"""
         self.select_leave_type(leave_type)
@@ -164,20 +97,24 @@ class LeavePage(BasePage):
             self.enter_comments(comments)
         self.click_apply()
 
+    @expects_api("leave/employees/leave-requests/{id}", method="PUT")
     def approve_first_leave(self):
         """Approve the first leave in the list"""
         self.approve_button.first.click()
 
+    @expects_api("leave/employees/leave-requests/{id}", method="PUT")
     def reject_first_leave(self):
         """Reject the first leave in the list"""
         self.reject_button.first.click()
 
+    @expects_api("leave/employees/leave-requests")
     def search_leave_by_date(self, from_date: str, to_date: str):
         """Search leave by date range"""
         self.from_date_search_input.fill(from_date)
         self.to_date_search_input.fill(to_date)
         self.search_button.click()
 
+    @expects_api("leave/employees/leave-requests")
     def reset_search(self):
         """Reset search filters"""
         self.reset_button.click()
@@ -188,4 +125,4 @@ class LeavePage(BasePage):
 
     def get_leave_status(self, row_index: int = 0) -> str:
         """Get leave status from specific row"""
-        return self.leave_list_rows.nth(row_index).locator('.oxd-table-cell').nth(5).text_content()
+        return self.leave_status_cell(row_index).text_content()
@@ -2,59 +2,28 @@
 Login Page Object - handles all login page interactions.
 Follows clean POM pattern: locators + actions only, no assertions.
 """
-from playwright.sync_api import Page
-from pages.base_page import BasePage
+from pages.base_page import BaseLocators, BasePage
+from utils.locators import by_role, by_text, css
 
 
-class LoginPage(BasePage):
-    """Login page object for OrangeHRM"""
+class LoginPageLocators(BaseLocators):
+    """Login page locators, shared with pages.aio.LoginPage"""
 
-    def __init__(self, page: Page):
-        super().__init__(page)
-        self.path = "web/index.php/auth/login"
+    path = "web/index.php/auth/login"
 
     # ---------- Locators ----------
-    @property
-    def username_input(self):
-        """Username input field"""
-        return self.page.locator('input[name="username"]')
-
-    @property
-    def password_input(self):
-        """Password input field"""
-        return self.page.locator('input[name="password"]')
-
-    @property
-    def login_button(self):
-        """Login button"""
-        return self.page.get_by_role("button", name="Login")
-
-    @property
-    def error_message(self):
-        """Error message displayed on login failure"""
-        return self.page.locator(
-            ".oxd-alert-content-text, .oxd-input-field-error-message"
-        ).first
+    username_input = css('input[name="username"]')
+    password_input = css('input[name="password"]')
+    login_button = by_role("button", name="Login")
+    error_message = css(".oxd-alert-content-text, .oxd-input-field-error-message").first  # shown on login failure
+    forgot_password_link = by_text("Forgot your password?")
+    page_title = css(".oxd-text--h5")
+    username_required_error = username_input.parent.locator('.oxd-input-field-error-message')
+    password_required_error = password_input.parent.locator('.oxd-input-field-error-message')
 
-    @property
-    def forgot_password_link(self):
-        """Forgot password link"""
-        return self.page.get_by_text("Forgot your password?")
 
-    @property
-    def page_title(self):
-        """Login page title"""
-        return self.page.locator(".oxd-text--h5")
-
-    @property
-    def username_required_error(self):
-        """Username required error message"""
-        return self.username_input.locator('..').locator('.oxd-input-field-error-message')
-
-    @property
-    def password_required_error(self):
-        """Password required error message"""
-        return self.password_input.locator('..').locator('.oxd-input-field-error-message')
+class LoginPage(LoginPageLocators, BasePage):
+    """Login page object for OrangeHRM"""
 
     # ---------- Actions ----------
     def navigate(self):
@@ -80,8 +49,6 @@ class LoginPage(BasePage):
         """Perform complete login action"""
         self.enter_username(username)
         self.enter_password(password)
-        # Small wait to ensure form is ready
-        self.page.wait_for_timeout(200)
         self.click_login()
 
     def get_error_text(self) -> str:
@@ -2,155 +2,53 @@
 My Info Page Object - handles employee self-service.
 Includes personal details, contact info, documents, profile picture.
 """
-from playwright.sync_api import Page
-from pages.base_page import BasePage
+from pages.base_page import BaseLocators, BasePage
+from utils.locators import by_role, css
 
 
-class MyInfoPage(BasePage):
-    """My Info page object for OrangeHRM"""
+class MyInfoPageLocators(BaseLocators):
+    """My Info page locators, shared with pages.aio.MyInfoPage"""
 
-    def __init__(self, page: Page):
-        super().__init__(page)
-        self.path = "web/index.php/pim/viewPersonalDetails/empNumber/7"
+    path = "web/index.php/pim/viewPersonalDetails/empNumber/7"
 
     # ---------- Locators ----------
-    @property
-    def my_info_menu_link(self):
-        """My Info menu link"""
-        return self.page.get_by_role("link", name="My Info")
-
-    @property
-    def personal_details_tab(self):
-        """Personal Details tab"""
-        return self.page.get_by_role("link", name="Personal Details")
-
-    @property
-    def contact_details_tab(self):
-        """Contact Details tab"""
-        return self.page.get_by_role("link", name="Contact Details")
-
-    @property
-    def emergency_contacts_tab(self):
-        """Emergency Contacts tab"""
-        return self.page.get_by_role("link", name="Emergency Contacts")
-
-    @property
-    def dependents_tab(self):
-        """Dependents tab"""
-        return self.page.get_by_role("link", name="Dependents")
-
-    @property
-    def immigration_tab(self):
-        """Immigration tab"""
-        return self.page.get_by_role("link", name="Immigration")
-
-    @property
-    def qualifications_tab(self):
-        """Qualifications tab"""
-        return self.page.get_by_role("link", name="Qualifications")
+    my_info_menu_link = by_role("link", name="My Info")
+    personal_details_tab = by_role("link", name="Personal Details")
+    contact_details_tab = by_role("link", name="Contact Details")
+    emergency_contacts_tab = by_role("link", name="Emergency Contacts")
+    dependents_tab = by_role("link", name="Dependents")
+    immigration_tab = by_role("link", name="Immigration")
+    qualifications_tab = by_role("link", name="Qualifications")
 
     # Profile Picture
-    @property
-    def profile_picture(self):
-        """Profile picture element"""
-        return self.page.locator('.employee-image')
-
-    @property
-    def profile_picture_input(self):
-        """Profile picture file input"""
-        return self.page.locator('input[type="file"]').first
-
-    @property
-    def upload_picture_button(self):
-        """Upload profile picture button (may be hidden)"""
-        return self.page.locator('.employee-image-action')
+    profile_picture = css('.employee-image')
+    profile_picture_input = css('input[type="file"]').first
+    upload_picture_button = css('.employee-image-action')  # may be hidden
 
     # Personal Details
-    @property
-    def first_name_input(self):
-        """First name input"""
-        return self.page.locator('input[name="firstName"]')
-
-    @property
-    def middle_name_input(self):
-        """Middle name input"""
-        return self.page.locator('input[name="middleName"]')
-
-    @property
-    def last_name_input(self):
-        """Last name input"""
-        return self.page.locator('input[name="lastName"]')
-
-    @property
-    def employee_id_input(self):
-        """Employee ID input"""
-        return self.page.locator('.oxd-input').nth(4)
-
-    @property
-    def license_number_input(self):
-        """Driver's license number input"""
-        return self.page.locator('.oxd-input').nth(5)
-
-    @property
-    def license_expiry_date_input(self):
-        """License expiry date input"""
-        return self.page.locator('.oxd-input').nth(6)
-
-    @property
-    def nationality_dropdown(self):
-        """Nationality dropdown"""
-        return self.page.locator('.oxd-select-text-input').first
-
-    @property
-    def marital_status_dropdown(self):
-        """Marital status dropdown"""
-        return self.page.locator('.oxd-select-text-input').nth(1)
-
-    @property
-    def date_of_birth_input(self):
-        """Date of birth input"""
-        return self.page.locator('.oxd-input').nth(7)
-
-    @property
-    def gender_male_radio(self):
-        """Male gender radio button"""
-        return self.page.locator('input[value="1"]').first
-
-    @property
-    def gender_female_radio(self):
-        """Female gender radio button"""
-        return self.page.locator('input[value="2"]').first
-
-    @property
-    def save_button(self):
-        """Save button"""
-        return self.page.get_by_role("button", name="Save").first
+    first_name_input = css('input[name="firstName"]')
+    middle_name_input = css('input[name="middleName"]')
+    last_name_input = css('input[name="lastName"]')
+    employee_id_input = css('.oxd-input').nth(4)
+    license_number_input = css('.oxd-input').nth(5)  # driver's license
+    license_expiry_date_input = css('.oxd-input').nth(6)
+    nationality_dropdown = css('.oxd-select-text-input').first
+    marital_status_dropdown = css('.oxd-select-text-input').nth(1)
+    date_of_birth_input = css('.oxd-input').nth(7)
+    gender_male_radio = css('input[value="1"]').first
+    gender_female_radio = css('input[value="2"]').first
+    save_button = by_role("button", name="Save").first
 
     # Attachments/Documents
-    @property
-    def add_attachment_button(self):
-        """Add attachment button"""
-        return self.page.get_by_role("button", name="Add")
-
-    @property
-    def attachment_file_input(self):
-        """Attachment file input"""
-        return self.page.locator('input[type="file"]')
-
-    @property
-    def attachment_comment_textarea(self):
-        """Attachment comment textarea"""
-        return self.page.locator('textarea').first
-
-    @property
-    def attachments_table(self):
-        """Attachments table"""
-        return self.page.locator('.oxd-table-body')
-
-    @property
-    def attachments_rows(self):
-        """Attachment table rows"""
-        return self.page.locator('.oxd-table-card')
+    add_attachment_button = by_role("button", name="Add")
+    attachment_file_input = css('input[type="file"]')
+    attachment_comment_textarea = css('textarea').first
+    attachments_table = css('.oxd-table-body')
+    attachments_rows = css('.oxd-table-card')
+
+
+class MyInfoPage(MyInfoPageLocators, BasePage):
+    """My Info page object for OrangeHRM"""
 
     # ---------- Actions ----------
     def navigate(self):
@@ -188,12 +86,12 @@ class MyInfoPage(BasePage):
     def select_nationality(self, nationality: str):
         """Select nationality from dropdown"""
         self.nationality_dropdown.click()
-        self.page.get_by_role("option", name=nationality).click()
+        self.dropdown_option(nationality).click()
 
     def select_marital_status(self, status: str):
         """Select marital status from dropdown"""
         self.marital_status_dropdown.click()
-        self.page.get_by_role("option", name=status).click()
+        self.dropdown_option(status).click()
 
     def enter_date_of_birth(self, date: str):
         """Enter date of birth (YYYY-MM-DD)"""
@@ -2,17 +2,49 @@
 PIM (Personnel Information Management) Page Object.
 Handles employee management: add, search, edit, delete employees.
 """
-from playwright.sync_api import Page
-from pages.base_page import BasePage
+from pages.base_page import BaseLocators, BasePage
+from utils.api_waits import expects_api
+from utils.locators import by_role, css, param
 
 
-class PimPage(BasePage):
-    """PIM page object for OrangeHRM"""
+class PimPageLocators(BaseLocators):
+    """PIM page locators, shared with pages.aio.PimPage"""
+
+    path = "web/index.php/pim/viewEmployeeList"
+    add_employee_path = "web/index.php/pim/addEmployee"
+
+    # ---------- Locators ----------
+    # PIM Menu
+    pim_menu_link = by_role("link", name="PIM")
+    add_employee_link = by_role("link", name="Add Employee")
 
-    def __init__(self, page: Page):
-        super().__init__(page)
-        self.path = "web/index.php/pim/viewEmployeeList"
-        self.add_employee_path = "web/index.php/pim/addEmployee"
+    # Add Employee Form
+    first_name_input = css('input[name="firstName"]')
+    middle_name_input = css('input[name="middleName"]')
+    last_name_input = css('input[name="lastName"]')
+    employee_id_input = css('.oxd-grid').locator('input').nth(4)
+    save_button = by_role("button", name="Save")
+    cancel_button = by_role("button", name="Cancel")
+
+    # Validation Messages
+    required_field_error = css('.oxd-input-field-error-message').first
+    first_name_required_error = first_name_input.parent.parent.locator('.oxd-input-field-error-message')
+    last_name_required_error = last_name_input.parent.parent.locator('.oxd-input-field-error-message')
+
+    # Employee List
+    employee_name_search_input = css('input[placeholder*="Type for hints"]').first
+    employee_id_search_input = css('.oxd-grid').locator('input').nth(1)
+    search_button = by_role("button", name="Search")
+    reset_button = by_role("button", name="Reset")
+    employee_table = css('.oxd-table-body')
+    employee_table_rows = css('.oxd-table-card')
+    employee_checkbox = employee_table_rows.nth(param("row_index")).locator('.oxd-checkbox-input')
+    delete_button = by_role("button", name="Delete Selected")
+    confirm_delete_button = by_role("button", name="Yes, Delete")
+
+
+class PimPage(PimPageLocators, BasePage):
+    """PIM page object for OrangeHRM"""
 
     # ---------- Navigation ----------
     def navigate(self):
@@ -28,95 +60,6 @@ class PimPage(BasePage):
         """Navigate directly to Add Employee page"""
         self.navigate_to(self.add_employee_path)
 
-    # ---------- Locators ----------
-    # PIM Menu
-    @property
-    def pim_menu_link(self):
-        return self.page.get_by_role("link", name="PIM")
-
-    @property
-    def add_employee_link(self):
-        return self.page.get_by_role("link", name="Add Employee")
-
-    # Add Employee Form
-    @property
-    def first_name_input(self):
-        return self.page.locator('input[name="firstName"]')
-
-    @property
-    def middle_name_input(self):
-        return self.page.locator('input[name="middleName"]')
-
-    @property
-    def last_name_input(self):
-        return self.page.locator('input[name="lastName"]')
-
-    @property
-    def employee_id_input(self):
-        return self.page.locator('.oxd-grid').locator('input').nth(4)
-
-    @property
-    def save_button(self):
-        return self.page.get_by_role("button", name="Save")
-
-    @property
-    def cancel_button(self):
-        return self.page.get_by_role("button", name="Cancel")
-
-    # Success/Error Messages
-    @property
-    def success_toast(self):
-        return self.page.locator('.oxd-toast--success')
-
-    @property
-    def error_toast(self):
-        return self.page.locator('.oxd-toast--error')
-
-    @property
-    def required_field_error(self):
-        return self.page.locator('.oxd-input-field-error-message').first
-
-    @property
-    def first_name_required_error(self):
-        return self.first_name_input.locator('..').locator('..').locator('.oxd-input-field-error-message')
-
-    @property
-    def last_name_required_error(self):
-        return self.last_name_input.locator('..').locator('..').locator('.oxd-input-field-error-message')
-
-    # Employee List
-    @property
-    def employee_name_search_input(self):
-        return self.page.locator('input[placeholder*="Type for hints"]').first
-
-    @property
-    def employee_id_search_input(self):
-        return self.page.locator('.oxd-grid').locator('input').nth(1)
-
-    @property
-    def search_button(self):
-        return self.page.get_by_role("button", name="Search")
-
-    @property
-    def reset_button(self):
-        return self.page.get_by_role("button", name="Reset")
-
-    @property
-    def employee_table(self):
-        return self.page.locator('.oxd-table-body')
-
-    @property
-    def employee_table_rows(self):
-        return self.page.locator('.oxd-table-card')
-
-    @property
-    def delete_button(self):
-        return self.page.get_by_role("button", name="Delete Selected")
-
-    @property
-    def confirm_delete_button(self):
-        return self.page.get_by_role("button", name="Yes, Delete")
-
     # ---------- Actions ----------
     def enter_first_name(self, first_name: str):
         """Enter first name"""
@@ -139,6 +82,7 @@ class PimPage(BasePage):
         """Click save button"""
         self.save_button.click()
 
+    @expects_api("pim/employees", method="POST", creates="employee")
     def add_employee(self, first_name: str, last_name: str, middle_name: str = "", employee_id: str = ""):
         """Add a new employee with required fields"""
         self.enter_first_name(first_name)
@@ -149,24 +93,28 @@ class PimPage(BasePage):
             self.enter_employee_id(employee_id)
         self.click_save()
 
+    @expects_api("pim/employees")
     def search_employee_by_name(self, full_name: str):
         """Search for an employee by name in the employee list"""
         self.employee_name_search_input.fill(full_name)
         self.search_button.click()
 
+    @expects_api("pim/employees")
     def search_employee_by_id(self, employee_id: str):
         """Search for an employee by ID in the employee list"""
         self.employee_id_search_input.fill(employee_id)
         self.search_button.click()
 
+    @expects_api("pim/employees")
     def reset_search(self):
         """Reset the search filters"""
         self.reset_button.click()
 
     def select_employee_checkbox(self, row_index: int = 0):
         """Select an employee checkbox by row index (default first row)"""
-        self.employee_table_rows.nth(row_index).locator('.oxd-checkbox-input').click()
+        self.employee_checkbox(row_index).click()
 
+    @expects_api("pim/employees", method="DELETE", removes="employee")
     def delete_selected_employee(self):
         """Click delete button and confirm deletion"""
         self.delete_button.click()
@@ -183,4 +131,3 @@ class PimPage(BasePage):
     def is_on_add_employee_page(self) -> bool:
         """Check if on Add Employee page"""
         return "/pim/addEmployee" in self.page.url
-
@@ -2,78 +2,36 @@
 Time Page Object - handles timesheet management.
 Includes viewing and submitting timesheets.
 """
-from playwright.sync_api import Page
-from pages.base_page import BasePage
+from pages.base_page import BaseLocators, BasePage
+from utils.api_waits import expects_api
+from utils.locators import by_role, css, param
 
 
-class TimePage(BasePage):
-    """Time page object for OrangeHRM"""
+class TimePageLocators(BaseLocators):
+    """Time page locators, shared with pages.aio.TimePage"""
 
-    def __init__(self, page: Page):
-        super().__init__(page)
-        self.path = "web/index.php/time/viewEmployeeTimesheet"
-        self.my_timesheet_path = "web/index.php/time/viewMyTimesheet"
+    path = "web/index.php/time/viewEmployeeTimesheet"
+    my_timesheet_path = "web/index.php/time/viewMyTimesheet"
 
     # ---------- Locators ----------
-    @property
-    def time_menu_link(self):
-        """Time menu link"""
-        return self.page.get_by_role("link", name="Time")
-
-    @property
-    def timesheets_link(self):
-        """Timesheets link"""
-        return self.page.get_by_role("link", name="Timesheets")
-
-    @property
-    def my_timesheets_link(self):
-        """My timesheets link"""
-        return self.page.get_by_role("link", name="My Timesheets")
-
-    @property
-    def edit_button(self):
-        """Edit timesheet button"""
-        return self.page.get_by_role("button", name="Edit")
-
-    @property
-    def submit_button(self):
-        """Submit timesheet button"""
-        return self.page.get_by_role("button", name="Submit")
-
-    @property
-    def save_button(self):
-        """Save timesheet button"""
-        return self.page.get_by_role("button", name="Save")
-
-    @property
-    def reset_button(self):
-        """Reset button"""
-        return self.page.get_by_role("button", name="Reset")
-
-    @property
-    def timesheet_table(self):
-        """Timesheet table"""
-        return self.page.locator('.orangehrm-timesheet-table')
-
-    @property
-    def timesheet_status(self):
-        """Timesheet status indicator"""
-        return self.page.locator('.orangehrm-timesheet-status')
-
-    @property
-    def project_input(self):
-        """Project input (first row)"""
-        return self.page.locator('input[placeholder*="Type for hints"]').first
-
-    @property
-    def activity_dropdown(self):
-        """Activity dropdown"""
-        return self.page.locator('.oxd-select-text-input').first
-
-    @property
-    def add_row_button(self):
-        """Add timesheet row button"""
-        return self.page.get_by_role("button", name="Add Row")
+    time_menu_link = by_role("link", name="Time")
+    timesheets_link = by_role("link", name="Timesheets")
+    my_timesheets_link = by_role("link", name="My Timesheets")
+    edit_button = by_role("button", name="Edit")
+    submit_button = by_role("button", name="Submit")
+    save_button = by_role("button", name="Save")
+    reset_button = by_role("button", name="Reset")
+    timesheet_table = css('.orangehrm-timesheet-table')
+    timesheet_status = css('.orangehrm-timesheet-status')
+    project_input = css('input[placeholder*="Type for hints"]').first  # first row
+    activity_dropdown = css('.oxd-select-text-input').first
+    # Timesheet has an hours input per day: day_index 0-6 for Mon-Sun
+    hours_input = css('input[type="text"]').filter(has_not_text="Type for hints").nth(param("day_index"))
+    add_row_button = by_role("button", name="Add Row")
+
+
+class TimePage(TimePageLocators, BasePage):
+    """Time page object for OrangeHRM"""
 
     # ---------- Actions ----------
     def navigate(self):
@@ -103,25 +61,23 @@ class TimePage(BasePage):
 
     def enter_project(self, project_name: str):
         """Enter project name and select from autocomplete"""
-        self.project_input.fill(project_name)
-        self.page.wait_for_timeout(1000)
-        self.page.get_by_role("option").first.click()
+        self.select_autocomplete(self.project_input, project_name, "time/projects")
 
     def select_activity(self, activity: str):
         """Select activity from dropdown"""
         self.activity_dropdown.click()
-        self.page.get_by_role("option", name=activity).click()
+        self.dropdown_option(activity).click()
 
     def enter_hours(self, day_index: int, hours: str):
         """Enter hours for a specific day (0-6 for Mon-Sun)"""
-        # Timesheet has input fields for each day
-        inputs = self.page.locator('input[type="text"]').filter(has_not_text="Type for hints")
-        inputs.nth(day_index).fill(hours)
+        self.hours_input(day_index).fill(hours)
 
+    @expects_api("time/timesheets/{id}", method="PUT")
     def submit_timesheet(self):
         """Submit the timesheet"""
         self.click_submit()
 
+    @expects_api("time/timesheets/{id}/entries", method="PUT")
     def save_timesheet(self):
         """Save the timesheet"""
         self.click_save()
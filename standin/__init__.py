@@ -0,0 +1,10 @@
+"""Local stand-in for the OrangeHRM web app and REST API"""
+from .state import StandinState
+from .app import StandinApp
+from .server import StandinServer
+
+__all__ = [
+    "StandinState",
+    "StandinApp",
+    "StandinServer",
+]
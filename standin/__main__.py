@@ -0,0 +1,27 @@
+"""
+Run the stand-in server from the command line.
+
+Usage:
+    python -m standin --port 8765
+"""
+import argparse
+
+from standin import StandinApp, StandinServer
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local OrangeHRM stand-in server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    server = StandinServer(StandinApp(), args.host, args.port)
+    print(f"OrangeHRM stand-in listening on {server.start()}")
+    try:
+        server.join()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,525 @@
+"""
+Request routing for the stand-in OrangeHRM application.
+Screens are served as an HTML shell plus the bundled app.js, which renders
+the same DOM structure the page objects target and talks to the in-memory
+REST API below. Static widget payloads come from recorded responses.
+"""
+import html
+import json
+import re
+from datetime import date
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+from standin.server import Request, Response
+from standin.state import LEAVE_TYPES, ORGANIZATION_NAME, PROJECTS, USER_ROLES, StandinState, SystemUser
+
+ASSETS_DIR = Path(__file__).parent / "assets"
+ASSET_VERSION = "5.7-standin"
+SESSION_COOKIE = "orangehrm"
+
+WEB = "/web/index.php"
+API = f"{WEB}/api/v2"
+
+# Screen name rendered by app.js for each module path the page objects use
+SCREENS = [
+    (r"dashboard/index", "dashboard"),
+    (r"pim/viewEmployeeList", "pim-list"),
+    (r"pim/addEmployee", "pim-add"),
+    (r"pim/viewPersonalDetails/empNumber/(?P<empNumber>\d+)", "personal-details"),
+    (r"admin/viewSystemUsers", "admin-list"),
+    (r"admin/saveSystemUser", "admin-add"),
+    (r"leave/viewLeaveList", "leave-list"),
+    (r"leave/viewMyLeaveList", "leave-my-list"),
+    (r"leave/applyLeave", "leave-apply"),
+    (r"leave/assignLeave", "leave-assign"),
+    (r"time/viewEmployeeTimesheet", "time-employee"),
+    (r"time/viewMyTimesheet", "time-my"),
+    (r"time/editTimesheet/(?P<timesheetId>\d+)", "time-edit"),
+]
+
+STATIC_FILES = {
+    "/web/dist/js/app.js": ("app.js", "application/javascript; charset=utf-8"),
+    "/web/dist/css/app.css": ("app.css", "text/css; charset=utf-8"),
+    "/web/images/ohrm_branding.png": ("ohrm_branding.png", "image/png"),
+    "/web/images/ohrm_logo.png": ("ohrm_branding.png", "image/png"),
+}
+
+# Bound API handlers: (request, signed-in user, path parameters) -> response
+Handler = Callable[[Request, SystemUser, dict], Response]
+
+
+def _json_error(status: int, message: str, invalid: Optional[dict] = None) -> Response:
+    error = {"status": str(status), "message": message}
+    if invalid:
+        error["data"] = {"invalidParamKeys": invalid}
+    return Response.json({"error": error}, status=status)
+
+
+def _list(items: List[dict], total: Optional[int] = None) -> Response:
+    return Response.json({"data": items, "meta": {"total": len(items) if total is None else total}, "rels": []})
+
+
+def _page(request: Request, items: list) -> Tuple[list, int]:
+    limit = int(request.query.get("limit", 50) or 50)
+    offset = int(request.query.get("offset", 0) or 0)
+    return items[offset:offset + limit] if limit else items[offset:], len(items)
+
+
+class StandinApp:
+    """Routes HTTP requests to page shells, static assets and API handlers"""
+
+    def __init__(self, state: Optional[StandinState] = None):
+        self.state = state or StandinState()
+        self._recorded = json.loads((ASSETS_DIR / "recorded_api.json").read_text(encoding="utf-8"))
+        self._static = {
+            path: ((ASSETS_DIR / name).read_bytes(), content_type)
+            for path, (name, content_type) in STATIC_FILES.items()
+        }
+        self._screens = [(re.compile(rf"{WEB}/{pattern}$"), name) for pattern, name in SCREENS]
+        self._api_routes: List[Tuple[str, re.Pattern, Handler]] = [
+            (method, re.compile(rf"{API}/{pattern}$"), handler)
+            for method, pattern, handler in (
+                ("GET", r"pim/employees", self.list_employees),
+                ("POST", r"pim/employees", self.create_employee),
+                ("DELETE", r"pim/employees", self.delete_employees),
+                ("GET", r"pim/employees/(?P<empNumber>\d+)/personal-details", self.get_personal_details),
+                ("PUT", r"pim/employees/(?P<empNumber>\d+)/personal-details", self.update_personal_details),
+                ("PUT", r"pim/employees/(?P<empNumber>\d+)/job-details", self.update_job_details),
+                ("POST", r"pim/employees/(?P<empNumber>\d+)/supervisors", self.add_supervisor),
+                ("GET", r"admin/users", self.list_users),
+                ("POST", r"admin/users", self.create_user),
+                ("DELETE", r"admin/users", self.delete_users),
+                ("GET", r"admin/job-titles", self.list_job_titles),
+                ("POST", r"admin/job-titles", self.create_job_title),
+                ("GET", r"admin/subunits", self.list_subunits),
+                ("POST", r"admin/subunits", self.create_subunit),
+                ("GET", r"leave/leave-types(?:/eligible)?", self.list_leave_types),
+                ("GET", r"leave/employees/leave-requests", self.list_leave_requests),
+                ("GET", r"leave/leave-requests", self.list_my_leave_requests),
+                ("POST", r"leave/leave-requests", self.create_leave_request),
+                ("POST", r"leave/employees/leave-requests", self.assign_leave_request),
+                ("PUT", r"leave/employees/leave-requests/(?P<id>\d+)", self.update_leave_request),
+                ("POST", r"leave/leave-entitlements", self.create_leave_entitlement),
+                ("GET", r"time/projects", self.list_projects),
+                ("GET", r"time/projects/(?P<id>\d+)/activities", self.list_activities),
+                ("GET", r"time/timesheets/default", self.get_my_timesheet),
+                ("GET", r"time/employees/timesheets/list", self.list_employee_timesheets),
+                ("POST", r"time/employees/(?P<empNumber>\d+)/timesheets", self.create_timesheet),
+                ("PUT", r"time/timesheets/(?P<id>\d+)", self.update_timesheet),
+                ("GET", r"time/timesheets/(?P<id>\d+)/entries", self.get_timesheet_entries),
+                ("PUT", r"time/(?:employees/)?timesheets/(?P<id>\d+)/entries", self.save_timesheet_entries),
+            )
+        ]
+
+    # ---------- Dispatch ----------
+    def handle(self, request: Request) -> Response:
+        path = request.path.rstrip("/") or "/"
+
+        if path in self._static:
+            body, content_type = self._static[path]
+            return Response(200, body, content_type, headers={
+                "Cache-Control": "public, max-age=31536000, immutable",
+                "ETag": f'"{ASSET_VERSION}-{len(body)}"',
+            })
+        if path in ("/", WEB, f"{WEB}/auth"):
+            return Response.redirect(f"{WEB}/auth/login")
+        if path == f"{WEB}/auth/login":
+            return self.login_page(request)
+        if path == f"{WEB}/auth/validate" and request.method == "POST":
+            return self.validate_login(request)
+        if path == f"{WEB}/auth/logout":
+            self.state.sessions.pop(request.cookies.get(SESSION_COOKIE, ""), None)
+            return Response.redirect(f"{WEB}/auth/login")
+
+        user = self.state.user_for_session(request.cookies.get(SESSION_COOKIE))
+
+        if path.startswith(API):
+            if user is None:
+                return _json_error(401, "Session expired")
+            recorded = self._recorded.get(path[len(API) + 1:])
+            if recorded is not None and request.method == "GET":
+                return Response.json(recorded)
+            for method, pattern, handler in self._api_routes:
+                match = pattern.match(path)
+                if match and method == request.method:
+                    try:
+                        return handler(request, user, match.groupdict())
+                    except (KeyError, ValueError, TypeError) as exc:
+                        return _json_error(422, f"Invalid Parameter: {exc}")
+            return _json_error(404, "Not Found")
+
+        if user is None:
+            return Response.redirect(f"{WEB}/auth/login")
+        if path == f"{WEB}/pim/viewMyDetails":
+            return Response.redirect(f"{WEB}/pim/viewPersonalDetails/empNumber/{user.emp_number}")
+        photo = re.match(rf"{WEB}/pim/viewPhoto/empNumber/\d+$", path)
+        if photo:
+            return Response(200, self._static["/web/images/ohrm_branding.png"][0], "image/png")
+        for pattern, screen in self._screens:
+            match = pattern.match(path)
+            if match:
+                return self.screen(screen, match.groupdict(), user)
+        return Response(404, b"<h1>404 Not Found</h1>")
+
+    # ---------- HTML ----------
+    def _session(self, request: Request) -> Tuple[str, dict]:
+        session_id = request.cookies.get(SESSION_COOKIE, "")
+        if session_id not in self.state.sessions:
+            session_id = self.state.new_session()
+        return session_id, self.state.sessions[session_id]
+
+    def login_page(self, request: Request) -> Response:
+        session_id, session = self._session(request)
+        if session["user_id"] is not None:
+            return Response.redirect(f"{WEB}/dashboard/index")
+
+        error, session["flash"] = session["flash"], None
+        token = session["csrf"]
+        template = (ASSETS_DIR / "login.html").read_text(encoding="utf-8")
+        body = template.format(
+            version=ASSET_VERSION,
+            token=html.escape(token),
+            token_prop=html.escape(json.dumps(token)),
+            error_prop=html.escape(json.dumps({"message": error} if error else None)),
+            error_alert=(
+                '<div class="oxd-alert oxd-alert--error" role="alert">'
+                f'<p class="oxd-text oxd-text--p oxd-alert-content-text">{html.escape(error)}</p></div>'
+                if error else ""
+            ),
+        )
+        return Response(200, body.encode(), headers={
+            "Set-Cookie": f"{SESSION_COOKIE}={session_id}; Path=/web; HttpOnly; SameSite=Lax",
+        })
+
+    def validate_login(self, request: Request) -> Response:
+        session_id, session = self._session(request)
+        form = request.form()
+        user = self.state.authenticate(form.get("username", ""), form.get("password", ""))
+        if form.get("_token") != session["csrf"]:
+            session["flash"] = "CSRF token validation failed"
+        elif user is None:
+            session["flash"] = "Invalid credentials"
+        else:
+            session["user_id"] = user.id
+            response = Response.redirect(f"{WEB}/dashboard/index")
+            response.headers["Set-Cookie"] = f"{SESSION_COOKIE}={session_id}; Path=/web; HttpOnly; SameSite=Lax"
+            return response
+        return Response.redirect(f"{WEB}/auth/login")
+
+    def screen(self, screen: str, params: dict, user: SystemUser) -> Response:
+        employee = self.state.employees.get(user.emp_number)
+        if screen == "pim-add":
+            params = {**params, "employeeId": self.state.next_employee_id()}
+        context = {
+            "screen": screen,
+            "params": params,
+            "user": {
+                "name": employee.full_name if employee else user.username,
+                "empNumber": user.emp_number,
+                "role": user.role,
+            },
+        }
+        template = (ASSETS_DIR / "app.html").read_text(encoding="utf-8")
+        body = template.format(version=ASSET_VERSION, context=html.escape(json.dumps(context)))
+        return Response(200, body.encode())
+
+    # ---------- PIM API ----------
+    def list_employees(self, request: Request, user, params) -> Response:
+        employees = self.state.search_employees(
+            request.query.get("nameOrId", ""), request.query.get("employeeId", "")
+        )
+        page, total = _page(request, employees)
+        return _list([e.to_api() for e in page], total)
+
+    def create_employee(self, request: Request, user, params) -> Response:
+        payload = request.json()
+        first, last = payload.get("firstName", "").strip(), payload.get("lastName", "").strip()
+        employee_id = (payload.get("employeeId") or "").strip()
+        invalid = {}
+        if not first:
+            invalid["firstName"] = "Required"
+        if not last:
+            invalid["lastName"] = "Required"
+        if employee_id and self.state.employee_id_taken(employee_id):
+            invalid["employeeId"] = "Employee Id already exists"
+        if invalid:
+            return _json_error(422, "Invalid Parameter", invalid)
+        employee = self.state.add_employee(first, last, payload.get("middleName", "").strip(), employee_id)
+        return Response.json({"data": employee.to_api(), "meta": [], "rels": []})
+
+    def delete_employees(self, request: Request, user, params) -> Response:
+        ids = [int(i) for i in request.json()["ids"]]
+        return Response.json({"data": self.state.delete_employees(ids), "meta": [], "rels": []})
+
+    def get_personal_details(self, request: Request, user, params) -> Response:
+        employee = self.state.employees.get(int(params["empNumber"]))
+        if employee is None:
+            return _json_error(404, "Record Not Found")
+        return Response.json({"data": employee.personal_details(), "meta": [], "rels": []})
+
+    def update_personal_details(self, request: Request, user, params) -> Response:
+        employee = self.state.employees.get(int(params["empNumber"]))
+        if employee is None:
+            return _json_error(404, "Record Not Found")
+        payload = request.json()
+        employee_id = payload.get("employeeId", employee.employee_id)
+        if self.state.employee_id_taken(employee_id, exclude=employee.emp_number):
+            return _json_error(422, "Invalid Parameter", {"employeeId": "Employee Id already exists"})
+        employee.first_name = payload.get("firstName", employee.first_name)
+        employee.middle_name = payload.get("middleName", employee.middle_name)
+        employee.last_name = payload.get("lastName", employee.last_name)
+        employee.employee_id = employee_id
+        employee.license_number = payload.get("drivingLicenseNo", employee.license_number)
+        employee.license_expiry = payload.get("drivingLicenseExpiredDate") or ""
+        employee.date_of_birth = payload.get("birthday") or ""
+        employee.marital_status = payload.get("maritalStatus", employee.marital_status)
+        employee.gender = payload.get("gender", employee.gender)
+        return Response.json({"data": employee.personal_details(), "meta": [], "rels": []})
+
+    def update_job_details(self, request: Request, user, params) -> Response:
+        employee = self.state.employees.get(int(params["empNumber"]))
+        if employee is None:
+            return _json_error(404, "Record Not Found")
+        payload = request.json()
+        invalid = {}
+        if payload.get("jobTitleId") and int(payload["jobTitleId"]) not in self.state.job_titles:
+            invalid["jobTitleId"] = "Invalid"
+        if payload.get("subunitId") and int(payload["subunitId"]) not in self.state.subunits:
+            invalid["subunitId"] = "Invalid"
+        if invalid:
+            return _json_error(422, "Invalid Parameter", invalid)
+        if payload.get("jobTitleId"):
+            employee.job_title = self.state.job_titles[int(payload["jobTitleId"])]
+        if payload.get("subunitId"):
+            employee.sub_unit = self.state.subunits[int(payload["subunitId"])]
+        return Response.json({"data": {
+            "empNumber": employee.emp_number,
+            "joinedDate": payload.get("joinedDate"),
+            "jobTitle": {"title": employee.job_title},
+            "subunit": {"name": employee.sub_unit},
+        }, "meta": [], "rels": []})
+
+    def add_supervisor(self, request: Request, user, params) -> Response:
+        employee = self.state.employees.get(int(params["empNumber"]))
+        if employee is None:
+            return _json_error(404, "Record Not Found")
+        supervisor = self.state.employees.get(int(request.json().get("empNumber") or 0))
+        if supervisor is None or supervisor is employee:
+            return _json_error(422, "Invalid Parameter", {"empNumber": "Invalid"})
+        employee.supervisor = f"{supervisor.first_name} {supervisor.last_name}"
+        return Response.json({"data": {
+            "supervisor": {"empNumber": supervisor.emp_number},
+            "subordinate": {"empNumber": employee.emp_number},
+            "reportingMethod": {"id": int(request.json().get("reportingMethodId") or 1)},
+        }, "meta": [], "rels": []})
+
+    # ---------- Admin API ----------
+    def list_users(self, request: Request, user, params) -> Response:
+        query = request.query
+        status = query.get("status")
+        users = self.state.search_users(
+            username=query.get("username", ""),
+            role_id=int(query["userRoleId"]) if query.get("userRoleId") else None,
+            enabled={"1": True, "0": False}.get(status) if status else None,
+            emp_number=int(query["empNumber"]) if query.get("empNumber") else None,
+        )
+        page, total = _page(request, users)
+        return _list([u.to_api(self.state.employees.get(u.emp_number)) for u in page], total)
+
+    def create_user(self, request: Request, user, params) -> Response:
+        payload = request.json()
+        username = payload.get("username", "").strip()
+        password = payload.get("password", "")
+        role_names = {role_id: name for name, role_id in USER_ROLES.items()}
+        invalid = {}
+        if len(username) < 5:
+            invalid["username"] = "Should have at least 5 characters"
+        elif self.state.username_taken(username):
+            invalid["username"] = "Already exists"
+        if len(password) < 7:
+            invalid["password"] = "Should have at least 7 characters"
+        if int(payload.get("empNumber") or 0) not in self.state.employees:
+            invalid["empNumber"] = "Invalid"
+        if int(payload.get("userRoleId") or 0) not in role_names:
+            invalid["userRoleId"] = "Invalid"
+        if invalid:
+            return _json_error(422, "Invalid Parameter", invalid)
+        created = self.state.add_user(
+            username, password, role_names[int(payload["userRoleId"])],
+            int(payload["empNumber"]), bool(payload.get("status", True)),
+        )
+        return Response.json({"data": created.to_api(self.state.employees.get(created.emp_number)), "meta": [], "rels": []})
+
+    def delete_users(self, request: Request, user, params) -> Response:
+        ids = [int(i) for i in request.json()["ids"]]
+        if user.id in ids:
+            return _json_error(422, "Cannot delete the current user")
+        return Response.json({"data": self.state.delete_users(ids), "meta": [], "rels": []})
+
+    def list_job_titles(self, request: Request, user, params) -> Response:
+        page, total = _page(request, list(self.state.job_titles.items()))
+        return _list([{"id": i, "title": title, "description": "", "note": ""} for i, title in page], total)
+
+    def create_job_title(self, request: Request, user, params) -> Response:
+        title = request.json().get("title", "").strip()
+        if not title:
+            return _json_error(422, "Invalid Parameter", {"title": "Required"})
+        if title in self.state.job_titles.values():
+            return _json_error(422, "Invalid Parameter", {"title": "Already exists"})
+        job_title_id = self.state.add_job_title(title)
+        return Response.json({"data": {"id": job_title_id, "title": title}, "meta": [], "rels": []})
+
+    def list_subunits(self, request: Request, user, params) -> Response:
+        # A flat tree: the organization at level 0, every other unit directly below it
+        return _list([
+            {"id": i, "name": name, "unitId": "", "level": 0 if name == ORGANIZATION_NAME else 1}
+            for i, name in self.state.subunits.items()
+        ])
+
+    def create_subunit(self, request: Request, user, params) -> Response:
+        name = request.json().get("name", "").strip()
+        if not name:
+            return _json_error(422, "Invalid Parameter", {"name": "Required"})
+        subunit_id = self.state.add_subunit(name)
+        return Response.json({"data": {"id": subunit_id, "name": name, "level": 1}, "meta": [], "rels": []})
+
+    # ---------- Leave API ----------
+    def list_leave_types(self, request: Request, user, params) -> Response:
+        return _list([{"id": i, "name": name} for i, name in LEAVE_TYPES.items()])
+
+    def _leave_to_api(self, leave) -> dict:
+        employee = self.state.employees.get(leave.emp_number)
+        return {
+            "id": leave.id,
+            "employee": {
+                "empNumber": leave.emp_number,
+                "firstName": employee.first_name if employee else "",
+                "lastName": employee.last_name if employee else "",
+            },
+            "leaveType": {"id": leave.leave_type_id, "name": LEAVE_TYPES.get(leave.leave_type_id, "")},
+            "dates": {"fromDate": leave.from_date, "toDate": leave.to_date},
+            "noOfDays": leave.days,
+            "leaveStatuses": [{"name": leave.status}],
+            "lastComment": {"comment": leave.comment} if leave.comment else None,
+        }
+
+    def list_leave_requests(self, request: Request, user, params) -> Response:
+        leaves = self.state.search_leave_requests(request.query.get("fromDate", ""), request.query.get("toDate", ""))
+        page, total = _page(request, leaves)
+        return _list([self._leave_to_api(leave) for leave in page], total)
+
+    def list_my_leave_requests(self, request: Request, user, params) -> Response:
+        leaves = [
+            leave for leave in self.state.search_leave_requests(
+                request.query.get("fromDate", ""), request.query.get("toDate", ""))
+            if leave.emp_number == user.emp_number
+        ]
+        return _list([self._leave_to_api(leave) for leave in leaves])
+
+    def _create_leave(self, emp_number: int, payload: dict) -> Response:
+        from_date, to_date = payload.get("fromDate", ""), payload.get("toDate", "") or payload.get("fromDate", "")
+        invalid = {}
+        if int(payload.get("leaveTypeId") or 0) not in LEAVE_TYPES:
+            invalid["leaveTypeId"] = "Required"
+        try:
+            if date.fromisoformat(to_date) < date.fromisoformat(from_date):
+                invalid["toDate"] = "To date should be after from date"
+        except ValueError:
+            invalid["fromDate"] = "Should be a valid date in yyyy-mm-dd format"
+        if invalid:
+            return _json_error(422, "Invalid Parameter", invalid)
+        leave = self.state.add_leave_request(
+            emp_number, int(payload["leaveTypeId"]), from_date, to_date, payload.get("comment") or ""
+        )
+        return Response.json({"data": self._leave_to_api(leave), "meta": [], "rels": []})
+
+    def create_leave_request(self, request: Request, user, params) -> Response:
+        return self._create_leave(user.emp_number, request.json())
+
+    def assign_leave_request(self, request: Request, user, params) -> Response:
+        payload = request.json()
+        return self._create_leave(int(payload["empNumber"]), payload)
+
+    def update_leave_request(self, request: Request, user, params) -> Response:
+        leave = self.state.leave_requests.get(int(params["id"]))
+        if leave is None:
+            return _json_error(404, "Record Not Found")
+        statuses = {"APPROVE": "Scheduled", "REJECT": "Rejected", "CANCEL": "Cancelled"}
+        leave.status = statuses[request.json()["action"]]
+        return Response.json({"data": self._leave_to_api(leave), "meta": [], "rels": []})
+
+    def create_leave_entitlement(self, request: Request, user, params) -> Response:
+        payload = request.json()
+        record = self.state.add_leave_entitlement(
+            int(payload["empNumber"]), int(payload["leaveTypeId"]),
+            payload["fromDate"], payload["toDate"], float(payload["entitlement"]),
+        )
+        return Response.json({"data": record, "meta": [], "rels": []})
+
+    # ---------- Time API ----------
+    def list_projects(self, request: Request, user, params) -> Response:
+        name = request.query.get("name", "").lower()
+        return _list([
+            {"id": i, "name": project["name"], "customer": {"name": project["name"].split(" ")[0]}}
+            for i, project in PROJECTS.items() if name in project["name"].lower()
+        ])
+
+    def list_activities(self, request: Request, user, params) -> Response:
+        project = PROJECTS[int(params["id"])]
+        return _list([{"id": i, "name": name} for i, name in project["activities"].items()])
+
+    def _timesheet_to_api(self, timesheet) -> dict:
+        employee = self.state.employees.get(timesheet.emp_number)
+        return {
+            "id": timesheet.id,
+            "startDate": timesheet.start_date,
+            "endDate": timesheet.end_date,
+            "status": {"id": timesheet.status.upper().replace(" ", "_"), "name": timesheet.status},
+            "employee": {
+                "empNumber": timesheet.emp_number,
+                "firstName": employee.first_name if employee else "",
+                "lastName": employee.last_name if employee else "",
+            },
+        }
+
+    def get_my_timesheet(self, request: Request, user, params) -> Response:
+        day = date.fromisoformat(request.query["date"]) if request.query.get("date") else date.today()
+        timesheet = self.state.timesheet_for(user.emp_number, day)
+        return Response.json({"data": self._timesheet_to_api(timesheet), "meta": [], "rels": []})
+
+    def list_employee_timesheets(self, request: Request, user, params) -> Response:
+        pending = [t for t in self.state.timesheets.values() if t.status == "Submitted"]
+        return _list([self._timesheet_to_api(t) for t in pending])
+
+    def create_timesheet(self, request: Request, user, params) -> Response:
+        day = date.fromisoformat(request.json()["date"])
+        timesheet = self.state.timesheet_for(int(params["empNumber"]), day)
+        return Response.json({"data": self._timesheet_to_api(timesheet), "meta": [], "rels": []})
+
+    def update_timesheet(self, request: Request, user, params) -> Response:
+        timesheet = self.state.timesheets[int(params["id"])]
+        statuses = {"SUBMIT": "Submitted", "APPROVE": "Approved", "REJECT": "Rejected"}
+        timesheet.status = statuses[request.json()["action"]]
+        return Response.json({"data": self._timesheet_to_api(timesheet), "meta": [], "rels": []})
+
+    def get_timesheet_entries(self, request: Request, user, params) -> Response:
+        timesheet = self.state.timesheets[int(params["id"])]
+        return Response.json({
+            "data": timesheet.entries,
+            "meta": {"timesheet": self._timesheet_to_api(timesheet)},
+            "rels": [],
+        })
+
+    def save_timesheet_entries(self, request: Request, user, params) -> Response:
+        timesheet = self.state.timesheets[int(params["id"])]
+        entries = []
+        for entry in request.json().get("entries", []):
+            project = PROJECTS[int(entry["projectId"])]
+            entries.append({
+                "project": {"id": int(entry["projectId"]), "name": project["name"]},
+                "activity": {"id": int(entry["activityId"]), "name": project["activities"][int(entry["activityId"])]},
+                "dates": entry.get("dates", {}),
+            })
+        timesheet.entries = entries
+        return Response.json({"data": entries, "meta": [], "rels": []})
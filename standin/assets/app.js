@@ -0,0 +1,1123 @@
+/*
+ * OrangeHRM stand-in client bundle.
+ * Renders each screen with the same class names, labels and roles as the
+ * real OrangeHRM 5 frontend and drives it through the /api/v2 endpoints.
+ */
+(function () {
+  "use strict";
+
+  var WEB = "/web/index.php";
+  var API = WEB + "/api/v2";
+  var AUTOCOMPLETE_DEBOUNCE_MS = 300;
+  var TOAST_DURATION_MS = 4000;
+
+  // ---------------------------------------------------------------- helpers
+  function h(tag, attrs) {
+    var el = document.createElement(tag);
+    Object.keys(attrs || {}).forEach(function (key) {
+      var value = attrs[key];
+      if (value === null || value === undefined || value === false) return;
+      if (key === "class") el.className = value;
+      else if (key === "text") el.textContent = value;
+      else if (key.slice(0, 2) === "on") el.addEventListener(key.slice(2), value);
+      else el.setAttribute(key, value === true ? "" : value);
+    });
+    for (var i = 2; i < arguments.length; i++) append(el, arguments[i]);
+    return el;
+  }
+
+  function append(parent, child) {
+    if (child === null || child === undefined || child === false) return;
+    if (Array.isArray(child)) child.forEach(function (c) { append(parent, c); });
+    else parent.appendChild(typeof child === "string" ? document.createTextNode(child) : child);
+  }
+
+  function clear(el) {
+    while (el.firstChild) el.removeChild(el.firstChild);
+    return el;
+  }
+
+  function go(path) {
+    window.location.href = WEB + "/" + path;
+  }
+
+  function api(method, path, body) {
+    var options = { method: method, headers: { Accept: "application/json" }, credentials: "same-origin" };
+    if (body !== undefined) {
+      options.headers["Content-Type"] = "application/json";
+      options.body = JSON.stringify(body);
+    }
+    return fetch(API + "/" + path, options).then(function (response) {
+      if (response.status === 401) {
+        window.location.href = WEB + "/auth/login";
+        return new Promise(function () {});
+      }
+      return response.json().then(function (payload) {
+        if (!response.ok) {
+          var error = new Error((payload.error && payload.error.message) || response.statusText);
+          error.invalid = (payload.error && payload.error.data && payload.error.data.invalidParamKeys) || {};
+          throw error;
+        }
+        return payload;
+      });
+    });
+  }
+
+  function query(params) {
+    var parts = [];
+    Object.keys(params).forEach(function (key) {
+      if (params[key] !== "" && params[key] !== null && params[key] !== undefined) {
+        parts.push(encodeURIComponent(key) + "=" + encodeURIComponent(params[key]));
+      }
+    });
+    return parts.length ? "?" + parts.join("&") : "";
+  }
+
+  function fullName(person) {
+    return [person.firstName, person.middleName, person.lastName].filter(Boolean).join(" ");
+  }
+
+  // ----------------------------------------------------------------- toasts
+  function toast(type, message) {
+    var titles = { success: "Success", error: "Error", info: "Info", warn: "Warning" };
+    var container = document.querySelector(".oxd-toast-container");
+    var el = h("div", { class: "oxd-toast oxd-toast--" + type + " oxd-toast-container--toast" },
+      h("div", { class: "oxd-toast-start" },
+        h("div", { class: "oxd-toast-icon-wrap oxd-toast-icon-wrap--" + type }),
+        h("div", { class: "oxd-toast-content oxd-toast-content--" + type },
+          h("p", { class: "oxd-text oxd-text--p oxd-text--toast-title oxd-toast-content-text", text: titles[type] }),
+          h("p", { class: "oxd-text oxd-text--p oxd-text--toast-message oxd-toast-content-text", text: message }))),
+      h("div", { class: "oxd-toast-close-container" },
+        h("button", { class: "oxd-toast-close", type: "button", "aria-label": "Close", onclick: function () { el.remove(); } })));
+    container.appendChild(el);
+    setTimeout(function () { el.remove(); }, TOAST_DURATION_MS);
+  }
+
+  // Toasts that must survive a navigation (e.g. "Successfully Saved" + redirect)
+  function flash(type, message, path) {
+    sessionStorage.setItem("standin.flash", JSON.stringify({ type: type, message: message }));
+    go(path);
+  }
+
+  function showFlash() {
+    var raw = sessionStorage.getItem("standin.flash");
+    if (!raw) return;
+    sessionStorage.removeItem("standin.flash");
+    var data = JSON.parse(raw);
+    toast(data.type, data.message);
+  }
+
+  // ------------------------------------------------------------ form fields
+  function textInput(attrs) {
+    var el = h("input", Object.assign({ class: "oxd-input oxd-input--active", autocomplete: "off" }, attrs || {}));
+    el.addEventListener("focus", function () { el.classList.add("oxd-input--focus"); });
+    el.addEventListener("blur", function () { el.classList.remove("oxd-input--focus"); });
+    return el;
+  }
+
+  function dateInput(attrs) {
+    return h("div", { class: "oxd-date-wrapper" },
+      h("div", { class: "oxd-date-input" }, textInput(Object.assign({ placeholder: "yyyy-mm-dd" }, attrs || {}))));
+  }
+
+  function field(label, control, required) {
+    return h("div", { class: "oxd-input-group oxd-input-field-bottom-space" },
+      h("label", { class: "oxd-label" + (required ? " oxd-input-field-required" : ""), text: label }),
+      h("div", { class: "oxd-input-wrapper" }, control));
+  }
+
+  function setError(control, message) {
+    var group = control.closest(".oxd-input-group");
+    var existing = group.querySelector(".oxd-input-field-error-message");
+    if (existing) existing.remove();
+    var input = control.matches("input, textarea") ? control : control.querySelector("input, .oxd-select-text");
+    if (input) input.classList.add("oxd-input--error");
+    group.appendChild(h("span", {
+      class: "oxd-text oxd-text--span oxd-input-field-error-message oxd-input-group__message",
+      text: message,
+    }));
+  }
+
+  function clearErrors(form) {
+    form.querySelectorAll(".oxd-input-field-error-message").forEach(function (el) { el.remove(); });
+    form.querySelectorAll(".oxd-input--error").forEach(function (el) { el.classList.remove("oxd-input--error"); });
+  }
+
+  function closeDropdowns(except) {
+    document.querySelectorAll("[role=listbox]").forEach(function (el) {
+      if (el !== except) el.remove();
+    });
+  }
+
+  document.addEventListener("mousedown", function (event) {
+    if (!event.target.closest(".oxd-select-wrapper, .oxd-autocomplete-wrapper")) closeDropdowns();
+  });
+
+  // Select: <div class="oxd-select-text-input">-- Select --</div> + listbox of options
+  function select(options, onChange) {
+    var display = h("div", { class: "oxd-select-text-input", tabindex: "0", text: "-- Select --" });
+    var wrapper = h("div", { class: "oxd-select-wrapper" },
+      h("div", { class: "oxd-select-text oxd-select-text--active" },
+        display, h("div", { class: "oxd-select-text--after" }, h("i", { class: "oxd-icon bi-caret-down-fill oxd-select-text--arrow" }))));
+    wrapper.value = "";
+
+    function choose(option) {
+      wrapper.value = option.value;
+      display.textContent = option.label;
+      closeDropdowns();
+      if (onChange) onChange(option.value);
+    }
+
+    wrapper.setValue = function (value) {
+      var option = options.filter(function (o) { return String(o.value) === String(value); })[0];
+      wrapper.value = option ? option.value : "";
+      display.textContent = option ? option.label : "-- Select --";
+    };
+    wrapper.setOptions = function (newOptions) { options = newOptions; };
+
+    wrapper.querySelector(".oxd-select-text").addEventListener("click", function () {
+      var open = wrapper.querySelector("[role=listbox]");
+      closeDropdowns();
+      if (open) return;
+      var listbox = h("div", { class: "oxd-select-dropdown --positon-bottom", role: "listbox" },
+        options.map(function (option) {
+          return h("div", {
+            class: "oxd-select-option", role: "option",
+            onmousedown: function (event) { event.preventDefault(); choose(option); },
+          }, h("span", { text: option.label }));
+        }));
+      wrapper.appendChild(listbox);
+    });
+    return wrapper;
+  }
+
+  // Autocomplete: debounced API lookup rendered as a listbox under the input
+  function autocomplete(search, label) {
+    var input = textInput({ placeholder: "Type for hints..." });
+    var wrapper = h("div", { class: "oxd-autocomplete-wrapper" },
+      h("div", { class: "oxd-autocomplete-text-input oxd-autocomplete-text-input--active" }, input));
+    var timer = null;
+    var generation = 0;
+    wrapper.selected = null;
+    wrapper.input = input;
+
+    function render(items) {
+      closeDropdowns();
+      var listbox = h("div", { class: "oxd-autocomplete-dropdown --positon-bottom", role: "listbox" });
+      if (!items.length) {
+        listbox.appendChild(h("div", { class: "oxd-autocomplete-option", text: "No Records Found" }));
+      }
+      items.forEach(function (item) {
+        listbox.appendChild(h("div", {
+          class: "oxd-autocomplete-option", role: "option",
+          onmousedown: function (event) {
+            event.preventDefault();
+            wrapper.selected = item;
+            input.value = label(item);
+            closeDropdowns();
+          },
+        }, h("span", { text: label(item) })));
+      });
+      wrapper.appendChild(listbox);
+    }
+
+    input.addEventListener("input", function () {
+      wrapper.selected = null;
+      clearTimeout(timer);
+      var text = input.value.trim();
+      if (!text) { closeDropdowns(); return; }
+      closeDropdowns();
+      wrapper.appendChild(h("div", { class: "oxd-autocomplete-dropdown --positon-bottom", role: "listbox" },
+        h("div", { class: "oxd-autocomplete-option --loading", text: "Searching...." })));
+      var current = ++generation;
+      timer = setTimeout(function () {
+        search(text).then(function (items) {
+          if (current === generation && document.activeElement === input) render(items);
+        });
+      }, AUTOCOMPLETE_DEBOUNCE_MS);
+    });
+    input.addEventListener("blur", function () { closeDropdowns(); });
+    return wrapper;
+  }
+
+  function employeeAutocomplete() {
+    return autocomplete(function (text) {
+      return api("GET", "pim/employees" + query({ nameOrId: text, limit: 10 })).then(function (r) { return r.data; });
+    }, fullName);
+  }
+
+  function button(label, attrs) {
+    var variant = (attrs && attrs.variant) || "main";
+    var el = h("button", Object.assign({ type: "button", class: "oxd-button oxd-button--medium oxd-button--" + variant }, attrs || {}), " " + label + " ");
+    el.removeAttribute("variant");
+    return el;
+  }
+
+  function formActions() {
+    return h("div", { class: "oxd-form-actions" }, Array.prototype.slice.call(arguments));
+  }
+
+  function card(title) {
+    var body = Array.prototype.slice.call(arguments, 1);
+    return h("div", { class: "orangehrm-card-container" },
+      h("h6", { class: "oxd-text oxd-text--h6 orangehrm-main-title", text: title }),
+      h("hr", { class: "oxd-divider" }),
+      body);
+  }
+
+  // ----------------------------------------------------------------- tables
+  function confirmDelete(onConfirm) {
+    var dialog = h("div", { class: "oxd-dialog-container-default" },
+      h("div", { class: "oxd-dialog-sheet oxd-dialog-sheet--shadow", role: "document" },
+        h("div", { class: "orangehrm-modal-header" },
+          h("p", { class: "oxd-text oxd-text--p oxd-text--card-title", text: "Are you Sure?" })),
+        h("div", { class: "orangehrm-text-center-align" },
+          h("p", { class: "oxd-text oxd-text--p oxd-text--card-body", text: "The selected record will be permanently deleted. Are you sure you want to continue?" })),
+        h("div", { class: "orangehrm-modal-footer" },
+          button("No, Cancel", { variant: "ghost", onclick: function () { dialog.remove(); } }),
+          button("Yes, Delete", { variant: "label-danger", onclick: function () { dialog.remove(); onConfirm(); } }))));
+    document.body.appendChild(dialog);
+  }
+
+  // Data table with selectable rows and an optional "Delete Selected" action
+  function dataTable(columns, options) {
+    options = options || {};
+    var header = h("div", { class: "orangehrm-horizontal-padding orangehrm-vertical-padding" });
+    var body = h("div", { class: "oxd-table-body", role: "rowgroup" });
+    var table = h("div", { class: "oxd-table", role: "table" },
+      h("div", { class: "oxd-table-header", role: "rowgroup" },
+        h("div", { class: "oxd-table-row oxd-table-row--with-border", role: "row" },
+          options.onDelete ? h("div", { class: "oxd-table-header-cell oxd-padding-cell oxd-table-th", role: "columnheader" }) : null,
+          columns.map(function (column) {
+            return h("div", { class: "oxd-table-header-cell oxd-padding-cell oxd-table-th", role: "columnheader", text: column.title });
+          }))),
+      body);
+    var container = h("div", { class: "orangehrm-paper-container" }, options.toolbar || null, header, h("div", { class: "orangehrm-container" }, table));
+    var selected = {};
+
+    function renderHeader(total) {
+      clear(header);
+      var ids = Object.keys(selected);
+      if (ids.length && options.onDelete) {
+        header.appendChild(h("div", { class: "orangehrm-horizontal-padding" },
+          h("span", { class: "oxd-text oxd-text--span", text: "(" + ids.length + ") Record Selected" }),
+          button("Delete Selected", {
+            variant: "label-danger orangehrm-horizontal-margin",
+            onclick: function () { confirmDelete(function () { options.onDelete(ids.map(Number)); }); },
+          })));
+      } else {
+        header.appendChild(h("span", {
+          class: "oxd-text oxd-text--span",
+          text: total ? "(" + total + ") Record" + (total === 1 ? "" : "s") + " Found" : "No Records Found",
+        }));
+      }
+    }
+
+    container.loading = function () {
+      clear(body).appendChild(h("div", { class: "oxd-loading-spinner-container" }, h("div", { class: "oxd-loading-spinner" })));
+    };
+
+    container.render = function (rows, total) {
+      selected = {};
+      clear(body);
+      rows.forEach(function (row) {
+        var cells = [];
+        if (options.onDelete) {
+          var checkbox = h("input", { type: "checkbox", value: String(row.id) });
+          checkbox.addEventListener("change", function () {
+            if (checkbox.checked) selected[row.id] = true; else delete selected[row.id];
+            renderHeader(total);
+          });
+          cells.push(h("div", { class: "oxd-table-cell oxd-padding-cell", role: "cell" },
+            h("div", { class: "oxd-table-card-cell-checkbox" },
+              h("div", { class: "oxd-checkbox-wrapper" },
+                h("label", {}, checkbox, h("span", { class: "oxd-checkbox-input oxd-checkbox-input--active --label-right" }))))));
+        }
+        columns.forEach(function (column) {
+          var value = column.render(row);
+          cells.push(h("div", { class: "oxd-table-cell oxd-padding-cell", role: "cell" },
+            typeof value === "string" || typeof value === "number" ? h("div", { text: String(value) }) : value));
+        });
+        body.appendChild(h("div", { class: "oxd-table-card" },
+          h("div", { class: "oxd-table-row oxd-table-row--with-border", role: "row" }, cells)));
+      });
+      renderHeader(total === undefined ? rows.length : total);
+      if (!rows.length) toast("info", "No Records Found");
+    };
+    return container;
+  }
+
+  function filterForm(title, fields, onSearch, onReset) {
+    var form = h("form", { class: "oxd-form", novalidate: true },
+      h("div", { class: "oxd-form-row" }, h("div", { class: "oxd-grid-4 oxd-grid" },
+        fields.map(function (f) { return h("div", { class: "oxd-grid-item oxd-grid-item--gutters" }, f); }))),
+      h("hr", { class: "oxd-divider" }),
+      formActions(
+        button("Reset", { variant: "ghost", onclick: function () { form.reset(); onReset(); } }),
+        button("Search", { type: "submit", variant: "secondary orangehrm-left-space" })));
+    form.addEventListener("submit", function (event) {
+      event.preventDefault();
+      closeDropdowns();
+      onSearch();
+    });
+    return h("div", { class: "oxd-table-filter" },
+      h("div", { class: "oxd-table-filter-header" },
+        h("h5", { class: "oxd-text oxd-text--h5 oxd-table-filter-title", text: title })),
+      h("hr", { class: "oxd-divider" }), form);
+  }
+
+  // ----------------------------------------------------------------- layout
+  var MODULE_TITLES = {
+    dashboard: "Dashboard", pim: "PIM", admin: "Admin", leave: "Leave", time: "Time", "personal-details": "PIM",
+  };
+
+  var TOP_NAV = {
+    pim: [["Configuration"], ["Employee List", "pim/viewEmployeeList"], ["Add Employee", "pim/addEmployee"], ["Reports"]],
+    admin: [["User Management", "admin/viewSystemUsers"], ["Job"], ["Organization"], ["Qualifications"], ["Nationalities"]],
+    leave: [["Apply", "leave/applyLeave"], ["My Leave", "leave/viewMyLeaveList"], ["Entitlements"], ["Reports"],
+      ["Configure"], ["Leave List", "leave/viewLeaveList"], ["Assign Leave", "leave/assignLeave"]],
+    time: [["My Timesheets", "time/viewMyTimesheet"], ["Employee Timesheets", "time/viewEmployeeTimesheet"],
+      ["Attendance"], ["Reports"], ["Project Info"]],
+  };
+
+  var SIDE_MENU = [
+    ["Admin", "admin/viewSystemUsers"], ["PIM", "pim/viewEmployeeList"], ["Leave", "leave/viewLeaveList"],
+    ["Time", "time/viewEmployeeTimesheet"], ["My Info", "pim/viewMyDetails"], ["Dashboard", "dashboard/index"],
+  ];
+
+  function layout(ctx, content) {
+    var module = ctx.screen.split("-")[0];
+    var title = MODULE_TITLES[module] || MODULE_TITLES[ctx.screen];
+    var userMenu = h("ul", { class: "oxd-dropdown-menu", role: "menu", hidden: true },
+      h("li", {}, h("a", { role: "menuitem", class: "oxd-userdropdown-link", href: "#", text: "About" })),
+      h("li", {}, h("a", { role: "menuitem", class: "oxd-userdropdown-link", href: "#", text: "Support" })),
+      h("li", {}, h("a", { role: "menuitem", class: "oxd-userdropdown-link", href: "#", text: "Change Password" })),
+      h("li", {}, h("a", { role: "menuitem", class: "oxd-userdropdown-link", href: WEB + "/auth/logout", text: "Logout" })));
+    var userTab = h("span", {
+      class: "oxd-userdropdown-tab",
+      onclick: function () { userMenu.hidden = !userMenu.hidden; },
+    }, h("img", { class: "oxd-userdropdown-img", alt: "profile picture", src: WEB + "/pim/viewPhoto/empNumber/" + ctx.user.empNumber }),
+      h("p", { class: "oxd-userdropdown-name", text: ctx.user.name }));
+
+    var activeModule = ctx.screen === "personal-details" ? "pim" : module;
+    return h("div", { class: "oxd-layout" },
+      h("div", { class: "oxd-layout-navigation" },
+        h("aside", { class: "oxd-sidepanel" },
+          h("nav", { class: "oxd-navbar-nav", role: "navigation", "aria-label": "Sidepanel" },
+            h("div", { class: "oxd-sidepanel-header" },
+              h("a", { class: "oxd-brand", href: "#", "aria-label": "Home" },
+                h("img", { alt: "client brand banner", src: "/web/images/ohrm_logo.png" }))),
+            h("div", { class: "oxd-sidepanel-body" },
+              h("div", { class: "oxd-main-menu-search" }, h("input", { placeholder: "Search", "aria-label": "Search menu" })),
+              h("ul", { class: "oxd-main-menu" }, SIDE_MENU.map(function (item) {
+                var active = item[1].split("/")[0] === activeModule && item[0] !== "My Info";
+                return h("li", { class: "oxd-main-menu-item-wrapper" },
+                  h("a", { class: "oxd-main-menu-item" + (active ? " active" : ""), href: WEB + "/" + item[1] },
+                    h("span", { class: "oxd-text oxd-text--span oxd-main-menu-item--name", text: item[0] })));
+              }))))),
+        h("header", { class: "oxd-topbar" },
+          h("div", { class: "oxd-topbar-header" },
+            h("div", { class: "oxd-topbar-header-title" },
+              h("span", { class: "oxd-topbar-header-breadcrumb" },
+                h("h6", { class: "oxd-text oxd-text--h6 oxd-topbar-header-breadcrumb-module", text: title }))),
+            h("div", { class: "oxd-topbar-header-userarea" }, h("ul", {}, h("li", { class: "oxd-userdropdown" }, userTab, userMenu)))),
+          TOP_NAV[activeModule] ? h("div", { class: "oxd-topbar-body" },
+            h("nav", { class: "oxd-topbar-body-nav", "aria-label": "Topbar Menu" },
+              h("ul", {}, TOP_NAV[activeModule].map(function (item) {
+                return h("li", { class: "oxd-topbar-body-nav-tab" }, item[1]
+                  ? h("a", { class: "oxd-topbar-body-nav-tab-item", href: WEB + "/" + item[1], text: item[0] })
+                  : h("span", { class: "oxd-topbar-body-nav-tab-item", text: item[0] }));
+              })))) : null)),
+      h("div", { class: "oxd-layout-container" }, h("div", { class: "oxd-layout-context" }, content)),
+      h("div", { class: "oxd-toast-container oxd-toast-container--bottom" }));
+  }
+
+  // -------------------------------------------------------------- dashboard
+  var QUICK_LAUNCH = [
+    ["Assign Leave", "leave/assignLeave"], ["Leave List", "leave/viewLeaveList"],
+    ["Timesheets", "time/viewEmployeeTimesheet"], ["Apply Leave", "leave/applyLeave"],
+    ["My Leave", "leave/viewMyLeaveList"], ["My Timesheet", "time/viewMyTimesheet"],
+  ];
+
+  function widget(title, endpoint, renderBody) {
+    var body = h("div", { class: "orangehrm-dashboard-widget-body" }, h("div", { class: "oxd-loading-spinner" }));
+    if (endpoint) {
+      api("GET", endpoint).then(function (payload) { clear(body).appendChild(renderBody(payload.data)); });
+    } else {
+      clear(body).appendChild(renderBody());
+    }
+    return h("div", { class: "oxd-grid-item oxd-grid-item--gutters orangehrm-dashboard-widget" },
+      h("div", { class: "oxd-sheet oxd-sheet--rounded oxd-sheet--white orangehrm-dashboard-widget" },
+        h("div", { class: "orangehrm-dashboard-widget-header" },
+          h("div", { class: "orangehrm-dashboard-widget-name" },
+            h("p", { class: "oxd-text oxd-text--p", text: title }))),
+        h("hr", { class: "oxd-divider" }), body));
+  }
+
+  function barChart(items) {
+    var max = Math.max.apply(null, items.map(function (i) { return i.count; }).concat([1]));
+    return h("ul", { class: "oxd-chart-legend" }, items.map(function (item) {
+      return h("li", {},
+        h("span", { class: "oxd-chart-legend-key", style: "width:" + Math.round(100 * item.count / max) + "px" }),
+        h("span", { class: "oxd-text oxd-text--span", text: item.name + " (" + item.count + ")" }));
+    }));
+  }
+
+  function dashboardScreen() {
+    return h("div", { class: "oxd-layout-context orangehrm-dashboard-grid" }, h("div", { class: "oxd-grid-3 orangehrm-dashboard-grid" },
+      widget("Time at Work", "dashboard/employees/time-at-work", function (data) {
+        return h("div", { class: "orangehrm-attendance-card" },
+          h("p", { class: "oxd-text oxd-text--p orangehrm-attendance-card-state", text: data.lastAction.state }),
+          h("p", { class: "oxd-text oxd-text--p", text: "Total: " + data.currentWeek.totalTime.hours + "h " + data.currentWeek.totalTime.minutes + "m" }));
+      }),
+      widget("My Actions", "dashboard/employees/action-summary", function (data) {
+        return h("div", { class: "orangehrm-todo-list" }, data.map(function (item) {
+          return h("p", { class: "oxd-text oxd-text--p orangehrm-todo-list-item", text: "(" + item.pendingActionCount + ") " + item.group });
+        }));
+      }),
+      widget("Quick Launch", "dashboard/shortcuts", function () {
+        return h("div", { class: "oxd-grid-3 orangehrm-quick-launch" }, QUICK_LAUNCH.map(function (item) {
+          return h("div", { class: "orangehrm-quick-launch-card" },
+            h("button", {
+              class: "oxd-icon-button orangehrm-quick-launch-icon", type: "button", title: item[0], "aria-label": item[0],
+              onclick: function () { go(item[1]); },
+            }, h("i", { class: "oxd-icon" })),
+            h("div", { class: "orangehrm-quick-launch-heading", title: item[0] },
+              h("p", { class: "oxd-text oxd-text--p", text: item[0] })));
+        }));
+      }),
+      widget("Buzz Latest Posts", "buzz/feed?limit=5&offset=0&sortOrder=DESC&sortField=share.createdAtUtc", function (data) {
+        return h("div", { class: "orangehrm-buzz-widget" }, data.map(function (post) {
+          return h("div", { class: "orangehrm-buzz-widget-card" },
+            h("img", { class: "orangehrm-buzz-widget-picture", alt: "profile picture", src: WEB + "/pim/viewPhoto/empNumber/" + post.employee.empNumber }),
+            h("p", { class: "oxd-text oxd-text--p orangehrm-buzz-widget-header-emp", text: fullName(post.employee) }),
+            h("p", { class: "oxd-text oxd-text--p orangehrm-buzz-widget-body", text: post.post.text }));
+        }));
+      }),
+      widget("Employees on Leave Today", "dashboard/employees/leaves?date=today", function (data) {
+        return data.length
+          ? h("div", {}, data.map(function (item) { return h("p", { class: "oxd-text oxd-text--p", text: fullName(item.employee) }); }))
+          : h("p", { class: "oxd-text oxd-text--p", text: "No Employees are on Leave Today" });
+      }),
+      widget("Employee Distribution by Sub Unit", "dashboard/employees/subunit", function (data) {
+        return barChart(data.map(function (i) { return { name: i.subunit.name, count: i.count }; }));
+      }),
+      widget("Employee Distribution by Location", "dashboard/employees/locations", function (data) {
+        return barChart(data.map(function (i) { return { name: i.location.name, count: i.count }; }));
+      })));
+  }
+
+  // -------------------------------------------------------------------- PIM
+  function pimListScreen() {
+    var name = employeeAutocomplete();
+    var employeeId = textInput();
+    var supervisor = employeeAutocomplete();
+    var table;
+
+    function load() {
+      table.loading();
+      var params = { limit: 50, offset: 0, nameOrId: name.input.value.trim(), employeeId: employeeId.value.trim(),
+        includeEmployees: "onlyCurrent", sortField: "employee.firstName", sortOrder: "ASC" };
+      return api("GET", "pim/employees" + query(params)).then(function (payload) {
+        table.render(payload.data.map(function (e) { return Object.assign({ id: e.empNumber }, e); }), payload.meta.total);
+      });
+    }
+
+    table = dataTable([
+      { title: "Id", render: function (e) { return e.employeeId; } },
+      { title: "First (& Middle) Name", render: function (e) { return [e.firstName, e.middleName].filter(Boolean).join(" "); } },
+      { title: "Last Name", render: function (e) { return e.lastName; } },
+      { title: "Job Title", render: function (e) { return e.jobTitle.title || ""; } },
+      { title: "Employment Status", render: function (e) { return e.empStatus.name || ""; } },
+      { title: "Sub Unit", render: function (e) { return e.subunit.name || ""; } },
+      { title: "Supervisor", render: function (e) { return e.supervisors.map(fullName).join(", "); } },
+    ], {
+      toolbar: h("div", { class: "orangehrm-header-container" },
+        button("Add", { variant: "secondary", onclick: function () { go("pim/addEmployee"); } })),
+      onDelete: function (ids) {
+        api("DELETE", "pim/employees", { ids: ids }).then(function () {
+          toast("success", "Successfully Deleted");
+          load();
+        });
+      },
+    });
+
+    var filters = filterForm("Employee Information", [
+      field("Employee Name", name),
+      field("Employee Id", employeeId),
+      field("Employment Status", select([{ value: 1, label: "Full-Time Permanent" }, { value: 2, label: "Part-Time Internship" }])),
+      field("Include", select([{ value: 1, label: "Current Employees Only" }, { value: 2, label: "Current and Past Employees" }])),
+      field("Supervisor Name", supervisor),
+      field("Job Title", select([{ value: 1, label: "QA Engineer" }, { value: 2, label: "Software Engineer" }])),
+      field("Sub Unit", select([{ value: 1, label: "Engineering" }, { value: 2, label: "Finance" }])),
+    ], load, load);
+
+    load();
+    return h("div", {}, filters, table);
+  }
+
+  function pimAddScreen(ctx) {
+    var first = textInput({ name: "firstName", placeholder: "First Name" });
+    var middle = textInput({ name: "middleName", placeholder: "Middle Name" });
+    var last = textInput({ name: "lastName", placeholder: "Last Name" });
+    var employeeId = textInput();
+    employeeId.value = ctx.params.employeeId || "";
+
+    function nameField(input) {
+      return h("div", { class: "oxd-input-group" }, h("div", { class: "oxd-input-wrapper" }, input));
+    }
+
+    var form = h("form", { class: "oxd-form", novalidate: true },
+      h("div", { class: "orangehrm-employee-container" },
+        h("div", { class: "orangehrm-employee-image" },
+          h("div", { class: "oxd-grid-1 oxd-grid" },
+            h("div", { class: "oxd-file-div" },
+              h("img", { class: "employee-image", alt: "profile picture", src: "/web/images/ohrm_branding.png" }),
+              h("input", { type: "file", class: "oxd-file-input", accept: "image/*" })))),
+        h("div", { class: "orangehrm-employee-form" },
+          h("div", { class: "oxd-form-row" },
+            h("div", { class: "oxd-grid-1 orangehrm-full-width-grid oxd-grid" },
+              h("div", { class: "oxd-grid-item oxd-grid-item--gutters" },
+                h("label", { class: "oxd-label oxd-input-field-required", text: "Employee Full Name" }),
+                h("div", { class: "--name-grouped-field" }, nameField(first), nameField(middle), nameField(last)))),
+            h("div", { class: "oxd-grid-2 orangehrm-full-width-grid oxd-grid" },
+              h("div", { class: "oxd-grid-item oxd-grid-item--gutters" }, field("Employee Id", employeeId)))),
+          h("div", { class: "oxd-form-row user-form-header" },
+            h("p", { class: "oxd-text oxd-text--p orangehrm-employee-form-header", text: "Create Login Details" }),
+            h("div", { class: "oxd-switch-wrapper" }, h("label", {}, h("input", { type: "checkbox" }), h("span", { class: "oxd-switch-input" })))))),
+      h("hr", { class: "oxd-divider" }),
+      formActions(
+        h("p", { class: "oxd-text oxd-text--p orangehrm-form-hint", text: "* Required" }),
+        button("Cancel", { variant: "ghost", onclick: function () { go("pim/viewEmployeeList"); } }),
+        button("Save", { type: "submit", variant: "secondary orangehrm-left-space" })));
+
+    form.addEventListener("submit", function (event) {
+      event.preventDefault();
+      clearErrors(form);
+      var valid = true;
+      [first, last].forEach(function (input) {
+        if (!input.value.trim()) { setError(input, "Required"); valid = false; }
+      });
+      if (!valid) return;
+      api("POST", "pim/employees", {
+        firstName: first.value.trim(), middleName: middle.value.trim(), lastName: last.value.trim(),
+        empPicture: null, employeeId: employeeId.value.trim(),
+      }).then(function (payload) {
+        flash("success", "Successfully Saved", "pim/viewPersonalDetails/empNumber/" + payload.data.empNumber);
+      }).catch(function (error) {
+        if (error.invalid.employeeId) setError(employeeId, error.invalid.employeeId);
+        else toast("error", error.message);
+      });
+    });
+    return card("Add Employee", form);
+  }
+
+  var DETAIL_TABS = ["Personal Details", "Contact Details", "Emergency Contacts", "Dependents", "Immigration",
+    "Job", "Salary", "Report-to", "Qualifications", "Memberships"];
+
+  function personalDetailsScreen(ctx) {
+    var empNumber = ctx.params.empNumber;
+    var inputs = {
+      firstName: textInput({ name: "firstName", placeholder: "First Name" }),
+      middleName: textInput({ name: "middleName", placeholder: "Middle Name" }),
+      lastName: textInput({ name: "lastName", placeholder: "Last Name" }),
+      employeeId: textInput(),
+      drivingLicenseNo: textInput(),
+      drivingLicenseExpiredDate: textInput({ placeholder: "yyyy-mm-dd" }),
+      birthday: textInput({ placeholder: "yyyy-mm-dd" }),
+      otherId: textInput(),
+    };
+    var nationality = select(["American", "British", "Canadian", "Indian", "Sri Lankan"].map(function (n, i) { return { value: i + 1, label: n }; }));
+    var marital = select(["Single", "Married", "Other"].map(function (m) { return { value: m, label: m }; }));
+    var male = h("input", { type: "radio", name: "gender", value: "1" });
+    var female = h("input", { type: "radio", name: "gender", value: "2" });
+    var title = h("h6", { class: "oxd-text oxd-text--h6 --strong", text: "" });
+
+    var form = h("form", { class: "oxd-form", novalidate: true },
+      h("div", { class: "oxd-form-row" }, h("div", { class: "oxd-grid-1 orangehrm-full-width-grid oxd-grid" },
+        h("div", { class: "oxd-grid-item oxd-grid-item--gutters" },
+          h("label", { class: "oxd-label oxd-input-field-required", text: "Employee Full Name" }),
+          h("div", { class: "--name-grouped-field" },
+            [inputs.firstName, inputs.middleName, inputs.lastName].map(function (input) {
+              return h("div", { class: "oxd-input-group" }, h("div", { class: "oxd-input-wrapper" }, input));
+            }))))),
+      h("hr", { class: "oxd-divider" }),
+      h("div", { class: "oxd-form-row" }, h("div", { class: "oxd-grid-3 orangehrm-full-width-grid oxd-grid" },
+        field("Employee Id", inputs.employeeId),
+        field("Driver's License Number", inputs.drivingLicenseNo),
+        field("License Expiry Date", inputs.drivingLicenseExpiredDate))),
+      h("hr", { class: "oxd-divider" }),
+      h("div", { class: "oxd-form-row" }, h("div", { class: "oxd-grid-3 orangehrm-full-width-grid oxd-grid" },
+        field("Nationality", nationality), field("Marital Status", marital),
+        field("Date of Birth", inputs.birthday),
+        h("div", { class: "oxd-input-group" }, h("label", { class: "oxd-label", text: "Gender" }),
+          h("div", { class: "oxd-radio-wrapper" }, h("label", {}, male, " Male")),
+          h("div", { class: "oxd-radio-wrapper" }, h("label", {}, female, " Female"))),
+        field("Other Id", inputs.otherId))),
+      formActions(
+        h("p", { class: "oxd-text oxd-text--p orangehrm-form-hint", text: "* Required" }),
+        button("Save", { type: "submit", variant: "secondary orangehrm-left-space" })));
+
+    api("GET", "pim/employees/" + empNumber + "/personal-details").then(function (payload) {
+      var d = payload.data;
+      title.textContent = fullName(d);
+      Object.keys(inputs).forEach(function (key) { if (d[key]) inputs[key].value = d[key]; });
+      if (d.maritalStatus) marital.setValue(d.maritalStatus);
+      if (d.gender === 1) male.checked = true;
+      if (d.gender === 2) female.checked = true;
+    });
+
+    form.addEventListener("submit", function (event) {
+      event.preventDefault();
+      clearErrors(form);
+      var body = {};
+      Object.keys(inputs).forEach(function (key) { body[key] = inputs[key].value.trim(); });
+      body.maritalStatus = marital.value;
+      body.gender = male.checked ? 1 : female.checked ? 2 : null;
+      if (!body.firstName) { setError(inputs.firstName, "Required"); return; }
+      if (!body.lastName) { setError(inputs.lastName, "Required"); return; }
+      api("PUT", "pim/employees/" + empNumber + "/personal-details", body).then(function () {
+        toast("success", "Successfully Updated");
+      }).catch(function (error) {
+        if (error.invalid.employeeId) setError(inputs.employeeId, error.invalid.employeeId);
+        else toast("error", error.message);
+      });
+    });
+
+    var attachments = dataTable([
+      { title: "File Name", render: function (a) { return a.name; } },
+      { title: "Description", render: function (a) { return a.comment; } },
+    ]);
+    var attachmentForm = h("div", { class: "orangehrm-attachment" });
+    attachments.render([], 0);
+
+    return h("div", { class: "orangehrm-background-container" },
+      h("div", { class: "orangehrm-card-container orangehrm-edit-employee" },
+        h("div", { class: "orangehrm-edit-employee-navigation" },
+          h("div", { class: "orangehrm-edit-employee-imagesection" },
+            h("div", { class: "orangehrm-edit-employee-name" }, title),
+            h("div", { class: "orangehrm-edit-employee-image-wrapper" },
+              h("div", { class: "orangehrm-edit-employee-image" },
+                h("img", { class: "employee-image", alt: "profile picture", src: WEB + "/pim/viewPhoto/empNumber/" + empNumber })),
+              h("div", { class: "employee-image-action" }))),
+          h("div", { class: "orangehrm-tabs", role: "tablist" }, DETAIL_TABS.map(function (tab) {
+            return h("div", { class: "orangehrm-tabs-wrapper" },
+              h("a", {
+                class: "orangehrm-tabs-item" + (tab === "Personal Details" ? " --active" : ""),
+                href: tab === "Personal Details" ? WEB + "/pim/viewPersonalDetails/empNumber/" + empNumber : "#",
+                text: tab,
+              }));
+          }))),
+        h("div", { class: "orangehrm-edit-employee-content" },
+          card("Personal Details", form),
+          h("div", { class: "orangehrm-attachment" },
+            h("div", { class: "orangehrm-action-header" },
+              h("h6", { class: "oxd-text oxd-text--h6", text: "Attachments" }),
+              button("Add", {
+                variant: "text", onclick: function () {
+                  clear(attachmentForm).appendChild(h("div", { class: "oxd-form" },
+                    field("Select File", h("input", { type: "file", class: "oxd-file-input" })),
+                    field("Comment", h("textarea", { class: "oxd-textarea oxd-textarea--active", placeholder: "Type comment here" })),
+                    formActions(button("Cancel", { variant: "ghost", onclick: function () { clear(attachmentForm); } }),
+                      button("Save", { variant: "secondary" }))));
+                },
+              })),
+            attachmentForm, attachments))));
+  }
+
+  // ------------------------------------------------------------------ Admin
+  var ROLE_OPTIONS = [{ value: 1, label: "Admin" }, { value: 2, label: "ESS" }];
+  var STATUS_OPTIONS = [{ value: 1, label: "Enabled" }, { value: 0, label: "Disabled" }];
+
+  function adminListScreen() {
+    var username = textInput();
+    var role = select(ROLE_OPTIONS);
+    var employee = employeeAutocomplete();
+    var status = select(STATUS_OPTIONS);
+    var table;
+
+    function load() {
+      table.loading();
+      var params = { limit: 50, offset: 0, sortField: "u.userName", sortOrder: "ASC", username: username.value.trim(),
+        userRoleId: role.value, empNumber: employee.selected ? employee.selected.empNumber : "", status: status.value };
+      return api("GET", "admin/users" + query(params)).then(function (payload) {
+        table.render(payload.data, payload.meta.total);
+      });
+    }
+
+    table = dataTable([
+      { title: "Username", render: function (u) { return u.userName; } },
+      { title: "User Role", render: function (u) { return u.userRole.displayName; } },
+      { title: "Employee Name", render: function (u) { return fullName(u.employee); } },
+      { title: "Status", render: function (u) { return u.status ? "Enabled" : "Disabled"; } },
+    ], {
+      toolbar: h("div", { class: "orangehrm-header-container" },
+        button("Add", { variant: "secondary", onclick: function () { go("admin/saveSystemUser"); } })),
+      onDelete: function (ids) {
+        api("DELETE", "admin/users", { ids: ids }).then(function () {
+          toast("success", "Successfully Deleted");
+          load();
+        }).catch(function (error) { toast("error", error.message); });
+      },
+    });
+
+    var filters = filterForm("System Users", [
+      field("Username", username), field("User Role", role), field("Employee Name", employee), field("Status", status),
+    ], load, function () { role.setValue(""); status.setValue(""); employee.selected = null; load(); });
+    load();
+    return h("div", {}, filters, table);
+  }
+
+  function adminAddScreen() {
+    var role = select(ROLE_OPTIONS);
+    var employee = employeeAutocomplete();
+    var status = select(STATUS_OPTIONS);
+    var username = textInput();
+    var password = textInput({ type: "password" });
+    var confirm = textInput({ type: "password" });
+
+    var form = h("form", { class: "oxd-form", novalidate: true },
+      h("div", { class: "oxd-form-row" }, h("div", { class: "oxd-grid-2 orangehrm-full-width-grid oxd-grid" },
+        field("User Role", role, true), field("Employee Name", employee, true),
+        field("Status", status, true), field("Username", username, true))),
+      h("div", { class: "oxd-form-row user-password-row" }, h("div", { class: "oxd-grid-2 orangehrm-full-width-grid oxd-grid" },
+        field("Password", password, true), field("Confirm Password", confirm, true))),
+      h("hr", { class: "oxd-divider" }),
+      formActions(
+        h("p", { class: "oxd-text oxd-text--p orangehrm-form-hint", text: "* Required" }),
+        button("Cancel", { variant: "ghost", onclick: function () { go("admin/viewSystemUsers"); } }),
+        button("Save", { type: "submit", variant: "secondary orangehrm-left-space" })));
+
+    form.addEventListener("submit", function (event) {
+      event.preventDefault();
+      clearErrors(form);
+      var valid = true;
+      function require(control, ok) { if (!ok) { setError(control, "Required"); valid = false; } }
+      require(role, role.value !== "");
+      require(status, status.value !== "");
+      require(username, username.value.trim());
+      require(password, password.value);
+      if (employee.input.value.trim() && !employee.selected) { setError(employee, "Invalid"); valid = false; }
+      else require(employee, employee.selected);
+      if (username.value.trim() && username.value.trim().length < 5) { setError(username, "Should be at least 5 characters"); valid = false; }
+      if (password.value !== confirm.value) { setError(confirm, "Passwords do not match"); valid = false; }
+      if (!valid) return;
+      api("POST", "admin/users", {
+        username: username.value.trim(), password: password.value, status: status.value === 1,
+        userRoleId: role.value, empNumber: employee.selected.empNumber,
+      }).then(function () {
+        flash("success", "Successfully Saved", "admin/viewSystemUsers");
+      }).catch(function (error) {
+        if (error.invalid.username) setError(username, error.invalid.username);
+        else if (error.invalid.password) setError(password, error.invalid.password);
+        else toast("error", error.message);
+      });
+    });
+    return card("Add User", form);
+  }
+
+  // ------------------------------------------------------------------ Leave
+  function leaveTypeSelect() {
+    var control = select([]);
+    api("GET", "leave/leave-types/eligible").then(function (payload) {
+      control.setOptions(payload.data.map(function (t) { return { value: t.id, label: t.name }; }));
+    });
+    return control;
+  }
+
+  function leaveListScreen(ctx, mine) {
+    var year = new Date().getFullYear();
+    var fromDate = dateInput();
+    var toDate = dateInput();
+    fromDate.querySelector("input").value = year + "-01-01";
+    toDate.querySelector("input").value = year + "-12-31";
+    var table;
+
+    function load() {
+      table.loading();
+      var params = { limit: 50, offset: 0, fromDate: fromDate.querySelector("input").value.trim(),
+        toDate: toDate.querySelector("input").value.trim() };
+      var endpoint = mine ? "leave/leave-requests" : "leave/employees/leave-requests";
+      return api("GET", endpoint + query(params)).then(function (payload) {
+        table.render(payload.data, payload.meta.total);
+      });
+    }
+
+    function act(leave, action) {
+      api("PUT", "leave/employees/leave-requests/" + leave.id, { action: action }).then(function () {
+        toast("success", "Successfully Updated");
+        load();
+      });
+    }
+
+    table = dataTable([
+      { title: "Date", render: function (l) { return l.dates.fromDate === l.dates.toDate ? l.dates.fromDate : l.dates.fromDate + " to " + l.dates.toDate; } },
+      { title: "Employee Name", render: function (l) { return fullName(l.employee); } },
+      { title: "Leave Type", render: function (l) { return l.leaveType.name; } },
+      { title: "Number of Days", render: function (l) { return l.noOfDays.toFixed(2); } },
+      { title: "Status", render: function (l) { return l.leaveStatuses[0].name; } },
+      { title: "Comments", render: function (l) { return l.lastComment ? l.lastComment.comment : ""; } },
+      {
+        title: "Actions", render: function (l) {
+          if (l.leaveStatuses[0].name !== "Pending Approval") return "";
+          return mine
+            ? h("div", { class: "oxd-table-cell-actions" }, button("Cancel", { variant: "label-warn", onclick: function () { act(l, "CANCEL"); } }))
+            : h("div", { class: "oxd-table-cell-actions" },
+              button("Reject", { variant: "label-danger", onclick: function () { act(l, "REJECT"); } }),
+              button("Approve", { variant: "label-success", onclick: function () { act(l, "APPROVE"); } }));
+        },
+      },
+    ], { onDelete: mine ? null : function () {} });
+
+    var fields = [field("From Date", fromDate, true), field("To Date", toDate, true),
+      field("Show Leave with Status", select([{ value: 1, label: "Pending Approval" }, { value: 2, label: "Scheduled" }])),
+      field("Leave Type", leaveTypeSelect())];
+    if (!mine) fields.push(field("Employee Name", employeeAutocomplete()));
+    var filters = filterForm(mine ? "My Leave List" : "Leave List", fields, load, load);
+    load();
+    return h("div", {}, filters, table);
+  }
+
+  function leaveRequestScreen(assign) {
+    var employee = employeeAutocomplete();
+    var leaveType = leaveTypeSelect();
+    var fromDate = dateInput();
+    var toDate = dateInput();
+    var comments = h("textarea", { class: "oxd-textarea oxd-textarea--active oxd-textarea--resize-vertical" });
+    var fromInput = fromDate.querySelector("input");
+    var toInput = toDate.querySelector("input");
+
+    fromInput.addEventListener("change", function () {
+      if (!toInput.value) toInput.value = fromInput.value;
+    });
+
+    var form = h("form", { class: "oxd-form", novalidate: true },
+      assign ? h("div", { class: "oxd-form-row" }, h("div", { class: "oxd-grid-2 orangehrm-full-width-grid oxd-grid" },
+        field("Employee Name", employee, true))) : null,
+      h("div", { class: "oxd-form-row" }, h("div", { class: "oxd-grid-4 orangehrm-full-width-grid oxd-grid" },
+        field("Leave Type", leaveType, true))),
+      h("div", { class: "oxd-form-row" }, h("div", { class: "oxd-grid-4 orangehrm-full-width-grid oxd-grid" },
+        field("From Date", fromDate, true), field("To Date", toDate, true))),
+      h("div", { class: "oxd-form-row" }, h("div", { class: "oxd-grid-1 orangehrm-full-width-grid oxd-grid" },
+        field("Comments", comments))),
+      h("hr", { class: "oxd-divider" }),
+      formActions(
+        h("p", { class: "oxd-text oxd-text--p orangehrm-form-hint", text: "* Required" }),
+        button(assign ? "Assign" : "Apply", { type: "submit", variant: "secondary orangehrm-left-space" })));
+
+    form.addEventListener("submit", function (event) {
+      event.preventDefault();
+      clearErrors(form);
+      var valid = true;
+      if (leaveType.value === "") { setError(leaveType, "Required"); valid = false; }
+      if (!fromInput.value.trim()) { setError(fromDate, "Required"); valid = false; }
+      if (!toInput.value.trim()) { setError(toDate, "Required"); valid = false; }
+      if (assign && !employee.selected) { setError(employee, "Required"); valid = false; }
+      if (!valid) return;
+      var body = { leaveTypeId: leaveType.value, fromDate: fromInput.value.trim(), toDate: toInput.value.trim(),
+        comment: comments.value.trim() || null, duration: { type: "full_day" } };
+      if (assign) body.empNumber = employee.selected.empNumber;
+      api("POST", assign ? "leave/employees/leave-requests" : "leave/leave-requests", body).then(function () {
+        toast("success", "Successfully Saved");
+        form.reset();
+        leaveType.setValue("");
+      }).catch(function (error) {
+        if (error.invalid.toDate) setError(toDate, error.invalid.toDate);
+        else toast("error", error.message);
+      });
+    });
+    return card(assign ? "Assign Leave" : "Apply Leave", form);
+  }
+
+  // ------------------------------------------------------------------- Time
+  var WEEKDAYS = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"];
+
+  function weekDates(startDate) {
+    var start = new Date(startDate + "T00:00:00");
+    return WEEKDAYS.map(function (_, i) {
+      var day = new Date(start.getTime() + i * 86400000);
+      return day.getFullYear() + "-" + String(day.getMonth() + 1).padStart(2, "0") + "-" + String(day.getDate()).padStart(2, "0");
+    });
+  }
+
+  function timesheetTable(timesheet, entries) {
+    var dates = weekDates(timesheet.startDate);
+    return h("table", { class: "orangehrm-timesheet-table" },
+      h("thead", { class: "orangehrm-timesheet-table-header" },
+        h("tr", {}, h("th", { text: "Project" }), h("th", { text: "Activity" }),
+          dates.map(function (d, i) { return h("th", { text: WEEKDAYS[i] + " " + d.slice(8) }); }), h("th", { text: "Total" }))),
+      h("tbody", { class: "orangehrm-timesheet-table-body" }, entries.length ? entries.map(function (entry) {
+        var total = 0;
+        return h("tr", { class: "orangehrm-timesheet-table-body-row" },
+          h("td", { text: entry.project.name }), h("td", { text: entry.activity.name }),
+          dates.map(function (d) {
+            var value = entry.dates[d] ? entry.dates[d].duration : "";
+            total += value ? parseFloat(value.replace(":", ".")) : 0;
+            return h("td", { text: value });
+          }), h("td", { text: total.toFixed(2) }));
+      }) : h("tr", {}, h("td", { colspan: "10", text: "No Records Found" }))));
+  }
+
+  function myTimesheetScreen() {
+    var container = h("div", { class: "orangehrm-timesheet" }, h("div", { class: "oxd-loading-spinner" }));
+    api("GET", "time/timesheets/default").then(function (payload) {
+      var timesheet = payload.data;
+      return api("GET", "time/timesheets/" + timesheet.id + "/entries").then(function (entries) {
+        var submitted = timesheet.status.name !== "Not Submitted";
+        clear(container).appendChild(card("My Timesheet",
+          h("div", { class: "orangehrm-timesheet-header" },
+            h("p", { class: "oxd-text oxd-text--p", text: "Timesheet Period " + timesheet.startDate + " - " + timesheet.endDate })),
+          timesheetTable(timesheet, entries.data),
+          h("div", { class: "orangehrm-timesheet-footer" },
+            h("p", { class: "oxd-text oxd-text--p orangehrm-timesheet-status", text: "Status: " + timesheet.status.name }),
+            h("div", { class: "orangehrm-timesheet-footer--options" },
+              submitted ? null : button("Edit", { variant: "ghost", onclick: function () { go("time/editTimesheet/" + timesheet.id); } }),
+              submitted ? null : button("Submit", {
+                variant: "secondary", onclick: function () {
+                  api("PUT", "time/timesheets/" + timesheet.id, { action: "SUBMIT" }).then(function () {
+                    flash("success", "Timesheet Submitted", "time/viewMyTimesheet");
+                  });
+                },
+              })))));
+      });
+    });
+    return container;
+  }
+
+  function editTimesheetScreen(ctx) {
+    var timesheetId = ctx.params.timesheetId;
+    var body = h("tbody", {});
+    var rows = [];
+    var container = h("div", {}, h("div", { class: "oxd-loading-spinner" }));
+    var timesheet;
+
+    function addRow(entry) {
+      var project = autocomplete(function (text) {
+        return api("GET", "time/projects" + query({ name: text })).then(function (r) { return r.data; });
+      }, function (p) { return p.customer.name + " - " + p.name; });
+      var activity = select([]);
+      var hours = weekDates(timesheet.startDate).map(function (d) {
+        var input = textInput({ type: "text" });
+        if (entry && entry.dates[d]) input.value = entry.dates[d].duration;
+        input.dataset.date = d;
+        return input;
+      });
+      project.input.addEventListener("blur", function () {
+        if (!project.selected) return;
+        api("GET", "time/projects/" + project.selected.id + "/activities").then(function (payload) {
+          activity.setOptions(payload.data.map(function (a) { return { value: a.id, label: a.name }; }));
+        });
+      });
+      if (entry) {
+        project.selected = { id: entry.project.id, name: entry.project.name, customer: { name: "" } };
+        project.input.value = entry.project.name;
+        activity.setOptions([{ value: entry.activity.id, label: entry.activity.name }]);
+        activity.setValue(entry.activity.id);
+      }
+      rows.push({ project: project, activity: activity, hours: hours });
+      body.appendChild(h("tr", { class: "orangehrm-timesheet-table-body-row" },
+        h("td", {}, field("Project", project)), h("td", {}, field("Activity", activity)),
+        hours.map(function (input) { return h("td", { class: "orangehrm-timesheet-table-body-cell" }, input); })));
+    }
+
+    api("GET", "time/timesheets/" + timesheetId + "/entries").then(function (payload) {
+      timesheet = payload.meta.timesheet;
+      if (payload.data.length) payload.data.forEach(addRow); else addRow();
+      clear(container).appendChild(card("Edit Timesheet",
+        h("table", { class: "orangehrm-timesheet-table" },
+          h("thead", {}, h("tr", {}, h("th", { text: "Project" }), h("th", { text: "Activity" }),
+            WEEKDAYS.map(function (d) { return h("th", { text: d }); }))), body),
+        formActions(
+          button("Add Row", { variant: "text", onclick: function () { addRow(); } }),
+          button("Cancel", { variant: "ghost", onclick: function () { go("time/viewMyTimesheet"); } }),
+          button("Reset", { variant: "ghost", onclick: function () { go("time/editTimesheet/" + timesheetId); } }),
+          button("Save", {
+            variant: "secondary", onclick: function () {
+              var entries = rows.filter(function (r) { return r.project.selected && r.activity.value !== ""; }).map(function (r) {
+                var dates = {};
+                r.hours.forEach(function (input) { if (input.value.trim()) dates[input.dataset.date] = { duration: input.value.trim() }; });
+                return { projectId: r.project.selected.id, activityId: r.activity.value, dates: dates };
+              });
+              api("PUT", "time/timesheets/" + timesheetId + "/entries", { entries: entries, deletedEntries: [] }).then(function () {
+                flash("success", "Successfully Saved", "time/viewMyTimesheet");
+              });
+            },
+          }))));
+    });
+    return container;
+  }
+
+  function employeeTimesheetScreen() {
+    var employee = employeeAutocomplete();
+    var form = h("form", { class: "oxd-form", novalidate: true },
+      h("div", { class: "oxd-form-row" }, h("div", { class: "oxd-grid-4 oxd-grid" }, field("Employee Name", employee, true))),
+      formActions(button("View", { type: "submit", variant: "secondary" })));
+    form.addEventListener("submit", function (event) { event.preventDefault(); closeDropdowns(); });
+
+    var table = dataTable([
+      { title: "Employee Name", render: function (t) { return fullName(t.employee); } },
+      { title: "Timesheet Period", render: function (t) { return t.startDate + " - " + t.endDate; } },
+    ]);
+    table.loading();
+    api("GET", "time/employees/timesheets/list?limit=50&offset=0").then(function (payload) {
+      table.render(payload.data, payload.meta.total);
+    });
+    return h("div", {}, card("Select Employee", form),
+      h("div", { class: "orangehrm-card-container" },
+        h("h6", { class: "oxd-text oxd-text--h6", text: "Timesheets Pending Action" }), table));
+  }
+
+  // ------------------------------------------------------------------ login
+  function initLogin() {
+    var form = document.querySelector("form.oxd-form");
+    form.addEventListener("submit", function (event) {
+      var valid = true;
+      form.querySelectorAll(".oxd-input-field-error-message").forEach(function (el) { el.remove(); });
+      ["username", "password"].forEach(function (name) {
+        var input = form.querySelector('input[name="' + name + '"]');
+        input.classList.remove("oxd-input--error");
+        if (!input.value.trim()) {
+          valid = false;
+          input.classList.add("oxd-input--error");
+          input.parentNode.appendChild(h("span", {
+            class: "oxd-text oxd-text--span oxd-input-field-error-message oxd-input-group__message", text: "Required",
+          }));
+        }
+      });
+      if (!valid) event.preventDefault();
+    });
+  }
+
+  // ------------------------------------------------------------------- boot
+  var SCREENS = {
+    dashboard: dashboardScreen,
+    "pim-list": pimListScreen,
+    "pim-add": pimAddScreen,
+    "personal-details": personalDetailsScreen,
+    "admin-list": adminListScreen,
+    "admin-add": adminAddScreen,
+    "leave-list": function (ctx) { return leaveListScreen(ctx, false); },
+    "leave-my-list": function (ctx) { return leaveListScreen(ctx, true); },
+    "leave-apply": function () { return leaveRequestScreen(false); },
+    "leave-assign": function () { return leaveRequestScreen(true); },
+    "time-employee": employeeTimesheetScreen,
+    "time-my": myTimesheetScreen,
+    "time-edit": editTimesheetScreen,
+  };
+
+  function boot() {
+    if (document.querySelector("auth-login")) {
+      initLogin();
+      return;
+    }
+    var root = document.getElementById("app");
+    var ctx = JSON.parse(root.getAttribute("data-context"));
+    var placeholder = h("div", {});
+    root.appendChild(layout(ctx, placeholder));
+    placeholder.replaceWith(SCREENS[ctx.screen](ctx));
+    showFlash();
+  }
+
+  if (document.readyState === "loading") document.addEventListener("DOMContentLoaded", boot);
+  else boot();
+})();
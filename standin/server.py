@@ -0,0 +1,175 @@
+"""
+Minimal asyncio HTTP/1.1 server hosting the stand-in application.
+Supports keep-alive and Content-Length bodies, which is everything
+Playwright and the framework's API clients send.
+"""
+import asyncio
+import json
+import threading
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from http.cookies import SimpleCookie
+from typing import Dict, Optional
+from urllib.parse import parse_qs, urlsplit
+
+
+@dataclass
+class Request:
+    method: str
+    target: str
+    headers: Dict[str, str]
+    body: bytes = b""
+
+    @property
+    def path(self) -> str:
+        return urlsplit(self.target).path
+
+    @property
+    def query(self) -> Dict[str, str]:
+        return {key: values[-1] for key, values in parse_qs(urlsplit(self.target).query).items()}
+
+    @property
+    def cookies(self) -> Dict[str, str]:
+        cookie = SimpleCookie()
+        cookie.load(self.headers.get("cookie", ""))
+        return {name: morsel.value for name, morsel in cookie.items()}
+
+    def json(self) -> dict:
+        return json.loads(self.body or b"{}")
+
+    def form(self) -> Dict[str, str]:
+        return {key: values[-1] for key, values in parse_qs(self.body.decode()).items()}
+
+
+@dataclass
+class Response:
+    status: int = 200
+    body: bytes = b""
+    content_type: str = "text/html; charset=utf-8"
+    headers: Dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def json(cls, payload, status: int = 200) -> "Response":
+        return cls(status, json.dumps(payload).encode(), "application/json")
+
+    @classmethod
+    def redirect(cls, location: str) -> "Response":
+        return cls(302, b"", headers={"Location": location})
+
+    def encode(self, keep_alive: bool, head_only: bool = False) -> bytes:
+        reason = HTTPStatus(self.status).phrase
+        headers = {
+            "Content-Type": self.content_type,
+            "Content-Length": str(len(self.body)),
+            "Connection": "keep-alive" if keep_alive else "close",
+            **self.headers,
+        }
+        head = f"HTTP/1.1 {self.status} {reason}\r\n"
+        head += "".join(f"{name}: {value}\r\n" for name, value in headers.items())
+        return (head + "\r\n").encode("latin-1") + (b"" if head_only else self.body)
+
+
+class StandinServer:
+    """
+    Serves a StandinApp over HTTP on a background event loop.
+
+    Usage:
+        server = StandinServer(StandinApp(), port=0)
+        base_url = server.start()
+        ...
+        server.stop()
+    """
+
+    def __init__(self, app, host: str = "127.0.0.1", port: int = 0):
+        self.app = app
+        self.host = host
+        self.port = port
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._server: Optional[asyncio.base_events.Server] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    async def serve(self):
+        """Bind the socket and start accepting connections on the running loop"""
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    def start(self) -> str:
+        """Run the server on a daemon thread and return its base URL"""
+        ready = threading.Event()
+        self._loop = asyncio.new_event_loop()
+
+        def run():
+            asyncio.set_event_loop(self._loop)
+            self._loop.run_until_complete(self.serve())
+            ready.set()
+            self._loop.run_forever()
+
+        self._thread = threading.Thread(target=run, name="standin-server", daemon=True)
+        self._thread.start()
+        ready.wait()
+        return self.base_url
+
+    def join(self):
+        """Block until the background loop stops"""
+        if self._thread:
+            self._thread.join()
+
+    def stop(self):
+        """Stop accepting connections and shut the background loop down"""
+        if not self._loop:
+            return
+
+        async def shutdown():
+            self._server.close()
+            # Idle keep-alive connections would otherwise outlive the loop
+            handlers = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+            for task in handlers:
+                task.cancel()
+            await asyncio.gather(*handlers, return_exceptions=True)
+            await self._server.wait_closed()
+
+        asyncio.run_coroutine_threadsafe(shutdown(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        self._loop = None
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                request = await self._read_request(reader)
+                if request is None:
+                    break
+                keep_alive = request.headers.get("connection", "").lower() != "close"
+                response = self.app.handle(request)
+                writer.write(response.encode(keep_alive, head_only=request.method == "HEAD"))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _read_request(reader: asyncio.StreamReader) -> Optional[Request]:
+        request_line = await reader.readline()
+        if not request_line.strip():
+            return None
+        method, target, _version = request_line.decode("latin-1").split()
+
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        length = int(headers.get("content-length") or 0)
+        body = await reader.readexactly(length) if length else b""
+        return Request(method.upper(), target, headers, body)
@@ -0,0 +1,346 @@
+"""
+In-memory data behind the stand-in server.
+Seeded deterministically so every run starts from the same employees,
+users, leave requests and timesheets.
+"""
+import secrets
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Dict, List, Optional
+
+
+@dataclass
+class Employee:
+    emp_number: int
+    employee_id: str
+    first_name: str
+    last_name: str
+    middle_name: str = ""
+    job_title: str = ""
+    sub_unit: str = ""
+    employment_status: str = "Full-Time Permanent"
+    supervisor: str = ""
+    nickname: str = ""
+    license_number: str = ""
+    license_expiry: str = ""
+    date_of_birth: str = ""
+    nationality: str = ""
+    marital_status: str = ""
+    gender: Optional[int] = None
+
+    @property
+    def full_name(self) -> str:
+        return " ".join(part for part in (self.first_name, self.middle_name, self.last_name) if part)
+
+    def matches(self, text: str) -> bool:
+        """Partial, case-insensitive match on name or employee ID"""
+        needle = text.strip().lower()
+        haystacks = (
+            self.full_name.lower(),
+            f"{self.first_name} {self.last_name}".lower(),
+            self.employee_id.lower(),
+        )
+        return any(needle in haystack for haystack in haystacks)
+
+    def to_api(self) -> dict:
+        return {
+            "empNumber": self.emp_number,
+            "employeeId": self.employee_id,
+            "firstName": self.first_name,
+            "middleName": self.middle_name,
+            "lastName": self.last_name,
+            "terminationId": None,
+            "jobTitle": {"title": self.job_title},
+            "subunit": {"name": self.sub_unit},
+            "empStatus": {"name": self.employment_status},
+            "supervisors": [{"firstName": self.supervisor, "lastName": ""}] if self.supervisor else [],
+        }
+
+    def personal_details(self) -> dict:
+        return {
+            "empNumber": self.emp_number,
+            "firstName": self.first_name,
+            "middleName": self.middle_name,
+            "lastName": self.last_name,
+            "nickname": self.nickname,
+            "employeeId": self.employee_id,
+            "drivingLicenseNo": self.license_number,
+            "drivingLicenseExpiredDate": self.license_expiry or None,
+            "birthday": self.date_of_birth or None,
+            "nationality": {"name": self.nationality} if self.nationality else None,
+            "maritalStatus": self.marital_status,
+            "gender": self.gender,
+        }
+
+
+@dataclass
+class SystemUser:
+    id: int
+    username: str
+    password: str
+    role: str
+    emp_number: int
+    enabled: bool = True
+
+    def to_api(self, employee: Optional[Employee]) -> dict:
+        return {
+            "id": self.id,
+            "userName": self.username,
+            "deleted": False,
+            "status": self.enabled,
+            "userRole": {"id": USER_ROLES[self.role], "name": self.role, "displayName": self.role},
+            "employee": {
+                "empNumber": self.emp_number,
+                "firstName": employee.first_name if employee else "",
+                "lastName": employee.last_name if employee else "",
+            },
+        }
+
+
+@dataclass
+class LeaveRequest:
+    id: int
+    emp_number: int
+    leave_type_id: int
+    from_date: str
+    to_date: str
+    comment: str = ""
+    status: str = "Pending Approval"
+
+    @property
+    def days(self) -> float:
+        start = date.fromisoformat(self.from_date)
+        end = date.fromisoformat(self.to_date)
+        return float((end - start).days + 1)
+
+
+@dataclass
+class Timesheet:
+    id: int
+    emp_number: int
+    start_date: str
+    status: str = "Not Submitted"
+    entries: List[dict] = field(default_factory=list)
+
+    @property
+    def end_date(self) -> str:
+        return (date.fromisoformat(self.start_date) + timedelta(days=6)).isoformat()
+
+
+USER_ROLES = {"Admin": 1, "ESS": 2}
+
+LEAVE_TYPES = {
+    1: "CAN - Bereavement",
+    2: "CAN - FMLA",
+    3: "CAN - Matternity",
+    4: "CAN - Personal",
+    5: "CAN - Vacation",
+    6: "US - Bereavement",
+    7: "US - FMLA",
+    8: "US - Personal",
+    9: "US - Vacation",
+}
+
+PROJECTS = {
+    1: {"name": "ACME Ltd", "activities": {1: "Bug Fixes", 2: "Implementation", 3: "QA Testing"}},
+    2: {"name": "Apache Software Foundation", "activities": {4: "Development", 5: "Code Review"}},
+    3: {"name": "Internal - Recruitment", "activities": {6: "Interviewing", 7: "Screening"}},
+}
+
+# Root of the sub unit tree (id 1, level 0)
+ORGANIZATION_NAME = "OrangeHRM"
+
+_SEED_EMPLOYEES = [
+    ("0001", "Paul", "Collings", "", "Chief Executive Officer", "Administration", ""),
+    ("0002", "Peter", "Anderson", "Mac", "Chief Financial Officer", "Finance", "Paul Collings"),
+    ("0003", "Linda", "Anderson", "Jane", "HR Manager", "Human Resources", "Paul Collings"),
+    ("0004", "Odis", "Adalwin", "", "Software Engineer", "Engineering", "Russel Hamilton"),
+    ("0005", "Russel", "Hamilton", "", "Engineering Manager", "Engineering", "Paul Collings"),
+    ("0006", "Rebecca", "Harmony", "", "QA Engineer", "Quality Assurance", "Russel Hamilton"),
+    ("0007", "Orange", "Admin", "", "HR Administrator", "Human Resources", "Linda Anderson"),
+    ("0008", "Garry", "White", "", "Account Assistant", "Finance", "Peter Anderson"),
+    ("0009", "Fiona", "Grace", "", "Sales Representative", "Sales & Marketing", "Paul Collings"),
+    ("0010", "Peter", "Mac", "", "Support Specialist", "Client Services", "Fiona Grace"),
+]
+
+
+class StandinState:
+    """Mutable application state shared by all requests"""
+
+    # Employee record the seeded admin user belongs to (MyInfoPage.path uses 7)
+    ADMIN_EMP_NUMBER = 7
+
+    def __init__(self, username: str = "Admin", password: str = "admin123"):
+        self.employees: Dict[int, Employee] = {}
+        self.users: Dict[int, SystemUser] = {}
+        self.leave_requests: Dict[int, LeaveRequest] = {}
+        self.leave_entitlements: List[dict] = []
+        self.timesheets: Dict[int, Timesheet] = {}
+        self.job_titles: Dict[int, str] = {}
+        self.subunits: Dict[int, str] = {}
+        self.sessions: Dict[str, dict] = {}
+        self._ids = {"employee": 0, "user": 0, "leave": 0, "entitlement": 0, "timesheet": 0, "job_title": 0, "subunit": 0}
+        self._seed(username, password)
+
+    def _next_id(self, kind: str) -> int:
+        self._ids[kind] += 1
+        return self._ids[kind]
+
+    def _seed(self, username: str, password: str):
+        self.add_subunit(ORGANIZATION_NAME)
+        for employee_id, first, last, middle, title, unit, supervisor in _SEED_EMPLOYEES:
+            self.job_title_id(title)
+            self.subunit_id(unit)
+            self.add_employee(first, last, middle, employee_id, job_title=title, sub_unit=unit, supervisor=supervisor)
+        self.add_user(username, password, "Admin", self.ADMIN_EMP_NUMBER)
+        self.add_user("fiona.grace", "fiona123", "ESS", 9)
+        self.add_user("russel.h", "russel123", "ESS", 5)
+
+        today = date.today()
+        self.add_leave_request(4, 5, (today + timedelta(days=3)).isoformat(), (today + timedelta(days=4)).isoformat(), "Family trip")
+        self.add_leave_request(6, 4, (today + timedelta(days=10)).isoformat(), (today + timedelta(days=10)).isoformat(), "Appointment")
+        self.add_leave_request(8, 9, (today - timedelta(days=20)).isoformat(), (today - timedelta(days=18)).isoformat(), "", status="Taken")
+
+    # ---------- Sessions ----------
+    def new_session(self) -> str:
+        session_id = secrets.token_hex(16)
+        self.sessions[session_id] = {"csrf": secrets.token_hex(20), "user_id": None, "flash": None}
+        return session_id
+
+    def user_for_session(self, session_id: Optional[str]) -> Optional[SystemUser]:
+        session = self.sessions.get(session_id or "")
+        if not session or session["user_id"] is None:
+            return None
+        return self.users.get(session["user_id"])
+
+    def authenticate(self, username: str, password: str) -> Optional[SystemUser]:
+        for user in self.users.values():
+            if user.username == username and user.password == password and user.enabled:
+                return user
+        return None
+
+    # ---------- Employees ----------
+    def add_employee(self, first_name: str, last_name: str, middle_name: str = "", employee_id: str = "", **details) -> Employee:
+        employee_id = employee_id or self.next_employee_id()
+        emp_number = self._next_id("employee")
+        employee = Employee(
+            emp_number=emp_number,
+            employee_id=employee_id,
+            first_name=first_name,
+            last_name=last_name,
+            middle_name=middle_name,
+            **details,
+        )
+        self.employees[emp_number] = employee
+        return employee
+
+    def next_employee_id(self) -> str:
+        return f"{self._ids['employee'] + 1:04d}"
+
+    def employee_id_taken(self, employee_id: str, exclude: Optional[int] = None) -> bool:
+        return any(
+            e.employee_id == employee_id and e.emp_number != exclude
+            for e in self.employees.values()
+        )
+
+    def search_employees(self, name_or_id: str = "", employee_id: str = "") -> List[Employee]:
+        results = list(self.employees.values())
+        if name_or_id:
+            results = [e for e in results if e.matches(name_or_id)]
+        if employee_id:
+            results = [e for e in results if employee_id.lower() in e.employee_id.lower()]
+        return results
+
+    def delete_employees(self, emp_numbers: List[int]) -> List[int]:
+        deleted = [n for n in emp_numbers if self.employees.pop(n, None)]
+        for user_id in [u.id for u in self.users.values() if u.emp_number in deleted]:
+            del self.users[user_id]
+        return deleted
+
+    # ---------- Organization ----------
+    def add_job_title(self, title: str) -> int:
+        job_title_id = self._next_id("job_title")
+        self.job_titles[job_title_id] = title
+        return job_title_id
+
+    def job_title_id(self, title: str) -> int:
+        """Id of a job title, added if new"""
+        for job_title_id, existing in self.job_titles.items():
+            if existing == title:
+                return job_title_id
+        return self.add_job_title(title)
+
+    def add_subunit(self, name: str) -> int:
+        subunit_id = self._next_id("subunit")
+        self.subunits[subunit_id] = name
+        return subunit_id
+
+    def subunit_id(self, name: str) -> int:
+        """Id of a sub unit, added if new"""
+        for subunit_id, existing in self.subunits.items():
+            if existing == name:
+                return subunit_id
+        return self.add_subunit(name)
+
+    # ---------- Users ----------
+    def add_user(self, username: str, password: str, role: str, emp_number: int, enabled: bool = True) -> SystemUser:
+        user = SystemUser(self._next_id("user"), username, password, role, emp_number, enabled)
+        self.users[user.id] = user
+        return user
+
+    def username_taken(self, username: str) -> bool:
+        return any(u.username.lower() == username.lower() for u in self.users.values())
+
+    def search_users(self, username: str = "", role_id: Optional[int] = None, enabled: Optional[bool] = None,
+                     emp_number: Optional[int] = None) -> List[SystemUser]:
+        results = list(self.users.values())
+        if username:
+            results = [u for u in results if u.username.lower() == username.lower()]
+        if role_id is not None:
+            results = [u for u in results if USER_ROLES[u.role] == role_id]
+        if enabled is not None:
+            results = [u for u in results if u.enabled == enabled]
+        if emp_number is not None:
+            results = [u for u in results if u.emp_number == emp_number]
+        return results
+
+    def delete_users(self, user_ids: List[int]) -> List[int]:
+        return [i for i in user_ids if self.users.pop(i, None)]
+
+    # ---------- Leave ----------
+    def add_leave_request(self, emp_number: int, leave_type_id: int, from_date: str, to_date: str,
+                          comment: str = "", status: str = "Pending Approval") -> LeaveRequest:
+        leave = LeaveRequest(self._next_id("leave"), emp_number, leave_type_id, from_date, to_date, comment, status)
+        self.leave_requests[leave.id] = leave
+        return leave
+
+    def add_leave_entitlement(self, emp_number: int, leave_type_id: int, from_date: str, to_date: str,
+                              entitlement: float) -> dict:
+        record = {
+            "id": self._next_id("entitlement"),
+            "empNumber": emp_number,
+            "leaveType": {"id": leave_type_id, "name": LEAVE_TYPES.get(leave_type_id, "")},
+            "fromDate": from_date,
+            "toDate": to_date,
+            "entitlement": entitlement,
+        }
+        self.leave_entitlements.append(record)
+        return record
+
+    def search_leave_requests(self, from_date: str = "", to_date: str = "") -> List[LeaveRequest]:
+        results = list(self.leave_requests.values())
+        if from_date:
+            results = [r for r in results if r.to_date >= from_date]
+        if to_date:
+            results = [r for r in results if r.from_date <= to_date]
+        return results
+
+    # ---------- Timesheets ----------
+    def timesheet_for(self, emp_number: int, day: date) -> Timesheet:
+        start = (day - timedelta(days=day.weekday())).isoformat()
+        for timesheet in self.timesheets.values():
+            if timesheet.emp_number == emp_number and timesheet.start_date == start:
+                return timesheet
+        timesheet = Timesheet(self._next_id("timesheet"), emp_number, start)
+        self.timesheets[timesheet.id] = timesheet
+        return timesheet
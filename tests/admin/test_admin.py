@@ -19,7 +19,7 @@ class TestAdmin:
         """
         admin = authenticated_admin_page
 
-        admin.navigate()
+        # Fixture opens the system users list directly
         admin.click_add_user()
 
         # Try to save without filling fields
@@ -5,6 +5,10 @@ Tests for OrangeHRM API endpoints using Playwright's request context.
 import pytest
 from playwright.sync_api import Page, APIRequestContext
 from config import config
+from loadgen.api_load import ApiLoadProfile, run_api_load
+from standin import StandinApp, StandinServer
+from utils import ApiAuthenticator
+from utils.http_pool import cookie_header
 
 
 @pytest.mark.api
@@ -75,3 +79,25 @@ class TestAPI:
 
         # Assert response within 2 seconds
         assert response_time < 2000, f"API response time {response_time}ms exceeds 2000ms"
+
+    def test_api_load_engine_against_standin(self, playwright):
+        """
+        Test ID: API-LOAD-001
+        Verify the API load engine sustains keep-alive traffic without errors
+        (self-test against a private stand-in server, whatever ENV is)
+        """
+        server = StandinServer(StandinApp())
+        base_url = server.start()
+        try:
+            cookie = cookie_header(ApiAuthenticator(playwright, base_url, "Admin", "admin123").login())
+            closed = run_api_load(ApiLoadProfile(model="closed", concurrency=10, duration=1), base_url, cookie=cookie)
+            open_ = run_api_load(ApiLoadProfile(model="open", rate=200, duration=1), base_url, cookie=cookie)
+        finally:
+            server.stop()
+
+        for report in (closed, open_):
+            assert report.requests > 0, f"{report.profile['model']} model sent no requests"
+            assert not report.errors, f"Transport errors: {report.errors}"
+            assert set(report.statuses) == {"200"}, f"Unexpected statuses: {report.statuses}"
+        # Keep-alive: connections are reused rather than opened per request
+        assert closed.connections_opened <= 10
@@ -2,13 +2,83 @@
 Centralized pytest fixtures for the test framework.
 Provides browser, page, authentication, and page object fixtures.
 """
+import os
+import re
+
 import pytest
-from playwright.sync_api import Page, Browser, BrowserContext
-from typing import Generator
+from playwright.sync_api import Page, Browser, BrowserContext, Playwright
+from typing import Callable, Generator, List
 
 from config import config
-from pages import LoginPage, DashboardPage, PimPage, AdminPage, LeavePage, TimePage, MyInfoPage
-from utils import data
+from pages import BasePage, LoginPage, DashboardPage, PimPage, AdminPage, LeavePage, TimePage, MyInfoPage
+from utils import (
+    data, run_stats, ApiAuthenticator, AssetCache, ContextPool, SessionStateCache, HarArchive, NetworkBlocker,
+)
+from utils.api_waits import api_waits
+from utils.data_seeder import DataSeeder
+from utils.hr_dataset import KeptDataset
+from utils.resource_registry import created_resources
+from utils.locators import locator_timings
+from utils.lpt_scheduler import duration_history, make_scheduler, shared_fixtures
+from utils.impact_index import impact_index, impact_recorder
+from utils.perf_baseline import current_git_sha
+from utils.perf_baseline import BaselineKey, PerfBaseline, RegressionVerdict
+from utils.perf_probe import perf_probe
+from utils.perf_scenario import PerfResult
+from utils.har_archive import HAR_MODES, HarReplaySeeder, module_for
+from utils.network_blocker import MODULE_PROFILES
+from utils.sleep_lint import find_hard_sleeps
+from standin import StandinApp, StandinServer
+
+
+# ============================================================================
+# Command-line Options
+# ============================================================================
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--har-mode",
+        choices=HAR_MODES,
+        default=config.HAR_MODE,
+        help="record: capture each test module's traffic into a HAR; "
+             "replay: serve requests from the recorded HARs",
+    )
+    parser.addoption(
+        "--impact-collect",
+        action="store_true",
+        help="record the code each test runs into the test impact index",
+    )
+    parser.addoption(
+        "--changed-since",
+        metavar="REF",
+        default=None,
+        help="run only the tests the changes since this git ref can affect (see --impact-collect)",
+    )
+
+
+def pytest_configure(config):
+    """
+    Where tests run: start the impact recorder. Once, on the xdist
+    controller: refuse hard sleeps, reset HARs for a record run.
+    """
+    is_worker = hasattr(config, "workerinput")
+    if config.getoption("impact_collect") and (is_worker or not getattr(config.option, "numprocesses", None)):
+        impact_recorder.start(config.rootpath)
+    if is_worker:
+        return
+    sleeps = find_hard_sleeps(config.rootpath)
+    if sleeps:
+        raise pytest.UsageError(
+            "Hard sleeps found; wait for a condition instead "
+            "(or mark a justified one with '# allow-sleep: <reason>'):\n"
+            + "\n".join(f"  {sleep}" for sleep in sleeps)
+        )
+    if config.getoption("har_mode") == "record":
+        HarArchive().clear()
+
+
+def _har_mode(request) -> str:
+    return request.config.getoption("har_mode")
 
 
 # ============================================================================
@@ -34,22 +104,111 @@ def browser_context_args():
     }
 
 
-@pytest.fixture(scope="function")
-def context(browser: Browser, browser_context_args) -> Generator[BrowserContext, None, None]:
-    """Create a new browser context for each test"""
-    context = browser.new_context(**browser_context_args)
+@pytest.fixture(scope="session")
+def context_pool(browser: Browser, browser_context_args) -> Generator[ContextPool, None, None]:
+    """Warm browser contexts reused across this worker's tests"""
+    pool = ContextPool(browser, browser_context_args)
+    yield pool
+    pool.close()
 
-    # Enable tracing if configured
-    if config.TRACE_ON_FAILURE:
-        context.tracing.start(screenshots=True, snapshots=True, sources=True)
 
-    yield context
+@pytest.fixture(scope="session")
+def asset_cache() -> Generator[AssetCache, None, None]:
+    """Static asset cache shared by every context (and xdist worker)"""
+    cache = AssetCache()
+    yield cache
+    cache.close()
 
-    # Stop tracing on test completion
-    if config.TRACE_ON_FAILURE:
-        context.tracing.stop(path=f"{config.TRACES_DIR}/trace.zip")
 
-    context.close()
+@pytest.fixture(scope="session")
+def network_blocker() -> Generator[NetworkBlocker, None, None]:
+    """Blocks requests a test's network profile marks as non-essential"""
+    blocker = NetworkBlocker()
+    yield blocker
+    blocker.close()
+
+
+def _network_profile(request) -> str:
+    """Profile from the network_profile marker, else the test package default"""
+    marker = request.node.get_closest_marker("network_profile")
+    if marker:
+        return marker.args[0]
+    return MODULE_PROFILES.get(module_for(request.node), config.NETWORK_PROFILE)
+
+
+@pytest.fixture(scope="session")
+def har_archive() -> HarArchive:
+    """Per-module HAR files used by --har-mode"""
+    return HarArchive()
+
+
+@pytest.fixture(scope="function")
+def context(
+    browser: Browser, browser_context_args, context_pool: ContextPool, created_data_cleanup, request
+) -> Generator[BrowserContext, None, None]:
+    """
+    Provide a clean browser context for each test.
+    Contexts come from the worker's pool unless the test is marked
+    isolated_context, context reuse is disabled, or HARs are being
+    recorded (Playwright writes a HAR only when its context closes).
+    """
+    har_mode = _har_mode(request)
+    har_options = {}
+    if har_mode != "off":
+        har_archive = request.getfixturevalue("har_archive")
+        module = module_for(request.node)
+        if har_mode == "record":
+            har_options = har_archive.record_options()
+        elif not har_archive.exists(module):
+            pytest.skip(f"No recorded HAR for '{module}'; run with --har-mode=record first")
+
+    isolated = (
+        har_mode == "record"
+        or not config.REUSE_CONTEXTS
+        or request.node.get_closest_marker("isolated_context")
+    )
+    if isolated:
+        run_stats.add("context_pool", "isolated")
+        context = browser.new_context(**browser_context_args, **har_options)
+        if config.TRACE_ON_FAILURE:
+            context.tracing.start(screenshots=True, snapshots=True, sources=True)
+    else:
+        context = context_pool.acquire()
+        if config.TRACE_ON_FAILURE:
+            # Pooled contexts trace continuously; each test records one chunk
+            context.tracing.start_chunk()
+
+    # Lets waits resolve on API responses instead of networkidle
+    api_waits.install(context)
+    # Browser-side timing (LCP, long tasks, CLS) for BasePage.measure / navigate_to
+    perf_probe.install(context)
+
+    if har_mode == "off" and config.ASSET_CACHE:
+        request.getfixturevalue("asset_cache").install(context)
+
+    # Registered after the caches so blocked requests never reach them
+    request.getfixturevalue("network_blocker").install(context, _network_profile(request))
+
+    if har_mode == "replay":
+        # Recorded responses already belong to a logged-in session
+        har_archive.replay(context, module)
+    elif _needs_auth(request):
+        # Authenticated tests start with session cookies already in place
+        ApiAuthenticator.apply_to(context, _session_state(request))
+
+    yield context
+
+    trace_path = f"{config.TRACES_DIR}/trace.zip"
+    if isolated:
+        if config.TRACE_ON_FAILURE:
+            context.tracing.stop(path=trace_path)
+        context.close()
+        if har_mode == "record":
+            har_archive.merge(har_options["record_har_path"], module)
+    else:
+        if config.TRACE_ON_FAILURE:
+            context.tracing.stop_chunk(path=trace_path)
+        context_pool.release(context)
 
 
 @pytest.fixture(scope="function")
@@ -67,27 +226,86 @@ def page(context: BrowserContext) -> Generator[Page, None, None]:
 
 
 # ============================================================================
-# Authentication Fixtures
+# Local Stand-in Server
 # ============================================================================
 
-@pytest.fixture(scope="function")
-def authenticated_page(page: Page) -> Page:
+@pytest.fixture(scope="session", autouse=True)
+def standin_server() -> Generator[None, None, None]:
     """
-    Provide an authenticated page (logged in as admin).
-    Use this fixture when tests require authentication.
+    Serve the OrangeHRM stand-in when running with ENV=local.
+    Each worker gets its own server and data on a free port, so xdist
+    workers never see each other's records.
     """
-    login_page = LoginPage(page)
-    login_page.navigate()
-    login_page.login(config.get_username(), config.get_password())
+    if config.ENV != "local" or not config.STANDIN_AUTOSTART:
+        yield
+        return
+
+    server = StandinServer(StandinApp())
+    configured_url = config.BASE_URLS["local"]
+    config.BASE_URLS["local"] = server.start()
+    yield
+    server.stop()
+    config.BASE_URLS["local"] = configured_url
+
 
-    # Wait for dashboard to confirm login success
-    from playwright.sync_api import expect
-    import re
-    expect(page).to_have_url(re.compile("/dashboard"), timeout=15000)
+# ============================================================================
+# Authentication Fixtures
+# ============================================================================
 
+def _needs_auth(request) -> bool:
+    """Authenticated fixtures follow the authenticated_* naming convention"""
+    return any(name.startswith("authenticated_") for name in request.fixturenames)
+
+
+def _session_state(request) -> dict:
+    """Session cookies for a new context: the shared cache or a fresh login"""
+    if config.REUSE_AUTH_STATE:
+        return request.getfixturevalue("auth_state").state
+    return request.getfixturevalue("api_auth").login()
+
+
+def _open_authenticated(page: Page, request, path: str) -> Page:
+    """Open a module path directly, logging in again if the session expired"""
+    BasePage(page).navigate_to(path)
+    if "/auth/login" in page.url and _har_mode(request) != "replay":
+        # Server dropped the session: log in over the API and retry once
+        api_auth = request.getfixturevalue("api_auth")
+        if config.REUSE_AUTH_STATE:
+            state = request.getfixturevalue("auth_state").refresh(api_auth.login)
+        else:
+            state = api_auth.login()
+        ApiAuthenticator.apply_to(page.context, state)
+        BasePage(page).navigate_to(path)
     return page
 
 
+@pytest.fixture(scope="session")
+def api_auth(playwright: Playwright) -> ApiAuthenticator:
+    """API login for the current environment's credentials"""
+    return ApiAuthenticator(playwright)
+
+
+@pytest.fixture(scope="session")
+def auth_state(playwright: Playwright, api_auth: ApiAuthenticator) -> SessionStateCache:
+    """
+    Storage state of a logged-in admin session, shared by the whole worker.
+    The login runs once per environment and credential pair; under xdist the
+    first worker logs in and the others reuse its state file.
+    """
+    cache = SessionStateCache(config.get_base_url(), config.get_username())
+    cache.ensure(playwright, api_auth.login)
+    return cache
+
+
+@pytest.fixture(scope="function")
+def authenticated_page(page: Page, request) -> Page:
+    """
+    Provide an authenticated page (logged in as admin) on the dashboard.
+    Use this fixture when tests require authentication.
+    """
+    return _open_authenticated(page, request, DashboardPage.path)
+
+
 # ============================================================================
 # Page Object Fixtures
 # ============================================================================
@@ -139,27 +357,27 @@ def myinfo_page(page: Page) -> MyInfoPage:
 # ============================================================================
 
 @pytest.fixture
-def authenticated_pim_page(authenticated_page: Page) -> PimPage:
-    """Provide authenticated PimPage instance"""
-    return PimPage(authenticated_page)
+def authenticated_pim_page(page: Page, request) -> PimPage:
+    """Provide authenticated PimPage instance, opened on the employee list"""
+    return PimPage(_open_authenticated(page, request, PimPage.path))
 
 
 @pytest.fixture
-def authenticated_admin_page(authenticated_page: Page) -> AdminPage:
-    """Provide authenticated AdminPage instance"""
-    return AdminPage(authenticated_page)
+def authenticated_admin_page(page: Page, request) -> AdminPage:
+    """Provide authenticated AdminPage instance, opened on system users"""
+    return AdminPage(_open_authenticated(page, request, AdminPage.path))
 
 
 @pytest.fixture
-def authenticated_leave_page(authenticated_page: Page) -> LeavePage:
-    """Provide authenticated LeavePage instance"""
-    return LeavePage(authenticated_page)
+def authenticated_leave_page(page: Page, request) -> LeavePage:
+    """Provide authenticated LeavePage instance, opened on the leave list"""
+    return LeavePage(_open_authenticated(page, request, LeavePage.path))
 
 
 @pytest.fixture
-def authenticated_time_page(authenticated_page: Page) -> TimePage:
-    """Provide authenticated TimePage instance"""
-    return TimePage(authenticated_page)
+def authenticated_time_page(page: Page, request) -> TimePage:
+    """Provide authenticated TimePage instance, opened on timesheets"""
+    return TimePage(_open_authenticated(page, request, TimePage.path))
 
 
 @pytest.fixture
@@ -174,6 +392,30 @@ def authenticated_dashboard_page(authenticated_page: Page) -> DashboardPage:
     return DashboardPage(authenticated_page)
 
 
+# ============================================================================
+# Performance Baseline Fixtures
+# ============================================================================
+
+@pytest.fixture(scope="session")
+def perf_baseline_store() -> PerfBaseline:
+    """SQLite history of performance scenario results"""
+    return PerfBaseline()
+
+
+@pytest.fixture
+def perf_baseline(
+    request, browser_name: str, perf_baseline_store: PerfBaseline
+) -> Callable[[PerfResult], RegressionVerdict]:
+    """
+    Compare a scenario result with earlier runs of this test, then store it.
+    Results are keyed by the docstring's Test ID (e.g. PERF-003), browser,
+    environment and git SHA.
+    """
+    match = re.search(r"Test ID:\s*(\S+)", request.node.function.__doc__ or "")
+    key = BaselineKey(match.group(1) if match else request.node.name, browser_name)
+    return lambda result: perf_baseline_store.check(result, key)
+
+
 # ============================================================================
 # Test Data Fixtures
 # ============================================================================
@@ -181,37 +423,86 @@ def authenticated_dashboard_page(authenticated_page: Page) -> DashboardPage:
 @pytest.fixture
 def random_employee_data() -> dict:
     """Generate random employee data for tests"""
-    first_name, last_name = data.random_full_name()
-    return {
-        "first_name": first_name,
-        "last_name": last_name,
-        "middle_name": data.random_string(6),
-        "employee_id": data.random_employee_id(),
-        "full_name": f"{first_name} {last_name}",
-    }
+    return data.employee_data()
 
 
 @pytest.fixture
 def random_user_data() -> dict:
     """Generate random user data for admin tests"""
-    return {
-        "username": data.random_username("testuser"),
-        "password": data.random_password(12),
-        "role": "ESS",
-        "status": "Enabled",
-    }
+    return data.user_data()
 
 
 @pytest.fixture
 def random_leave_data() -> dict:
     """Generate random leave data for leave tests"""
-    from_date, to_date = data.random_date_range(1, 3)
-    return {
-        "leave_type": "CAN - Vacation",
-        "from_date": from_date,
-        "to_date": to_date,
-        "comments": f"Test leave request {data.unique_timestamp()}",
-    }
+    return data.leave_data()
+
+
+@pytest.fixture(scope="session")
+def data_seeder(created_data_cleanup, request) -> DataSeeder:
+    """
+    Creates test preconditions in bulk through the API, as the admin session.
+    With --har-mode=replay, employees and users are added to the replayed
+    responses instead, so nothing reaches a server.
+    """
+    if _har_mode(request) == "replay":
+        return HarReplaySeeder(request.getfixturevalue("har_archive"))
+    return DataSeeder(_session_state(request))
+
+
+@pytest.fixture
+def seeded_employee(data_seeder: DataSeeder, random_employee_data: dict) -> dict:
+    """An employee created through the API: random_employee_data plus its emp_number"""
+    return data_seeder.employees([random_employee_data])[0]
+
+
+@pytest.fixture
+def seeded_user(data_seeder: DataSeeder, random_user_data: dict) -> dict:
+    """
+    An ESS user created through the API for a new employee: random_user_data
+    plus its "id", "emp_number" and "employee" record
+    """
+    return data_seeder.users([random_user_data])[0]
+
+
+@pytest.fixture(scope="session")
+def hr_dataset(data_seeder: DataSeeder) -> List[dict]:
+    """
+    A synthesized organization of HR_DATASET_EMPLOYEES employees, with their
+    leave and timesheets, loaded through the API; returns the employee records.
+    The load stays in the environment and later sessions reuse it. Skipped
+    outside ENV=local/staging unless HR_DATASET_LOAD=true.
+    """
+    if config.ENV not in ("local", "staging") and not config.HR_DATASET_LOAD:
+        pytest.skip(f"HR dataset loads ~60k records; not on ENV={config.ENV} without HR_DATASET_LOAD=true")
+    # Each worker's stand-in is a server of its own
+    name = f"local-{os.environ.get('PYTEST_XDIST_WORKER', 'main')}" if config.ENV == "local" else config.ENV
+    employees, loaded = KeptDataset(f"{config.HR_DATASET_DIR}/{name}", config.HR_DATASET_EMPLOYEES).ensure(
+        data_seeder, config.get_base_url()
+    )
+    run_stats.add("hr_dataset", "reused" if not loaded else "loaded")
+    for dataset, count in loaded.items():
+        run_stats.add("hr_dataset", f"{dataset}_loaded", count)
+    return employees
+
+
+@pytest.fixture(scope="session")
+def created_data_cleanup(api_auth: ApiAuthenticator, request) -> Generator[None, None, None]:
+    """
+    Delete the employees and users this worker created once its tests are
+    done. Page-object actions and the seeder register them in created_resources;
+    the browser context and data_seeder fixtures request this one, so sessions
+    without either (e.g. tests/unit) never start Playwright. It is set up after
+    the autouse stand-in server, so it is torn down while the server still runs.
+    """
+    yield
+    leftovers = created_resources.drain()
+    if not config.CLEANUP_CREATED_DATA or _har_mode(request) == "replay" or not any(leftovers.values()):
+        return
+    # Fresh login: the shared session may have expired during a long run
+    deleted = DataSeeder(api_auth.login()).delete(leftovers)
+    for kind, count in deleted.items():
+        run_stats.add("cleanup", f"{kind}s_deleted", count)
 
 
 # ============================================================================
@@ -223,6 +514,8 @@ def pytest_runtest_makereport(item, call):
     """Hook to capture screenshots on test failure"""
     outcome = yield
     report = outcome.get_result()
+    # Travels with the report to the xdist controller, which records durations
+    report.shared_fixtures = shared_fixtures(item)
 
     if report.when == "call" and report.failed:
         # Get the page fixture if it exists
@@ -236,3 +529,107 @@ def pytest_runtest_makereport(item, call):
                     print(f"\nScreenshot saved: {screenshot_path}")
                 except Exception as e:
                     print(f"\nFailed to capture screenshot: {e}")
+
+
+# ============================================================================
+# Hooks for Test Impact Analysis
+# ============================================================================
+
+def pytest_collection_modifyitems(config, items):
+    """--changed-since: deselect the tests the changes cannot affect"""
+    ref = config.getoption("changed_since")
+    if not ref:
+        return
+    selection = impact_index.select(ref, config.rootpath)
+    deselected = [item for item in items if not selection.includes(item)]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = [item for item in items if selection.includes(item)]
+    # Every xdist worker selects the same tests; count them once
+    if os.environ.get("PYTEST_XDIST_WORKER", "gw0") == "gw0":
+        run_stats.add("impact", "selected", len(items))
+        run_stats.add("impact", "deselected", len(deselected))
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_fixture_setup(fixturedef, request):
+    """--impact-collect: credit what a fixture's setup runs to the tests using it"""
+    if not request.config.getoption("impact_collect"):
+        yield
+        return
+    with impact_recorder.fixture(fixturedef):
+        yield
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item):
+    """--impact-collect: record the code a test runs"""
+    if not item.config.getoption("impact_collect"):
+        yield
+        return
+    with impact_recorder.test(item):
+        yield
+
+
+# ============================================================================
+# Hooks for Run Statistics
+# ============================================================================
+
+# Seconds per test so far this run (setup + call + teardown)
+_test_durations: dict = {}
+
+
+def pytest_runtest_logreport(report):
+    """On the controller (or a run without -n): record each finished test's duration"""
+    _test_durations[report.nodeid] = _test_durations.get(report.nodeid, 0.0) + report.duration
+    if report.when == "teardown":
+        duration_history.record(
+            report.nodeid, _test_durations.pop(report.nodeid), getattr(report, "shared_fixtures", [])
+        )
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    """Distribute -n runs longest-test-first from the recorded durations"""
+    return make_scheduler(config, log)
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_sessionfinish(session):
+    """Hand this worker's counters to the xdist controller; on the controller, save test durations"""
+    if hasattr(session.config, "workeroutput"):
+        session.config.workeroutput["run_stats"] = run_stats.as_dict()
+        session.config.workeroutput["locator_timings"] = locator_timings.as_dict()
+        if session.config.getoption("impact_collect"):
+            session.config.workeroutput["test_impact"] = impact_recorder.as_dict()
+    elif not session.config.getoption("collectonly"):
+        duration_history.save()
+        if session.config.getoption("impact_collect"):
+            impact_index.save(impact_recorder.as_dict(), current_git_sha())
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Merge counters reported by a finished xdist worker"""
+    run_stats.merge(getattr(node, "workeroutput", {}).get("run_stats", {}))
+    locator_timings.merge(getattr(node, "workeroutput", {}).get("locator_timings", {}))
+    impact_recorder.merge(getattr(node, "workeroutput", {}).get("test_impact", {}))
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Report pool, cache and network counters collected during the run"""
+    ref = terminalreporter.config.getoption("changed_since")
+    if ref:
+        terminalreporter.write_sep("=", f"test impact since {ref}")
+        for reason in impact_index.select(ref, terminalreporter.config.rootpath).reasons:
+            terminalreporter.write_line(reason)
+    lines = run_stats.format_lines()
+    if lines:
+        terminalreporter.write_sep("=", "run statistics")
+        for line in lines:
+            terminalreporter.write_line(line)
+    lines = locator_timings.format_lines()
+    if lines:
+        terminalreporter.write_sep("=", "slowest locators (LOCATOR_DEBUG)")
+        for line in lines:
+            terminalreporter.write_line(line)
@@ -1,12 +1,63 @@
 """
 Performance Tests - Page load and interaction performance
-Basic performance checks using Playwright's timing API.
+Timings come from the browser's own performance APIs (utils.perf_probe);
+each check runs its flow repeatedly (utils.perf_scenario) and fails on a
+statistically significant slowdown against earlier runs (utils.perf_baseline),
+or when a percentile exceeds the scenario's absolute ceiling.
 """
 import pytest
 from playwright.sync_api import Page
 from pages import LoginPage, PimPage, DashboardPage
 from config import config
-from utils import waits
+from utils import waits, perf_probe
+from utils.perf_scenario import perf_scenario
+
+
+# ============================================================================
+# Scenarios: one iteration each, repeated by @perf_scenario
+# ============================================================================
+
+@perf_scenario("login page load")
+def login_page_load(login_page: LoginPage):
+    return login_page.navigate_to(login_page.path, measure=True)
+
+
+@perf_scenario("dashboard after login")
+def dashboard_after_login(login_page: LoginPage):
+    # Start every iteration logged out
+    login_page.page.context.clear_cookies()
+    login_page.navigate()
+    login_page.login(config.get_username(), config.get_password())
+    waits.wait_for_url_change(login_page.page, "/dashboard")
+
+    # Dashboard document: from the login redirect until its content was painted
+    timing = perf_probe.page_timing(login_page.page)
+    return timing.lcp_ms or timing.fcp_ms or timing.load_ms
+
+
+@perf_scenario("employee search")
+def employee_search(pim: PimPage):
+    pim.reset_search()
+    with pim.measure("employee search") as timing:
+        pim.search_employee_by_name("Peter")  # returns once the search response rendered
+    return timing
+
+
+@perf_scenario("employee search among {employees} employees")
+def employee_search_at_scale(pim: PimPage, full_name: str, employees: int):
+    pim.reset_search()
+    with pim.measure("employee search") as timing:
+        pim.search_employee_by_name(full_name)
+    return timing
+
+
+@perf_scenario("open {module}")
+def module_navigation(dashboard: DashboardPage, module: str):
+    dashboard.navigate()
+    with dashboard.measure(f"open {module}") as timing:
+        dashboard.click_menu_item(module)
+        dashboard.wait_for_page_load()
+    return timing
 
 
 @pytest.mark.performance
@@ -14,98 +65,68 @@ from utils import waits
 class TestPerformance:
     """Performance test suite"""
 
-    def test_login_page_load_time(self, page: Page):
+    def test_login_page_load_time(self, page: Page, perf_baseline):
         """
         Test ID: PERF-001
-        Verify that login page loads within acceptable time
+        Verify that login page load time has not regressed
         """
-        login_page = LoginPage(page)
+        result = login_page_load(LoginPage(page))
 
-        # Start timing
-        page.goto(login_page.base_url)
+        # 90% of loads within 3 seconds, whatever the history says
+        result.assert_percentile(90, 3000)
+        perf_baseline(result).assert_no_regression()
 
-        # Measure load time
-        load_state = page.wait_for_load_state("domcontentloaded", timeout=5000)
-
-        # Check performance navigation timing
-        timing = page.evaluate("""() => {
-            const perfData = window.performance.timing;
-            return {
-                loadTime: perfData.loadEventEnd - perfData.navigationStart,
-                domContentLoaded: perfData.domContentLoadedEventEnd - perfData.navigationStart
-            };
-        }""")
-
-        # Assert load time is reasonable (< 3 seconds)
-        assert timing['loadTime'] < 3000, f"Page load time {timing['loadTime']}ms exceeds 3000ms threshold"
-
-    def test_dashboard_page_load_time_after_login(self, page: Page):
+    def test_dashboard_page_load_time_after_login(self, page: Page, perf_baseline):
         """
         Test ID: PERF-002
-        Verify that dashboard loads quickly after login
+        Verify that dashboard load after login has not regressed
         """
-        login_page = LoginPage(page)
-        login_page.navigate()
-        login_page.login(config.get_username(), config.get_password())
+        result = dashboard_after_login(LoginPage(page))
 
-        # Wait for dashboard
-        waits.wait_for_url_change(page, "/dashboard")
+        result.assert_percentile(90, 5000)
+        perf_baseline(result).assert_no_regression()
 
-        # Check timing
-        timing = page.evaluate("""() => {
-            return performance.now();
-        }""")
-
-        assert timing < 5000, f"Dashboard load time {timing}ms exceeds 5000ms threshold"
-
-    def test_employee_search_response_time(self, authenticated_pim_page: PimPage):
+    def test_employee_search_response_time(self, authenticated_pim_page: PimPage, perf_baseline):
         """
         Test ID: PERF-003
-        Verify that employee search responds within acceptable time
+        Verify that employee search response time has not regressed
         """
+        # Fixture opens the employee list directly
         pim = authenticated_pim_page
 
-        pim.navigate()
-        waits.wait_for_network_idle(pim.page)
+        result = employee_search(pim)
 
-        # Measure search time
-        import time
-        start_time = time.time()
+        # 90% of searches within 3 seconds
+        result.assert_percentile(90, 3000)
+        perf_baseline(result).assert_no_regression()
 
-        pim.search_employee_by_name("Peter")
-        waits.wait_for_network_idle(pim.page)
+    def test_employee_search_response_time_at_scale(
+        self, authenticated_pim_page: PimPage, hr_dataset: list, perf_baseline
+    ):
+        """
+        Test ID: PERF-005
+        Verify employee search has not regressed with a production-sized employee list
+        """
+        pim = authenticated_pim_page
+        employee = hr_dataset[len(hr_dataset) // 2]
 
-        end_time = time.time()
-        search_time = (end_time - start_time) * 1000  # Convert to milliseconds
+        result = employee_search_at_scale(pim, f"{employee['first_name']} {employee['last_name']}", len(hr_dataset))
 
-        # Assert search completes within 3 seconds
-        assert search_time < 3000, f"Search time {search_time}ms exceeds 3000ms threshold"
+        result.assert_percentile(90, 5000)
+        perf_baseline(result).assert_no_regression()
 
-    def test_page_navigation_performance(self, authenticated_page: Page):
+    def test_page_navigation_performance(self, authenticated_dashboard_page: DashboardPage, perf_baseline):
         """
         Test ID: PERF-004
-        Verify navigation between major modules is performant
+        Verify navigation between major modules has not regressed
         """
-        import time
-
-        modules = ["PIM", "Admin", "Leave", "Time"]
-        navigation_times = []
-
-        for module in modules:
-            start = time.time()
-
-            # Click module link
-            authenticated_page.get_by_role("link", name=module).click()
-            authenticated_page.wait_for_load_state("domcontentloaded")
-
-            end = time.time()
-            nav_time = (end - start) * 1000
-            navigation_times.append(nav_time)
+        verdicts = []
+        for module in ["PIM", "Admin", "Leave", "Time"]:
+            result = module_navigation(authenticated_dashboard_page, module)
 
             # PIM module has more data and may take longer on demo site
-            threshold = 5000 if module == "PIM" else 3000
-            assert nav_time < threshold, f"{module} navigation time {nav_time}ms exceeds {threshold}ms"
+            result.assert_percentile(90, 5000 if module == "PIM" else 3000)
+            verdicts.append(perf_baseline(result))
 
-        # Check average navigation time (allow up to 3 seconds for demo site)
-        avg_time = sum(navigation_times) / len(navigation_times)
-        assert avg_time < 3000, f"Average navigation time {avg_time}ms exceeds 3000ms"
+        regressions = [verdict.describe() for verdict in verdicts if verdict.regressed]
+        assert not regressions, "Performance regression: " + "; ".join(regressions)
@@ -50,77 +50,38 @@ class TestPIM:
         # Assert validation error
         assertions.assert_element_visible(pim.last_name_required_error)
 
-    def test_new_employee_appears_in_search(
-        self, authenticated_pim_page: PimPage, random_employee_data: dict
-    ):
+    def test_new_employee_appears_in_search(self, authenticated_pim_page: PimPage, seeded_employee: dict):
         """
         Test ID: PIM-LIST-001
         Verify that newly created employee appears in search results
         """
         pim = authenticated_pim_page
 
-        # Create employee
-        pim.navigate_to_add_employee()
-        pim.add_employee(
-            random_employee_data["first_name"],
-            random_employee_data["last_name"]
-        )
-
-        # Wait for save (toast may appear)
-        try:
-            waits.wait_for_success_toast(pim.page)
-        except:
-            # If toast doesn't appear, just wait for network
-            waits.wait_for_network_idle(pim.page)
-
-        # Search for employee
-        pim.navigate()
-        waits.wait_for_network_idle(pim.page)
-
-        pim.search_employee_by_name(random_employee_data["full_name"])
-        waits.wait_for_network_idle(pim.page)
+        # Employee was created through the API; the fixture opens the employee list directly
+        pim.search_employee_by_name(seeded_employee["full_name"])
 
         # Assert employee appears in list
-        assertions.assert_table_contains_text(pim.page, random_employee_data["first_name"])
+        assertions.assert_table_contains_text(pim.page, seeded_employee["first_name"])
 
-    def test_delete_employee_removes_from_list(
-        self, authenticated_pim_page: PimPage, random_employee_data: dict
-    ):
+    def test_delete_employee_removes_from_list(self, authenticated_pim_page: PimPage, seeded_employee: dict):
         """
         Test ID: PIM-DEL-001
         Verify that deleted employee is removed from list
         """
         pim = authenticated_pim_page
 
-        # Create employee first
-        pim.navigate_to_add_employee()
-        pim.add_employee(
-            random_employee_data["first_name"],
-            random_employee_data["last_name"]
-        )
-        waits.wait_for_success_toast(pim.page)
-
-        # Search and delete
-        pim.navigate()
-        waits.wait_for_network_idle(pim.page)
-
-        pim.search_employee_by_name(random_employee_data["full_name"])
-        waits.wait_for_network_idle(pim.page)
+        # Fixture opens the employee list directly; search and delete
+        pim.search_employee_by_name(seeded_employee["full_name"])
 
         # Verify employee exists before deleting
-        assertions.assert_table_contains_text(pim.page, random_employee_data["first_name"])
+        assertions.assert_table_contains_text(pim.page, seeded_employee["first_name"])
 
         # Delete employee
         pim.select_employee_checkbox(0)
         pim.delete_selected_employee()
 
-        # Wait for deletion to complete (toast may or may not appear)
-        waits.wait_for_network_idle(pim.page)
-
         # Verify employee is gone
         pim.reset_search()
-        waits.wait_for_network_idle(pim.page)
-        pim.search_employee_by_name(random_employee_data["full_name"])
-        waits.wait_for_network_idle(pim.page)
+        pim.search_employee_by_name(seeded_employee["full_name"])
 
         assertions.assert_no_records_found(pim.page)
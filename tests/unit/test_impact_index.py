@@ -0,0 +1,141 @@
+"""
+Unit Tests - Test impact analysis
+Recording, line-level selection and git diff parsing of utils.impact_index,
+without a browser or server.
+"""
+import importlib.util
+import subprocess
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from utils.impact_index import ImpactRecorder, affected_tests, changed_lines
+
+LEAVE_PAGE = '''\
+def apply():
+    return 1
+
+
+def cancel():
+    return 2
+'''
+
+
+def _load(path: Path):
+    spec = importlib.util.spec_from_file_location("impact_fixture_module", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _git(root: Path, *args: str):
+    subprocess.run(["git", *args], cwd=root, check=True, capture_output=True)
+
+
+@pytest.mark.unit
+class TestImpactIndex:
+    """Test impact analysis suite"""
+
+    def test_nested_collectors_with_equal_regions(self, tmp_path: Path):
+        """
+        Test ID: IMPACT-001
+        Verify a fixture recorded inside a test leaves the test's collection intact
+        when both have recorded the same regions
+        """
+        (tmp_path / "pages").mkdir()
+        (tmp_path / "pages" / "leave_page.py").write_text(LEAVE_PAGE)
+        leave_page = _load(tmp_path / "pages" / "leave_page.py")
+        fixturedef = SimpleNamespace(baseid="tests", argname="leave_request")
+        item = SimpleNamespace(
+            nodeid="tests/leave/test_leave.py::test_cancel",
+            fixturenames=["leave_request"],
+            _fixtureinfo=SimpleNamespace(name2fixturedefs={"leave_request": [fixturedef]}),
+        )
+
+        recorder = ImpactRecorder()
+        recorder.start(tmp_path)
+        try:
+            with recorder.test(item):
+                leave_page.apply()
+                with recorder.fixture(fixturedef):
+                    leave_page.apply()
+                # The test's regions grow after the fixture's, equal, set was closed
+                leave_page.cancel()
+        finally:
+            recorder.stop()
+
+        assert recorder.as_dict()["tests"][item.nodeid]["deps"] == {"pages/leave_page.py": [1, 5]}
+
+    def test_affected_tests_by_changed_lines(self):
+        """
+        Test ID: IMPACT-002
+        Verify a change selects only the tests whose recorded regions it touches
+        """
+        index = {
+            "files": {
+                "pages/leave_page.py": {"1": [2, "LeavePage.apply"], "5": [6, "LeavePage.cancel"]},
+                "pages/pim_page.py": {"1": [2, "PimPage.add"]},
+            },
+            "tests": {
+                "tests/leave/test_leave.py::test_apply": {"deps": {"pages/leave_page.py": [1]}, "fixtures": []},
+                "tests/leave/test_leave.py::test_cancel": {"deps": {"pages/leave_page.py": [5]}, "fixtures": []},
+                "tests/pim/test_pim.py::test_add": {"deps": {"pages/pim_page.py": [1]}, "fixtures": []},
+            },
+        }
+
+        selection = affected_tests(index, {"pages/leave_page.py": [(6, 6)], "README.md": None})
+        assert selection.tests == {"tests/leave/test_leave.py::test_cancel"}
+        assert selection.reasons == ["pages/leave_page.py (LeavePage.cancel): 1 tests"]
+
+        # A whole changed file selects every test that used it
+        selection = affected_tests(index, {"pages/leave_page.py": None})
+        assert selection.tests == {"tests/leave/test_leave.py::test_apply", "tests/leave/test_leave.py::test_cancel"}
+
+        # Outside the instrumented packages, everything is affected
+        assert affected_tests(index, {"config/settings.py": [(3, 3)]}).tests is None
+
+    def test_affected_tests_by_code_no_test_ran(self):
+        """
+        Test ID: IMPACT-004
+        Verify a changed hook no test recorded selects every test, and an
+        unused page-object method none
+        """
+        index = {
+            "files": {
+                "tests/conftest.py": {"60": [64, "pytest_configure"], "70": [72, "page"]},
+                "pages/leave_page.py": {"1": [2, "LeavePage.apply"], "5": [6, "LeavePage.cancel"]},
+            },
+            "tests": {
+                "tests/leave/test_leave.py::test_apply": {
+                    "deps": {"tests/conftest.py": [70], "pages/leave_page.py": [1]}, "fixtures": ["page"],
+                },
+            },
+        }
+
+        selection = affected_tests(index, {"tests/conftest.py": [(62, 62)]})
+        assert selection.tests is None
+        assert selection.reasons == ["tests/conftest.py (pytest_configure): run outside any test, every test is affected"]
+
+        assert affected_tests(index, {"tests/conftest.py": [(71, 71)]}).tests == {"tests/leave/test_leave.py::test_apply"}
+        assert affected_tests(index, {"pages/leave_page.py": [(6, 6)]}).tests == set()
+
+    def test_changed_lines_from_git_diff(self, tmp_path: Path):
+        """
+        Test ID: IMPACT-003
+        Verify changed line ranges are read from git diff, old side, with untracked files whole
+        """
+        _git(tmp_path, "init", "-q")
+        (tmp_path / "pages").mkdir()
+        (tmp_path / "pages" / "leave_page.py").write_text(LEAVE_PAGE)
+        _git(tmp_path, "add", ".")
+        _git(tmp_path, "-c", "user.name=test", "-c", "user.email=test@example.com", "commit", "-q", "-m", "init")
+
+        (tmp_path / "pages" / "leave_page.py").write_text(LEAVE_PAGE.replace("return 1", "return 3") + "\n\ndef x():\n    pass\n")
+        (tmp_path / "pages" / "pim_page.py").write_text("def add():\n    return 3\n")
+
+        assert changed_lines("HEAD", tmp_path) == {
+            # An edited line, and an insertion after the last line (between line 6 and 7)
+            "pages/leave_page.py": [(2, 2), (6, 7)],
+            "pages/pim_page.py": None,
+        }
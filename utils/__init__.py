@@ -1,13 +1,52 @@
 """Utility modules for test framework"""
 from .data_generator import DataGenerator, data
+from .batch_data import BatchDataGenerator, batch_data
 from .custom_waits import CustomWaits, waits
+from .api_waits import ApiWaits, api_waits, expects_api
+from .conditions import Condition, wait_until
+from .locators import LocatorSpec, locator_timings
+from .perf_probe import PerfProbe, perf_probe
+from .perf_scenario import PerfResult, perf_scenario
+from .perf_baseline import PerfBaseline
 from .custom_assertions import CustomAssertions, assertions
+from .file_lock import FileLock
+from .auth import ApiAuthenticator, AuthError
+from .session_state import SessionStateCache
+from .run_stats import RunStats, run_stats
+from .context_pool import ContextPool
+from .har_archive import HarArchive
+from .asset_cache import AssetCache
+from .network_blocker import NetworkBlocker
 
 __all__ = [
     "DataGenerator",
     "data",
+    "BatchDataGenerator",
+    "batch_data",
     "CustomWaits",
     "waits",
+    "ApiWaits",
+    "api_waits",
+    "expects_api",
+    "Condition",
+    "wait_until",
+    "LocatorSpec",
+    "locator_timings",
+    "PerfProbe",
+    "perf_probe",
+    "PerfResult",
+    "perf_scenario",
+    "PerfBaseline",
     "CustomAssertions",
     "assertions",
+    "FileLock",
+    "ApiAuthenticator",
+    "AuthError",
+    "SessionStateCache",
+    "RunStats",
+    "run_stats",
+    "ContextPool",
+    "HarArchive",
+    "AssetCache",
+    "NetworkBlocker",
 ]
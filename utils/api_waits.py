@@ -0,0 +1,229 @@
+"""
+Waits that resolve on OrangeHRM API traffic instead of `networkidle`.
+`networkidle` needs 500ms without any request, which a chatty SPA rarely
+gives. These waits finish as soon as the /api/v2/ responses an action
+triggers have arrived and the UI has had a frame or two to re-render.
+"""
+import functools
+import inspect
+import os
+import re
+import time
+import weakref
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Callable, Iterator, Optional
+
+from playwright.async_api import BrowserContext as AsyncBrowserContext, Page as AsyncPage
+from playwright.sync_api import BrowserContext, Page, Response
+
+from config import config
+from utils.resource_registry import created_resources
+from utils.run_stats import RunStats, run_stats
+
+# Counts in-flight /api/v2/ XHR and fetch calls in every frame of the context
+_PENDING_API_SCRIPT = """(() => {
+    if (window.__apiWaits) return;
+    const state = window.__apiWaits = { pending: 0, quietFrames: 0 };
+    const isApi = (url) => String(url).includes('/api/v2/');
+    const open = XMLHttpRequest.prototype.open;
+    const send = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.open = function (method, url) {
+        this.__isApi = isApi(url);
+        return open.apply(this, arguments);
+    };
+    XMLHttpRequest.prototype.send = function () {
+        if (this.__isApi) {
+            state.pending++;
+            this.addEventListener('loadend', () => state.pending--, { once: true });
+        }
+        return send.apply(this, arguments);
+    };
+    const nativeFetch = window.fetch;
+    window.fetch = function (input) {
+        if (!isApi(typeof input === 'string' ? input : input.url)) return nativeFetch.apply(this, arguments);
+        state.pending++;
+        return nativeFetch.apply(this, arguments).finally(() => state.pending--);
+    };
+})()"""
+
+# Idle once nothing is in flight for two consecutive animation frames,
+# which gives the frontend time to render what the last response returned
+_API_IDLE_CONDITION = """() => {
+    const state = window.__apiWaits;
+    if (!state || state.pending > 0) {
+        if (state) state.quietFrames = 0;
+        return false;
+    }
+    return ++state.quietFrames >= 2;
+}"""
+
+
+class ApiWaits:
+    """
+    Response-aware waits for pages whose context has install()ed tracking.
+
+    Timings are collected per suite (test package) under run statistics.
+    With API_WAIT_BASELINE enabled, every wait also measures how much longer
+    `networkidle` would have taken, i.e. the wall-clock time saved.
+
+    The *_async methods are the same waits for playwright.async_api pages.
+    """
+
+    def __init__(self, stats: RunStats = run_stats, baseline: bool = config.API_WAIT_BASELINE):
+        self.stats = stats
+        self.baseline = baseline
+        self._tracked: "weakref.WeakSet[BrowserContext]" = weakref.WeakSet()
+
+    def install(self, context: BrowserContext):
+        """Track in-flight API calls in every page of the context"""
+        if context not in self._tracked:
+            # Init scripts survive a pooled context's reset, so add it once
+            context.add_init_script(_PENDING_API_SCRIPT)
+            self._tracked.add(context)
+
+    def is_tracked(self, page: Page) -> bool:
+        return page.context in self._tracked
+
+    def wait_for_api_idle(self, page: Page, timeout: int = config.DEFAULT_TIMEOUT):
+        """Wait until no API call is in flight and the UI has re-rendered"""
+        start = time.perf_counter()
+        if self.is_tracked(page):
+            page.wait_for_function(_API_IDLE_CONDITION, timeout=timeout, polling="raf")
+        else:
+            page.wait_for_load_state("networkidle", timeout=timeout)
+        self._record(page, start)
+
+    @contextmanager
+    def expect_api(
+        self, page: Page, endpoint: str, method: str = "GET", timeout: int = config.DEFAULT_TIMEOUT
+    ) -> Iterator[Any]:
+        """
+        Wait for the /api/v2/<endpoint> response triggered inside the block.
+        `{id}`-style placeholders in the endpoint match any path segment.
+        The response is the yielded EventInfo's `value` after the block.
+        """
+        start = time.perf_counter()
+        with page.expect_response(endpoint_matcher(endpoint, method), timeout=timeout) as response:
+            yield response
+        if self.is_tracked(page):
+            # Follow-up calls (e.g. the list reload after a delete) and re-render
+            page.wait_for_function(_API_IDLE_CONDITION, timeout=timeout, polling="raf")
+        self._record(page, start)
+
+    async def install_async(self, context: AsyncBrowserContext):
+        if context not in self._tracked:
+            await context.add_init_script(_PENDING_API_SCRIPT)
+            self._tracked.add(context)
+
+    async def wait_for_api_idle_async(self, page: AsyncPage, timeout: int = config.DEFAULT_TIMEOUT):
+        start = time.perf_counter()
+        if self.is_tracked(page):
+            await page.wait_for_function(_API_IDLE_CONDITION, timeout=timeout, polling="raf")
+        else:
+            await page.wait_for_load_state("networkidle", timeout=timeout)
+        await self._record_async(page, start)
+
+    @asynccontextmanager
+    async def expect_api_async(
+        self, page: AsyncPage, endpoint: str, method: str = "GET", timeout: int = config.DEFAULT_TIMEOUT
+    ) -> AsyncIterator[Any]:
+        start = time.perf_counter()
+        async with page.expect_response(endpoint_matcher(endpoint, method), timeout=timeout) as response:
+            yield response
+        if self.is_tracked(page):
+            await page.wait_for_function(_API_IDLE_CONDITION, timeout=timeout, polling="raf")
+        await self._record_async(page, start)
+
+    def _record(self, page: Page, start: float):
+        self._count(start)
+        if self.baseline:
+            idle_start = time.perf_counter()
+            page.wait_for_load_state("networkidle")
+            self._count_baseline(idle_start)
+
+    async def _record_async(self, page: AsyncPage, start: float):
+        self._count(start)
+        if self.baseline:
+            idle_start = time.perf_counter()
+            await page.wait_for_load_state("networkidle")
+            self._count_baseline(idle_start)
+
+    def _count(self, start: float):
+        section = f"api_waits[{_current_suite()}]"
+        self.stats.add(section, "calls")
+        self.stats.add(section, "wait_ms", (time.perf_counter() - start) * 1000)
+
+    def _count_baseline(self, idle_start: float):
+        section = f"api_waits[{_current_suite()}]"
+        self.stats.add(section, "networkidle_extra_ms", (time.perf_counter() - idle_start) * 1000)
+
+
+def endpoint_matcher(endpoint: str, method: str = "GET") -> Callable[[Response], bool]:
+    """Predicate for responses of `METHOD /api/v2/<endpoint>` (query string ignored)"""
+    path = re.sub(r"\\\{\w+\\\}", r"[^/]+", re.escape(endpoint.strip("/")))
+    pattern = re.compile(rf"/api/v2/{path}/?(\?|$)")
+    return lambda response: response.request.method == method and bool(pattern.search(response.url))
+
+
+def expects_api(endpoint: str, method: str = "GET", creates: Optional[str] = None, removes: Optional[str] = None):
+    """
+    Declare the /api/v2/ endpoint a page-object action triggers.
+    The action returns once that response arrived and the UI settled.
+    Works on sync actions and on the async ones of pages.aio.
+
+    `creates` / `removes` name the kind of entity ("employee", "user") the
+    call adds or deletes, so created_resources can clean up after the run.
+
+    Usage:
+        @expects_api("pim/employees")
+        def search_employee_by_name(self, full_name: str): ...
+
+        @expects_api("pim/employees", method="POST", creates="employee")
+        def add_employee(self, first_name: str, last_name: str): ...
+    """
+    def decorator(action):
+        if inspect.iscoroutinefunction(action):
+            @functools.wraps(action)
+            async def wrapper(self, *args, **kwargs):
+                async with api_waits.expect_api_async(self.page, endpoint, method) as response:
+                    result = await action(self, *args, **kwargs)
+                if creates or removes:
+                    response = await response.value
+                    if response.ok:
+                        body = await response.json() if creates else None
+                        _track(creates, removes, response.request.post_data_json, body)
+                return result
+        else:
+            @functools.wraps(action)
+            def wrapper(self, *args, **kwargs):
+                with api_waits.expect_api(self.page, endpoint, method) as response:
+                    result = action(self, *args, **kwargs)
+                if creates or removes:
+                    response = response.value
+                    if response.ok:
+                        body = response.json() if creates else None
+                        _track(creates, removes, response.request.post_data_json, body)
+                return result
+
+        wrapper.api_endpoint = (method, endpoint)
+        return wrapper
+
+    return decorator
+
+
+def _track(creates: Optional[str], removes: Optional[str], request_body: Optional[dict], response_body: Optional[dict]):
+    if creates:
+        created_resources.register_response(creates, response_body)
+    if removes:
+        created_resources.forget(removes, (request_body or {}).get("ids", []))
+
+
+def _current_suite() -> str:
+    """Test package of the running test, e.g. 'pim' for tests/pim/test_pim.py"""
+    current = os.environ.get("PYTEST_CURRENT_TEST", "")
+    parts = current.split("::")[0].split("/")
+    return parts[-2] if len(parts) >= 2 else "other"
+
+
+# Convenience instance
+api_waits = ApiWaits()
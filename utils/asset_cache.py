@@ -0,0 +1,189 @@
+"""
+On-disk cache of OrangeHRM's static assets, shared by contexts and workers.
+Every new browser context would otherwise download the JS/CSS bundles, fonts
+and images again; the cache serves them through context.route instead.
+Dynamic /api/v2/ calls always go to the server.
+"""
+import hashlib
+import json
+import re
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+from playwright.sync_api import BrowserContext, Route
+
+from config import config
+from utils.file_lock import FileLock, atomic_write_text
+from utils.run_stats import RunStats, run_stats
+
+STATIC_EXTENSIONS = ("js", "css", "woff", "woff2", "ttf", "otf", "eot", "png", "jpg", "jpeg", "gif", "svg", "ico", "webp")
+
+# Response headers worth replaying with a cached body
+_KEPT_HEADERS = ("content-type", "cache-control", "etag", "last-modified")
+
+
+class AssetCache:
+    """
+    Content-addressed asset store keyed by URL, validated by ETag.
+
+    Bodies live in blobs/<sha256>, so identical files under different URLs
+    are stored once. index.json maps each URL to its blob, ETag, headers and
+    last use; it is only written under a file lock, so xdist workers share
+    one cache. When the blobs exceed max_bytes, the least recently used URLs
+    are evicted.
+
+    Usage:
+        cache = AssetCache()
+        cache.install(context)
+        ...
+        cache.close()  # persist last-used times at the end of the session
+    """
+
+    def __init__(
+        self,
+        cache_dir: str = config.ASSET_CACHE_DIR,
+        max_bytes: int = config.ASSET_CACHE_MAX_MB * 1024 * 1024,
+        base_url: Optional[str] = None,
+        stats: RunStats = run_stats,
+    ):
+        self.dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.base_url = (base_url or config.get_base_url()).rstrip("/")
+        self.stats = stats
+        self._index_path = self.dir / "index.json"
+        self._lock = FileLock(self.dir / "index.lock")
+        self._index: Dict[str, dict] = {}
+        self._index_mtime = 0.0
+        self._touched: Dict[str, float] = {}
+        self._pattern = re.compile(
+            rf"^{re.escape(self.base_url)}/(?!.*/api/v2/).*\.({'|'.join(STATIC_EXTENSIONS)})(\?.*)?$"
+        )
+
+    def install(self, context: BrowserContext):
+        """Serve static assets of the base URL from the cache"""
+        context.route(self._pattern, self.handle)
+
+    def handle(self, route: Route):
+        request = route.request
+        if request.method != "GET":
+            route.fallback()
+            return
+
+        url = request.url
+        entry = self._lookup(url)
+        body = self._read_blob(entry) if entry else None
+
+        if body is not None and _is_fresh(entry):
+            self._serve(route, url, entry, body)
+            return
+
+        # Stale or unknown: a conditional request costs a round trip, not the body
+        headers = {**request.headers}
+        if body is not None and entry.get("etag"):
+            headers["if-none-match"] = entry["etag"]
+        response = route.fetch(headers=headers)
+
+        if response.status == 304 and body is not None:
+            self.stats.add("asset_cache", "revalidated")
+            self._serve(route, url, entry, body)
+            return
+
+        self.stats.add("asset_cache", "misses")
+        fresh_body = response.body()
+        if response.status == 200 and "no-store" not in response.headers.get("cache-control", ""):
+            self._store(url, response.headers, fresh_body)
+        route.fulfill(response=response, body=fresh_body)
+
+    def close(self):
+        """Persist last-used times so LRU eviction sees this worker's hits"""
+        if not self._touched:
+            return
+        with self._lock:
+            index = self._load_index()
+            for url, used in self._touched.items():
+                if url in index:
+                    index[url]["last_used"] = max(index[url]["last_used"], used)
+            self._write_index(index)
+        self._touched.clear()
+
+    # ---------- Internals ----------
+    def _serve(self, route: Route, url: str, entry: dict, body: bytes):
+        self.stats.add("asset_cache", "hits")
+        self.stats.add("asset_cache", "bytes_saved", len(body))
+        self._touched[url] = time.time()
+        route.fulfill(status=200, headers=entry["headers"], body=body)
+
+    def _lookup(self, url: str) -> Optional[dict]:
+        """Index entry for a URL, re-reading index.json when another worker changed it"""
+        try:
+            mtime = self._index_path.stat().st_mtime
+        except FileNotFoundError:
+            return None
+        if mtime != self._index_mtime:
+            self._index = self._load_index()
+            self._index_mtime = mtime
+        return self._index.get(url)
+
+    def _blob_path(self, digest: str) -> Path:
+        return self.dir / "blobs" / digest[:2] / digest
+
+    def _read_blob(self, entry: dict) -> Optional[bytes]:
+        try:
+            return self._blob_path(entry["sha256"]).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def _store(self, url: str, headers: Dict[str, str], body: bytes):
+        digest = hashlib.sha256(body).hexdigest()
+        blob = self._blob_path(digest)
+        with self._lock:
+            if not blob.exists():
+                blob.parent.mkdir(parents=True, exist_ok=True)
+                tmp = blob.with_suffix(".tmp")
+                tmp.write_bytes(body)
+                tmp.replace(blob)
+            index = self._load_index()
+            index[url] = {
+                "sha256": digest,
+                "size": len(body),
+                "etag": headers.get("etag"),
+                "headers": {name: headers[name] for name in _KEPT_HEADERS if name in headers},
+                "stored_at": time.time(),
+                "last_used": time.time(),
+            }
+            self._evict(index)
+            self._write_index(index)
+
+    def _evict(self, index: Dict[str, dict]):
+        """Drop least recently used URLs until the unique blobs fit in max_bytes"""
+        blob_sizes = {entry["sha256"]: entry["size"] for entry in index.values()}
+        total = sum(blob_sizes.values())
+        for url in sorted(index, key=lambda u: index[u]["last_used"]):
+            if total <= self.max_bytes:
+                break
+            digest = index.pop(url)["sha256"]
+            self.stats.add("asset_cache", "evicted")
+            if all(entry["sha256"] != digest for entry in index.values()):
+                total -= blob_sizes[digest]
+                self._blob_path(digest).unlink(missing_ok=True)
+
+    def _load_index(self) -> Dict[str, dict]:
+        try:
+            return json.loads(self._index_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+
+    def _write_index(self, index: Dict[str, dict]):
+        atomic_write_text(self._index_path, json.dumps(index))
+        self._index = index
+        self._index_mtime = self._index_path.stat().st_mtime
+
+
+def _is_fresh(entry: dict) -> bool:
+    """Whether a cached response may be served without asking the server"""
+    cache_control = entry["headers"].get("cache-control", "")
+    if "immutable" in cache_control:
+        return True
+    max_age = re.search(r"max-age=(\d+)", cache_control)
+    return bool(max_age) and time.time() - entry["stored_at"] < int(max_age.group(1))
@@ -0,0 +1,192 @@
+"""
+Batch test data generation for seeding and load runs.
+Builds N employee, user, leave or address records a chunk at a time: each
+field of a chunk is sampled in one vectorized call (NumPy when installed,
+the standard library's random otherwise). Records are streamed, so feeding
+100k employees to the seeder never holds them all in memory.
+
+Employee IDs and usernames come from ranges the ID allocator reserves, so
+they are unique across xdist workers and runs. Everything else (names,
+dates, passwords) repeats for a given seed.
+"""
+import random
+import string
+from datetime import date, timedelta
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+try:
+    import numpy as np
+except ImportError:  # optional: pure-Python sampling, same formats
+    np = None
+
+from utils.id_allocator import EMPLOYEE_ID_DIGITS, KEY_SPACES, USERNAME_LETTERS, base26, id_allocator
+
+FIRST_NAMES = [
+    "James", "Mary", "John", "Patricia", "Robert", "Jennifer", "Michael", "Linda", "William", "Elizabeth",
+    "David", "Barbara", "Richard", "Susan", "Joseph", "Jessica", "Thomas", "Sarah", "Charles", "Karen",
+    "Christopher", "Nancy", "Daniel", "Lisa", "Matthew", "Betty", "Anthony", "Margaret", "Mark", "Sandra",
+    "Aisha", "Wei", "Priya", "Mateo", "Olga", "Kenji", "Fatima", "Liam", "Chloe", "Arjun",
+    "Sofia", "Noah", "Amara", "Lucas", "Yuki", "Omar", "Elena", "Ethan", "Zara", "Diego",
+]
+LAST_NAMES = [
+    "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis", "Rodriguez", "Martinez",
+    "Hernandez", "Lopez", "Gonzalez", "Wilson", "Anderson", "Thomas", "Taylor", "Moore", "Jackson", "Martin",
+    "Lee", "Perez", "Thompson", "White", "Harris", "Sanchez", "Clark", "Ramirez", "Lewis", "Robinson",
+    "Nguyen", "Patel", "Kim", "Chen", "Okafor", "Kowalski", "Novak", "Haddad", "Silva", "Tanaka",
+    "Singh", "Cohen", "Rossi", "Müller", "Dubois", "Ivanova", "Khan", "Mensah", "Larsen", "Costa",
+]
+CITIES = [("New York", "NY"), ("Los Angeles", "CA"), ("Chicago", "IL"), ("Houston", "TX"), ("Phoenix", "AZ")]
+
+_LETTERS = string.ascii_lowercase
+_PASSWORD_CHARS = string.ascii_letters + string.digits + "!@#$%^&*"
+
+
+class BatchDataGenerator:
+    """
+    Stream N test records, sampled a chunk at a time.
+
+    Records have the same shape as DataGenerator.employee_data(),
+    user_data(), leave_data() and random_address(), so they feed
+    DataSeeder directly.
+
+    Usage:
+        batch = BatchDataGenerator(seed=42)
+        for chunk in chunked(batch.employees(100_000), 1000):
+            seeder.employees(chunk)
+    """
+
+    def __init__(self, seed: Optional[int] = None, chunk_size: int = 10_000):
+        self.chunk_size = chunk_size
+        self._numpy = np.random.default_rng(seed) if np is not None else None
+        self._random = random.Random(seed)
+
+    # ---------- Records ----------
+    def employees(self, count: int) -> Iterator[dict]:
+        """Employee records with a unique employee ID"""
+        def chunk(size: int) -> Dict[str, list]:
+            first, last = self._choice(FIRST_NAMES, size), self._choice(LAST_NAMES, size)
+            return {
+                "first_name": first,
+                "last_name": last,
+                "middle_name": self._strings(_LETTERS, 6, size),
+                "employee_id": self._employee_ids(size),
+                "full_name": [f"{f} {l}" for f, l in zip(first, last)],
+            }
+
+        return self._stream(count, chunk)
+
+    def users(self, count: int, role: str = "ESS") -> Iterator[dict]:
+        """System user records with a unique username"""
+        def chunk(size: int) -> Dict[str, list]:
+            return {
+                "username": self._usernames(size),
+                "password": self._strings(_PASSWORD_CHARS, 12, size),
+                "role": [role] * size,
+                "status": ["Enabled"] * size,
+            }
+
+        return self._stream(count, chunk)
+
+    def leave(self, count: int, leave_type: str = "CAN - Vacation", within_days: int = 90) -> Iterator[dict]:
+        """Leave requests of 1-5 days starting within the next `within_days` days"""
+        def chunk(size: int) -> Dict[str, list]:
+            starts = self._integers(1, within_days + 1, size)
+            lengths = self._integers(0, 5, size)
+            return {
+                "leave_type": [leave_type] * size,
+                "from_date": self._dates(starts),
+                "to_date": self._dates([s + n for s, n in zip(starts, lengths)]),
+                "comments": [f"Test leave request {i}" for i in self._integers(0, 10 ** 9, size)],
+            }
+
+        return self._stream(count, chunk)
+
+    def addresses(self, count: int) -> Iterator[dict]:
+        """Street addresses in the format of DataGenerator.random_address()"""
+        def chunk(size: int) -> Dict[str, list]:
+            numbers = self._integers(1, 1000, size)
+            streets = self._strings(_LETTERS, 8, size)
+            cities = self._choice(CITIES, size)
+            return {
+                "street": [f"{n} {s.title()} St" for n, s in zip(numbers, streets)],
+                "city": [city for city, _ in cities],
+                "state": [state for _, state in cities],
+                "zip": [str(z) for z in self._integers(10000, 100000, size)],
+                "country": ["United States"] * size,
+            }
+
+        return self._stream(count, chunk)
+
+    # ---------- Streaming ----------
+    def _stream(self, count: int, chunk: Callable[[int], Dict[str, list]]) -> Iterator[dict]:
+        remaining = count
+        while remaining > 0:
+            size = min(self.chunk_size, remaining)
+            columns = chunk(size)
+            keys = list(columns)
+            for values in zip(*columns.values()):
+                yield dict(zip(keys, values))
+            remaining -= size
+
+    # ---------- Vectorized sampling ----------
+    def _choice(self, options: list, size: int) -> list:
+        if self._numpy is not None:
+            return [options[i] for i in self._numpy.integers(0, len(options), size).tolist()]
+        return self._random.choices(options, k=size)
+
+    def _integers(self, low: int, high: int, size: int) -> List[int]:
+        """`size` ints in [low, high)"""
+        if self._numpy is not None:
+            return self._numpy.integers(low, high, size).tolist()
+        return [self._random.randrange(low, high) for _ in range(size)]
+
+    def _strings(self, alphabet: str, length: int, size: int) -> List[str]:
+        if self._numpy is not None:
+            codes = np.frombuffer(alphabet.encode(), dtype=np.uint8)[self._numpy.integers(0, len(alphabet), (size, length))]
+            return codes.view(f"S{length}").ravel().astype(str).tolist()
+        return ["".join(self._random.choices(alphabet, k=length)) for _ in range(size)]
+
+    def _dates(self, days_from_now: List[int]) -> List[str]:
+        if np is not None:
+            return (np.datetime64(date.today()) + np.array(days_from_now, dtype="timedelta64[D]")).astype(str).tolist()
+        today = date.today()
+        return [(today + timedelta(days=days)).isoformat() for days in days_from_now]
+
+    # ---------- Unique keys ----------
+    def _employee_ids(self, size: int) -> List[str]:
+        values = _reserved("employee_id", size)
+        if np is not None:
+            return np.char.add("EMP", np.char.zfill(values.astype(str), EMPLOYEE_ID_DIGITS)).tolist()
+        return [f"EMP{value:0{EMPLOYEE_ID_DIGITS}d}" for value in values]
+
+    def _usernames(self, size: int) -> List[str]:
+        values = _reserved("username", size)
+        if np is not None:
+            # Base-26 digits of each value, most significant first, as letters
+            powers = len(_LETTERS) ** np.arange(USERNAME_LETTERS - 1, -1, -1, dtype=np.int64)
+            codes = (values[:, None] // powers % len(_LETTERS) + ord("a")).astype(np.uint8)
+            return np.char.add("testuser_", codes.view(f"S{USERNAME_LETTERS}").ravel().astype(str)).tolist()
+        return [f"testuser_{base26(value)}" for value in values]
+
+
+def _reserved(key: str, size: int):
+    """`size` values of a key space reserved from the ID allocator"""
+    start = id_allocator.reserve(key, size)
+    if np is not None:
+        return (start + np.arange(size, dtype=np.int64)) % KEY_SPACES[key]
+    return [(start + i) % KEY_SPACES[key] for i in range(size)]
+
+
+def chunked(records: Iterable[dict], size: int) -> Iterator[List[dict]]:
+    """Lists of up to `size` records, e.g. one DataSeeder call each"""
+    iterator = iter(records)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+# Convenience instance
+batch_data = BatchDataGenerator()
@@ -0,0 +1,219 @@
+"""
+Declarative wait conditions evaluated inside the browser.
+A Python polling loop pays one driver round trip per check and notices a
+change up to one interval late; these conditions compile into a single
+`page.wait_for_function`, so the browser checks them every animation frame
+and the test hears back once.
+
+Selectors are plain CSS (document.querySelectorAll), not Playwright
+selector engines such as `text=` or `role=`.
+
+Usage:
+    from utils.conditions import Count, Text, Hidden, wait_until
+
+    wait_until(page, Count(".oxd-table-card", 1) & Hidden(".oxd-loading-spinner"))
+    wait_until(page, Text(".oxd-toast", "Successfully Saved") | Text(".oxd-toast", "No Records Found"))
+    wait_until(page, Visible(".oxd-loading-spinner").then(Hidden(".oxd-loading-spinner")))
+"""
+import abc
+import json
+import time
+import uuid
+from typing import Tuple
+
+from playwright.sync_api import Page, TimeoutError as PlaywrightTimeoutError
+
+from config import config
+
+# Shared helpers for compiled conditions; `visible` mirrors Playwright's definition
+_PRELUDE = """
+    const all = (selector) => Array.from(document.querySelectorAll(selector));
+    const visible = (el) => {
+        const style = getComputedStyle(el);
+        const box = el.getBoundingClientRect();
+        return style.visibility !== 'hidden' && box.width > 0 && box.height > 0;
+    };
+    const compare = (actual, op, expected) => ({
+        '==': actual === expected, '>=': actual >= expected, '<=': actual <= expected,
+        '>': actual > expected, '<': actual < expected,
+    })[op];
+"""
+
+
+class Condition(abc.ABC):
+    """Base class; subclasses return a JavaScript boolean expression from js()"""
+
+    @abc.abstractmethod
+    def js(self) -> str:
+        """JavaScript boolean expression, evaluated after the shared prelude"""
+
+    def __and__(self, other: "Condition") -> "AllOf":
+        return AllOf(self, other)
+
+    def __or__(self, other: "Condition") -> "AnyOf":
+        return AnyOf(self, other)
+
+    def then(self, other: "Condition") -> "Sequence":
+        """This condition, and after it has held, `other`"""
+        return Sequence(self, other)
+
+
+class Count(Condition):
+    """Number of elements matching `selector` compared with `count`"""
+
+    def __init__(self, selector: str, count: int, op: str = "=="):
+        if op not in ("==", ">=", "<=", ">", "<"):
+            raise ValueError(f"Unsupported comparison '{op}'")
+        self.selector, self.count, self.op = selector, count, op
+
+    def js(self) -> str:
+        return f"compare(all({json.dumps(self.selector)}).length, {json.dumps(self.op)}, {self.count})"
+
+    def __repr__(self) -> str:
+        return f"count({self.selector}) {self.op} {self.count}"
+
+
+class Text(Condition):
+    """Some element matching `selector` contains (or, with exact, equals) `text`"""
+
+    def __init__(self, selector: str, text: str, exact: bool = False):
+        self.selector, self.text, self.exact = selector, text, exact
+
+    def js(self) -> str:
+        text = json.dumps(self.text)
+        check = f"t === {text}" if self.exact else f"t.includes({text})"
+        return f"all({json.dumps(self.selector)}).some((el) => {{ const t = el.textContent.trim(); return {check}; }})"
+
+    def __repr__(self) -> str:
+        return f"text({self.selector}) {'==' if self.exact else 'contains'} {self.text!r}"
+
+
+class Attribute(Condition):
+    """Some element matching `selector` has attribute `name` equal to `value`"""
+
+    def __init__(self, selector: str, name: str, value: str):
+        self.selector, self.name, self.value = selector, name, value
+
+    def js(self) -> str:
+        return (f"all({json.dumps(self.selector)})"
+                f".some((el) => el.getAttribute({json.dumps(self.name)}) === {json.dumps(self.value)})")
+
+    def __repr__(self) -> str:
+        return f"{self.selector}[{self.name}={self.value!r}]"
+
+
+class Visible(Condition):
+    """Some element matching `selector` is visible"""
+
+    def __init__(self, selector: str):
+        self.selector = selector
+
+    def js(self) -> str:
+        return f"all({json.dumps(self.selector)}).some(visible)"
+
+    def __repr__(self) -> str:
+        return f"visible({self.selector})"
+
+
+class Hidden(Condition):
+    """No element matching `selector` is visible (or none exists)"""
+
+    def __init__(self, selector: str):
+        self.selector = selector
+
+    def js(self) -> str:
+        return f"!all({json.dumps(self.selector)}).some(visible)"
+
+    def __repr__(self) -> str:
+        return f"hidden({self.selector})"
+
+
+class UrlContains(Condition):
+    """The page URL contains `fragment`"""
+
+    def __init__(self, fragment: str):
+        self.fragment = fragment
+
+    def js(self) -> str:
+        return f"location.href.includes({json.dumps(self.fragment)})"
+
+    def __repr__(self) -> str:
+        return f"url contains {self.fragment!r}"
+
+
+class AllOf(Condition):
+    """Every condition holds in the same check"""
+
+    def __init__(self, *conditions: Condition):
+        self.conditions: Tuple[Condition, ...] = _flatten(AllOf, conditions)
+
+    def js(self) -> str:
+        return "(" + " && ".join(f"({c.js()})" for c in self.conditions) + ")"
+
+    def __repr__(self) -> str:
+        return " AND ".join(map(repr, self.conditions))
+
+
+class AnyOf(Condition):
+    """At least one condition holds"""
+
+    def __init__(self, *conditions: Condition):
+        self.conditions: Tuple[Condition, ...] = _flatten(AnyOf, conditions)
+
+    def js(self) -> str:
+        return "(" + " || ".join(f"({c.js()})" for c in self.conditions) + ")"
+
+    def __repr__(self) -> str:
+        return "(" + " OR ".join(map(repr, self.conditions)) + ")"
+
+
+class Sequence(Condition):
+    """
+    The conditions hold one after another, in order: e.g. a spinner appears,
+    then disappears. Progress is kept in the page between checks, so a step
+    only has to be observed once.
+    """
+
+    def __init__(self, *conditions: Condition):
+        self.conditions: Tuple[Condition, ...] = _flatten(Sequence, conditions)
+
+    def js(self) -> str:
+        steps = ", ".join(f"() => ({c.js()})" for c in self.conditions)
+        # Fresh key per compile: every wait starts the sequence from its first step
+        key = json.dumps(uuid.uuid4().hex)
+        return (f"((steps) => {{ const progress = window.__waitSequences = window.__waitSequences || {{}};"
+                f" let i = progress[{key}] || 0;"
+                f" while (i < steps.length && steps[i]()) i++;"
+                f" progress[{key}] = i; return i === steps.length; }})([{steps}])")
+
+    def __repr__(self) -> str:
+        return " THEN ".join(map(repr, self.conditions))
+
+
+def _flatten(kind: type, conditions) -> Tuple[Condition, ...]:
+    """AllOf(AllOf(a, b), c) -> AllOf(a, b, c), keeping the compiled JS flat"""
+    flat = []
+    for condition in conditions:
+        flat.extend(condition.conditions if type(condition) is kind else (condition,))
+    return tuple(flat)
+
+
+def compile_condition(condition: Condition) -> str:
+    """JavaScript predicate for page.wait_for_function"""
+    return f"() => {{ {_PRELUDE} return Boolean({condition.js()}); }}"
+
+
+def wait_until(page: Page, condition: Condition, timeout: int = config.DEFAULT_TIMEOUT, polling="raf") -> float:
+    """
+    Block until `condition` holds in the page; returns the milliseconds waited.
+    `polling` is "raf" (every animation frame) or an interval in milliseconds.
+
+    Raises:
+        TimeoutError: naming the condition that did not hold
+    """
+    start = time.perf_counter()
+    try:
+        page.wait_for_function(compile_condition(condition), timeout=timeout, polling=polling)
+    except PlaywrightTimeoutError:
+        raise TimeoutError(f"Condition not met within {timeout}ms: {condition!r}") from None
+    return (time.perf_counter() - start) * 1000
@@ -0,0 +1,113 @@
+"""
+Pool of warm browser contexts reused across tests.
+Creating a context (and starting tracing on it) costs far more than wiping
+one, so each worker keeps a few idle contexts and resets them between tests.
+"""
+from typing import List
+
+from playwright.sync_api import Browser, BrowserContext
+
+from config import config
+from utils.run_stats import RunStats, run_stats
+
+
+class ContextPool:
+    """Per-worker pool of reusable browser contexts"""
+
+    # Clears every client-side store of the origin the page is on
+    _CLEAR_STORAGE_SCRIPT = """async () => {
+        localStorage.clear();
+        sessionStorage.clear();
+        if (window.indexedDB && indexedDB.databases) {
+            for (const db of await indexedDB.databases()) {
+                indexedDB.deleteDatabase(db.name);
+            }
+        }
+        if (window.caches) {
+            for (const key of await caches.keys()) {
+                await caches.delete(key);
+            }
+        }
+    }"""
+    _RESET_PATH = "__context_pool_reset__"
+
+    def __init__(
+        self,
+        browser: Browser,
+        context_args: dict,
+        max_idle: int = config.CONTEXT_POOL_SIZE,
+        tracing: bool = config.TRACE_ON_FAILURE,
+        stats: RunStats = run_stats,
+    ):
+        self.browser = browser
+        self.context_args = context_args
+        self.max_idle = max_idle
+        self.tracing = tracing
+        self.stats = stats
+        self._idle: List[BrowserContext] = []
+
+    def acquire(self) -> BrowserContext:
+        """Take an idle context, or create one when the pool is empty"""
+        if self._idle:
+            self.stats.add("context_pool", "hits")
+            return self._idle.pop()
+
+        self.stats.add("context_pool", "misses")
+        context = self.browser.new_context(**self.context_args)
+        if self.tracing:
+            # Tracing stays on for the context's lifetime; tests record chunks
+            context.tracing.start(screenshots=True, snapshots=True, sources=True)
+        return context
+
+    def release(self, context: BrowserContext):
+        """Reset a context and return it to the pool (or close it when full)"""
+        if len(self._idle) >= self.max_idle or not self._reset(context):
+            self.stats.add("context_pool", "discarded")
+            self._close(context)
+            return
+        self._idle.append(context)
+
+    def close(self):
+        """Close every idle context"""
+        while self._idle:
+            self._close(self._idle.pop())
+
+    def _reset(self, context: BrowserContext) -> bool:
+        """Wipe cookies, permissions, routes and storage; False if it failed"""
+        try:
+            for page in context.pages:
+                page.close()
+            context.unroute_all(behavior="ignoreErrors")
+            self._clear_origin_storage(context)
+            context.clear_cookies()
+            context.clear_permissions()
+            context.set_extra_http_headers({})
+            context.set_offline(False)
+            return True
+        except Exception:
+            return False
+
+    def _clear_origin_storage(self, context: BrowserContext):
+        """Clear storage of every origin the previous test wrote to"""
+        origins = [entry["origin"] for entry in context.storage_state()["origins"]]
+        if not origins:
+            return
+
+        # Visit each origin on a stubbed URL so the reset never hits the network
+        page = context.new_page()
+        try:
+            for origin in origins:
+                reset_url = f"{origin}/{self._RESET_PATH}"
+                page.route(reset_url, lambda route: route.fulfill(body="", content_type="text/html"))
+                page.goto(reset_url)
+                page.evaluate(self._CLEAR_STORAGE_SCRIPT)
+        finally:
+            page.close()
+
+    def _close(self, context: BrowserContext):
+        if self.tracing:
+            try:
+                context.tracing.stop()
+            except Exception:
+                pass
+        context.close()
@@ -2,9 +2,14 @@
 Custom wait utilities to replace hard-coded timeouts.
 Provides intelligent waiting strategies for various UI states.
 """
+import warnings
+
 from playwright.sync_api import Page, Locator, expect
 from typing import Callable, Optional, Any
 
+from utils.api_waits import api_waits
+from utils.conditions import Condition, Hidden, Visible, wait_until
+
 
 class CustomWaits:
     """Custom wait utilities for Playwright"""
@@ -37,8 +42,11 @@ class CustomWaits:
 
     @staticmethod
     def wait_for_network_idle(page: Page, timeout: int = 30000):
-        """Wait for network to be idle (no more than 2 connections for 500ms)"""
-        page.wait_for_load_state("networkidle", timeout=timeout)
+        """
+        Wait until no API call is in flight and the UI has re-rendered.
+        Falls back to `networkidle` on pages without API tracking.
+        """
+        api_waits.wait_for_api_idle(page, timeout=timeout)
 
     @staticmethod
     def wait_for_url_change(page: Page, expected_pattern: str, timeout: int = 15000):
@@ -84,9 +92,19 @@ class CustomWaits:
     @staticmethod
     def wait_for_table_load(page: Page, table_selector: str = '.oxd-table-body', timeout: int = 15000):
         """Wait for data table to load"""
-        table = page.locator(table_selector)
-        expect(table).to_be_visible(timeout=timeout)
-        page.wait_for_load_state("networkidle", timeout=timeout)
+        wait_until(page, Visible(table_selector) & Hidden('.oxd-loading-spinner'), timeout=timeout)
+        api_waits.wait_for_api_idle(page, timeout=timeout)
+
+    @staticmethod
+    def wait_until(page: Page, condition: Condition, timeout: int = 10000) -> float:
+        """
+        Wait for a declarative condition (utils.conditions) checked inside the
+        browser every animation frame; returns the milliseconds waited.
+
+        Example:
+            waits.wait_until(page, Count('.oxd-table-card', 0) | Text('.oxd-toast', 'No Records Found'))
+        """
+        return wait_until(page, condition, timeout=timeout)
 
     @staticmethod
     def wait_for_condition(
@@ -97,6 +115,8 @@ class CustomWaits:
     ) -> bool:
         """
         Wait for a custom condition to be true.
+        Polls from Python, one driver round trip per check; for conditions on
+        the DOM or URL prefer wait_until(), which the browser checks itself.
 
         Args:
             condition: A callable that returns True when condition is met
@@ -113,17 +133,23 @@ class CustomWaits:
         while (time.time() * 1000 - start_time) < timeout:
             if condition():
                 return True
-            time.sleep(interval / 1000)
+            time.sleep(interval / 1000)  # allow-sleep: polling interval of a real condition
 
         raise TimeoutError(error_message)
 
     @staticmethod
     def smart_wait(page: Page, short_wait: int = 500):
         """
-        Smart wait - use sparingly, only when absolutely necessary.
-        Prefer explicit waits for specific conditions.
+        Deprecated: a fixed sleep in disguise. Use BasePage.select_autocomplete
+        for autocompletes, @expects_api / api_waits for API-driven updates, or
+        one of the explicit waits above.
         """
-        page.wait_for_timeout(short_wait)
+        warnings.warn(
+            "smart_wait() is deprecated; use BasePage.select_autocomplete or an explicit wait",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        page.wait_for_timeout(short_wait)  # allow-sleep: deprecated shim
 
 
 # Convenience instance
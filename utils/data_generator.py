@@ -2,14 +2,22 @@
 Random test data generators to ensure test isolation and uniqueness.
 """
 import random
+import re
 import string
 from datetime import datetime, timedelta
 from typing import Optional
 
+from utils.id_allocator import id_allocator
+
 
 class DataGenerator:
     """Generate random test data for various test scenarios"""
 
+    # Shapes of the generated IDs (5 digits: before the ID allocator), used to
+    # recognise test data a crashed run left behind
+    EMPLOYEE_ID_PATTERN = re.compile(r"^EMP(\d{5}|\d{7})$")
+    TEST_USERNAME_PATTERN = re.compile(r"^testuser_[a-z]{6}$")
+
     @staticmethod
     def random_string(length: int = 8, prefix: str = "") -> str:
         """Generate a random string with optional prefix"""
@@ -65,13 +73,13 @@ class DataGenerator:
 
     @staticmethod
     def random_employee_id() -> str:
-        """Generate a random employee ID"""
-        return f"EMP{DataGenerator.random_number(10000, 99999)}"
+        """Generate an employee ID no other worker or earlier run has used"""
+        return id_allocator.employee_id()
 
     @staticmethod
     def random_username(prefix: str = "user") -> str:
-        """Generate a random username"""
-        return f"{prefix}_{DataGenerator.random_string(6)}"
+        """Generate a username no other worker or earlier run has used"""
+        return id_allocator.username(prefix)
 
     @staticmethod
     def random_password(length: int = 12) -> str:
@@ -108,6 +116,39 @@ class DataGenerator:
         """Return a random choice from a list"""
         return random.choice(choices)
 
+    @staticmethod
+    def employee_data() -> dict:
+        """Generate a complete employee record (names, employee ID)"""
+        first_name, last_name = DataGenerator.random_full_name()
+        return {
+            "first_name": first_name,
+            "last_name": last_name,
+            "middle_name": DataGenerator.random_string(6),
+            "employee_id": DataGenerator.random_employee_id(),
+            "full_name": f"{first_name} {last_name}",
+        }
+
+    @staticmethod
+    def user_data(role: str = "ESS") -> dict:
+        """Generate a system user record (credentials, role, status)"""
+        return {
+            "username": DataGenerator.random_username("testuser"),
+            "password": DataGenerator.random_password(12),
+            "role": role,
+            "status": "Enabled",
+        }
+
+    @staticmethod
+    def leave_data() -> dict:
+        """Generate a leave request record for the coming days"""
+        from_date, to_date = DataGenerator.random_date_range(1, 3)
+        return {
+            "leave_type": "CAN - Vacation",
+            "from_date": from_date,
+            "to_date": to_date,
+            "comments": f"Test leave request {DataGenerator.unique_timestamp()}",
+        }
+
     @staticmethod
     def unique_timestamp() -> str:
         """Generate a unique timestamp-based identifier"""
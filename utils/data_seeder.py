@@ -0,0 +1,445 @@
+"""
+Bulk test data seeding over OrangeHRM's REST API.
+Creates employees (with job details and supervisors), system users, leave
+entitlements, assigned leave and timesheets with
+concurrent /api/v2/ requests on a keep-alive connection pool, so a test's
+preconditions take one round of API calls instead of a walk through the
+Add Employee and Add User screens. Deletes them again the same way.
+
+Sweep up the users and employees crashed runs on this machine left behind:
+    python -m utils.data_seeder --sweep --dry-run     # list them
+    python -m utils.data_seeder --sweep               # delete them
+"""
+import argparse
+import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional, Union
+from urllib.parse import quote
+
+from playwright.sync_api import sync_playwright
+
+from config import config
+from utils.auth import ApiAuthenticator
+from utils.data_generator import DataGenerator
+from utils.http_pool import API_PREFIX, HttpConnectionPool, cookie_header
+from utils.id_allocator import id_allocator, in_reservations, key_value
+from utils.resource_registry import KINDS, created_resources
+
+# Records to create: a count (generated by DataGenerator) or the records themselves
+Records = Union[int, Iterable[dict]]
+
+# userRoleId values of OrangeHRM's built-in roles
+USER_ROLES = {"Admin": 1, "ESS": 2}
+
+# reportingMethodId values of OrangeHRM's built-in reporting methods
+REPORTING_METHODS = {"Direct": 1, "Indirect": 2}
+
+# Actions that move assigned leave to a record's "status"
+LEAVE_ACTIONS = {"Rejected": "REJECT", "Cancelled": "CANCEL"}
+
+# The sweeper leaves alone values reserved more recently: their run may still be going
+SWEEP_MIN_AGE_HOURS = 12
+
+# Collection endpoints of the kinds created_resources tracks
+ENDPOINTS = {"user": "admin/users", "employee": "pim/employees"}
+
+# Page size when listing a collection
+_LIST_LIMIT = 500
+
+
+class SeedError(Exception):
+    """Raised when the API rejects a seeding request"""
+
+
+class DataSeeder:
+    """
+    Create test preconditions in bulk through the API.
+
+    Every method takes the records to create (dicts shaped like the
+    random_*_data fixtures, or a count to generate) and returns them with
+    the server-assigned ids added. Requests run concurrently, at most
+    `concurrency` at a time. Created employees and users are registered in
+    created_resources, so the session cleans them up.
+
+    Usage:
+        seeder = DataSeeder(auth_state.state)
+        employees = seeder.employees(20)                 # each gets "emp_number"
+        users = seeder.users([{**data.user_data(), "emp_number": employees[0]["emp_number"]}])
+        seeder.leave_entitlements(employees, entitlement=10)
+    """
+
+    def __init__(self, state: dict, base_url: Optional[str] = None, concurrency: int = config.SEED_CONCURRENCY):
+        self.base_url = (base_url or config.get_base_url()).rstrip("/")
+        self.cookie = cookie_header(state)
+        self.concurrency = concurrency
+        self._leave_types: Optional[Dict[str, int]] = None
+        self._job_titles: Optional[Dict[str, int]] = None
+        self._subunits: Dict[str, int] = {}
+
+    # ---------- Employees ----------
+    def employees(self, records: Records) -> List[dict]:
+        """Create employees; adds "emp_number" to each record"""
+        return self._run(self._employees, _records(records, DataGenerator.employee_data))
+
+    async def _employees(self, pool: HttpConnectionPool, records: List[dict]) -> List[dict]:
+        async def create(record: dict) -> dict:
+            created = await self._send(pool, "POST", "pim/employees", {
+                "firstName": record["first_name"],
+                "lastName": record["last_name"],
+                "middleName": record.get("middle_name", ""),
+                "employeeId": record.get("employee_id", ""),
+            })
+            created_resources.register("employee", created["empNumber"])
+            return {**record, "emp_number": created["empNumber"]}
+
+        return list(await asyncio.gather(*(create(record) for record in records)))
+
+    def find_employees(self, employee_ids: Iterable[str]) -> Dict[str, int]:
+        """emp_number of each of the employee IDs that exists on the server"""
+        return self._run(self._find_employees, list(employee_ids))
+
+    async def _find_employees(self, pool: HttpConnectionPool, employee_ids: List[str]) -> Dict[str, int]:
+        async def find(employee_id: str) -> Optional[int]:
+            # nameOrId matches partially: keep the exact employee ID only
+            matches = await self._send(pool, "GET", f"{ENDPOINTS['employee']}?nameOrId={quote(employee_id)}")
+            return next((e["empNumber"] for e in matches if e["employeeId"] == employee_id), None)
+
+        found = await asyncio.gather(*(find(employee_id) for employee_id in employee_ids))
+        return {employee_id: n for employee_id, n in zip(employee_ids, found) if n is not None}
+
+    def job_details(self, records: Iterable[dict]) -> List[dict]:
+        """
+        Set the "job_title", "sub_unit" and "joined_date" of each record's
+        "emp_number" (each optional). Job titles and sub units the server
+        does not have yet are created first, and are left in place.
+        """
+        records = list(records)
+        return self._run(self._job_details, records) if records else []
+
+    async def _job_details(self, pool: HttpConnectionPool, records: List[dict]) -> List[dict]:
+        job_titles, subunits = await self._organization(pool, records)
+
+        async def update(record: dict) -> dict:
+            await self._send(pool, "PUT", f"pim/employees/{record['emp_number']}/job-details", {
+                "joinedDate": record.get("joined_date"),
+                "jobTitleId": job_titles.get(record.get("job_title")),
+                "subunitId": subunits.get(record.get("sub_unit")),
+            })
+            return record
+
+        return list(await asyncio.gather(*(update(record) for record in records)))
+
+    async def _organization(self, pool: HttpConnectionPool, records: List[dict]):
+        """Job title and sub unit ids by name, creating the missing ones"""
+        if self._job_titles is None:
+            job_titles, subunits = await asyncio.gather(
+                self._send(pool, "GET", "admin/job-titles?limit=0"), self._send(pool, "GET", "admin/subunits"),
+            )
+            self._job_titles = {job_title["title"]: job_title["id"] for job_title in job_titles}
+            self._subunits = {subunit["name"]: subunit["id"] for subunit in subunits}
+            self._root_subunit = next(subunit["id"] for subunit in subunits if subunit["level"] == 0)
+        # One at a time: names must stay unique
+        for title in sorted({r["job_title"] for r in records if r.get("job_title")} - set(self._job_titles)):
+            created = await self._send(pool, "POST", "admin/job-titles", {"title": title, "description": "", "note": ""})
+            self._job_titles[title] = created["id"]
+        for name in sorted({r["sub_unit"] for r in records if r.get("sub_unit")} - set(self._subunits)):
+            created = await self._send(pool, "POST", "admin/subunits", {
+                "name": name, "unitId": "", "description": "", "parentId": self._root_subunit,
+            })
+            self._subunits[name] = created["id"]
+        return self._job_titles, self._subunits
+
+    def supervisors(self, records: Iterable[dict], reporting_method: str = "Direct") -> List[dict]:
+        """Report each record's "emp_number" to its "supervisor_emp_number\""""
+        records = list(records)
+        return self._run(self._supervisors, records, REPORTING_METHODS[reporting_method]) if records else []
+
+    async def _supervisors(self, pool: HttpConnectionPool, records: List[dict], reporting_method_id: int) -> List[dict]:
+        async def add(record: dict) -> dict:
+            await self._send(pool, "POST", f"pim/employees/{record['emp_number']}/supervisors", {
+                "empNumber": record["supervisor_emp_number"], "reportingMethodId": reporting_method_id,
+            })
+            return record
+
+        return list(await asyncio.gather(*(add(record) for record in records)))
+
+    # ---------- System users ----------
+    def users(self, records: Records) -> List[dict]:
+        """
+        Create system users; adds "id" to each record. Records without an
+        "emp_number" first get a generated employee of their own.
+        """
+        return self._run(self._users, _records(records, DataGenerator.user_data))
+
+    async def _users(self, pool: HttpConnectionPool, records: List[dict]) -> List[dict]:
+        orphans = [record for record in records if "emp_number" not in record]
+        employees = iter(await self._employees(pool, [DataGenerator.employee_data() for _ in orphans]))
+        records = [record if "emp_number" in record else {**record, "employee": next(employees)} for record in records]
+
+        async def create(record: dict) -> dict:
+            emp_number = record.get("emp_number") or record["employee"]["emp_number"]
+            created = await self._send(pool, "POST", "admin/users", {
+                "username": record["username"],
+                "password": record["password"],
+                "userRoleId": USER_ROLES[record.get("role", "ESS")],
+                "empNumber": emp_number,
+                "status": record.get("status", "Enabled") == "Enabled",
+            })
+            created_resources.register("user", created["id"])
+            return {**record, "emp_number": emp_number, "id": created["id"]}
+
+        return list(await asyncio.gather(*(create(record) for record in records)))
+
+    # ---------- Leave entitlements ----------
+    def leave_entitlements(
+        self, records: Iterable[dict], leave_type: str = "CAN - Vacation", entitlement: float = 10.0,
+    ) -> List[dict]:
+        """
+        Grant leave entitlements for the current year; adds "entitlement_id".
+        Records need an "emp_number" (e.g. employees() results) and may
+        override "leave_type", "entitlement", "from_date" and "to_date".
+        """
+        year = date.today().year
+        defaults = {
+            "leave_type": leave_type, "entitlement": entitlement,
+            "from_date": f"{year}-01-01", "to_date": f"{year}-12-31",
+        }
+        records = [{**defaults, **record} for record in records]
+        return self._run(self._leave_entitlements, records) if records else []
+
+    async def _leave_entitlements(self, pool: HttpConnectionPool, records: List[dict]) -> List[dict]:
+        leave_types = await self._leave_type_ids(pool)
+
+        async def create(record: dict) -> dict:
+            if record["leave_type"] not in leave_types:
+                raise SeedError(f"Unknown leave type {record['leave_type']!r}; expected one of {sorted(leave_types)}")
+            created = await self._send(pool, "POST", "leave/leave-entitlements", {
+                "empNumber": record["emp_number"],
+                "leaveTypeId": leave_types[record["leave_type"]],
+                "fromDate": record["from_date"],
+                "toDate": record["to_date"],
+                "entitlement": record["entitlement"],
+            })
+            return {**record, "entitlement_id": created["id"]}
+
+        return list(await asyncio.gather(*(create(record) for record in records)))
+
+    async def _leave_type_ids(self, pool: HttpConnectionPool) -> Dict[str, int]:
+        if self._leave_types is None:
+            leave_types = await self._send(pool, "GET", "leave/leave-types?limit=0")
+            self._leave_types = {leave_type["name"]: leave_type["id"] for leave_type in leave_types}
+        return self._leave_types
+
+    # ---------- Assigned leave ----------
+    def leave_requests(self, records: Iterable[dict]) -> List[dict]:
+        """
+        Assign leave to each record's "emp_number" (records shaped like
+        random_leave_data); adds "leave_request_id". A "status" of
+        "Rejected" or "Cancelled" is applied after assigning.
+        """
+        records = list(records)
+        return self._run(self._leave_requests, records) if records else []
+
+    async def _leave_requests(self, pool: HttpConnectionPool, records: List[dict]) -> List[dict]:
+        leave_types = await self._leave_type_ids(pool)
+
+        async def assign(record: dict) -> dict:
+            if record["leave_type"] not in leave_types:
+                raise SeedError(f"Unknown leave type {record['leave_type']!r}; expected one of {sorted(leave_types)}")
+            payload = {
+                "empNumber": record["emp_number"],
+                "leaveTypeId": leave_types[record["leave_type"]],
+                "fromDate": record["from_date"],
+                "toDate": record["to_date"],
+                "comment": record.get("comments", ""),
+            }
+            if record["from_date"] == record["to_date"]:
+                payload["duration"] = {"type": "full_day"}
+            else:
+                payload["partialOption"] = ""
+            created = await self._send(pool, "POST", "leave/employees/leave-requests", payload)
+            if record.get("status") in LEAVE_ACTIONS:
+                await self._send(pool, "PUT", f"leave/employees/leave-requests/{created['id']}", {
+                    "action": LEAVE_ACTIONS[record["status"]],
+                })
+            return {**record, "leave_request_id": created["id"]}
+
+        return list(await asyncio.gather(*(assign(record) for record in records)))
+
+    # ---------- Timesheets ----------
+    def projects(self) -> List[dict]:
+        """Projects timesheet entries can use, each with a list of "activities\""""
+        return self._run(self._projects)
+
+    async def _projects(self, pool: HttpConnectionPool) -> List[dict]:
+        projects = await self._send(pool, "GET", "time/projects?limit=0")
+        activities = await asyncio.gather(*(
+            self._send(pool, "GET", f"time/projects/{project['id']}/activities?limit=0") for project in projects
+        ))
+        return [{**project, "activities": project_activities} for project, project_activities in zip(projects, activities)]
+
+    def timesheets(self, records: Iterable[dict]) -> List[dict]:
+        """
+        Create each employee's timesheet for the week of "date" (default:
+        today); adds "timesheet_id". Optional "entries" are saved to it:
+        [{"project_id": 1, "activity_id": 1, "dates": {"2024-05-06": {"duration": "08:00"}}}]
+        """
+        return self._run(self._timesheets, [{"date": date.today().isoformat(), **record} for record in records])
+
+    async def _timesheets(self, pool: HttpConnectionPool, records: List[dict]) -> List[dict]:
+        async def create(record: dict) -> dict:
+            timesheet = await self._send(
+                pool, "POST", f"time/employees/{record['emp_number']}/timesheets", {"date": record["date"]},
+            )
+            if record.get("entries"):
+                await self._send(pool, "PUT", f"time/employees/timesheets/{timesheet['id']}/entries", {
+                    "entries": [
+                        {"projectId": entry["project_id"], "activityId": entry["activity_id"], "dates": entry["dates"]}
+                        for entry in record["entries"]
+                    ],
+                })
+            return {**record, "timesheet_id": timesheet["id"]}
+
+        return list(await asyncio.gather(*(create(record) for record in records)))
+
+    # ---------- Cleanup ----------
+    def delete(self, resources: Dict[str, List[int]], batch_size: int = config.CLEANUP_BATCH_SIZE) -> Dict[str, int]:
+        """
+        Bulk-delete {"user": [ids], "employee": [emp_numbers]}, users first,
+        `batch_size` ids per request. Ids already gone are skipped; returns
+        how many of each kind the server deleted.
+        """
+        return self._run(self._delete, resources, batch_size)
+
+    async def _delete(self, pool: HttpConnectionPool, resources: Dict[str, List[int]], batch_size: int) -> Dict[str, int]:
+        deleted = {}
+        for kind in KINDS:
+            ids = list(resources.get(kind, []))
+            batches = [ids[i:i + batch_size] for i in range(0, len(ids), batch_size)]
+            deleted[kind] = sum(await asyncio.gather(*(self._delete_batch(pool, kind, batch) for batch in batches)))
+        return deleted
+
+    async def _delete_batch(self, pool: HttpConnectionPool, kind: str, ids: List[int]) -> int:
+        body = json.dumps({"ids": ids}).encode()
+        status, response = await pool.request("DELETE", API_PREFIX + ENDPOINTS[kind], body)
+        if 200 <= status < 300:
+            return len(json.loads(response)["data"])
+        if status in (404, 422):
+            # Some ids no longer exist (deleted by a test, or with their employee): retry one by one
+            if len(ids) == 1:
+                return 0
+            return sum(await asyncio.gather(*(self._delete_batch(pool, kind, [i]) for i in ids)))
+        raise SeedError(f"DELETE {ENDPOINTS[kind]} returned {status}: {response[:300].decode(errors='replace')}")
+
+    def leftovers(self, min_age_hours: float = SWEEP_MIN_AGE_HOURS) -> Dict[str, List[dict]]:
+        """
+        Users and employees on the server whose username or employee ID has
+        the shape DataGenerator gives test data and falls in a range this
+        machine's ID allocator reserved at least `min_age_hours` ago, i.e.
+        left behind by runs that never reached their cleanup. Other
+        machines' and CI jobs' records, and those of runs that may still be
+        going, are left alone.
+        """
+        return self._run(self._leftovers, time.time() - min_age_hours * 3600)
+
+    async def _leftovers(self, pool: HttpConnectionPool, before: float) -> Dict[str, List[dict]]:
+        users, employees = await asyncio.gather(
+            self._list_all(pool, ENDPOINTS["user"]), self._list_all(pool, ENDPOINTS["employee"]),
+        )
+        usernames = [id_allocator.reserved_range("username", before)]
+        employee_ids = [id_allocator.reserved_range("employee_id", before)]
+
+        def ours(key: str, text: str, reservations) -> bool:
+            value = key_value(key, text)
+            return value is not None and in_reservations(key, value, reservations)
+
+        return {
+            "user": [
+                u for u in users
+                if DataGenerator.TEST_USERNAME_PATTERN.match(u["userName"]) and ours("username", u["userName"], usernames)
+            ],
+            "employee": [
+                e for e in employees
+                if DataGenerator.EMPLOYEE_ID_PATTERN.match(e["employeeId"] or "")
+                and ours("employee_id", e["employeeId"], employee_ids)
+            ],
+        }
+
+    def sweep(self, min_age_hours: float = SWEEP_MIN_AGE_HOURS) -> Dict[str, int]:
+        """Delete the leftovers() of earlier runs"""
+        leftovers = self.leftovers(min_age_hours)
+        return self.delete({
+            "user": [user["id"] for user in leftovers["user"]],
+            "employee": [employee["empNumber"] for employee in leftovers["employee"]],
+        })
+
+    async def _list_all(self, pool: HttpConnectionPool, path: str) -> List[dict]:
+        items: List[dict] = []
+        while True:
+            page = await self._send(pool, "GET", f"{path}?limit={_LIST_LIMIT}&offset={len(items)}")
+            items.extend(page)
+            if len(page) < _LIST_LIMIT:
+                return items
+
+    # ---------- Transport ----------
+    def _run(self, seed, *args):
+        async def main():
+            pool = HttpConnectionPool(self.base_url, size=self.concurrency, headers={"Cookie": self.cookie})
+            try:
+                return await seed(pool, *args)
+            finally:
+                await pool.close()
+
+        # A thread of its own: the caller may already run an event loop (e.g. sync Playwright)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, main()).result()
+
+    async def _send(self, pool: HttpConnectionPool, method: str, path: str, payload: Optional[dict] = None) -> Any:
+        body = json.dumps(payload).encode() if payload is not None else b""
+        status, response = await pool.request(method, API_PREFIX + path, body)
+        if not 200 <= status < 300:
+            raise SeedError(f"{method} {path} returned {status}: {response[:300].decode(errors='replace')}")
+        return json.loads(response)["data"]
+
+
+def _records(records: Records, generate) -> List[dict]:
+    if isinstance(records, int):
+        return [generate() for _ in range(records)]
+    return list(records)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Delete test data that earlier runs left on the server")
+    parser.add_argument("--sweep", action="store_true", help="find users and employees named like generated test data")
+    parser.add_argument("--dry-run", action="store_true", help="only list what --sweep would delete")
+    parser.add_argument(
+        "--min-age", type=float, default=SWEEP_MIN_AGE_HOURS, metavar="HOURS",
+        help="only sweep IDs this machine reserved at least this long ago",
+    )
+    parser.add_argument("--base-url", default=None, help=f"defaults to the {config.ENV} environment's URL")
+    parser.add_argument("--username", default=None)
+    parser.add_argument("--password", default=None)
+    args = parser.parse_args()
+    if not args.sweep:
+        parser.error("nothing to do; pass --sweep")
+
+    with sync_playwright() as playwright:
+        state = ApiAuthenticator(playwright, args.base_url, args.username, args.password).login()
+    seeder = DataSeeder(state, args.base_url)
+    if args.dry_run:
+        leftovers = seeder.leftovers(args.min_age)
+        for user in leftovers["user"]:
+            print(f"user {user['id']}: {user['userName']}")
+        for employee in leftovers["employee"]:
+            print(f"employee {employee['empNumber']}: {employee['employeeId']} {employee['firstName']} {employee['lastName']}")
+        print(f"{len(leftovers['user'])} users and {len(leftovers['employee'])} employees would be deleted")
+    else:
+        deleted = seeder.sweep(args.min_age)
+        print(f"Deleted {deleted['user']} users and {deleted['employee']} employees")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Inter-process file lock for artifacts shared between pytest-xdist workers.
+"""
+import os
+from pathlib import Path
+from typing import Union
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+
+class FileLock:
+    """
+    Exclusive lock backed by an OS-level lock on a sidecar file.
+
+    The lock is released automatically if the holding process dies, so a
+    crashed worker never leaves a stale lock behind.
+
+    Usage:
+        with FileLock(".auth/demo.json.lock"):
+            ...  # only one worker at a time gets here
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self._fd = None
+
+    def acquire(self):
+        """Block until the lock is held by this process"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        if os.name == "nt":
+            msvcrt.locking(self._fd, msvcrt.LK_LOCK, 1)
+        else:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+
+    def release(self):
+        """Release the lock if held"""
+        if self._fd is None:
+            return
+        if os.name == "nt":
+            msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        os.close(self._fd)
+        self._fd = None
+
+    def __enter__(self) -> "FileLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.release()
+
+
+def atomic_write_text(path: Union[str, Path], text: str):
+    """Write a file so concurrent readers never observe a partial write"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(text, encoding="utf-8")
+    os.replace(tmp_path, path)
@@ -0,0 +1,314 @@
+"""
+HAR record/replay for page-object suites.
+Record mode captures each test module's traffic against a real OrangeHRM into
+one HAR per module; replay mode serves those exchanges from the HAR so UI
+regression runs skip server latency while still running the real frontend.
+"""
+import base64
+import json
+import re
+import uuid
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+from playwright.sync_api import BrowserContext, Route
+
+from config import config
+from utils.data_generator import DataGenerator
+from utils.file_lock import FileLock, atomic_write_text
+from utils.run_stats import RunStats, run_stats
+
+HAR_MODES = ("off", "record", "replay")
+
+# Hop-by-hop / encoding headers that no longer apply to a decoded HAR body
+_DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection"}
+
+
+class HarArchive:
+    """Per-module HAR files for one environment"""
+
+    def __init__(self, har_dir: str = config.HAR_DIR, base_url: Optional[str] = None):
+        self.base_url = (base_url or config.get_base_url()).rstrip("/")
+        self.dir = Path(har_dir) / config.ENV
+        self._parts_dir = self.dir / ".parts"
+        self._entries_cache: Dict[Path, Tuple[float, List[dict]]] = {}
+        # Request bodies of records seeded during replay, by collection and id (see HarReplaySeeder)
+        self.seeded: Dict[str, Dict[int, dict]] = {path: {} for path in MUTABLE_COLLECTIONS}
+        self._next_seeded_id = HarReplayFallback.FIRST_SEEDED_ID
+
+    def path(self, module: str) -> Path:
+        return self.dir / f"{module}.har"
+
+    def exists(self, module: str) -> bool:
+        return self.path(module).exists()
+
+    def clear(self):
+        """Delete every module HAR so a record run starts from scratch"""
+        for har in self.dir.glob("*.har"):
+            har.unlink()
+
+    # ---------- Record ----------
+    def record_options(self) -> dict:
+        """
+        new_context() arguments that record one test's traffic to a part file.
+        Playwright writes the file when the context closes; merge() then folds
+        it into the module HAR.
+        """
+        self._parts_dir.mkdir(parents=True, exist_ok=True)
+        return {
+            "record_har_path": str(self._parts_dir / f"{uuid.uuid4().hex}.har"),
+            "record_har_content": "embed",
+            "record_har_url_filter": re.compile(rf"^{re.escape(self.base_url)}/"),
+        }
+
+    def merge(self, part_path: str, module: str):
+        """Fold a recorded part into the module HAR, newest exchange winning"""
+        part = Path(part_path)
+        if not part.exists():
+            return
+        recorded = json.loads(part.read_text(encoding="utf-8"))
+        target = self.path(module)
+
+        with FileLock(target.with_suffix(".lock")):
+            archive = json.loads(target.read_text(encoding="utf-8")) if target.exists() else recorded
+            entries = {_entry_key(e): e for e in archive["log"]["entries"]}
+            for entry in recorded["log"]["entries"]:
+                entries[_entry_key(entry)] = entry
+            archive["log"]["entries"] = list(entries.values())
+            archive["log"].pop("pages", None)
+            atomic_write_text(target, json.dumps(archive))
+        part.unlink()
+
+    # ---------- Replay ----------
+    def replay(self, context: BrowserContext, module: str, stats: RunStats = run_stats):
+        """
+        Serve the module's recorded exchanges to a context.
+        Requests the HAR has no exact match for fall through to a
+        HarReplayFallback, which emulates the mutations tests make with
+        fresh random data.
+        """
+        har_path = self.path(module)
+        fallback = HarReplayFallback(self._entries(har_path), self.base_url, stats, self.seeded)
+        url_pattern = f"{self.base_url}/**"
+        # Routes registered later run first: HAR lookup, then the fallback
+        context.route(url_pattern, fallback.handle)
+        context.route_from_har(str(har_path), url=url_pattern, not_found="fallback")
+
+    def seed(self, collection: str, body: dict) -> int:
+        """Add a record, as the body of its create request, to every replayed context; returns its id"""
+        self._next_seeded_id += 1
+        self.seeded[collection][self._next_seeded_id] = body
+        return self._next_seeded_id
+
+    def _entries(self, har_path: Path) -> List[dict]:
+        """Parsed HAR entries, cached per file until it changes"""
+        mtime = har_path.stat().st_mtime
+        cached = self._entries_cache.get(har_path)
+        if cached is None or cached[0] != mtime:
+            entries = json.loads(har_path.read_text(encoding="utf-8"))["log"]["entries"]
+            self._entries_cache[har_path] = cached = (mtime, entries)
+        return cached[1]
+
+
+def module_for(node) -> str:
+    """HAR module of a test item: its package under tests/ (pim, admin, ...)"""
+    return node.path.parent.name
+
+
+def _entry_key(entry: dict) -> Tuple[str, str, str]:
+    request = entry["request"]
+    return request["method"], request["url"], (request.get("postData") or {}).get("text", "")
+
+
+def _template_path(url: str) -> str:
+    """URL path with numeric ids wildcarded: /empNumber/42 -> /empNumber/{n}"""
+    return re.sub(r"/\d+(?=/|$)", "/{n}", urlsplit(url).path)
+
+
+def _response_body(entry: dict) -> bytes:
+    content = entry["response"].get("content", {})
+    text = content.get("text", "")
+    return base64.b64decode(text) if content.get("encoding") == "base64" else text.encode()
+
+
+# ---------- Mutation emulation ----------
+
+def _employee_record(template: dict, body: dict, record_id: int) -> dict:
+    return {
+        **template,
+        "empNumber": record_id,
+        "employeeId": body.get("employeeId") or f"{record_id:04d}",
+        "firstName": body.get("firstName", ""),
+        "middleName": body.get("middleName", ""),
+        "lastName": body.get("lastName", ""),
+        "terminationId": None,
+    }
+
+
+def _user_record(template: dict, body: dict, record_id: int) -> dict:
+    return {**template, "id": record_id, "userName": body.get("username", ""), "status": body.get("status", True)}
+
+
+def _name_matches(record: dict, value: str) -> bool:
+    name = " ".join(record.get(key) or "" for key in ("firstName", "middleName", "lastName"))
+    haystacks = (" ".join(name.split()), f"{record.get('firstName')} {record.get('lastName')}", record.get("employeeId") or "")
+    return any(value.lower() in haystack.lower() for haystack in haystacks)
+
+
+# Collection path (under /api/v2/) -> (id key, record builder, query filters)
+MUTABLE_COLLECTIONS: Dict[str, Tuple[str, Callable[[dict, dict, int], dict], Dict[str, Callable[[dict, str], bool]]]] = {
+    "pim/employees": ("empNumber", _employee_record, {
+        "nameOrId": _name_matches,
+        "employeeId": lambda record, value: value.lower() in (record.get("employeeId") or "").lower(),
+    }),
+    "admin/users": ("id", _user_record, {
+        "username": lambda record, value: record.get("userName", "").lower() == value.lower(),
+    }),
+}
+
+
+class HarReplayFallback:
+    """
+    Answers requests the HAR has no exact match for.
+
+    - POST/DELETE on a MUTABLE_COLLECTIONS endpoint (PimPage.add_employee,
+      AdminPage.add_user, bulk delete) are emulated in memory, and filtered
+      GETs on the same collection see those records and the archive's
+      seeded ones.
+    - Other requests reuse a recorded exchange whose URL differs only in
+      numeric ids (e.g. the new employee's personal details page).
+    - Anything else goes to the network and is counted as a passthrough.
+    """
+
+    # Emulated ids start well above anything a demo instance hands out
+    FIRST_ID = 900000
+    FIRST_SEEDED_ID = 800000
+
+    def __init__(
+        self, entries: List[dict], base_url: str, stats: RunStats = run_stats,
+        seeded: Optional[Dict[str, Dict[int, dict]]] = None,
+    ):
+        self.api_prefix = urlsplit(f"{base_url}/web/index.php/api/v2/").path
+        self.stats = stats
+        self.created: Dict[str, Dict[int, dict]] = {path: {} for path in MUTABLE_COLLECTIONS}
+        self.seeded = seeded if seeded is not None else {path: {} for path in MUTABLE_COLLECTIONS}
+        self._next_id = self.FIRST_ID
+        self._templates: Dict[Tuple[str, str], dict] = {}
+        self._list_templates: Dict[str, dict] = {}
+        for entry in entries:
+            method, url = entry["request"]["method"], entry["request"]["url"]
+            self._templates[(method, _template_path(url))] = entry
+            collection = self._collection(url)
+            if method == "GET" and collection:
+                records = json.loads(_response_body(entry) or b"{}").get("data") or []
+                if records:
+                    self._list_templates[collection] = records[0]
+
+    def _collection(self, url: str) -> Optional[str]:
+        path = urlsplit(url).path
+        if not path.startswith(self.api_prefix):
+            return None
+        path = path[len(self.api_prefix):].rstrip("/")
+        return path if path in MUTABLE_COLLECTIONS else None
+
+    def handle(self, route: Route):
+        request = route.request
+        collection = self._collection(request.url)
+        if collection and request.method == "POST":
+            return self._create(route, collection)
+        if collection and request.method == "DELETE":
+            return self._delete(route, collection)
+        if collection and request.method == "GET":
+            return self._search(route, collection)
+
+        template = self._templates.get((request.method, _template_path(request.url)))
+        if template is not None:
+            self.stats.add("har_replay", "templated")
+            response = template["response"]
+            headers = {h["name"]: h["value"] for h in response["headers"] if h["name"].lower() not in _DROPPED_HEADERS}
+            return route.fulfill(status=response["status"], headers=headers, body=_response_body(template))
+
+        self.stats.add("har_replay", "passthrough")
+        route.fallback()
+
+    def _create(self, route: Route, collection: str):
+        self.stats.add("har_replay", "emulated")
+        id_key, build, _filters = MUTABLE_COLLECTIONS[collection]
+        self._next_id += 1
+        record = build(self._list_templates.get(collection, {}), route.request.post_data_json or {}, self._next_id)
+        self.created[collection][record[id_key]] = record
+        route.fulfill(json={"data": record, "meta": [], "rels": []})
+
+    def _delete(self, route: Route, collection: str):
+        self.stats.add("har_replay", "emulated")
+        ids = [int(i) for i in (route.request.post_data_json or {}).get("ids", [])]
+        deleted = [
+            i for i in ids
+            if self.created[collection].pop(i, None) is not None or self.seeded[collection].pop(i, None) is not None
+        ]
+        route.fulfill(json={"data": deleted, "meta": [], "rels": []})
+
+    def _search(self, route: Route, collection: str):
+        """Filtered list with no recorded match: answer from emulated records"""
+        self.stats.add("har_replay", "emulated")
+        _id_key, build, filters = MUTABLE_COLLECTIONS[collection]
+        query = {key: values[-1] for key, values in parse_qs(urlsplit(route.request.url).query).items()}
+        template = self._list_templates.get(collection, {})
+        records = [build(template, body, record_id) for record_id, body in self.seeded[collection].items()]
+        matches = [
+            record for record in [*records, *self.created[collection].values()]
+            if all(match(record, query[key]) for key, match in filters.items() if query.get(key))
+        ]
+        route.fulfill(json={"data": matches, "meta": {"total": len(matches)}, "rels": []})
+
+
+class HarReplaySeeder:
+    """
+    DataSeeder for --har-mode=replay: employees() and users() add their
+    records to the archive's seeded collections, which every replayed
+    context serves, instead of sending them to a server. Seeding anything
+    else needs a server and skips the test.
+
+    Usage:
+        seeder = HarReplaySeeder(har_archive)
+        employee = seeder.employees(1)[0]     # found by PimPage searches in replay
+    """
+
+    def __init__(self, archive: HarArchive):
+        self.archive = archive
+
+    def employees(self, records: Union[int, Iterable[dict]]) -> List[dict]:
+        """Seed employees; adds "emp_number" to each record"""
+        records = [DataGenerator.employee_data() for _ in range(records)] if isinstance(records, int) else records
+        return [
+            {**record, "emp_number": self.archive.seed("pim/employees", {
+                "firstName": record["first_name"],
+                "lastName": record["last_name"],
+                "middleName": record.get("middle_name", ""),
+                "employeeId": record.get("employee_id", ""),
+            })}
+            for record in records
+        ]
+
+    def users(self, records: Union[int, Iterable[dict]]) -> List[dict]:
+        """Seed system users; adds "id", and gives records without an "emp_number" an "employee" """
+        records = [DataGenerator.user_data() for _ in range(records)] if isinstance(records, int) else records
+        seeded = []
+        for record in records:
+            if "emp_number" not in record:
+                record = {**record, "employee": self.employees(1)[0]}
+            emp_number = record.get("emp_number") or record["employee"]["emp_number"]
+            user_id = self.archive.seed("admin/users", {
+                "username": record["username"],
+                "status": record.get("status", "Enabled") == "Enabled",
+                "empNumber": emp_number,
+            })
+            seeded.append({**record, "emp_number": emp_number, "id": user_id})
+        return seeded
+
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        pytest.skip(f"DataSeeder.{name}() needs a server; not available with --har-mode=replay")
@@ -0,0 +1,482 @@
+"""
+Realistic HR datasets for load and scale testing.
+Synthesizes an organization whose records agree with each other: employees
+belong to departments of realistic sizes, report up a management tree whose
+depth decides their job title, were hired on a tenure distribution (managers
+earlier), and get leave entitlements that grow with service. Their leave
+history spends most of each year's entitlement, and their weekly timesheets
+are blank on the days they were on leave.
+
+Records are written as they are generated, so a million-employee dataset
+never sits in memory, and DatasetLoader pushes a written dataset into an
+environment through the API in concurrent chunks:
+    python -m utils.hr_dataset --employees 100000 --out reports/hr_dataset
+    python -m utils.hr_dataset --load reports/hr_dataset
+
+KeptDataset loads a dataset into an environment once and leaves it there
+for later sessions, instead of loading and deleting it every run.
+"""
+import argparse
+import csv
+import json
+import random
+import time
+from datetime import date, timedelta
+from itertools import islice
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from playwright.sync_api import sync_playwright
+
+from config import config
+from utils.auth import ApiAuthenticator
+from utils.batch_data import BatchDataGenerator, chunked
+from utils.data_seeder import DataSeeder
+from utils.file_lock import FileLock, atomic_write_text
+from utils.resource_registry import created_resources
+
+# (department, share of the headcount, job titles from the head down)
+DEPARTMENTS = [
+    ("Administration", 0.04, ["Chief Executive Officer", "Office Manager", "Administrative Assistant"]),
+    ("Engineering", 0.30, ["VP Engineering", "Engineering Manager", "Lead Software Engineer",
+                           "Senior Software Engineer", "Software Engineer"]),
+    ("Sales & Marketing", 0.18, ["VP Sales", "Sales Manager", "Senior Sales Representative", "Sales Representative"]),
+    ("Client Services", 0.15, ["Head of Client Services", "Support Manager", "Support Team Lead", "Support Specialist"]),
+    ("Operations", 0.12, ["COO", "Operations Manager", "Operations Analyst"]),
+    ("Quality Assurance", 0.08, ["Head of QA", "QA Manager", "Senior QA Engineer", "QA Engineer"]),
+    ("Finance", 0.07, ["Chief Financial Officer", "Finance Manager", "Accountant", "Account Assistant"]),
+    ("Human Resources", 0.06, ["HR Director", "HR Manager", "HR Administrator"]),
+]
+
+# Leave types every OrangeHRM install has; vacation days grow by a day per year of service
+VACATION, PERSONAL = "CAN - Vacation", "CAN - Personal"
+BASE_VACATION_DAYS, MAX_SERVICE_DAYS, PERSONAL_DAYS = 12, 10, 3
+
+# Column order of OrangeHRM's PIM > Data Import CSV template
+PIM_IMPORT_COLUMNS = [
+    "first_name", "middle_name", "last_name", "employee_id", "other_id", "driver's_license_no",
+    "license_expiry_date", "gender", "marital_status", "nationality", "date_of_birth",
+    "address_street_1", "address_street_2", "city", "state/province", "zip/postal_code", "country",
+    "home_telephone", "mobile", "work_telephone", "work_email", "other_email",
+]
+# Dataset fields behind the template columns that are not named the same
+_IMPORT_FIELDS = {
+    "address_street_1": "street", "state/province": "state", "zip/postal_code": "zip",
+}
+
+WEEKDAYS = ["mon", "tue", "wed", "thu", "fri", "sat", "sun"]
+
+# Columns of the other datasets' CSV files
+COLUMNS = {
+    "leave_entitlements": ["employee_ref", "employee_id", "leave_type", "from_date", "to_date", "entitlement"],
+    "leave_requests": ["employee_ref", "employee_id", "leave_type", "from_date", "to_date", "status", "comments"],
+    "timesheets": ["employee_ref", "employee_id", "department", "week_start", *WEEKDAYS],
+}
+DATASETS = ["employees", *COLUMNS]
+
+
+class HrDatasetSynthesizer:
+    """
+    Correlated employees, leave and timesheets for an organization of
+    `employees` people.
+
+    Each department is a tree with `span` direct reports per manager,
+    under the first employee (the CEO). Leave history covers the last
+    `years` calendar years; timesheets the last `timesheet_weeks` weeks.
+    Names, addresses and employee IDs come from BatchDataGenerator, so
+    IDs are unique across runs; everything else repeats for a seed.
+
+    Usage:
+        synthesizer = HrDatasetSynthesizer(100_000, seed=7)
+        for employee, entitlements, leave, timesheets in synthesizer.records():
+            ...
+        synthesizer.write("reports/hr_dataset")            # NDJSON, or fmt="csv"
+    """
+
+    def __init__(self, employees: int, seed: Optional[int] = None, years: int = 3,
+                 timesheet_weeks: int = 12, span: int = 6, today: Optional[date] = None):
+        self.employees = employees
+        self.years = years
+        self.timesheet_weeks = timesheet_weeks
+        self.span = span
+        self.today = today or date.today()
+        self._seed = seed
+        self._random = random.Random(seed)
+        self._departments = self._layout()
+
+    # ---------- Organization ----------
+    def _layout(self) -> List[Tuple[str, List[str], int, int]]:
+        """(department, titles, first ref, size): contiguous ref ranges by headcount share"""
+        shares = [share * self.employees for _, share, _ in DEPARTMENTS]
+        sizes = [int(share) for share in shares]
+        # Largest remainders get the employees rounding dropped
+        for i in sorted(range(len(shares)), key=lambda i: sizes[i] - shares[i])[:self.employees - sum(sizes)]:
+            sizes[i] += 1
+        layout, start = [], 0
+        for (name, _, titles), size in zip(DEPARTMENTS, sizes):
+            layout.append((name, titles, start, size))
+            start += size
+        return layout
+
+    def _position(self, ref: int, titles: List[str], start: int, size: int) -> Tuple[Optional[int], int]:
+        """(manager ref, rank in `titles`) of an employee, from its place in the department tree"""
+        local = ref - start
+        if local == 0:
+            # Department heads report to the CEO
+            return (None if ref == 0 else 0), 0
+        depth, level_start, level_size = 0, 0, 1
+        while local >= level_start + level_size:
+            level_start += level_size
+            level_size *= self.span
+            depth += 1
+        manager = start + (local - 1) // self.span
+        # Whoever has reports gets a manager title by depth; the rest the entry-level title
+        has_reports = local * self.span + 1 < size
+        return manager, min(depth, len(titles) - 2) if has_reports else len(titles) - 1
+
+    # ---------- Records ----------
+    def records(self) -> Iterator[Tuple[dict, List[dict], List[dict], List[dict]]]:
+        """Per employee: (employee, leave entitlements, leave requests, timesheets)"""
+        batch = BatchDataGenerator(self._seed)
+        people = zip(batch.employees(self.employees), batch.addresses(self.employees))
+        for department, titles, start, size in self._departments:
+            for ref in range(start, start + size):
+                person, address = next(people)
+                manager, rank = self._position(ref, titles, start, size)
+                employee = self._employee(ref, person, address, department, titles, rank, manager)
+                entitlements, leave = self._leave(employee)
+                taken = {
+                    day for request in leave if request["status"] in ("Taken", "Scheduled")
+                    for day in _weekdays(date.fromisoformat(request["from_date"]), date.fromisoformat(request["to_date"]))
+                }
+                yield employee, entitlements, leave, self._timesheets(employee, taken)
+
+    def _employee(self, ref: int, person: dict, address: dict, department: str, titles: List[str],
+                  rank: int, manager: Optional[int]) -> dict:
+        rng = self._random
+        # A long-tailed tenure, longer the more senior the title
+        tenure = min(rng.expovariate(1 / 3.5) + (len(titles) - 1 - rank) * 2.0, 30.0)
+        age = min(max(22 + tenure + rng.gauss(8, 6), 21), 66)
+        first, last = person["first_name"], person["last_name"]
+        return {
+            "ref": ref,
+            **{key: person[key] for key in ("first_name", "middle_name", "last_name", "employee_id")},
+            "gender": rng.choice(["Male", "Female"]),
+            "marital_status": "Married" if rng.random() < min(0.75, (age - 20) / 30) else "Single",
+            "nationality": "American",
+            "date_of_birth": (self.today - timedelta(days=int(age * 365.25))).isoformat(),
+            **address,
+            "mobile": f"555{rng.randrange(10 ** 7):07d}",
+            "work_email": f"{first}.{last}.{person['employee_id']}@example.com".lower(),
+            "department": department,
+            "job_title": titles[rank],
+            "manager_ref": manager,
+            "joined_date": (self.today - timedelta(days=int(tenure * 365.25))).isoformat(),
+        }
+
+    def _leave(self, employee: dict) -> Tuple[List[dict], List[dict]]:
+        """Entitlements per leave year, and requests spending most of them"""
+        rng = self._random
+        joined = date.fromisoformat(employee["joined_date"])
+        entitlements, requests = [], []
+        booked: Set[date] = set()
+        for year in range(self.today.year - self.years + 1, self.today.year + 1):
+            year_start, year_end = date(year, 1, 1), date(year, 12, 31)
+            if joined > year_end:
+                continue
+            employed_from = max(joined, year_start)
+            fraction = ((year_end - employed_from).days + 1) / ((year_end - year_start).days + 1)
+            service = max(0, year - joined.year)
+            granted = {
+                VACATION: round((BASE_VACATION_DAYS + min(service, MAX_SERVICE_DAYS)) * fraction * 2) / 2,
+                PERSONAL: round(PERSONAL_DAYS * fraction * 2) / 2,
+            }
+            for leave_type, days in granted.items():
+                if days <= 0:
+                    continue
+                entitlements.append({
+                    "employee_ref": employee["ref"], "employee_id": employee["employee_id"], "leave_type": leave_type,
+                    "from_date": year_start.isoformat(), "to_date": year_end.isoformat(), "entitlement": days,
+                })
+                # Most of the vacation gets used, in trips of a day to a week; personal days one at a time
+                if leave_type == VACATION:
+                    remaining = int(days * rng.betavariate(5, 2))
+                    lengths = []
+                    while remaining > 0:
+                        lengths.append(min(remaining, rng.choice([1, 1, 2, 3, 5])))
+                        remaining -= lengths[-1]
+                else:
+                    lengths = [1] * sum(rng.random() < 0.4 for _ in range(int(days)))
+                for length in lengths:
+                    span = self._free_span(employed_from, year_end, length, booked)
+                    if span is None:
+                        continue
+                    booked.update(span)
+                    requests.append({
+                        "employee_ref": employee["ref"], "employee_id": employee["employee_id"], "leave_type": leave_type,
+                        "from_date": span[0].isoformat(), "to_date": span[-1].isoformat(),
+                        "status": self._status(span[-1]), "comments": "",
+                    })
+        requests.sort(key=lambda request: request["from_date"])
+        return entitlements, requests
+
+    def _free_span(self, first: date, last: date, length: int, booked: Set[date]) -> Optional[List[date]]:
+        """`length` consecutive weekdays between first and last, none already booked"""
+        days = (last - first).days
+        for _ in range(5):
+            start = first + timedelta(days=self._random.randrange(days + 1))
+            span = list(islice(_weekdays(start, last), length))
+            if len(span) == length and not booked.intersection(span):
+                return span
+        return None
+
+    def _status(self, last_day: date) -> str:
+        roll = self._random.random()
+        if roll < 0.02:
+            return "Rejected"
+        if roll < 0.06:
+            return "Cancelled"
+        return "Taken" if last_day < self.today else "Scheduled"
+
+    def _timesheets(self, employee: dict, on_leave: Set[date]) -> List[dict]:
+        """Completed weeks, oldest first: about 8 hours a weekday, none on leave days"""
+        rng = self._random
+        joined = date.fromisoformat(employee["joined_date"])
+        this_week = self.today - timedelta(days=self.today.weekday())
+        timesheets = []
+        for weeks_ago in range(self.timesheet_weeks, 0, -1):
+            week_start = this_week - timedelta(weeks=weeks_ago)
+            if week_start < joined:
+                continue
+            hours = {}
+            for offset, day in enumerate(WEEKDAYS):
+                current = week_start + timedelta(days=offset)
+                if current in on_leave:
+                    hours[day] = 0.0
+                elif offset < 5:
+                    hours[day] = min(max(round(rng.gauss(8, 0.6) * 4) / 4, 0.0), 12.0)
+                else:
+                    hours[day] = float(rng.choice([2, 3, 4])) if rng.random() < 0.05 else 0.0
+            timesheets.append({
+                "employee_ref": employee["ref"], "employee_id": employee["employee_id"],
+                "department": employee["department"], "week_start": week_start.isoformat(), **hours,
+            })
+        return timesheets
+
+    # ---------- Output ----------
+    def write(self, directory: str, fmt: str = "ndjson") -> Dict[str, int]:
+        """
+        Stream the dataset to <directory>/<dataset>.<fmt>; returns the
+        records written per dataset. CSV employees.csv follows the PIM Data
+        Import template, which has no department, job or supervisor columns;
+        NDJSON keeps every field and is what DatasetLoader reads.
+        """
+        out = Path(directory)
+        out.mkdir(parents=True, exist_ok=True)
+        files = {name: (out / f"{name}.{fmt}").open("w", encoding="utf-8", newline="") for name in DATASETS}
+        counts = dict.fromkeys(DATASETS, 0)
+        try:
+            if fmt == "csv":
+                employees_csv = csv.writer(files["employees"])
+                employees_csv.writerow(PIM_IMPORT_COLUMNS)
+                writers = {name: csv.DictWriter(files[name], COLUMNS[name], extrasaction="ignore") for name in COLUMNS}
+                for writer in writers.values():
+                    writer.writeheader()
+
+                def emit(name: str, record: dict):
+                    if name == "employees":
+                        employees_csv.writerow([record.get(_IMPORT_FIELDS.get(c, c), "") for c in PIM_IMPORT_COLUMNS])
+                    else:
+                        writers[name].writerow(record)
+            elif fmt == "ndjson":
+                def emit(name: str, record: dict):
+                    files[name].write(json.dumps(record) + "\n")
+            else:
+                raise ValueError(f"Unknown format {fmt!r}; expected 'ndjson' or 'csv'")
+
+            for employee, *related in self.records():
+                emit("employees", employee)
+                for name, records in zip(COLUMNS, related):
+                    for record in records:
+                        emit(name, record)
+                    counts[name] += len(records)
+                counts["employees"] += 1
+        finally:
+            for file in files.values():
+                file.close()
+        return counts
+
+
+class DatasetLoader:
+    """
+    Push a written NDJSON dataset into an environment through DataSeeder,
+    `chunk_size` records per concurrent batch: employees with their job
+    details and supervisors, then leave entitlements, assigned leave and
+    timesheets. Loaded employees are registered for cleanup like any
+    seeded employee, unless the load keeps them.
+
+    Usage:
+        DatasetLoader(DataSeeder(state)).load("reports/hr_dataset")
+    """
+
+    def __init__(self, seeder: DataSeeder, chunk_size: int = 1000):
+        self.seeder = seeder
+        self.chunk_size = chunk_size
+
+    def load(self, directory: str, keep: bool = False) -> Dict[str, int]:
+        """
+        Returns the records loaded per dataset. With keep, the employees
+        are left out of the session's cleanup once all of it has loaded.
+        """
+        directory = Path(directory)
+        # Dataset ref -> emp_number; refs are consecutive from 0 in file order
+        emp_numbers: List[int] = []
+        counts = dict.fromkeys(DATASETS, 0)
+
+        for chunk in chunked(_read(directory / "employees.ndjson"), self.chunk_size):
+            created = self.seeder.employees(chunk)
+            emp_numbers.extend(record["emp_number"] for record in created)
+            self.seeder.job_details([
+                {"emp_number": r["emp_number"], "job_title": r["job_title"], "sub_unit": r["department"],
+                 "joined_date": r["joined_date"]}
+                for r in created
+            ])
+            # Managers come before their reports, so they exist by now
+            self.seeder.supervisors([
+                {"emp_number": r["emp_number"], "supervisor_emp_number": emp_numbers[r["manager_ref"]]}
+                for r in created if r["manager_ref"] is not None
+            ])
+            counts["employees"] += len(created)
+
+        def with_emp_number(records: List[dict]) -> List[dict]:
+            return [{**record, "emp_number": emp_numbers[record["employee_ref"]]} for record in records]
+
+        for chunk in chunked(_read(directory / "leave_entitlements.ndjson"), self.chunk_size):
+            counts["leave_entitlements"] += len(self.seeder.leave_entitlements(with_emp_number(chunk)))
+        for chunk in chunked(_read(directory / "leave_requests.ndjson"), self.chunk_size):
+            counts["leave_requests"] += len(self.seeder.leave_requests(with_emp_number(chunk)))
+
+        # Each department books its hours to one project, on the project's first activity
+        projects = [project for project in self.seeder.projects() if project["activities"]]
+        if projects:
+            departments = [name for name, _, _ in DEPARTMENTS]
+            for chunk in chunked(_read(directory / "timesheets.ndjson"), self.chunk_size):
+                counts["timesheets"] += len(self.seeder.timesheets(
+                    _timesheet(record, projects[departments.index(record["department"]) % len(projects)])
+                    for record in with_emp_number(chunk)
+                ))
+        if keep:
+            created_resources.forget("employee", emp_numbers)
+        return counts
+
+
+class KeptDataset:
+    """
+    A dataset of `employees` loaded into an environment once and left there.
+    Later sessions, and the other xdist workers, reuse it instead of loading
+    tens of thousands of records and deleting them again. The written
+    dataset and a marker of the server it went into live in `directory`.
+    It is synthesized and loaded again when the server or the size changes,
+    or when sample employees are gone from the server. The job titles and
+    sub units the load creates stay with it.
+
+    Usage:
+        employees, loaded = KeptDataset(".cache/hr_dataset/staging", 2000).ensure(seeder, base_url)
+    """
+
+    def __init__(self, directory: str, employees: int):
+        self.directory = Path(directory)
+        self.employees = employees
+        self._marker = self.directory / "loaded.json"
+
+    def ensure(self, seeder: DataSeeder, base_url: str) -> Tuple[List[dict], Dict[str, int]]:
+        """The employee records, and the records loaded per dataset ({} when reused)"""
+        with FileLock(self.directory.with_suffix(".lock")):
+            if self._reusable(seeder, base_url):
+                return self._employee_records(), {}
+            self._marker.unlink(missing_ok=True)
+            HrDatasetSynthesizer(self.employees).write(self.directory)
+            counts = DatasetLoader(seeder).load(self.directory, keep=True)
+            atomic_write_text(self._marker, json.dumps({"base_url": base_url, "employees": self.employees}))
+            return self._employee_records(), counts
+
+    def _reusable(self, seeder: DataSeeder, base_url: str) -> bool:
+        try:
+            marker = json.loads(self._marker.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return False
+        if marker != {"base_url": base_url, "employees": self.employees}:
+            return False
+        records = self._employee_records()
+        sample = {records[i]["employee_id"] for i in (0, len(records) // 2, len(records) - 1)}
+        return len(seeder.find_employees(sample)) == len(sample)
+
+    def _employee_records(self) -> List[dict]:
+        return list(_read(self.directory / "employees.ndjson"))
+
+
+def _timesheet(record: dict, project: dict) -> dict:
+    week_start = date.fromisoformat(record["week_start"])
+    dates = {
+        (week_start + timedelta(days=offset)).isoformat(): {"duration": _duration(record[day])}
+        for offset, day in enumerate(WEEKDAYS) if record[day]
+    }
+    return {
+        "emp_number": record["emp_number"],
+        "date": record["week_start"],
+        "entries": [{"project_id": project["id"], "activity_id": project["activities"][0]["id"], "dates": dates}],
+    }
+
+
+def _duration(hours: float) -> str:
+    minutes = round(hours * 60)
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+def _weekdays(first: date, last: date) -> Iterator[date]:
+    day = first
+    while day <= last:
+        if day.weekday() < 5:
+            yield day
+        day += timedelta(days=1)
+
+
+def _read(path: Path) -> Iterator[dict]:
+    with path.open(encoding="utf-8") as file:
+        for line in file:
+            if line.strip():
+                yield json.loads(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Synthesize a correlated HR dataset, or load one through the API")
+    parser.add_argument("--employees", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--years", type=int, default=3, help="calendar years of leave history")
+    parser.add_argument("--timesheet-weeks", type=int, default=12)
+    parser.add_argument("--format", choices=["ndjson", "csv"], default="ndjson")
+    parser.add_argument("--out", default="reports/hr_dataset", help="directory to write the dataset to")
+    parser.add_argument("--load", metavar="DIR", default=None, help="load the NDJSON dataset in DIR instead")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="records per concurrent load batch")
+    parser.add_argument("--base-url", default=None, help=f"defaults to the {config.ENV} environment's URL")
+    parser.add_argument("--username", default=None)
+    parser.add_argument("--password", default=None)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    if args.load:
+        with sync_playwright() as playwright:
+            state = ApiAuthenticator(playwright, args.base_url, args.username, args.password).login()
+        counts = DatasetLoader(DataSeeder(state, args.base_url), args.chunk_size).load(args.load)
+        verb = "Loaded"
+    else:
+        synthesizer = HrDatasetSynthesizer(args.employees, args.seed, args.years, args.timesheet_weeks)
+        counts = synthesizer.write(args.out, args.format)
+        verb = f"Wrote {args.out}:"
+    elapsed = time.perf_counter() - started
+    print(f"{verb} " + ", ".join(f"{count} {name.replace('_', ' ')}" for name, count in counts.items()))
+    print(f"{sum(counts.values())} records in {elapsed:.1f}s ({sum(counts.values()) / max(elapsed, 1e-9):,.0f}/s)")
+
+
+if __name__ == "__main__":
+    main()
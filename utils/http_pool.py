@@ -0,0 +1,151 @@
+"""
+Minimal asyncio HTTP/1.1 client with a keep-alive connection pool.
+Just enough protocol for OrangeHRM's JSON API (Content-Length and chunked
+bodies, TLS), so the API load engine and the data seeder spend their time
+on requests rather than on a general-purpose client's machinery.
+"""
+import asyncio
+import ssl
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+# Path prefix of OrangeHRM's REST API
+API_PREFIX = "/web/index.php/api/v2/"
+
+
+def cookie_header(state: dict) -> str:
+    """Cookie header for the session of a storage state (see ApiAuthenticator.login)"""
+    return "; ".join(f"{c['name']}={c['value']}" for c in state["cookies"])
+
+
+class HttpError(Exception):
+    """Raised when a connection fails or the server sends a malformed response"""
+
+
+class _Connection:
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+
+    def close(self):
+        self.writer.close()
+
+    async def wait_closed(self):
+        try:
+            await self.writer.wait_closed()
+        except (ConnectionError, ssl.SSLError):
+            pass
+
+
+class HttpConnectionPool:
+    """
+    Up to `size` persistent connections to one origin.
+
+    Requests wait for a free connection, so `size` is also the cap on
+    requests in flight against the server.
+
+    Usage:
+        pool = HttpConnectionPool("https://hr.example.com", size=100, headers={"Cookie": "..."})
+        status, body = await pool.request("GET", "/web/index.php/api/v2/pim/employees")
+        await pool.close()
+    """
+
+    def __init__(self, base_url: str, size: int = 100, headers: Optional[Dict[str, str]] = None, timeout: float = 30.0):
+        parts = urlsplit(base_url)
+        self.scheme = parts.scheme
+        self.host = parts.hostname
+        self.port = parts.port or (443 if parts.scheme == "https" else 80)
+        self.path_prefix = parts.path.rstrip("/")
+        self.timeout = timeout
+        self._ssl = ssl.create_default_context() if parts.scheme == "https" else None
+        host_header = parts.netloc
+        self._headers = {"Host": host_header, "Connection": "keep-alive", "Accept": "application/json", **(headers or {})}
+        self._slots = asyncio.Semaphore(size)
+        self._idle: list = []
+        self.opened = 0
+
+    async def request(self, method: str, target: str, body: bytes = b"", content_type: str = "application/json") -> Tuple[int, bytes]:
+        """Send one request on a pooled connection; returns (status, body)"""
+        async with self._slots:
+            connection = self._idle.pop() if self._idle else await self._open()
+            try:
+                status, payload, keep_alive = await asyncio.wait_for(
+                    self._exchange(connection, method, target, body, content_type), self.timeout
+                )
+            except BaseException:
+                connection.close()
+                raise
+            if keep_alive:
+                self._idle.append(connection)
+            else:
+                connection.close()
+            return status, payload
+
+    async def close(self):
+        idle, self._idle = self._idle, []
+        for connection in idle:
+            connection.close()
+        await asyncio.gather(*(connection.wait_closed() for connection in idle))
+
+    async def _open(self) -> _Connection:
+        try:
+            reader, writer = await asyncio.open_connection(
+                self.host, self.port, ssl=self._ssl, server_hostname=self.host if self._ssl else None,
+            )
+        except OSError as error:
+            raise HttpError(f"Cannot connect to {self.host}:{self.port}: {error}") from error
+        self.opened += 1
+        return _Connection(reader, writer)
+
+    async def _exchange(self, connection: _Connection, method: str, target: str, body: bytes, content_type: str):
+        headers = dict(self._headers)
+        if body:
+            headers["Content-Type"] = content_type
+            headers["Content-Length"] = str(len(body))
+        head = f"{method} {self.path_prefix}{target} HTTP/1.1\r\n"
+        head += "".join(f"{name}: {value}\r\n" for name, value in headers.items())
+        connection.writer.write((head + "\r\n").encode("latin-1") + body)
+        await connection.writer.drain()
+        return await _read_response(connection.reader, head_only=method == "HEAD")
+
+
+async def _read_response(reader: asyncio.StreamReader, head_only: bool = False) -> Tuple[int, bytes, bool]:
+    status_line = await reader.readline()
+    if not status_line:
+        raise HttpError("Connection closed before a response")
+    try:
+        version, status, *_reason = status_line.decode("latin-1").split(" ", 2)
+        status = int(status)
+    except ValueError as error:
+        raise HttpError(f"Malformed status line {status_line!r}") from error
+
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    keep_alive = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+    if head_only or status in (204, 304) or 100 <= status < 200:
+        return status, b"", keep_alive
+    if headers.get("transfer-encoding", "").lower() == "chunked":
+        return status, await _read_chunked(reader), keep_alive
+    if "content-length" in headers:
+        return status, await reader.readexactly(int(headers["content-length"])), keep_alive
+    # No framing: the body runs until the server closes the connection
+    return status, await reader.read(), False
+
+
+async def _read_chunked(reader: asyncio.StreamReader) -> bytes:
+    chunks = []
+    while True:
+        size = int((await reader.readline()).split(b";")[0].strip() or b"0", 16)
+        if size == 0:
+            # Trailer headers, then the blank line ending the message
+            while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                pass
+            return b"".join(chunks)
+        chunks.append(await reader.readexactly(size))
+        await reader.readline()
@@ -0,0 +1,186 @@
+"""
+Collision-free employee IDs and usernames for parallel and repeated runs.
+Each process reserves blocks of values from a high-water mark kept in a
+local file, under a file lock, so xdist workers get disjoint ranges and a
+later run never hands out a value an earlier run used. Values inside a
+block come from an itertools.count, so taking one needs no lock. The file
+also keeps where this machine's values start, so everything it ever
+reserved is one contiguous range (what the leftover sweep matches).
+"""
+import itertools
+import json
+import os
+import random
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from config import config
+from utils.file_lock import FileLock, atomic_write_text
+
+# Size of each key space: "EMP" + 7 digits (OrangeHRM allows 10 characters),
+# and 6 lowercase letters after a username's prefix
+EMPLOYEE_ID_DIGITS = 7
+USERNAME_LETTERS = 6
+KEY_SPACES = {"employee_id": 10 ** EMPLOYEE_ID_DIGITS, "username": 26 ** USERNAME_LETTERS}
+
+# Reservations kept in the state file, for tracing a value back to its run
+_LEDGER_SIZE = 200
+# Seconds between every other (time, high-water mark) checkpoint kept per key
+# space; _LEDGER_SIZE of them cover at least 4 days
+_CHECKPOINT_INTERVAL = 3600
+
+
+def run_nonce() -> str:
+    """Id shared by all workers of this pytest run (xdist's testrun uid), else per process"""
+    return os.environ.get("PYTEST_XDIST_TESTRUNUID") or _PROCESS_NONCE
+
+
+_PROCESS_NONCE = uuid.uuid4().hex[:12]
+
+
+class IdAllocator:
+    """
+    Hands out unique values per key space ("employee_id", "username").
+
+    Usage:
+        id_allocator.employee_id()          # "EMP0481530"
+        id_allocator.username("testuser")   # "testuser_bkfqzm"
+        start = id_allocator.reserve("employee_id", 10_000)   # a range for batch generation
+    """
+
+    def __init__(self, path: str = config.ID_ALLOCATOR_FILE, block_size: int = config.ID_BLOCK_SIZE):
+        self.path = Path(path)
+        self.block_size = block_size
+        self.owner = f"{run_nonce()}/{os.environ.get('PYTEST_XDIST_WORKER', 'main')}"
+        self._lock = FileLock(self.path.with_suffix(".lock"))
+        self._refill_lock = threading.Lock()
+        # Key space -> (counter, end) of this process's current block
+        self._blocks: Dict[str, Tuple[Iterator[int], int]] = {}
+
+    # ---------- Values ----------
+    def employee_id(self) -> str:
+        return f"EMP{self.take('employee_id'):0{EMPLOYEE_ID_DIGITS}d}"
+
+    def username(self, prefix: str = "testuser") -> str:
+        return f"{prefix}_{base26(self.take('username'))}"
+
+    def take(self, key: str) -> int:
+        """One unused value; lock-free until this process's block runs out"""
+        block = self._blocks.get(key)
+        if block is not None:
+            # next() on itertools.count is atomic, so threads never get the same value
+            value = next(block[0])
+            if value < block[1]:
+                return value % KEY_SPACES[key]
+        return self._refill(key)
+
+    def _refill(self, key: str) -> int:
+        with self._refill_lock:
+            block = self._blocks.get(key)
+            if block is not None:
+                value = next(block[0])
+                if value < block[1]:
+                    return value % KEY_SPACES[key]  # another thread refilled first
+            start = self.reserve(key, self.block_size)
+            self._blocks[key] = (itertools.count(start + 1), start + self.block_size)
+            return start % KEY_SPACES[key]
+
+    # ---------- Shared high-water mark ----------
+    def reserve(self, key: str, count: int) -> int:
+        """
+        Reserve `count` consecutive values; returns the first. Values run
+        modulo the key space, so take `(start + i) % KEY_SPACES[key]`.
+        """
+        with self._lock:
+            state = self._load()
+            marks = state.setdefault("high_water", {})
+            origins = state.setdefault("origin", {})
+            if key not in origins:
+                origins[key] = _origin(state, key)
+            # A fresh machine starts at a random point, away from other machines' values
+            start = marks.get(key, origins[key])
+            marks[key] = start + count
+            now = time.time()
+            ledger = state.setdefault("reservations", [])
+            ledger.append({"owner": self.owner, "key": key, "start": start, "count": count, "at": now})
+            del ledger[:-_LEDGER_SIZE]
+            checkpoints = state.setdefault("checkpoints", {}).setdefault(key, [])
+            if len(checkpoints) > 1 and now - checkpoints[-2][0] < _CHECKPOINT_INTERVAL:
+                checkpoints[-1] = [now, marks[key]]
+            else:
+                checkpoints.append([now, marks[key]])
+            del checkpoints[:-_LEDGER_SIZE]
+            atomic_write_text(self.path, json.dumps(state, indent=1))
+        return start
+
+    def reserved_range(self, key: str, before: Optional[float] = None) -> Tuple[int, int]:
+        """
+        (start, count) of every value this machine has reserved in a key
+        space: reservations are contiguous from its random starting point up
+        to the high-water mark. With the epoch time `before`, only up to the
+        mark as of then, to the hour where the ledger no longer reaches back.
+        """
+        state = self._load()
+        marks = state.get("high_water", {})
+        if key not in marks:
+            return 0, 0
+        origin = state.get("origin", {}).get(key, _origin(state, key))
+        if before is None:
+            return origin, marks[key] - origin
+        ends = [entry["start"] + entry["count"] for entry in state.get("reservations", [])
+                if entry["key"] == key and entry.get("at", 0) < before]
+        ends += [mark for at, mark in state.get("checkpoints", {}).get(key, []) if at < before]
+        return origin, max(ends, default=origin) - origin
+
+    def _load(self) -> dict:
+        try:
+            return json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+
+def _origin(state: dict, key: str) -> int:
+    """
+    Where this machine's values of a key space start: a random point when it
+    has none yet. State files written before origins were kept fall back to
+    the oldest reservation still in the ledger.
+    """
+    if key not in state.get("high_water", {}):
+        return random.SystemRandom().randrange(KEY_SPACES[key])
+    starts = [entry["start"] for entry in state.get("reservations", []) if entry["key"] == key]
+    return min(starts, default=state["high_water"][key])
+
+
+def base26(value: int, letters: int = USERNAME_LETTERS) -> str:
+    """A value of the username key space as lowercase letters"""
+    chars = []
+    for _ in range(letters):
+        value, digit = divmod(value, 26)
+        chars.append(chr(ord("a") + digit))
+    return "".join(reversed(chars))
+
+
+def key_value(key: str, text: str) -> Optional[int]:
+    """The key-space value an employee ID ("EMP0481530") or username ("testuser_bkfqzm") was made from"""
+    if key == "employee_id":
+        digits = text[3:]
+        return int(digits) if text.startswith("EMP") and len(digits) == EMPLOYEE_ID_DIGITS and digits.isdigit() else None
+    letters = text.rpartition("_")[2]
+    if len(letters) != USERNAME_LETTERS or not all("a" <= c <= "z" for c in letters):
+        return None
+    value = 0
+    for char in letters:
+        value = value * 26 + ord(char) - ord("a")
+    return value
+
+
+def in_reservations(key: str, value: int, reservations: List[Tuple[int, int]]) -> bool:
+    """Whether a value falls in one of the (start, count) ranges, which wrap around the key space"""
+    return any((value - start) % KEY_SPACES[key] < count for start, count in reservations)
+
+
+# Convenience instance
+id_allocator = IdAllocator()
@@ -0,0 +1,394 @@
+"""
+Test impact analysis: run only the tests a change can affect.
+An instrumented run (pytest --impact-collect) records, for every test, the
+functions, methods and locator declarations of pages/, utils/, loadgen/,
+standin/ and tests/ it executed, including the work its fixtures did when
+they were set up. `pytest --changed-since=<git ref>` maps the lines changed
+since that ref onto those regions and deselects every test that touched
+none of them.
+
+A change outside the instrumented packages (config/, pytest.ini, the
+stand-in's assets, requirements) selects every test; documentation never
+selects any. Tests the index has not seen yet always run.
+"""
+import ast
+import json
+import re
+import subprocess
+import sys
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+import pytest
+
+from config import config
+from utils.file_lock import FileLock, atomic_write_text
+from utils.locators import LocatorSpec
+
+# Top-level directories whose code is instrumented
+PACKAGES = ("pages", "utils", "loadgen", "standin", "tests")
+
+# Packages whose functions only run when a test or fixture calls them. Code
+# elsewhere that no test recorded (conftest hooks, collection) runs for all of them
+CALLED_PACKAGES = ("pages", "utils")
+
+# Changed files that can never affect a test
+IGNORED_SUFFIXES = (".md",)
+
+# (file relative to the root, first line of a region)
+Region = Tuple[str, int]
+# Changed line ranges of a file, old side of the diff; None: the whole file
+Changes = Dict[str, Optional[List[Tuple[int, int]]]]
+
+_UNSEEN = object()
+
+# The recorder's own code runs inside every test, but no test depends on it
+_OWN_FILE = "utils/impact_index.py"
+
+
+def impact_key(item: pytest.Item) -> str:
+    """Node id without the browser parameter: one index entry serves every browser of the matrix"""
+    browser = getattr(item, "callspec", None) and item.callspec.params.get("browser_name")
+    if not browser:
+        return item.nodeid
+    base, _, ids = item.nodeid.partition("[")
+    parts = [part for part in ids.rstrip("]").split("-") if part != browser]
+    return f"{base}[{'-'.join(parts)}]" if parts else base
+
+
+def source_regions(path: Path) -> Tuple[Dict[int, Tuple[int, str]], Dict[Tuple[str, str], Tuple[int, int]]]:
+    """
+    ({first line: (last line, label)} of the file's functions and methods,
+    {(class, attribute): (first line, last line)} of its class attributes)
+    """
+    functions: Dict[int, Tuple[int, str]] = {}
+    attributes: Dict[Tuple[str, str], Tuple[int, int]] = {}
+
+    def visit(body: list, owner: str):
+        for node in body:
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                start = min([node.lineno] + [decorator.lineno for decorator in node.decorator_list])
+                functions[start] = (node.end_lineno, f"{owner}.{node.name}" if owner else node.name)
+            elif isinstance(node, ast.ClassDef):
+                visit(node.body, f"{owner}.{node.name}" if owner else node.name)
+            elif owner and isinstance(node, ast.Assign):
+                for target in node.targets:
+                    if isinstance(target, ast.Name):
+                        attributes[(owner, target.id)] = (node.lineno, node.end_lineno)
+
+    try:
+        visit(ast.parse(path.read_text(encoding="utf-8")).body, "")
+    except (OSError, SyntaxError, ValueError):
+        pass
+    return functions, attributes
+
+
+class ImpactRecorder:
+    """
+    Records which code regions each test executes, through a profile hook
+    on every thread (page objects, the seeder's worker threads, the
+    stand-in server's handlers).
+
+    Usage (see the hooks in tests/conftest.py):
+        impact_recorder.start(config.rootpath)
+        with impact_recorder.fixture(fixturedef):
+            ...                               # fixture setup
+        with impact_recorder.test(item):
+            ...                               # setup, call and teardown
+        impact_recorder.as_dict()             # {"files": ..., "tests": ...}
+    """
+
+    def __init__(self):
+        self.root = Path.cwd()
+        self.tests: Dict[str, dict] = {}
+        self.files: Dict[str, Dict[int, List]] = {}
+        self._fixtures: Dict[str, Set[Region]] = {}
+        self._active: List[Set[Region]] = []
+        self._code_regions: Dict[object, Optional[Region]] = {}
+        self._relative_paths: Dict[str, Optional[str]] = {}
+        self._sources: Dict[str, tuple] = {}
+        self._locator_regions: Dict[int, Optional[Region]] = {}
+        self._locator_get = LocatorSpec.__get__.__code__
+        self._previous: tuple = (None, None)
+
+    # ---------- Profiling ----------
+    def start(self, root: Path):
+        """Instrument the code under `root` (pytest's rootdir) from now on"""
+        self.root = root.resolve()
+        self._previous = (sys.getprofile(), threading.getprofile())
+        sys.setprofile(self._profile)
+        threading.setprofile(self._profile)
+
+    def stop(self):
+        """Put back the profile hooks start() replaced"""
+        sys.setprofile(self._previous[0])
+        threading.setprofile(self._previous[1])
+
+    def _profile(self, frame, event, arg):
+        if event != "call" or not self._active:
+            return
+        code = frame.f_code
+        region = self._code_regions.get(code, _UNSEEN)
+        if region is _UNSEEN:
+            region = self._code_regions[code] = self._region_of(code)
+        if region is not None:
+            for regions in self._active:
+                regions.add(region)
+        if code is self._locator_get and frame.f_locals.get("instance") is not None:
+            locator = self._locator_region(frame.f_locals["self"])
+            if locator is not None:
+                for regions in self._active:
+                    regions.add(locator)
+
+    def _relative(self, filename: str) -> Optional[str]:
+        """Path of an instrumented file relative to the root, else None"""
+        if filename not in self._relative_paths:
+            try:
+                relative = Path(filename).resolve().relative_to(self.root).as_posix()
+            except ValueError:
+                relative = None
+            instrumented = relative and relative.split("/")[0] in PACKAGES and relative != _OWN_FILE
+            self._relative_paths[filename] = relative if instrumented else None
+        return self._relative_paths[filename]
+
+    def _source(self, relative: str) -> tuple:
+        if relative not in self._sources:
+            self._sources[relative] = source_regions(self.root / relative)
+        return self._sources[relative]
+
+    def _region_of(self, code) -> Optional[Region]:
+        """The outermost function or method containing a code object"""
+        relative = self._relative(code.co_filename)
+        if relative is None:
+            return None
+        line = code.co_firstlineno
+        functions, _ = self._source(relative)
+        # Module and class bodies run at import, not in a test, and are left out
+        containing = [start for start, (end, _) in functions.items() if start <= line <= end]
+        return (relative, min(containing)) if containing else None
+
+    def _locator_region(self, spec: LocatorSpec) -> Optional[Region]:
+        """The class attribute that declares a locator chain"""
+        if id(spec) not in self._locator_regions:
+            region = None
+            module = sys.modules.get(getattr(spec.owner, "__module__", ""))
+            relative = self._relative(getattr(module, "__file__", None) or "")
+            if relative:
+                lines = self._source(relative)[1].get((spec.owner.__qualname__, spec.name))
+                if lines:
+                    region = (relative, lines[0])
+                    self.files.setdefault(relative, {})[lines[0]] = [lines[1], spec.qualname]
+            self._locator_regions[id(spec)] = region
+        return self._locator_regions[id(spec)]
+
+    # ---------- Attribution ----------
+    @contextmanager
+    def _collecting(self) -> Iterator[Set[Region]]:
+        regions: Set[Region] = set()
+        self._active.append(regions)
+        try:
+            yield regions
+        finally:
+            # Contexts nest strictly; remove() would match an equal set of an enclosing one
+            self._active.pop()
+
+    @contextmanager
+    def fixture(self, fixturedef):
+        """Credit what a fixture's setup runs to every test that uses the fixture"""
+        with self._collecting() as regions:
+            yield
+        self._fixtures.setdefault(_fixture_key(fixturedef), set()).update(regions)
+
+    @contextmanager
+    def test(self, item: pytest.Item):
+        """Record the regions one test runs, its fixtures' included"""
+        with self._collecting() as regions:
+            yield
+        fixture_defs = item._fixtureinfo.name2fixturedefs
+        for name in item.fixturenames:
+            if name in fixture_defs:
+                regions |= self._fixtures.get(_fixture_key(fixture_defs[name][-1]), set())
+        entry = self.tests.setdefault(impact_key(item), {"deps": {}, "fixtures": []})
+        for relative, start in regions:
+            entry["deps"].setdefault(relative, set()).add(start)
+        entry["fixtures"] = sorted(set(entry["fixtures"]) | {n for n in item.fixturenames if n in fixture_defs})
+
+    # ---------- Export ----------
+    def as_dict(self) -> dict:
+        """Plain-dict index of this process, safe to send between xdist processes"""
+        files = {relative: dict(regions) for relative, regions in self.files.items()}
+        # Every instrumented file loaded, so changes to code no test ran are recognised as such
+        for module in list(sys.modules.values()):
+            relative = self._relative(getattr(module, "__file__", None) or "")
+            if relative:
+                functions, _ = self._source(relative)
+                files.setdefault(relative, {}).update({start: [end, label] for start, (end, label) in functions.items()})
+        tests = {
+            key: {"deps": {relative: sorted(starts) for relative, starts in entry["deps"].items()},
+                  "fixtures": entry["fixtures"]}
+            for key, entry in self.tests.items()
+        }
+        return {"files": files, "tests": tests}
+
+    def merge(self, other: dict):
+        """Add the index exported by another process (see as_dict)"""
+        for relative, regions in other.get("files", {}).items():
+            self.files.setdefault(relative, {}).update({int(start): region for start, region in regions.items()})
+        for key, entry in other.get("tests", {}).items():
+            self.tests[key] = {
+                "deps": {relative: set(starts) for relative, starts in entry["deps"].items()},
+                "fixtures": entry["fixtures"],
+            }
+
+
+def _fixture_key(fixturedef) -> str:
+    return f"{fixturedef.baseid}::{fixturedef.argname}"
+
+
+class ImpactIndex:
+    """
+    The test -> code regions index on disk, and test selection from a
+    git diff against it.
+
+    Usage:
+        index = ImpactIndex()
+        selection = index.select("origin/main")
+        selection.tests          # keys of the affected tests, None for all
+        selection.reasons        # why, one line per changed file
+    """
+
+    def __init__(self, path: str = config.TEST_IMPACT_INDEX):
+        self.path = Path(path)
+        self._lock = FileLock(self.path.with_suffix(".lock"))
+
+    def load(self) -> dict:
+        try:
+            return json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+    def save(self, recorded: dict, commit: str):
+        """
+        Store a run's index. A run on the indexed commit adds to it (e.g. a
+        partial -k run), a run on another commit replaces it.
+        """
+        with self._lock:
+            index = self.load()
+            if index.get("commit") != commit:
+                index = {"commit": commit, "files": {}, "tests": {}}
+            for relative, regions in recorded["files"].items():
+                index["files"].setdefault(relative, {}).update({str(start): region for start, region in regions.items()})
+            index["tests"].update(recorded["tests"])
+            atomic_write_text(self.path, json.dumps(index, indent=1, sort_keys=True))
+
+    def select(self, ref: str, root: Path) -> "Selection":
+        """Tests the changes between `ref` and the working tree of `root` can affect"""
+        index = self.load()
+        if not index.get("tests"):
+            return Selection(None, [f"no impact index at {self.path}; run pytest --impact-collect first"])
+        exact = _git(root, "rev-parse", f"{ref}^{{commit}}").strip() == index["commit"]
+        changes = changed_lines(ref, root)
+        if not exact:
+            # Line numbers only match the indexed commit's sources: fall back to whole files
+            changes = dict.fromkeys(changes)
+        selection = affected_tests(index, changes)
+        if not exact:
+            selection.reasons.insert(0, f"index built at {index['commit'][:10]}, not {ref}: matched whole files")
+        return selection
+
+
+class Selection:
+    """
+    Tests a change affects: keys (None when every test is affected), the
+    reasons, and the keys the index knows
+    """
+
+    def __init__(self, tests: Optional[Set[str]], reasons: List[str], indexed: Iterable[str] = ()):
+        self.tests = tests
+        self.reasons = reasons
+        self.indexed = set(indexed)
+
+    def includes(self, item: pytest.Item) -> bool:
+        """Whether to run a test; tests missing from the index always run"""
+        key = impact_key(item)
+        return self.tests is None or key in self.tests or key not in self.indexed
+
+
+def affected_tests(index: dict, changes: Changes) -> Selection:
+    """Tests whose recorded regions overlap the changed lines"""
+    tests, files = index["tests"], index["files"]
+    selected: Set[str] = set()
+    reasons = []
+    for relative, hunks in sorted(changes.items()):
+        if relative.endswith(IGNORED_SUFFIXES):
+            continue
+        if relative not in files:
+            if relative.split("/")[0] in PACKAGES and relative.endswith(".py"):
+                continue  # instrumented, but no test imports it
+            return Selection(None, [f"{relative}: outside the instrumented packages, every test is affected"])
+
+        regions = {int(start): (end, label) for start, (end, label) in files[relative].items()}
+        touching = {key for key, entry in tests.items() if relative in entry["deps"]}
+        hits: Set[str] = set()
+        labels = set()
+        for hunk in hunks or [None]:
+            changed = [] if hunk is None else [
+                start for start, (end, _) in regions.items() if start <= hunk[1] and hunk[0] <= end
+            ]
+            if hunk is None or not changed:
+                if not touching:
+                    # Module-level code of a file no test calls into directly: anything may depend on it
+                    return Selection(None, [f"{relative}: module-level change, every test is affected"])
+                hits |= touching
+                labels.add("module level" if hunk else "whole file")
+                continue
+            changed_labels = sorted(regions[start][1] for start in changed)
+            labels.update(changed_labels)
+            hunk_hits = {key for key in touching if set(tests[key]["deps"][relative]) & set(changed)}
+            if not hunk_hits and relative.split("/")[0] not in CALLED_PACKAGES:
+                return Selection(None, [
+                    f"{relative} ({', '.join(changed_labels)}): run outside any test, every test is affected"
+                ])
+            hits |= hunk_hits
+        selected |= hits
+        reasons.append(f"{relative} ({', '.join(sorted(labels))}): {len(hits)} tests")
+    return Selection(selected, reasons, tests)
+
+
+def changed_lines(ref: str, root: Path) -> Changes:
+    """Lines changed between `ref` and the working tree, old side, by path relative to `root`; untracked files whole"""
+    changes: Changes = {}
+    path = None
+    for line in _git(root, "diff", "-U0", "--no-color", "--no-renames", "--relative", ref, "--").splitlines():
+        if line.startswith("diff --git "):
+            path = line.split(" b/", 1)[0][len("diff --git a/"):]
+            changes[path] = []
+        elif path is None:
+            continue
+        elif line.startswith(("new file mode", "deleted file mode", "Binary files")):
+            changes[path] = None
+        elif line.startswith("@@") and changes[path] is not None:
+            match = re.match(r"@@ -(\d+)(?:,(\d+))? ", line)
+            start, count = int(match[1]), int(match[2] or 1)
+            # A pure insertion sits between two lines: either neighbour's region may own it
+            changes[path].append((start, start + count - 1) if count else (start, start + 1))
+    for path in _git(root, "ls-files", "--others", "--exclude-standard").splitlines():
+        changes[path] = None
+    # Mode-only changes carry no hunks
+    return {path: hunks or None for path, hunks in changes.items()}
+
+
+def _git(root: Path, *args: str) -> str:
+    try:
+        return subprocess.run(
+            ["git", *args], cwd=root, capture_output=True, text=True, check=True, timeout=60,
+        ).stdout
+    except subprocess.CalledProcessError as error:
+        raise pytest.UsageError(f"git {' '.join(args)} failed: {error.stderr.strip()}") from error
+
+
+# Convenience instances
+impact_recorder = ImpactRecorder()
+impact_index = ImpactIndex()
@@ -0,0 +1,269 @@
+"""
+Declarative locators for page objects.
+A page's locator class lists its selectors as class attributes. Each chain
+is compiled once, when the class is defined, into the fewest Playwright
+calls (consecutive CSS, nth and parent steps become one `>>` selector).
+Its Locator is built on first access and then served from the page object
+itself, so repeated access costs nothing.
+
+With LOCATOR_DEBUG enabled, the first access on a sync page also times how
+long the browser takes to resolve the chain, and the run summary lists the
+slowest ones.
+"""
+import statistics
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from playwright.sync_api import Page
+
+from config import config
+
+
+@dataclass(frozen=True)
+class param:
+    """Placeholder for an argument of a parameterized locator, e.g. nth(param("row"))"""
+    name: str
+
+
+@dataclass(frozen=True)
+class _Step:
+    method: str
+    args: Tuple[Any, ...] = ()
+    kwargs: Tuple[Tuple[str, Any], ...] = ()
+
+    @property
+    def params(self) -> List[str]:
+        values = list(self.args) + [value for _, value in self.kwargs]
+        return [value.name for value in values if isinstance(value, param)]
+
+    def bind(self, values: Dict[str, Any]) -> "_Step":
+        def resolve(value):
+            return values[value.name] if isinstance(value, param) else value
+
+        return _Step(
+            self.method,
+            tuple(resolve(a) for a in self.args),
+            tuple((k, resolve(v)) for k, v in self.kwargs),
+        )
+
+    @property
+    def selector(self) -> Optional[str]:
+        """The step as a plain selector fragment, when it has one"""
+        if self.method == "locator" and not self.kwargs and isinstance(self.args[0], str):
+            return self.args[0]
+        if self.method == "nth" and isinstance(self.args[0], int):
+            return f"nth={self.args[0]}"
+        return None
+
+
+class LocatorSpec:
+    """
+    A locator chain written like Playwright's own calls, used as a class
+    attribute of a page's locator class.
+
+    Usage:
+        class AdminPageLocators(BaseLocators):
+            save_button = by_role("button", name="Save")
+            user_role_dropdown = css('label:text("User Role")').parent.locator('.oxd-select-text-input')
+            user_checkbox = users_table_rows.nth(param("row_index")).locator('.oxd-checkbox-input')
+
+        admin.save_button              # Locator, built once per AdminPage
+        admin.user_checkbox(2)         # parameterized: Locator per argument, also cached
+    """
+
+    def __init__(self, steps: Tuple[_Step, ...] = ()):
+        self.steps = steps
+        self.name: Optional[str] = None
+        self.owner: Optional[type] = None
+        self.params: List[str] = list(dict.fromkeys(p for step in steps for p in step.params))
+        self._plan = None if self.params else _compile(steps)
+
+    # ---------- Chain ----------
+    def _then(self, method: str, *args, **kwargs) -> "LocatorSpec":
+        return LocatorSpec(self.steps + (_Step(method, args, tuple(sorted(kwargs.items()))),))
+
+    def locator(self, selector: str, **kwargs) -> "LocatorSpec":
+        return self._then("locator", selector, **kwargs)
+
+    def get_by_role(self, role: str, **kwargs) -> "LocatorSpec":
+        return self._then("get_by_role", role, **kwargs)
+
+    def get_by_text(self, text: str, **kwargs) -> "LocatorSpec":
+        return self._then("get_by_text", text, **kwargs)
+
+    def get_by_placeholder(self, text: str, **kwargs) -> "LocatorSpec":
+        return self._then("get_by_placeholder", text, **kwargs)
+
+    def filter(self, **kwargs) -> "LocatorSpec":
+        return self._then("filter", **kwargs)
+
+    def nth(self, index) -> "LocatorSpec":
+        return self._then("nth", index)
+
+    @property
+    def first(self) -> "LocatorSpec":
+        return self.nth(0)
+
+    @property
+    def parent(self) -> "LocatorSpec":
+        return self.locator("..")
+
+    # ---------- Descriptor ----------
+    def __set_name__(self, owner: type, name: str):
+        if self.name is not None:
+            raise TypeError(f"{owner.__name__}.{name} reuses the locator of {self.qualname}; chain a new one")
+        self.name = name
+        self.owner = owner
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        if self.params:
+            return self._bound_factory(instance)
+        locator = self.build(instance.page)
+        # Shadows this (non-data) descriptor: later reads are plain attribute lookups
+        instance.__dict__[self.name] = locator
+        if config.LOCATOR_DEBUG:
+            locator_timings.time(self.qualname, self.describe(), instance.page, locator)
+        return locator
+
+    def _bound_factory(self, instance) -> Callable:
+        cache: Dict[tuple, Any] = {}
+
+        def factory(*args, **kwargs):
+            values = dict(zip(self.params, args), **kwargs)
+            key = tuple(values.get(p) for p in self.params)
+            if key not in cache:
+                cache[key] = self.build(instance.page, values)
+                if config.LOCATOR_DEBUG:
+                    locator_timings.time(self.qualname, self.describe(values), instance.page, cache[key])
+            return cache[key]
+
+        instance.__dict__[self.name] = factory
+        return factory
+
+    # ---------- Building ----------
+    def build(self, root, values: Optional[Dict[str, Any]] = None):
+        """Locator for this chain on `root` (a Page, Frame or Locator)"""
+        plan = self._plan if values is None else _compile(tuple(step.bind(values) for step in self.steps))
+        for method, args, kwargs in plan:
+            root = getattr(root, method)(*args, **kwargs)
+        return root
+
+    def describe(self, values: Optional[Dict[str, Any]] = None) -> str:
+        """The compiled chain in Playwright-call notation"""
+        steps = self.steps if values is None else tuple(step.bind(values) for step in self.steps)
+        return ".".join(f"{method}({_format_args(args, kwargs)})" for method, args, kwargs in _compile(steps))
+
+    @property
+    def qualname(self) -> str:
+        return f"{self.owner.__name__}.{self.name}" if self.owner else repr(self)
+
+
+def _compile(steps: Tuple[_Step, ...]) -> Tuple[Tuple[str, tuple, dict], ...]:
+    """Fold runs of plain selector steps into single locator() calls"""
+    plan: List[Tuple[str, tuple, dict]] = []
+    pending: List[str] = []
+
+    def flush():
+        if pending:
+            plan.append(("locator", (" >> ".join(pending),), {}))
+            pending.clear()
+
+    for step in steps:
+        fragment = step.selector
+        # nth= only chains onto a selector; at the root it stays a call
+        if fragment is not None and (pending or step.method == "locator"):
+            pending.append(fragment)
+            continue
+        flush()
+        plan.append((step.method, step.args, dict(step.kwargs)))
+    flush()
+    return tuple(plan)
+
+
+def _format_args(args: tuple, kwargs: dict) -> str:
+    return ", ".join([repr(a) for a in args] + [f"{k}={v!r}" for k, v in kwargs.items()])
+
+
+# Chain roots
+css = LocatorSpec().locator
+by_role = LocatorSpec().get_by_role
+by_text = LocatorSpec().get_by_text
+by_placeholder = LocatorSpec().get_by_placeholder
+
+
+def locator_table(cls: type) -> Dict[str, LocatorSpec]:
+    """Every declared locator of a page class, including inherited ones"""
+    table: Dict[str, LocatorSpec] = {}
+    for klass in reversed(cls.__mro__):
+        table.update({name: value for name, value in vars(klass).items() if isinstance(value, LocatorSpec)})
+    return table
+
+
+def resolution_ms(page: Page, locator, rounds: int = 3) -> float:
+    """
+    Roughly what the browser spends matching a locator: the median `count()`
+    round trip minus the median empty `evaluate` round trip on the same page.
+    """
+    def median(call: Callable) -> float:
+        samples = []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            call()
+            samples.append((time.perf_counter() - start) * 1000)
+        return statistics.median(samples)
+
+    baseline = median(lambda: page.evaluate("0"))
+    return max(0.0, median(locator.count) - baseline)
+
+
+class LocatorTimings:
+    """Browser-side resolution times of locators (LOCATOR_DEBUG), see resolution_ms"""
+
+    def __init__(self, slow_ms: float = config.LOCATOR_SLOW_MS):
+        self.slow_ms = slow_ms
+        self._timings: Dict[str, Dict[str, Any]] = {}
+
+    def time(self, name: str, chain: str, page, locator):
+        if not isinstance(page, Page):
+            return  # sync pages only; an async page would need awaiting here
+        try:
+            ms = resolution_ms(page, locator)
+        except Exception:
+            return  # page closed or navigating; not the locator's cost
+        self.record(name, chain, ms)
+
+    def record(self, name: str, chain: str, ms: float, samples: int = 1):
+        entry = self._timings.setdefault(name, {"chain": chain, "samples": 0, "total_ms": 0.0, "max_ms": 0.0})
+        entry["samples"] += samples
+        entry["total_ms"] += ms * samples
+        entry["max_ms"] = max(entry["max_ms"], ms)
+
+    def merge(self, other: Dict[str, Dict[str, Any]]):
+        """Add timings exported by another process (see as_dict)"""
+        for name, entry in other.items():
+            mine = self._timings.setdefault(name, {**entry, "samples": 0, "total_ms": 0.0, "max_ms": 0.0})
+            mine["samples"] += entry["samples"]
+            mine["total_ms"] += entry["total_ms"]
+            mine["max_ms"] = max(mine["max_ms"], entry["max_ms"])
+
+    def as_dict(self) -> Dict[str, Dict[str, Any]]:
+        return {name: dict(entry) for name, entry in self._timings.items()}
+
+    def slowest(self, limit: int = 10) -> List[Tuple[str, Dict[str, Any]]]:
+        ranked = sorted(self._timings.items(), key=lambda item: item[1]["total_ms"] / item[1]["samples"], reverse=True)
+        return ranked[:limit]
+
+    def format_lines(self, limit: int = 10) -> List[str]:
+        lines = []
+        for name, entry in self.slowest(limit):
+            mean = entry["total_ms"] / entry["samples"]
+            flag = "  SLOW" if mean >= self.slow_ms else ""
+            lines.append(f"{mean:8.1f}ms avg {entry['max_ms']:8.1f}ms max  {name}: {entry['chain']}{flag}")
+        return lines
+
+
+# Convenience instance
+locator_timings = LocatorTimings()
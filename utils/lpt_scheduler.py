@@ -0,0 +1,276 @@
+"""
+Duration-aware test distribution for pytest-xdist.
+Every run records each test's duration (setup, call and teardown) and the
+session-scoped fixtures it pulls in to a local history file. With -n, later
+runs plan the work longest-processing-time-first: tests are split into
+units of similar cost, each unit goes to the least-loaded worker, and a
+worker that already sets up the unit's session fixtures (an admin login, a
+loaded dataset) is preferred when that costs little balance. A worker that
+finishes its plan early takes units from the end of the busiest plan.
+
+The predicted makespan of the plan and the actual one are reported in the
+run statistics.
+"""
+import json
+import statistics
+import time
+from collections import OrderedDict, defaultdict
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import pytest
+from xdist.scheduler import LoadScopeScheduling
+
+from config import config
+from utils.file_lock import FileLock, atomic_write_text
+from utils.run_stats import run_stats
+
+# Weight of the latest run in a test's smoothed duration
+_SMOOTHING = 0.3
+
+# Seconds predicted for a test when no test has a history yet
+_DEFAULT_DURATION = 10.0
+
+# Units per worker a plan aims for: enough to balance, few enough to keep fixture groups together
+_UNITS_PER_WORKER = 3
+
+# A worker already holding a unit's fixtures may end this share of the ideal makespan above the least-loaded one
+_AFFINITY_SLACK = 0.1
+
+# History entries of tests that have not run for this long are dropped
+_HISTORY_DAYS = 30
+
+
+def shared_fixtures(item: pytest.Item) -> List[str]:
+    """
+    The project's session-scoped fixtures a test needs, i.e. what a worker
+    sets up once and reuses (plugin fixtures like base_url are left out)
+    """
+    fixture_defs = item._fixtureinfo.name2fixturedefs
+    names = [
+        name for name in item.fixturenames
+        if name in fixture_defs and fixture_defs[name][-1].scope == "session" and fixture_defs[name][-1].baseid
+    ]
+    # Each browser is its own session fixture instance
+    browser = getattr(item, "callspec", None) and item.callspec.params.get("browser_name")
+    return sorted(names + ([f"browser:{browser}"] if browser else []))
+
+
+class DurationHistory:
+    """
+    Smoothed duration and shared fixtures of each test (by node id), kept
+    in a JSON file and merged under a file lock by every run that saves.
+
+    Usage:
+        history = DurationHistory()
+        history.record("tests/pim/test_pim.py::TestPim::test_add[chromium]", 12.4, ["auth_state"])
+        history.save()
+        history.predict("tests/pim/test_pim.py::TestPim::test_add[chromium]")   # 12.4
+    """
+
+    def __init__(self, path: str = config.TEST_DURATIONS_FILE):
+        self.path = Path(path)
+        self._lock = FileLock(self.path.with_suffix(".lock"))
+        self._tests: Optional[Dict[str, dict]] = None
+        self._recorded: Dict[str, dict] = {}
+
+    @property
+    def tests(self) -> Dict[str, dict]:
+        """History entries by node id, read on first use"""
+        if self._tests is None:
+            self._tests = self._load().get("tests", {})
+        return self._tests
+
+    def predict(self, nodeid: str) -> float:
+        """Expected seconds; the median of known tests for a new one"""
+        entry = self.tests.get(nodeid)
+        if entry:
+            return entry["duration"]
+        return statistics.median(e["duration"] for e in self.tests.values()) if self.tests else _DEFAULT_DURATION
+
+    def affinity(self, nodeid: str) -> Tuple[str, ...]:
+        """Session fixtures the test used last time it ran"""
+        return tuple(self.tests.get(nodeid, {}).get("fixtures", ()))
+
+    def is_known(self, nodeid: str) -> bool:
+        return nodeid in self.tests
+
+    def record(self, nodeid: str, duration: float, fixtures: Sequence[str]):
+        self._recorded[nodeid] = {"duration": duration, "fixtures": list(fixtures)}
+
+    def save(self):
+        """Fold this run's durations into the file, keeping other runs' entries"""
+        if not self._recorded:
+            return
+        today = date.today()
+        with self._lock:
+            tests = self._load().get("tests", {})
+            for nodeid, run in self._recorded.items():
+                previous = tests.get(nodeid)
+                duration = run["duration"] if previous is None else (
+                    (1 - _SMOOTHING) * previous["duration"] + _SMOOTHING * run["duration"]
+                )
+                tests[nodeid] = {
+                    "duration": round(duration, 3),
+                    "runs": (previous or {}).get("runs", 0) + 1,
+                    "fixtures": run["fixtures"],
+                    "seen": today.isoformat(),
+                }
+            cutoff = (today - timedelta(days=_HISTORY_DAYS)).isoformat()
+            tests = {nodeid: entry for nodeid, entry in tests.items() if entry.get("seen", cutoff) >= cutoff}
+            atomic_write_text(self.path, json.dumps({"tests": tests}, indent=1, sort_keys=True))
+        self._tests = tests
+        self._recorded.clear()
+
+    def _load(self) -> dict:
+        try:
+            return json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+
+def plan_lpt(
+    units: Dict[str, Tuple[float, Tuple[str, ...]]], workers: int, slack: float = _AFFINITY_SLACK,
+) -> Tuple[List[List[str]], List[float]]:
+    """
+    Longest-processing-time-first plan of {unit: (seconds, fixture key)}
+    over `workers`; returns each worker's units and predicted load
+    """
+    plans: List[List[str]] = [[] for _ in range(workers)]
+    loads = [0.0] * workers
+    holders: Dict[Tuple[str, ...], set] = defaultdict(set)
+    tolerance = slack * sum(cost for cost, _ in units.values()) / max(workers, 1)
+    for unit, (cost, key) in sorted(units.items(), key=lambda item: -item[1][0]):
+        least = min(range(workers), key=loads.__getitem__)
+        warm = [w for w in holders[key] if loads[w] <= loads[least] + tolerance]
+        worker = min(warm, key=loads.__getitem__) if warm else least
+        plans[worker].append(unit)
+        loads[worker] += cost
+        holders[key].add(worker)
+    return plans, loads
+
+
+class LptScheduling(LoadScopeScheduling):
+    """
+    xdist scheduler that runs the plan_lpt() plan of the collection, with
+    units of tests that share session fixtures. Returned from the
+    pytest_xdist_make_scheduler hook.
+    """
+
+    def __init__(self, config: pytest.Config, log=None, history: Optional[DurationHistory] = None):
+        super().__init__(config, log)
+        self.history = history or duration_history
+        self._unit_of: Dict[str, str] = {}
+        self._test_cost: Dict[str, float] = {}
+        self._plans: Dict[object, List[str]] = {}
+        self.predicted_makespan = 0.0
+        self._started: Optional[float] = None
+        self._busy: Dict[object, float] = defaultdict(float)
+        self._reported = False
+
+    def _split_scope(self, nodeid: str) -> str:
+        return self._unit_of.get(nodeid) or super()._split_scope(nodeid)
+
+    def schedule(self):
+        assert self.collection_is_completed
+        if self.collection is not None:
+            for node in self.nodes:
+                self._reschedule(node)
+            return
+        if not self._check_nodes_have_same_collection():
+            self.log("**Different tests collected, aborting run**")
+            return
+        self.collection = list(next(iter(self.registered_collections.values())))
+        if not self.collection:
+            return
+
+        units = self._units(self.collection, len(self.nodes))
+        plans, loads = plan_lpt(
+            {unit: (sum(self._test_cost[n] for n in nodeids), key) for unit, (key, nodeids) in units.items()},
+            len(self.nodes),
+        )
+        for unit, (_, nodeids) in units.items():
+            self.workqueue[unit] = dict.fromkeys(nodeids, False)
+        self.predicted_makespan = max(loads)
+        self._started = time.perf_counter()
+
+        # More workers than units: the extra ones have an empty plan
+        for node, plan in list(zip(self.nodes, plans)):
+            if plan:
+                self._plans[node] = plan
+            else:
+                self.assigned_work.pop(node)
+                node.shutdown()
+        for node in self.nodes:
+            self._assign_work_unit(node)
+        for node in self.nodes:
+            self._reschedule(node)
+        if not self.workqueue:
+            for node in self.nodes:
+                node.shutdown()
+
+    def _units(self, collection: List[str], workers: int) -> "OrderedDict[str, Tuple[Tuple[str, ...], List[str]]]":
+        """Tests grouped by shared fixtures, in collection order, cut into units of similar cost"""
+        groups: Dict[Tuple[str, ...], List[str]] = OrderedDict()
+        for nodeid in collection:
+            self._test_cost[nodeid] = self.history.predict(nodeid)
+            groups.setdefault(self.history.affinity(nodeid), []).append(nodeid)
+        total = sum(self._test_cost.values())
+        cap = max(total / (workers * _UNITS_PER_WORKER), max(self._test_cost.values()))
+
+        units: "OrderedDict[str, Tuple[Tuple[str, ...], List[str]]]" = OrderedDict()
+        for key, nodeids in groups.items():
+            chunk, cost = [], 0.0
+            for nodeid in nodeids:
+                if chunk and cost + self._test_cost[nodeid] > cap:
+                    units[f"{'+'.join(key) or 'none'}#{len(units)}"] = (key, chunk)
+                    chunk, cost = [], 0.0
+                chunk.append(nodeid)
+                cost += self._test_cost[nodeid]
+            units[f"{'+'.join(key) or 'none'}#{len(units)}"] = (key, chunk)
+        for unit, (_, nodeids) in units.items():
+            for nodeid in nodeids:
+                self._unit_of[nodeid] = unit
+        return units
+
+    def _assign_work_unit(self, node):
+        """Next unit of the node's plan, else the last unit of the busiest remaining plan"""
+        unit = next((u for u in self._plans.get(node, []) if u in self.workqueue), None)
+        if unit is None:
+            remaining = {
+                other: [u for u in plan if u in self.workqueue] for other, plan in self._plans.items() if other is not node
+            }
+            busiest = max(remaining.values(), key=lambda units: sum(self._cost(u) for u in units), default=[])
+            # Units a crashed worker handed back belong to no plan
+            unit = busiest[-1] if busiest else next(iter(self.workqueue))
+        work_unit = self.workqueue.pop(unit)
+        self.assigned_work.setdefault(node, {})[unit] = work_unit
+        collection = self.registered_collections[node]
+        node.send_runtest_some([collection.index(nodeid) for nodeid, done in work_unit.items() if not done])
+
+    def _cost(self, unit: str) -> float:
+        return sum(self._test_cost.get(nodeid, 0.0) for nodeid in self.workqueue.get(unit, ()))
+
+    def mark_test_complete(self, node, item_index: int, duration: float = 0):
+        self._busy[node] += duration
+        super().mark_test_complete(node, item_index, duration)
+        if not self._reported and not self.has_pending:
+            self._reported = True
+            run_stats.add("scheduler", "workers", len(self._busy))
+            run_stats.add("scheduler", "units", len(set(self._unit_of.values())))
+            run_stats.add("scheduler", "new_tests", sum(not self.history.is_known(n) for n in self.collection or []))
+            run_stats.add("scheduler", "predicted_makespan_s", round(self.predicted_makespan, 1))
+            run_stats.add("scheduler", "actual_makespan_s", round(time.perf_counter() - self._started, 1))
+            run_stats.add("scheduler", "busiest_worker_s", round(max(self._busy.values()), 1))
+
+
+def make_scheduler(pytest_config: pytest.Config, log) -> Optional[LptScheduling]:
+    """The LPT scheduler for -n runs left on xdist's default --dist load; None keeps xdist's choice"""
+    if config.LPT_SCHEDULING and pytest_config.getvalue("dist") == "load":
+        return LptScheduling(pytest_config, log)
+    return None
+
+
+# Convenience instance
+duration_history = DurationHistory()
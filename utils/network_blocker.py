@@ -0,0 +1,157 @@
+"""
+Declarative blocking of network requests a test never asserts on.
+Dashboard widgets, profile images, fonts and analytics add dozens of requests
+to every page that passes through the dashboard; a blocking profile aborts
+them before they leave the browser.
+"""
+import json
+import re
+import weakref
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Tuple
+from urllib.parse import urlsplit
+
+from playwright.sync_api import BrowserContext, Request, Route
+
+from config import config
+from utils.file_lock import FileLock, atomic_write_text
+from utils.run_stats import RunStats, run_stats
+
+
+@dataclass(frozen=True)
+class BlockRule:
+    """Requests matching any resource type or URL regex are aborted"""
+    name: str
+    resource_types: Tuple[str, ...] = ()
+    url_patterns: Tuple[str, ...] = ()
+
+    def matches(self, request: Request) -> bool:
+        if request.resource_type in self.resource_types:
+            return True
+        return any(re.search(pattern, request.url) for pattern in self.url_patterns)
+
+
+BLOCK_RULES: Dict[str, BlockRule] = {
+    rule.name: rule for rule in (
+        BlockRule("images", resource_types=("image",)),
+        BlockRule("fonts", resource_types=("font",)),
+        BlockRule("media", resource_types=("media",)),
+        BlockRule("analytics", url_patterns=(
+            r"google-analytics\.com", r"googletagmanager\.com", r"doubleclick\.net",
+            r"hotjar\.com", r"clarity\.ms", r"segment\.(io|com)", r"facebook\.net",
+        )),
+        # Widget data only; dashboard/shortcuts still drives the Quick Launch buttons
+        BlockRule("dashboard_widgets", url_patterns=(
+            r"/api/v2/buzz/feed",
+            r"/api/v2/dashboard/employees/(time-at-work|action-summary|leaves|subunit|locations)",
+        )),
+    )
+}
+
+# Profile name -> rules it applies
+BLOCKING_PROFILES: Dict[str, Tuple[str, ...]] = {
+    "none": (),
+    "no_tracking": ("analytics", "media"),
+    "lean": ("images", "fonts", "media", "analytics", "dashboard_widgets"),
+}
+
+# Default profile per test package; override with @pytest.mark.network_profile("...")
+MODULE_PROFILES: Dict[str, str] = {
+    "pim": "lean",
+    "admin": "lean",
+    "leave": "lean",
+    "time": "lean",
+    "auth": "lean",
+    "dashboard": "no_tracking",
+    "performance": "none",
+}
+
+
+class NetworkBlocker:
+    """
+    Applies blocking profiles to browser contexts and accounts for savings.
+
+    Requests saved are counted exactly. Bytes saved are estimated from a
+    ledger of response sizes observed for the same resources in contexts
+    that did not block them (e.g. dashboard or performance tests); blocked
+    requests with no recorded size are counted as unsized.
+    """
+
+    def __init__(self, ledger_path: str = config.NETWORK_SIZE_LEDGER, stats: RunStats = run_stats):
+        self.ledger_path = Path(ledger_path)
+        self.stats = stats
+        self._lock = FileLock(self.ledger_path.with_suffix(".lock"))
+        self._sizes: Dict[str, int] = self._load_ledger()
+        self._observed: Dict[str, int] = {}
+        self._watched: "weakref.WeakSet[BrowserContext]" = weakref.WeakSet()
+
+    @staticmethod
+    def rules_for(profile: str) -> List[BlockRule]:
+        if profile not in BLOCKING_PROFILES:
+            raise ValueError(f"Unknown network profile '{profile}'; expected one of {sorted(BLOCKING_PROFILES)}")
+        return [BLOCK_RULES[name] for name in BLOCKING_PROFILES[profile]]
+
+    def install(self, context: BrowserContext, profile: str):
+        """Block the profile's requests; sizes of everything else feed the ledger"""
+        rules = self.rules_for(profile)
+        if context not in self._watched:
+            # Listeners outlive a pooled context's reset, so attach only once
+            self._watched.add(context)
+            context.on("requestfinished", self._observe)
+        if not rules:
+            return
+
+        def handle(route: Route):
+            for rule in rules:
+                if rule.matches(route.request):
+                    self._account(rule, route.request)
+                    route.abort("blockedbyclient")
+                    return
+            route.fallback()
+
+        context.route("**/*", handle)
+
+    def close(self):
+        """Merge sizes observed by this worker into the shared ledger"""
+        if not self._observed:
+            return
+        with self._lock:
+            ledger = self._load_ledger()
+            ledger.update(self._observed)
+            atomic_write_text(self.ledger_path, json.dumps(ledger, indent=1, sort_keys=True))
+        self._observed.clear()
+
+    # ---------- Internals ----------
+    def _account(self, rule: BlockRule, request: Request):
+        self.stats.add("network_blocking", "requests_saved")
+        self.stats.add("network_blocking", f"requests_saved_{rule.name}")
+        size = self._sizes.get(_resource_key(request.url))
+        if size is None:
+            self.stats.add("network_blocking", "unsized_requests")
+        else:
+            self.stats.add("network_blocking", "bytes_saved", size)
+
+    def _observe(self, request: Request):
+        """Remember response sizes of resources some profile could block"""
+        if not any(rule.matches(request) for rule in BLOCK_RULES.values()):
+            return
+        try:
+            size = request.sizes()["responseBodySize"]
+        except Exception:
+            return
+        if size > 0:
+            key = _resource_key(request.url)
+            self._observed[key] = self._sizes[key] = size
+
+    def _load_ledger(self) -> Dict[str, int]:
+        try:
+            return json.loads(self.ledger_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+
+
+def _resource_key(url: str) -> str:
+    """Host and path with numeric ids wildcarded, so per-employee photos share a size"""
+    parts = urlsplit(url)
+    return parts.netloc + re.sub(r"/\d+(?=/|$)", "/{n}", parts.path)
@@ -0,0 +1,213 @@
+"""
+Baseline store for performance scenario results, with regression detection.
+Each @perf_scenario result is stored in SQLite, keyed by test ID, browser,
+environment and git SHA. A new result is compared with the samples of
+recent runs of the same key, and with those of its earliest runs, using a
+one-sided Mann-Whitney U test: a 15% jump is flagged long before it crosses
+any fixed threshold, while run-to-run noise on a shared server is not.
+Regressed results are not stored, so they never become the baseline, and
+the earliest runs pin a reference that creep in small steps cannot move.
+"""
+import functools
+import json
+import math
+import os
+import sqlite3
+import subprocess
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from config import config
+from utils.perf_scenario import PerfResult, percentile_of
+from utils.run_stats import RunStats, run_stats
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS perf_runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    test_id TEXT NOT NULL,
+    scenario TEXT NOT NULL,
+    browser TEXT NOT NULL,
+    env TEXT NOT NULL,
+    git_sha TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    p50_ms REAL NOT NULL,
+    p90_ms REAL NOT NULL,
+    samples_ms TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS perf_runs_key ON perf_runs (test_id, scenario, browser, env, created_at);
+"""
+
+# Fewer samples than this on either side and the comparison is skipped
+MIN_SAMPLES = 5
+
+
+@dataclass(frozen=True)
+class BaselineKey:
+    """What a result is compared against: same test, browser and environment"""
+    test_id: str
+    browser: str
+    env: str = config.ENV
+    git_sha: str = ""
+
+    def __post_init__(self):
+        if not self.git_sha:
+            object.__setattr__(self, "git_sha", current_git_sha())
+
+
+@dataclass
+class RegressionVerdict:
+    """Outcome of comparing one result with its baseline"""
+    scenario: str
+    key: BaselineKey
+    baseline_runs: int
+    baseline_samples: int
+    median_ratio: Optional[float] = None
+    p_value: Optional[float] = None
+    regressed: bool = False
+    # "recent" runs, or the pinned "reference" runs
+    against: str = "recent"
+
+    def assert_no_regression(self):
+        assert not self.regressed, f"Performance regression: {self.describe()}"
+
+    def describe(self) -> str:
+        if self.p_value is None:
+            return f"{self.scenario}: no baseline yet ({self.baseline_samples} samples from {self.baseline_runs} runs)"
+        return (f"{self.scenario}: median x{self.median_ratio:.2f} vs {self.baseline_runs} {self.against} runs "
+                f"(Mann-Whitney p={self.p_value:.4f})")
+
+
+class PerfBaseline:
+    """
+    SQLite-backed history of scenario results.
+
+    A result regresses when its samples are significantly slower than the
+    pooled samples of the last `window` runs, or of the first `window` runs
+    (the reference), with p < alpha and a median at least `min_effect`
+    slower, so statistically real but negligible shifts pass. To accept a
+    new level after an intended slowdown, delete the scenario's rows.
+    """
+
+    def __init__(
+        self,
+        db_path: str = config.PERF_BASELINE_DB,
+        window: int = config.PERF_BASELINE_RUNS,
+        alpha: float = config.PERF_REGRESSION_ALPHA,
+        min_effect: float = config.PERF_REGRESSION_MIN_EFFECT,
+        stats: RunStats = run_stats,
+    ):
+        self.db_path = Path(db_path)
+        self.window = window
+        self.alpha = alpha
+        self.min_effect = min_effect
+        self.stats = stats
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as db:
+            db.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        # xdist workers write to the same file; wait for each other's locks
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def history(self, scenario: str, key: BaselineKey, earliest: bool = False) -> List[List[float]]:
+        """Samples of the most recent runs for the key, newest first; with earliest, the first runs, oldest first"""
+        order = "ASC" if earliest else "DESC"
+        with self._connect() as db:
+            rows = db.execute(
+                "SELECT samples_ms FROM perf_runs WHERE test_id = ? AND scenario = ? AND browser = ? AND env = ? "
+                f"ORDER BY created_at {order} LIMIT ?",
+                (key.test_id, scenario, key.browser, key.env, self.window),
+            ).fetchall()
+        return [json.loads(samples) for (samples,) in rows]
+
+    def record(self, result: PerfResult, key: BaselineKey):
+        with self._connect() as db:
+            db.execute(
+                "INSERT INTO perf_runs (test_id, scenario, browser, env, git_sha, created_at, p50_ms, p90_ms, samples_ms) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key.test_id, result.name, key.browser, key.env, key.git_sha, time.time(),
+                 result.p50, result.p90, json.dumps(result.samples_ms)),
+            )
+        self.stats.add("perf_baseline", "recorded")
+
+    def compare(self, result: PerfResult, key: BaselineKey) -> RegressionVerdict:
+        """
+        Compare a result with the recent and the reference runs (without
+        recording it); a regression against either is reported
+        """
+        recent = self._compare(result, key, self.history(result.name, key), "recent")
+        reference = self._compare(result, key, self.history(result.name, key, earliest=True), "reference")
+        verdict = recent if recent.regressed or not reference.regressed else reference
+        if verdict.p_value is not None:
+            self.stats.add("perf_baseline", "compared")
+        if verdict.regressed:
+            self.stats.add("perf_baseline", "regressions")
+        return verdict
+
+    def _compare(self, result: PerfResult, key: BaselineKey, runs: List[List[float]], against: str) -> RegressionVerdict:
+        baseline = [sample for run in runs for sample in run]
+        verdict = RegressionVerdict(result.name, key, len(runs), len(baseline), against=against)
+        if len(baseline) < MIN_SAMPLES or len(result.samples_ms) < MIN_SAMPLES:
+            return verdict
+
+        verdict.median_ratio = percentile_of(result.samples_ms, 50) / max(percentile_of(baseline, 50), 1e-9)
+        verdict.p_value = mann_whitney_greater(result.samples_ms, baseline)
+        verdict.regressed = verdict.p_value < self.alpha and verdict.median_ratio >= 1 + self.min_effect
+        return verdict
+
+    def check(self, result: PerfResult, key: BaselineKey) -> RegressionVerdict:
+        """Compare with the history, then add the result to it unless it regressed"""
+        verdict = self.compare(result, key)
+        if not verdict.regressed:
+            self.record(result, key)
+        return verdict
+
+
+def mann_whitney_greater(current: List[float], baseline: List[float]) -> float:
+    """
+    One-sided p-value that `current` tends to be larger (slower) than
+    `baseline`: Mann-Whitney U with the normal approximation, tie
+    correction and continuity correction.
+    """
+    n1, n2 = len(current), len(baseline)
+    ranks, ties = _ranks([*current, *baseline])
+    u = sum(ranks[:n1]) - n1 * (n1 + 1) / 2
+    n = n1 + n2
+    variance = n1 * n2 / 12 * ((n + 1) - ties / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (u - n1 * n2 / 2 - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def _ranks(values: List[float]) -> Tuple[List[float], float]:
+    """Average ranks (1-based) and the tie term sum(t^3 - t)"""
+    order = sorted(range(len(values)), key=values.__getitem__)
+    ranks = [0.0] * len(values)
+    ties = 0.0
+    i = 0
+    while i < len(order):
+        j = i
+        while j + 1 < len(order) and values[order[j + 1]] == values[order[i]]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[order[k]] = (i + j) / 2 + 1
+        size = j - i + 1
+        ties += size ** 3 - size
+        i = j + 1
+    return ranks, ties
+
+
+@functools.lru_cache(maxsize=None)
+def current_git_sha() -> str:
+    """Commit under test: CI's GITHUB_SHA, else the checkout's HEAD"""
+    if os.getenv("GITHUB_SHA"):
+        return os.environ["GITHUB_SHA"]
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True, timeout=5,
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return "unknown"
@@ -0,0 +1,227 @@
+"""
+Browser-side performance collection for page loads and page-object actions.
+Numbers come from the browser's own timing APIs (Navigation, Resource and
+Paint Timing, Largest Contentful Paint, Long Tasks, Layout Instability)
+instead of Python clocks around driver calls, so they exclude the test
+process and the Playwright round trips.
+"""
+import weakref
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Iterator, List, Optional
+
+from playwright.sync_api import BrowserContext, Page
+
+# Buffers entries the timing APIs only report to observers (LCP, long tasks,
+# layout shifts) from the very start of every document in the context
+_OBSERVER_SCRIPT = """(() => {
+    if (window.__perfProbe) return;
+    const probe = window.__perfProbe = { lcp: null, layoutShifts: [], longTasks: [] };
+    const observe = (type, callback) => {
+        try {
+            new PerformanceObserver((list) => list.getEntries().forEach(callback)).observe({ type, buffered: true });
+        } catch (e) { /* entry type not supported by this browser */ }
+    };
+    observe('largest-contentful-paint', (e) => { probe.lcp = e.renderTime || e.loadTime || e.startTime; });
+    observe('layout-shift', (e) => { if (!e.hadRecentInput) probe.layoutShifts.push({ start: e.startTime, value: e.value }); });
+    observe('longtask', (e) => probe.longTasks.push({ start: e.startTime, duration: e.duration }));
+    if (performance.setResourceTimingBufferSize) performance.setResourceTimingBufferSize(5000);
+})()"""
+
+# Everything recorded since the epoch-ms timestamp `since` (0 = document start);
+# an action that navigated gets the whole new document
+_COLLECT_SCRIPT = """(sinceEpoch) => {
+    const since = sinceEpoch ? sinceEpoch - performance.timeOrigin : 0;
+    const probe = window.__perfProbe || { lcp: null, layoutShifts: [], longTasks: [] };
+    const nav = performance.getEntriesByType('navigation')[0];
+    const paint = (name) => {
+        const entry = performance.getEntriesByName(name)[0];
+        return entry ? entry.startTime : null;
+    };
+    return {
+        url: location.href,
+        nowEpoch: performance.timeOrigin + performance.now(),
+        navigation: nav ? {
+            type: nav.type,
+            ttfb: nav.responseStart,
+            domInteractive: nav.domInteractive,
+            domContentLoaded: nav.domContentLoadedEventEnd,
+            load: nav.loadEventEnd,
+            transferSize: nav.transferSize,
+            encodedBodySize: nav.encodedBodySize,
+        } : null,
+        fcp: paint('first-contentful-paint'),
+        lcp: probe.lcp,
+        resources: performance.getEntriesByType('resource')
+            .filter((r) => r.startTime >= since)
+            .map((r) => ({
+                name: r.name, initiatorType: r.initiatorType, start: r.startTime,
+                duration: r.duration, transferSize: r.transferSize,
+            })),
+        layoutShifts: probe.layoutShifts.filter((s) => s.start >= since),
+        longTasks: probe.longTasks.filter((t) => t.start >= since),
+    };
+}"""
+
+# Main-thread work above this many ms counts as blocking (Total Blocking Time)
+LONG_TASK_BUDGET_MS = 50
+
+# Cumulative Layout Shift session windows: shifts less than GAP apart, at most SPAN long
+CLS_WINDOW_GAP_MS = 1000
+CLS_WINDOW_SPAN_MS = 5000
+
+
+@dataclass
+class ResourceTiming:
+    """One fetched resource (script, stylesheet, image, XHR/fetch call...)"""
+    name: str
+    initiator_type: str
+    start_ms: float
+    duration_ms: float
+    transfer_size: int
+
+    @property
+    def is_api(self) -> bool:
+        return "/api/v2/" in self.name
+
+
+@dataclass
+class _MainThreadTiming:
+    """Fields shared by page-load and action records"""
+    resources: List[ResourceTiming] = field(default_factory=list)
+    cls: float = 0.0
+    long_tasks: int = 0
+    total_blocking_time_ms: float = 0.0
+
+    @property
+    def transfer_bytes(self) -> int:
+        return sum(r.transfer_size for r in self.resources)
+
+    @property
+    def api_calls(self) -> List[ResourceTiming]:
+        return [r for r in self.resources if r.is_api]
+
+    @property
+    def slowest_api_ms(self) -> float:
+        return max((r.duration_ms for r in self.api_calls), default=0.0)
+
+
+@dataclass
+class PageTiming(_MainThreadTiming):
+    """
+    A document load, in ms from navigation start.
+    Paint metrics are None when the browser does not report them
+    (e.g. LCP outside Chromium, or before anything was painted).
+    """
+    url: str = ""
+    navigation_type: str = ""
+    ttfb_ms: float = 0.0
+    dom_interactive_ms: float = 0.0
+    dom_content_loaded_ms: float = 0.0
+    load_ms: float = 0.0
+    document_bytes: int = 0
+    fcp_ms: Optional[float] = None
+    lcp_ms: Optional[float] = None
+
+
+@dataclass
+class ActionTiming(_MainThreadTiming):
+    """
+    A page-object action, measured on the browser clock from just before
+    the action until it returned (its waits included). Actions that load a
+    new document are measured across it.
+    """
+    name: str = ""
+    duration_ms: float = 0.0
+
+
+class PerfProbe:
+    """
+    Collects typed timing records from pages of install()ed contexts.
+
+    Usage:
+        perf_probe.install(context)
+        timing = perf_probe.page_timing(page)       # after a navigation
+        with perf_probe.measure(page, "search") as timing:
+            pim.search_employee_by_name("Peter")
+        timing.duration_ms, timing.slowest_api_ms
+    """
+
+    def __init__(self):
+        self._observed: "weakref.WeakSet[BrowserContext]" = weakref.WeakSet()
+
+    def install(self, context: BrowserContext):
+        """Start the performance observers in every page of the context"""
+        if context not in self._observed:
+            # Init scripts survive a pooled context's reset, so add it once
+            context.add_init_script(_OBSERVER_SCRIPT)
+            self._observed.add(context)
+
+    def page_timing(self, page: Page) -> PageTiming:
+        """Timing of the current document, once its load event has finished"""
+        page.wait_for_load_state("load")
+        raw = page.evaluate(_COLLECT_SCRIPT, 0)
+        nav = raw["navigation"] or {}
+        if nav and not nav["load"]:
+            # loadEventEnd is only set after the load handlers have returned
+            page.wait_for_function("() => performance.getEntriesByType('navigation')[0].loadEventEnd > 0")
+            raw = page.evaluate(_COLLECT_SCRIPT, 0)
+            nav = raw["navigation"]
+        return PageTiming(
+            url=raw["url"],
+            navigation_type=nav.get("type", ""),
+            ttfb_ms=nav.get("ttfb", 0.0),
+            dom_interactive_ms=nav.get("domInteractive", 0.0),
+            dom_content_loaded_ms=nav.get("domContentLoaded", 0.0),
+            load_ms=nav.get("load", 0.0),
+            document_bytes=nav.get("transferSize", 0),
+            fcp_ms=raw["fcp"],
+            lcp_ms=raw["lcp"],
+            **_main_thread(raw),
+        )
+
+    @contextmanager
+    def measure(self, page: Page, name: str) -> Iterator[ActionTiming]:
+        """Time the block as an action; the yielded record is filled on exit"""
+        timing = ActionTiming(name=name)
+        since = page.evaluate("() => performance.timeOrigin + performance.now()")
+        yield timing
+        raw = page.evaluate(_COLLECT_SCRIPT, since)
+        timing.duration_ms = raw["nowEpoch"] - since
+        for key, value in _main_thread(raw).items():
+            setattr(timing, key, value)
+
+
+def _main_thread(raw: dict) -> dict:
+    """Resource, layout-shift and long-task fields of a collected snapshot"""
+    long_tasks = raw["longTasks"]
+    return {
+        "resources": [
+            ResourceTiming(r["name"], r["initiatorType"], r["start"], r["duration"], r["transferSize"])
+            for r in raw["resources"]
+        ],
+        "cls": cumulative_layout_shift(raw["layoutShifts"]),
+        "long_tasks": len(long_tasks),
+        "total_blocking_time_ms": sum(max(0.0, t["duration"] - LONG_TASK_BUDGET_MS) for t in long_tasks),
+    }
+
+
+def cumulative_layout_shift(shifts: List[dict]) -> float:
+    """
+    CLS of layout shifts ({"start", "value"}): the largest total of a
+    session window, not the sum of every shift since navigation
+    """
+    largest = window = 0.0
+    window_start = previous = None
+    for shift in sorted(shifts, key=lambda s: s["start"]):
+        start = shift["start"]
+        if window_start is None or start - previous >= CLS_WINDOW_GAP_MS or start - window_start >= CLS_WINDOW_SPAN_MS:
+            window_start, window = start, 0.0
+        window += shift["value"]
+        previous = start
+        largest = max(largest, window)
+    return largest
+
+
+# Convenience instance
+perf_probe = PerfProbe()
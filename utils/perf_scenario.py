@@ -0,0 +1,207 @@
+"""
+Repeated-sampling runner for performance scenarios.
+A single timing against a shared OrangeHRM is mostly noise; a scenario runs
+a flow several times after warm-up, drops outliers and asserts on
+percentiles, each reported with a confidence interval. Every run is written
+to a JSON artifact under PERF_RESULTS_DIR for trend tooling.
+"""
+import functools
+import inspect
+import json
+import math
+import os
+import re
+import statistics
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from config import config
+
+# Two-sided 95% normal quantile, for order-statistic confidence intervals
+_Z_95 = 1.959964
+
+REPORTED_PERCENTILES = (50, 90, 99)
+
+
+@dataclass
+class PercentileEstimate:
+    """A percentile with its distribution-free 95% confidence interval"""
+    percentile: int
+    value_ms: float
+    ci_low_ms: float
+    ci_high_ms: float
+
+
+@dataclass
+class PerfResult:
+    """Summary of one scenario run; samples are in milliseconds"""
+    name: str
+    test_id: str
+    iterations: int
+    warmup: int
+    samples_ms: List[float]
+    outliers_ms: List[float]
+    mean_ms: float
+    stdev_ms: float
+    percentiles: Dict[int, PercentileEstimate] = field(default_factory=dict)
+
+    def p(self, percentile: int) -> float:
+        return self.percentiles[percentile].value_ms if percentile in self.percentiles else percentile_of(self.samples_ms, percentile)
+
+    @property
+    def p50(self) -> float:
+        return self.p(50)
+
+    @property
+    def p90(self) -> float:
+        return self.p(90)
+
+    @property
+    def p99(self) -> float:
+        return self.p(99)
+
+    def assert_percentile(self, percentile: int, max_ms: float):
+        """Fail when the given percentile of the kept samples exceeds max_ms"""
+        value = self.p(percentile)
+        assert value < max_ms, f"{self.name}: p{percentile} {value:.0f}ms exceeds {max_ms:.0f}ms ({self.describe()})"
+
+    def describe(self) -> str:
+        parts = [
+            f"p{e.percentile}={e.value_ms:.0f}ms [{e.ci_low_ms:.0f}-{e.ci_high_ms:.0f}]"
+            for e in self.percentiles.values()
+        ]
+        return f"n={len(self.samples_ms)} outliers={len(self.outliers_ms)} " + " ".join(parts)
+
+    def as_dict(self) -> dict:
+        result = asdict(self)
+        result["percentiles"] = {f"p{p}": asdict(e) for p, e in self.percentiles.items()}
+        return result
+
+
+def percentile_of(samples: List[float], percentile: float) -> float:
+    """Linear-interpolated percentile of a non-empty sample (numpy's default method)"""
+    ordered = sorted(samples)
+    rank = (len(ordered) - 1) * percentile / 100
+    low = math.floor(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def percentile_ci(samples: List[float], percentile: float) -> Tuple[float, float]:
+    """
+    95% confidence interval of a percentile from order statistics.
+    Uses the normal approximation to the binomial rank distribution, so it
+    needs no distributional assumption; with few samples, high percentiles
+    simply get an interval reaching the maximum.
+    """
+    ordered = sorted(samples)
+    n = len(ordered)
+    q = percentile / 100
+    spread = _Z_95 * math.sqrt(n * q * (1 - q))
+    low = max(0, math.floor(n * q - spread) - 1)
+    high = min(n - 1, math.ceil(n * q + spread) - 1)
+    return ordered[low], ordered[high]
+
+
+def split_outliers(samples: List[float], fence: float = 1.5) -> Tuple[List[float], List[float]]:
+    """(kept, outliers) using Tukey's fences around the interquartile range"""
+    if len(samples) < 4:
+        return list(samples), []
+    q1, q3 = percentile_of(samples, 25), percentile_of(samples, 75)
+    low, high = q1 - fence * (q3 - q1), q3 + fence * (q3 - q1)
+    kept = [s for s in samples if low <= s <= high]
+    return kept, [s for s in samples if not low <= s <= high]
+
+
+def summarize(name: str, samples: List[float], warmup: int = 0, test_id: str = "") -> PerfResult:
+    kept, outliers = split_outliers(samples)
+    return PerfResult(
+        name=name,
+        test_id=test_id,
+        iterations=len(samples),
+        warmup=warmup,
+        samples_ms=kept,
+        outliers_ms=outliers,
+        mean_ms=statistics.fmean(kept),
+        stdev_ms=statistics.stdev(kept) if len(kept) > 1 else 0.0,
+        percentiles={
+            p: PercentileEstimate(p, percentile_of(kept, p), *percentile_ci(kept, p))
+            for p in REPORTED_PERCENTILES
+        },
+    )
+
+
+def perf_scenario(
+    name: Optional[str] = None,
+    iterations: Optional[int] = None,
+    warmup: Optional[int] = None,
+    results_dir: Optional[str] = None,
+):
+    """
+    Turn a one-iteration flow into a repeated, summarized scenario.
+
+    The flow returns its sample: milliseconds, or a timing record from
+    utils.perf_probe (ActionTiming.duration_ms / PageTiming.load_ms). A flow
+    returning None is timed around the call. Calling the decorated function
+    runs `warmup` discarded iterations, then `iterations` measured ones,
+    writes the JSON artifact and returns a PerfResult. The name may refer
+    to the flow's arguments, e.g. "open {module}".
+
+    Usage:
+        @perf_scenario("employee search", iterations=10, warmup=2)
+        def employee_search(pim: PimPage):
+            with pim.measure("search") as timing:
+                pim.search_employee_by_name("Peter")
+            return timing
+
+        employee_search(pim).assert_percentile(90, 3000)
+    """
+    def decorator(flow: Callable):
+        signature = inspect.signature(flow)
+
+        @functools.wraps(flow)
+        def run(*args, **kwargs) -> PerfResult:
+            scenario = (name or flow.__name__).format(**signature.bind(*args, **kwargs).arguments)
+            rounds = iterations or config.PERF_ITERATIONS
+            warm = config.PERF_WARMUP if warmup is None else warmup
+            samples = []
+            for i in range(warm + rounds):
+                start = time.perf_counter()
+                value = flow(*args, **kwargs)
+                sample = _sample_ms(value, (time.perf_counter() - start) * 1000)
+                if i >= warm:
+                    samples.append(sample)
+            result = summarize(scenario, samples, warm, _current_test_id())
+            write_result(result, results_dir or config.PERF_RESULTS_DIR)
+            return result
+
+        return run
+
+    return decorator
+
+
+def write_result(result: PerfResult, results_dir: str) -> Path:
+    """One JSON file per test and scenario, so xdist workers never share a file"""
+    directory = Path(results_dir)
+    directory.mkdir(parents=True, exist_ok=True)
+    slug = re.sub(r"[^A-Za-z0-9_.-]+", "_", f"{result.test_id}--{result.name}").strip("_")
+    path = directory / f"{slug}.json"
+    path.write_text(json.dumps(result.as_dict(), indent=2), encoding="utf-8")
+    return path
+
+
+def _sample_ms(value, elapsed_ms: float) -> float:
+    if value is None:
+        return elapsed_ms
+    if isinstance(value, (int, float)):
+        return float(value)
+    for attribute in ("duration_ms", "load_ms"):
+        if hasattr(value, attribute):
+            return float(getattr(value, attribute))
+    raise TypeError(f"perf_scenario flow returned {type(value).__name__}; expected ms or a timing record")
+
+
+def _current_test_id() -> str:
+    return os.environ.get("PYTEST_CURRENT_TEST", "").rsplit(" ", 1)[0]
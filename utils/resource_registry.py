@@ -0,0 +1,59 @@
+"""
+Registry of the entities a test run creates on the server.
+Page-object actions and the API seeder register the id of every employee
+and system user they create, and forget the ones a test deletes itself.
+At the end of the session (of each worker, under xdist) the conftest
+deletes whatever is left in bulk over the API.
+"""
+import threading
+from typing import Dict, List
+
+# Kinds in deletion order: users before the employees they belong to
+KINDS = ("user", "employee")
+
+# Field holding the id in an /api/v2/ create response's "data"
+ID_FIELDS = {"user": "id", "employee": "empNumber"}
+
+
+class ResourceRegistry:
+    """
+    Ids of created entities, by kind. Safe to use from the seeder's thread.
+
+    Usage:
+        created_resources.register("employee", 42)
+        created_resources.forget("employee", [42])
+        leftovers = created_resources.drain()   # {"user": [...], "employee": [...]}
+    """
+
+    def __init__(self):
+        self._ids: Dict[str, set] = {kind: set() for kind in KINDS}
+        self._lock = threading.Lock()
+
+    def register(self, kind: str, resource_id: int):
+        with self._lock:
+            self._ids[kind].add(int(resource_id))
+
+    def register_response(self, kind: str, payload: dict):
+        """Register the entity of a create response body ({"data": {...}})"""
+        self.register(kind, payload["data"][ID_FIELDS[kind]])
+
+    def forget(self, kind: str, resource_ids: List[int]):
+        """Drop ids the test deleted itself"""
+        with self._lock:
+            self._ids[kind].difference_update(int(i) for i in resource_ids)
+
+    def drain(self) -> Dict[str, List[int]]:
+        """Return and clear everything registered, in deletion order"""
+        with self._lock:
+            drained = {kind: sorted(self._ids[kind]) for kind in KINDS}
+            for ids in self._ids.values():
+                ids.clear()
+        return drained
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(ids) for ids in self._ids.values())
+
+
+# Convenience instance
+created_resources = ResourceRegistry()
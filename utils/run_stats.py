@@ -0,0 +1,50 @@
+"""
+Run-level counters reported in the pytest terminal summary.
+Each xdist worker collects its own counters; the controller merges them.
+"""
+from collections import defaultdict
+from typing import Dict, List
+
+
+class RunStats:
+    """Named sections of numeric counters collected during a test run"""
+
+    def __init__(self):
+        self._sections: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+
+    def add(self, section: str, key: str, amount: float = 1):
+        """Increment a counter"""
+        self._sections[section][key] += amount
+
+    def merge(self, other: Dict[str, Dict[str, float]]):
+        """Add counters exported by another process (see as_dict)"""
+        for section, values in other.items():
+            for key, amount in values.items():
+                self.add(section, key, amount)
+
+    def as_dict(self) -> Dict[str, Dict[str, float]]:
+        """Plain-dict snapshot, safe to send between xdist processes"""
+        return {section: dict(values) for section, values in self._sections.items()}
+
+    def get(self, section: str, key: str) -> float:
+        """Read a single counter (0 when never incremented)"""
+        return self._sections.get(section, {}).get(key, 0)
+
+    def format_lines(self) -> List[str]:
+        """Human-readable summary, one line per section"""
+        lines = []
+        for section, values in sorted(self._sections.items()):
+            parts = [f"{key}={_format_number(amount)}" for key, amount in sorted(values.items())]
+            lookups = values.get("hits", 0) + values.get("misses", 0)
+            if lookups:
+                parts.append(f"hit_rate={values.get('hits', 0) / lookups:.1%}")
+            lines.append(f"{section}: {' '.join(parts)}")
+        return lines
+
+
+def _format_number(amount: float) -> str:
+    return str(int(amount)) if float(amount).is_integer() else f"{amount:.2f}"
+
+
+# Convenience instance
+run_stats = RunStats()
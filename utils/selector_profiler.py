@@ -0,0 +1,270 @@
+"""
+Selector profiler for the page objects' declared locators.
+Opens every page object's screens, resolves each LocatorSpec there, and
+records the median time the browser spends matching it and how many nodes
+it matches. For locators matching one element it proposes cheaper
+selectors built from the element's id, name, data-* attributes, ARIA label,
+placeholder or role. A proposal is only kept if it matches exactly that
+element. Prints a ranked report (slowest first) and writes it as JSON.
+
+Usage:
+    python -m utils.selector_profiler                  # configured environment
+    python -m utils.selector_profiler --standin        # against a fresh stand-in server
+    python -m utils.selector_profiler --rounds 9 --top 20
+"""
+import argparse
+import json
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from playwright.sync_api import Page, sync_playwright
+
+from config import config
+from pages import AdminPage, DashboardPage, LeavePage, LoginPage, MyInfoPage, PimPage, TimePage
+from utils.api_waits import api_waits
+from utils.locators import LocatorSpec, locator_table, resolution_ms
+
+# Dashboard first: the shared BaseLocators (header, menu) are profiled there
+PAGE_CLASSES = (DashboardPage, PimPage, AdminPage, LeavePage, TimePage, MyInfoPage)
+
+# Arguments for parameterized locators; locators needing others are skipped
+SAMPLE_PARAMS = {"row_index": 0, "day_index": 0, "menu_name": "Admin"}
+
+# Marks the profiled element so candidates can be checked against exactly it
+_MARKER = "data-selector-profiler-target"
+
+# Candidate selectors for one element, cheapest kinds first
+_CANDIDATES_SCRIPT = """(elements, marker) => {
+    elements.forEach(e => e.setAttribute(marker, ''));
+    if (elements.length !== 1) return [];
+    const e = elements[0];
+    const tag = e.tagName.toLowerCase();
+    const quote = (value) => JSON.stringify(value);
+    const candidates = [];
+    if (e.id) candidates.push(['css', '#' + CSS.escape(e.id)]);
+    for (const attr of e.attributes) {
+        if (attr.name.startsWith('data-') && !attr.name.startsWith('data-v-') && attr.name !== marker) {
+            candidates.push(['css', `[${attr.name}=${quote(attr.value)}]`]);
+        }
+    }
+    for (const name of ['name', 'aria-label', 'placeholder']) {
+        const value = e.getAttribute(name);
+        if (value) candidates.push(['css', `${tag}[${name}=${quote(value)}]`]);
+    }
+    const type = (e.getAttribute('type') || 'text').toLowerCase();
+    const implicit = {
+        a: e.hasAttribute('href') ? 'link' : null, button: 'button', select: 'combobox', textarea: 'textbox',
+        h1: 'heading', h2: 'heading', h3: 'heading', h4: 'heading', h5: 'heading', h6: 'heading',
+        input: {checkbox: 'checkbox', radio: 'radio', button: 'button', submit: 'button'}[type]
+            || (['text', 'password', 'email', 'search', 'tel', 'url'].includes(type) ? 'textbox' : null),
+    };
+    const role = e.getAttribute('role') || implicit[tag];
+    const name = (e.getAttribute('aria-label') || e.innerText || '').trim();
+    if (role && name && name.length <= 60 && !name.includes('\\n')) candidates.push(['role', role, name]);
+    return candidates;
+}"""
+
+# True when a locator's matches are exactly the marked element(s)
+_SAME_TARGET_SCRIPT = """(elements, marker) =>
+    elements.length === document.querySelectorAll(`[${marker}]`).length
+    && elements.every(e => e.hasAttribute(marker))"""
+
+_UNMARK_SCRIPT = "(marker) => document.querySelectorAll(`[${marker}]`).forEach(e => e.removeAttribute(marker))"
+
+
+@dataclass
+class Suggestion:
+    """A verified alternative selector"""
+    spec: str  # LocatorSpec declaration, e.g. css('input[name="firstName"]')
+    median_ms: float
+
+
+@dataclass
+class SelectorProfile:
+    """One locator, profiled on the first screen where it matched"""
+    locator: str
+    chain: str
+    url: Optional[str] = None
+    matches: int = 0
+    median_ms: Optional[float] = None
+    suggestions: List[Suggestion] = field(default_factory=list)
+
+    @property
+    def best(self) -> Optional[Suggestion]:
+        faster = [s for s in self.suggestions if self.median_ms is not None and s.median_ms < self.median_ms]
+        return min(faster, key=lambda s: s.median_ms) if faster else None
+
+    @property
+    def saving_ms(self) -> float:
+        return self.median_ms - self.best.median_ms if self.best else 0.0
+
+
+@dataclass
+class SelectorReport:
+    """Profiles ranked slowest first"""
+    base_url: str
+    rounds: int
+    profiles: List[SelectorProfile]
+
+    def ranked(self) -> List[SelectorProfile]:
+        matched = sorted((p for p in self.profiles if p.matches), key=lambda p: p.median_ms, reverse=True)
+        return matched + [p for p in self.profiles if not p.matches]
+
+    def format_lines(self, top: Optional[int] = None) -> List[str]:
+        ranked = self.ranked()
+        matched = [p for p in ranked if p.matches]
+        lines = [
+            f"{len(self.profiles)} locators on {self.base_url}, median of {self.rounds} resolutions; "
+            f"{len(matched)} matched, {sum(1 for p in matched if p.best)} with a faster equivalent",
+            f"{'median':>9}{'nodes':>7}  locator",
+        ]
+        for profile in matched[:top]:
+            lines.append(f"{profile.median_ms:>7.2f}ms{profile.matches:>7}  {profile.locator}: {profile.chain}")
+            if profile.best:
+                lines.append(
+                    f"{'':>16}-> {profile.best.spec}  ({profile.best.median_ms:.2f}ms, "
+                    f"-{profile.saving_ms:.2f}ms)"
+                )
+        unmatched = [p.locator for p in ranked if not p.matches]
+        if unmatched:
+            lines.append(f"Not found on any visited screen: {', '.join(unmatched)}")
+        return lines
+
+    def as_dict(self) -> dict:
+        return {
+            "base_url": self.base_url,
+            "rounds": self.rounds,
+            "profiles": [{**asdict(p), "best": asdict(p.best) if p.best else None} for p in self.ranked()],
+        }
+
+    def write(self, results_dir: str = f"{config.REPORTS_DIR}/selectors") -> Path:
+        directory = Path(results_dir)
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f"selectors-{time.strftime('%Y%m%d-%H%M%S')}.json"
+        path.write_text(json.dumps(self.as_dict(), indent=2), encoding="utf-8")
+        return path
+
+
+class SelectorProfiler:
+    """
+    Profiles the locators declared by page classes on a live page.
+
+    Usage:
+        profiler = SelectorProfiler(page, rounds=5)
+        profiles = profiler.profile_class(PimPage)
+    """
+
+    def __init__(self, page: Page, rounds: int = 5):
+        self.page = page
+        self.rounds = rounds
+        self.profiles: Dict[str, SelectorProfile] = {}
+
+    def profile_class(self, page_class: type) -> List[SelectorProfile]:
+        """Visit each of the class's screens and profile its locators not yet matched elsewhere"""
+        specs = {spec.qualname: spec for spec in locator_table(page_class).values()}
+        for url in screens(page_class):
+            self.page.goto(url)
+            api_waits.wait_for_api_idle(self.page)
+            for name, spec in specs.items():
+                if not set(spec.params) <= set(SAMPLE_PARAMS):
+                    continue
+                profile = self.profiles.setdefault(name, SelectorProfile(name, spec.describe(_sample(spec))))
+                if not profile.matches:
+                    self._profile(spec, profile, url)
+        return [self.profiles[name] for name in specs if name in self.profiles]
+
+    def _profile(self, spec: LocatorSpec, profile: SelectorProfile, url: str):
+        locator = spec.build(self.page, _sample(spec))
+        matches = locator.count()
+        if not matches:
+            return
+        profile.url, profile.matches = url, matches
+        profile.median_ms = resolution_ms(self.page, locator, self.rounds)
+        try:
+            for candidate in locator.evaluate_all(_CANDIDATES_SCRIPT, _MARKER):
+                suggestion, alternative = _candidate_locator(self.page, candidate)
+                if alternative.evaluate_all(_SAME_TARGET_SCRIPT, _MARKER):
+                    profile.suggestions.append(Suggestion(suggestion, resolution_ms(self.page, alternative, self.rounds)))
+        finally:
+            self.page.evaluate(_UNMARK_SCRIPT, _MARKER)
+
+
+def _sample(spec: LocatorSpec) -> Optional[dict]:
+    return {name: SAMPLE_PARAMS[name] for name in spec.params} if spec.params else None
+
+
+def _candidate_locator(page: Page, candidate: list) -> Tuple[str, object]:
+    """(LocatorSpec declaration, Locator) for a candidate from _CANDIDATES_SCRIPT"""
+    if candidate[0] == "role":
+        _, role, name = candidate
+        return f"by_role({role!r}, name={name!r}, exact=True)", page.get_by_role(role, name=name, exact=True)
+    return f"css({candidate[1]!r})", page.locator(candidate[1])
+
+
+def screens(page_class: type) -> List[str]:
+    """URLs of a page class: its `path` and any other `*_path` attribute"""
+    base_url = config.get_base_url()
+    paths = [page_class.path] + [
+        getattr(page_class, name) for name in dir(page_class)
+        if name.endswith("_path") and isinstance(getattr(page_class, name), str)
+    ]
+    return [f"{base_url}/{path}" for path in dict.fromkeys(paths)]
+
+
+def profile_selectors(
+    base_url: Optional[str] = None, username: Optional[str] = None, password: Optional[str] = None,
+    rounds: int = 5, headless: bool = config.HEADLESS,
+) -> SelectorReport:
+    """Profile every page object's locators; the login page is profiled before logging in"""
+    if base_url:
+        config.BASE_URLS[config.ENV] = base_url
+    with sync_playwright() as playwright:
+        browser = getattr(playwright, config.BROWSER).launch(headless=headless)
+        context = browser.new_context(viewport={"width": 1920, "height": 1080})
+        api_waits.install(context)
+        page = context.new_page()
+        page.set_default_timeout(config.DEFAULT_TIMEOUT)
+        profiler = SelectorProfiler(page, rounds)
+        profiler.profile_class(LoginPage)
+        login_page = LoginPage(page)
+        login_page.navigate()
+        login_page.login(username or config.get_username(), password or config.get_password())
+        page.wait_for_url("**/dashboard/**")
+        for page_class in PAGE_CLASSES:
+            profiler.profile_class(page_class)
+        browser.close()
+    return SelectorReport(config.get_base_url(), rounds, list(profiler.profiles.values()))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rank page-object locators by resolution time and suggest faster ones")
+    parser.add_argument("--rounds", type=int, default=5, help="resolutions per locator for the median")
+    parser.add_argument("--top", type=int, default=None, help="only print the N slowest locators")
+    parser.add_argument("--base-url", default=None, help=f"defaults to the {config.ENV} environment's URL")
+    parser.add_argument("--username", default=None)
+    parser.add_argument("--password", default=None)
+    parser.add_argument("--headed", action="store_true")
+    parser.add_argument("--standin", action="store_true", help="profile against a fresh in-process stand-in server")
+    args = parser.parse_args()
+
+    server = None
+    base_url = args.base_url
+    if args.standin:
+        from standin import StandinApp, StandinServer
+        server = StandinServer(StandinApp())
+        base_url = server.start()
+    try:
+        report = profile_selectors(
+            base_url, args.username, args.password, rounds=args.rounds, headless=not args.headed,
+        )
+    finally:
+        if server:
+            server.stop()
+    print("\n".join(report.format_lines(args.top)))
+    print(f"Report written to {report.write()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Cached Playwright storage state for authenticated sessions.
+Logs in once per environment and credential pair, then reuses the saved
+cookies in every browser context until the server-side session expires.
+"""
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+from playwright.sync_api import Playwright
+
+from config import config
+from utils.file_lock import FileLock, atomic_write_text
+
+
+class SessionStateCache:
+    """Storage state file for one environment + credential pair"""
+
+    # Cheap authenticated endpoint: 200 with a live session, 401 without one
+    PROBE_PATH = "web/index.php/api/v2/pim/employees?limit=1"
+
+    def __init__(
+        self,
+        base_url: str,
+        username: str,
+        state_dir: str = config.AUTH_STATE_DIR,
+        max_age: int = config.AUTH_STATE_MAX_AGE,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.username = username
+        self.max_age = max_age
+        key = hashlib.sha1(f"{self.base_url}|{username}".encode()).hexdigest()[:12]
+        self.path = Path(state_dir) / f"{config.ENV}-{key}.json"
+        self._lock = FileLock(self.path.with_suffix(".lock"))
+        self.state: Optional[dict] = None
+
+    def is_fresh(self) -> bool:
+        """Check that a state file exists and is younger than max_age"""
+        if not self.path.exists():
+            return False
+        return (time.time() - self.path.stat().st_mtime) < self.max_age
+
+    def is_valid(self, playwright: Playwright) -> bool:
+        """Check the cached session is still accepted by the server"""
+        if not self.is_fresh():
+            return False
+        request_context = playwright.request.new_context(
+            base_url=self.base_url,
+            storage_state=str(self.path),
+        )
+        try:
+            response = request_context.get(f"/{self.PROBE_PATH}", max_redirects=0)
+            return response.status == 200
+        except Exception:
+            return False
+        finally:
+            request_context.dispose()
+
+    def ensure(self, playwright: Playwright, login: Callable[[], dict]) -> dict:
+        """
+        Return a valid storage state, logging in only if the cache is stale.
+
+        Args:
+            playwright: Playwright instance used to probe the cached session
+            login: Callable performing a fresh login and returning storage state
+
+        Returns:
+            Storage state dict with the session cookies
+        """
+        # Only one xdist worker logs in; the others wait and reuse its result
+        with self._lock:
+            if self.is_valid(playwright):
+                self.state = json.loads(self.path.read_text(encoding="utf-8"))
+            else:
+                self.state = login()
+                self.write(self.state)
+        return self.state
+
+    def refresh(self, login: Callable[[], dict]) -> dict:
+        """Log in again after the server dropped the cached session"""
+        with self._lock:
+            self.state = login()
+            self.write(self.state)
+        return self.state
+
+    def write(self, state: dict):
+        """Persist storage state atomically"""
+        atomic_write_text(self.path, json.dumps(state))
+
+    def invalidate(self):
+        """Drop the cached session"""
+        with self._lock:
+            self.path.unlink(missing_ok=True)
@@ -0,0 +1,60 @@
+"""
+Lint for hard sleeps in page objects, tests, utilities and load generators.
+`page.wait_for_timeout(...)`, `time.sleep(...)` and `asyncio.sleep(...)`
+make tests slow and flaky at the same time; waits should resolve on a condition instead.
+A sleep that really is needed (e.g. a polling interval) is allowed with
+an `# allow-sleep: <reason>` comment on the same line.
+"""
+import ast
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, List
+
+# Directories (relative to the project root) that must stay sleep-free
+LINTED_DIRS = ("pages", "tests", "utils", "loadgen")
+
+ALLOW_COMMENT = "# allow-sleep"
+
+
+@dataclass(frozen=True)
+class HardSleep:
+    path: Path
+    line: int
+    call: str
+
+    def __str__(self) -> str:
+        return f"{self.path}:{self.line}: {self.call}(...)"
+
+
+def find_hard_sleeps(root: Path, dirs: Iterable[str] = LINTED_DIRS) -> List[HardSleep]:
+    """Every un-allowed sleep call under the given directories"""
+    found = []
+    for directory in dirs:
+        for path in sorted((root / directory).rglob("*.py")):
+            found.extend(_sleeps_in(path, root))
+    return found
+
+
+def _sleeps_in(path: Path, root: Path) -> List[HardSleep]:
+    source = path.read_text(encoding="utf-8")
+    lines = source.splitlines()
+    found = []
+    for node in ast.walk(ast.parse(source, filename=str(path))):
+        if not isinstance(node, ast.Call):
+            continue
+        call = _sleep_call_name(node.func)
+        if call and ALLOW_COMMENT not in lines[node.lineno - 1]:
+            found.append(HardSleep(path.relative_to(root), node.lineno, call))
+    return found
+
+
+def _sleep_call_name(func: ast.expr) -> str:
+    """'wait_for_timeout' / 'time.sleep' / 'asyncio.sleep' / 'sleep' for sleep calls, '' otherwise"""
+    if isinstance(func, ast.Attribute):
+        if func.attr == "wait_for_timeout":
+            return "wait_for_timeout"
+        if func.attr == "sleep" and isinstance(func.value, ast.Name) and func.value.id in ("time", "asyncio"):
+            return f"{func.value.id}.sleep"
+    if isinstance(func, ast.Name) and func.id == "sleep":
+        return "sleep"
+    return ""